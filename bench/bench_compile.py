@@ -0,0 +1,107 @@
+"""Compile-throughput benchmark for DB2Compiler.
+
+Compiles a small corpus of representative ORM statements (joins,
+correlated subqueries, CTEs, LIMIT/OFFSET pagination) against the
+ibm_db_sa dialect with the statement cache disabled, so every iteration
+exercises the full compiler path.
+
+    python bench/bench_compile.py [iterations]
+
+"""
+import sys
+import time
+
+from sqlalchemy import Column, ForeignKey, Integer, String, Numeric, Date
+from sqlalchemy import select, func, and_, or_, exists
+from sqlalchemy.orm import declarative_base, relationship, aliased
+
+import ibm_db_sa
+
+Base = declarative_base()
+
+
+class Customer(Base):
+    __tablename__ = "customer"
+    id = Column(Integer, primary_key=True)
+    name = Column(String(80))
+    region = Column(String(20))
+    orders = relationship("Order", back_populates="customer")
+
+
+class Order(Base):
+    __tablename__ = "orders"
+    id = Column(Integer, primary_key=True)
+    customer_id = Column(Integer, ForeignKey("customer.id"))
+    placed = Column(Date)
+    total = Column(Numeric(31, 8))
+    customer = relationship("Customer", back_populates="orders")
+    lines = relationship("OrderLine")
+
+
+class OrderLine(Base):
+    __tablename__ = "order_line"
+    id = Column(Integer, primary_key=True)
+    order_id = Column(Integer, ForeignKey("orders.id"))
+    sku = Column(String(40))
+    qty = Column(Integer)
+
+
+def corpus():
+    o2 = aliased(Order)
+    big_orders = (
+        select(Order.customer_id, func.sum(Order.total).label("spend"))
+        .group_by(Order.customer_id)
+        .cte("big_orders")
+    )
+    line_count = (
+        select(func.count(OrderLine.id))
+        .where(OrderLine.order_id == Order.id)
+        .scalar_subquery()
+    )
+    return [
+        select(Customer).where(Customer.id == 5),
+        select(Customer).order_by(Customer.name).limit(20).offset(40),
+        select(Customer).order_by(Customer.name).offset(40),
+        select(Order, line_count.label("n_lines"))
+        .join(Order.customer)
+        .where(Customer.region.in_(["EU", "US"]))
+        .limit(50),
+        select(Customer.name, big_orders.c.spend)
+        .join(big_orders, big_orders.c.customer_id == Customer.id)
+        .where(big_orders.c.spend > 1000),
+        select(Customer).where(
+            exists().where(and_(Order.customer_id == Customer.id,
+                                Order.total > select(func.avg(o2.total))
+                                .where(o2.customer_id == Customer.id)
+                                .scalar_subquery()))
+        ),
+        select(Order).where(
+            Order.id.in_(
+                select(OrderLine.order_id)
+                .where(or_(OrderLine.sku.like("A%"), OrderLine.qty > 10))
+                .limit(100)
+            )
+        ).offset(10),
+    ]
+
+
+def main(iterations=2000):
+    dialect = ibm_db_sa.dialect()
+    statements = corpus()
+    # warm up mapper configuration outside of the timed loop
+    for stmt in statements:
+        stmt.compile(dialect=dialect)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for stmt in statements:
+            # Compiled objects are built directly, bypassing the engine's
+            # compiled cache.
+            dialect.statement_compiler(dialect, stmt)
+    elapsed = time.perf_counter() - start
+    total = iterations * len(statements)
+    print("compiled %d statements in %.3f s -> %.0f compiles/sec"
+          % (total, elapsed, total / elapsed))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,71 @@
+"""DATE binding and fetching benchmark.
+
+Inserts rows with executemany() and fetches a large date range through
+test/fake_dbapi.py, once with DATE values converted to strings on
+bind and post-processed on fetch (the generic ``_IBM_Date``) and once
+with the native handling used by the ibm_db and pyodbc dialects, so the
+timing covers only the per-value Python work.  The fake runs
+executemany() as one execute() per row; that cost is the same for both.
+
+    python bench/bench_date_binding.py [rows]
+
+"""
+import os
+import sys
+import time
+import datetime
+
+from sqlalchemy import select, types as sa_types
+from sqlalchemy import Column, Date, Integer, MetaData, Table
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ibm_db_sa  # noqa: F401,E402 registers the dialects
+from ibm_db_sa.base import _IBM_Date  # noqa: E402
+from test.fake_dbapi import make_dbapi, make_engine  # noqa: E402
+
+ROWS = 100000
+START = datetime.date(2020, 1, 1)
+
+events = Table("events", MetaData(),
+               Column("id", Integer), Column("happened", Date))
+
+
+def events_rows(connection, statement, parameters):
+    if statement.startswith("SELECT"):
+        return (["ID", "HAPPENED"],
+                [(i, START + datetime.timedelta(days=i % 3650))
+                 for i in range(ROWS)])
+    return None
+
+
+def run(label, native):
+    engine = make_engine(make_dbapi(events_rows))
+    if not native:
+        engine.dialect.colspecs = dict(engine.dialect.colspecs)
+        engine.dialect.colspecs[sa_types.Date] = _IBM_Date
+    params = [{"id": i, "happened": START + datetime.timedelta(days=i % 3650)}
+              for i in range(ROWS)]
+    query = select(events).where(events.c.happened.between(
+        START, START + datetime.timedelta(days=3650)))
+    with engine.connect() as conn:
+        start = time.perf_counter()
+        conn.execute(events.insert(), params)
+        bound = time.perf_counter() - start
+        start = time.perf_counter()
+        fetched = len(conn.execute(query).all())
+        elapsed = time.perf_counter() - start
+    engine.dispose()
+    print("%-8s executemany %d rows in %.3f s, fetched %d rows in %.3f s"
+          % (label, ROWS, bound, fetched, elapsed))
+
+
+def main(rows=ROWS):
+    global ROWS
+    ROWS = rows
+    run("str", native=False)
+    run("native", native=True)
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
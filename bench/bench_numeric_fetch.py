@@ -0,0 +1,131 @@
+"""Numeric fetch throughput benchmark.
+
+Fetches 10M numeric cells (1M rows of ten DECIMAL(31,8), float-typed
+NUMERIC and DECFLOAT columns) through test/fake_dbapi.py, handing back
+values as ibm_db_dbi does -- Decimal for DECIMAL, strings for
+DECFLOAT -- so the timing covers the dialect's result processing.  The
+raw cursor loop is timed first as the floor, then the same select runs
+with three sets of result processors:
+
+``before``   the ibm_db dialect before supports_native_decimal: a Python
+             float() closure logging every value, DECFLOAT strings kept
+``generic``  SQLAlchemy's own Numeric processors without native decimals,
+             C float() and Decimal quantized to the scale, and a plain
+             Decimal(value) per DECFLOAT string
+``after``    _IBM_Numeric_ibm_db and _IBM_DecFloat_ibm_db: C float(),
+             Decimals passed through, DECFLOAT through _DECFLOAT_CONTEXT
+
+    python bench/bench_numeric_fetch.py [rows]
+
+"""
+import os
+import sys
+import time
+from decimal import Decimal
+
+from sqlalchemy import select, util
+from sqlalchemy import Column, MetaData, Numeric, Table
+from sqlalchemy import types as sa_types
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ibm_db_sa  # noqa: F401,E402 registers the dialects
+from ibm_db_sa import DECFLOAT  # noqa: E402
+from ibm_db_sa.logger import logger  # noqa: E402
+from test.fake_dbapi import make_dbapi, make_engine  # noqa: E402
+
+ROWS = 1000000
+
+COLUMNS = (
+    [Column("amount%d" % i, Numeric(31, 8)) for i in range(4)]
+    + [Column("ratio%d" % i, Numeric(15, 6, asdecimal=False)) for i in range(3)]
+    + [Column("rate%d" % i, DECFLOAT(34)) for i in range(3)]
+)
+ROW = ((Decimal("123456.78901234"),) * 4 + (Decimal("0.125000"),) * 3
+       + ("1.000000000000000000000000000000001",) * 3)
+
+ledger = Table("ledger", MetaData(), *COLUMNS)
+
+
+class _Numeric_before(sa_types.Numeric):
+    """_IBM_Numeric_ibm_db as it was before supports_native_decimal."""
+
+    def result_processor(self, dialect, coltype):
+        def to_float(value):
+            logger.debug("Processing numeric result value: %s", value)
+            if value is None:
+                return None
+            else:
+                return float(value)
+        if self.asdecimal:
+            return None
+        return to_float
+
+
+class _DecFloat_generic(sa_types.Numeric):
+    """DECFLOAT strings converted with the default decimal context."""
+
+    def result_processor(self, dialect, coltype):
+        def process(value):
+            if value is None:
+                return None
+            return Decimal(value)
+        return process
+
+
+# colspecs and supports_native_decimal of each pipeline
+PIPELINES = [
+    ("before",
+     {sa_types.Numeric: _Numeric_before, DECFLOAT: _Numeric_before}, False),
+    ("generic",
+     {sa_types.Numeric: sa_types.Numeric, DECFLOAT: _DecFloat_generic}, False),
+    ("after", None, True),
+]
+
+
+def ledger_rows(connection, statement, parameters):
+    if statement.startswith("SELECT"):
+        return [column.name.upper() for column in COLUMNS], [ROW] * ROWS
+    return None
+
+
+def run(label, colspecs, native_decimal, cells):
+    engine = make_engine(make_dbapi(ledger_rows))
+    dialect = engine.dialect
+    if colspecs is not None:
+        dialect.colspecs = util.update_copy(dialect.colspecs, colspecs)
+    dialect.supports_native_decimal = native_decimal
+    with engine.connect() as conn:
+        start = time.perf_counter()
+        result = conn.execution_options(yield_per=10000).execute(select(ledger))
+        for partition in result.partitions():
+            pass
+        elapsed = time.perf_counter() - start
+    engine.dispose()
+    print("%-10s  %d cells in %.3f s -> %.1f M cells/s"
+          % (label + ":", cells, elapsed, cells / elapsed / 1e6))
+
+
+def main(rows=ROWS):
+    global ROWS
+    ROWS = rows
+    cells = ROWS * len(COLUMNS)
+
+    cursor = make_dbapi(ledger_rows).connect().cursor()
+    cursor.execute("SELECT")
+    start = time.perf_counter()
+    rows = cursor.fetchmany(10000)
+    while rows:
+        for row in rows:
+            pass
+        rows = cursor.fetchmany(10000)
+    elapsed = time.perf_counter() - start
+    print("raw cursor: %d cells in %.3f s -> %.1f M cells/s"
+          % (cells, elapsed, cells / elapsed / 1e6))
+
+    for label, colspecs, native_decimal in PIPELINES:
+        run(label, colspecs, native_decimal, cells)
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
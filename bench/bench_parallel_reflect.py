@@ -0,0 +1,78 @@
+"""Parallel reflection benchmark.
+
+Reflects columns, primary keys, foreign keys and indexes for a schema of
+many tables through test/fake_dbapi.py, answering catalog queries after
+a fixed latency on every execute(), once serially and once per
+``reflection_workers`` setting.  With catalog latency dominating, the
+elapsed time should drop close to linearly with the number of workers.
+
+    python bench/bench_parallel_reflect.py [tables] [latency_ms]
+
+"""
+import os
+import sys
+import time
+import logging
+
+from sqlalchemy import inspect
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ibm_db_sa  # noqa: F401,E402 registers the dialects
+from test.fake_dbapi import make_dbapi, make_engine  # noqa: E402
+
+LATENCY = 0.002
+TABLES = ["T%04d" % i for i in range(200)]
+COLUMNS = [
+    ("ID", "INTEGER", None, "N", 4, 0, "N", " ", None, 0),
+    ("NAME", "VARCHAR", None, "Y", 80, 0, "N", " ", None, 1208),
+    ("AMOUNT", "DECIMAL", None, "Y", 31, 8, "N", " ", None, 0),
+]
+
+
+def catalog_rows(connection, statement, parameters):
+    time.sleep(LATENCY)
+    if "SQLFOREIGNKEYS" in statement:
+        return []
+    if '"SYSCAT"."TABLES"' in statement and "TYPE" in statement:
+        return [(name,) for name in TABLES]
+    if '"SYSCAT"."COLUMNS"' in statement:
+        return COLUMNS
+    return []
+
+
+def run(workers):
+    engine = make_engine(
+        make_dbapi(catalog_rows),
+        reflection_workers=workers, pool_size=max(workers or 1, 5))
+    with engine.connect() as conn:
+        insp = inspect(conn)
+        start = time.perf_counter()
+        insp.get_multi_columns()
+        insp.get_multi_pk_constraint()
+        insp.get_multi_foreign_keys()
+        insp.get_multi_indexes()
+        elapsed = time.perf_counter() - start
+    engine.dispose()
+    return elapsed
+
+
+def main(tables=200, latency_ms=2.0):
+    global LATENCY
+    del TABLES[tables:]
+    TABLES.extend("T%04d" % i for i in range(len(TABLES), tables))
+    LATENCY = latency_ms / 1000.0
+    # the stub has no primary keys; keep the per-table warnings quiet
+    logging.getLogger("ibm_db_sa").setLevel(logging.ERROR)
+    serial = run(None)
+    print("%d tables, %.1f ms latency" % (tables, latency_ms))
+    print("serial:     %.3f s" % serial)
+    for workers in (2, 4, 8):
+        elapsed = run(workers)
+        print("workers=%d:  %.3f s  (%.1fx)"
+              % (workers, elapsed, serial / elapsed))
+
+
+if __name__ == "__main__":
+    main(*[int(sys.argv[1])] if len(sys.argv) > 1 else [],
+         **({"latency_ms": float(sys.argv[2])} if len(sys.argv) > 2 else {}))
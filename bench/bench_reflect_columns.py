@@ -0,0 +1,71 @@
+"""Reflection benchmark for a wide table.
+
+Runs DB2Reflector.get_columns() over a 500-column table whose catalog
+rows are served from memory, so the timing covers the per-column Python
+work (type resolution and logging) rather than a database round trip.
+Each run is repeated with ibm_db_sa logging off and with logging routed
+to a discarding handler.
+
+    python bench/bench_reflect_columns.py [iterations]
+
+"""
+import sys
+import time
+import logging
+
+import ibm_db_sa
+from ibm_db_sa import reflection
+from ibm_db_sa.logger import logger
+
+TYPES = [
+    ("INTEGER", 4, 0, 0), ("VARCHAR", 120, 0, 1208), ("DECIMAL", 31, 8, 0),
+    ("TIMESTAMP", 10, 6, 0), ("CHARACTER", 10, 0, 1208), ("DATE", 4, 0, 0),
+    ("BIGINT", 8, 0, 0), ("CLOB", 1048576, 0, 1208), ("DOUBLE", 8, 0, 0),
+]
+
+
+class FakeConnection(object):
+    """Answers every query with the same SYSCAT.COLUMNS rows."""
+
+    def __init__(self, ncols=500):
+        self.rows = [
+            ("COL%03d" % i, typename, None, "Y", length, scale,
+             "N", " ", None, codepage)
+            for i, (typename, length, scale, codepage) in (
+                (i, TYPES[i % len(TYPES)]) for i in range(ncols))
+        ]
+
+    def execute(self, query, parameters=None):
+        return iter(self.rows)
+
+
+def run(reflector, connection, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        reflector.get_columns(connection, "WIDE", schema="BENCH")
+    return time.perf_counter() - start
+
+
+def main(iterations=200):
+    reflector = reflection.DB2Reflector(ibm_db_sa.dialect())
+    connection = FakeConnection()
+    run(reflector, connection, 5)
+
+    elapsed = run(reflector, connection, iterations)
+    print("logging off: %d x get_columns(500 cols) in %.3f s -> %.2f ms/call"
+          % (iterations, elapsed, elapsed * 1000 / iterations))
+
+    handler = logging.NullHandler()
+    logger.addHandler(handler)
+    logger.setLevel(logging.DEBUG)
+    try:
+        elapsed = run(reflector, connection, iterations)
+    finally:
+        logger.removeHandler(handler)
+        logger.setLevel(logging.WARNING)
+    print("logging on:  %d x get_columns(500 cols) in %.3f s -> %.2f ms/call"
+          % (iterations, elapsed, elapsed * 1000 / iterations))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
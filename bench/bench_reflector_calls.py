@@ -0,0 +1,84 @@
+"""Reflector call-rate benchmark.
+
+Calls the per-table reflector methods through a real SQLAlchemy
+Connection backed by test/fake_dbapi.py, which answers instantly, so
+the measured time is the Python work of building, cache-keying and
+executing catalog queries and processing their rows.
+
+    python bench/bench_reflector_calls.py [iterations]
+
+"""
+import os
+import sys
+import time
+import logging
+
+from sqlalchemy import sql
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ibm_db_sa  # noqa: F401,E402 registers the dialects
+from test.fake_dbapi import make_dbapi, make_engine  # noqa: E402
+
+COLUMNS = [
+    ("ID", "INTEGER", None, "N", 4, 0, "N", " ", None, 0),
+    ("NAME", "VARCHAR", None, "Y", 80, 0, "N", " ", None, 1208),
+    ("AMOUNT", "DECIMAL", None, "Y", 31, 8, "N", " ", None, 0),
+    ("CREATED", "TIMESTAMP", None, "Y", 10, 6, "N", " ", None, 0),
+]
+
+METHODS = [
+    "get_columns", "get_pk_constraint", "get_foreign_keys",
+    "get_indexes", "get_unique_constraints", "get_table_comment",
+    "has_table",
+]
+
+
+def catalog_rows(connection, statement, parameters):
+    if '"SYSCAT"."COLUMNS"' in statement and "COLNO" in statement:
+        return COLUMNS
+    return []
+
+
+def main(iterations=2000):
+    logging.getLogger("ibm_db_sa").setLevel(logging.ERROR)
+    engine = make_engine(make_dbapi(catalog_rows))
+    with engine.connect() as conn:
+        reflector = engine.dialect._reflector
+        for name in METHODS:
+            method = getattr(reflector, name)
+            method(conn, "ORDERS", schema="BENCH")
+            start = time.perf_counter()
+            for _ in range(iterations):
+                method(conn, "ORDERS", schema="BENCH")
+            elapsed = time.perf_counter() - start
+            print("%-24s %8.0f calls/sec" % (name, iterations / elapsed))
+
+        # the same catalog query built per call, as the reflectors did
+        # before their queries became class-level templates
+        cols = reflector.sys_columns
+        start = time.perf_counter()
+        for _ in range(iterations):
+            query = (
+                sql.select(
+                    cols.c.colname, cols.c.typename, cols.c.defaultval,
+                    cols.c.nullable, cols.c.length, cols.c.scale,
+                    cols.c.identity, cols.c.generated, cols.c.remarks,
+                    cols.c.codepage)
+                .where(sql.and_(cols.c.tabschema == "BENCH",
+                                cols.c.tabname == "ORDERS"))
+                .order_by(cols.c.colno)
+            )
+            conn.execute(query).fetchall()
+        fresh = iterations / (time.perf_counter() - start)
+        start = time.perf_counter()
+        for _ in range(iterations):
+            conn.execute(reflector._columns_query,
+                         {"schema": "BENCH", "table": "ORDERS"}).fetchall()
+        template = iterations / (time.perf_counter() - start)
+        print("columns query, built per call: %8.0f executions/sec" % fresh)
+        print("columns query, template:       %8.0f executions/sec" % template)
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,143 @@
+"""Work queue benchmark for with_for_update(skip_locked=True).
+
+Concurrent consumers claim batches of pending jobs with
+``SELECT ... WITH RS USE AND KEEP UPDATE LOCKS [SKIP LOCKED DATA]``,
+"process" them while holding the row locks, mark them done and commit.
+test/fake_dbapi.py runs the statements against an in-memory job table
+that models Db2 row locking: a scan that reaches a row locked by another
+transaction waits until that transaction ends, unless the statement has
+SKIP LOCKED DATA, in which case the row is passed over.  Reports jobs/sec with and without SKIP LOCKED DATA.
+
+    python bench/bench_skip_locked.py [jobs] [workers]
+
+"""
+import os
+import re
+import sys
+import time
+import threading
+
+from sqlalchemy import bindparam, select, update
+from sqlalchemy import Column, Integer, MetaData, Table
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ibm_db_sa  # noqa: F401,E402 registers the dialects
+from test.fake_dbapi import make_dbapi, make_engine  # noqa: E402
+
+JOBS = 2000
+WORKERS = 16
+BATCH = 10
+WORK_SECONDS = 0.001  # per job, while its row stays locked
+
+jobs = Table("jobs", MetaData(), Column("id", Integer), Column("state", Integer))
+
+_LIMIT_RE = re.compile(r"LIMIT (\d+)|FETCH FIRST (\d+)")
+
+
+class JobTable(object):
+    """Job states plus row locks held until commit or rollback; execute()
+    is the fake DBAPI's statement handler, each connection a transaction."""
+
+    def __init__(self, count):
+        self.state = [0] * count
+        self.owner = [None] * count
+        # connection -> indexes of the rows it holds locks on
+        self.locks = {}
+        self.first_pending = 0
+        self.condition = threading.Condition()
+
+    def execute(self, connection, statement, parameters):
+        if statement.startswith("SELECT") and "FROM jobs" in statement:
+            match = _LIMIT_RE.search(statement)
+            limit = int(match.group(1) or match.group(2)) if match else 1 << 30
+            return ["ID"], self.claim(
+                connection, limit, "SKIP LOCKED DATA" in statement)
+        if statement.startswith("UPDATE jobs"):
+            # UPDATE jobs SET state=? WHERE jobs.id = ?
+            state, index = parameters
+            self.state[index] = state
+        elif statement in ("COMMIT", "ROLLBACK"):
+            self.finish(connection, statement == "COMMIT")
+        elif statement.startswith("SELECT"):
+            return []
+        return None
+
+    def claim(self, txn, limit, skip_locked):
+        claimed = []
+        with self.condition:
+            index = self.first_pending
+            while index < len(self.state) and len(claimed) < limit:
+                owner = self.owner[index]
+                if owner is not None and owner is not txn:
+                    if skip_locked:
+                        index += 1
+                        continue
+                    # lock wait; the row is evaluated again once released
+                    self.condition.wait()
+                    continue
+                if self.state[index] == 0:
+                    self.owner[index] = txn
+                    self.locks.setdefault(txn, []).append(index)
+                    claimed.append((index,))
+                index += 1
+        return claimed
+
+    def finish(self, txn, commit):
+        with self.condition:
+            for index in self.locks.pop(txn, ()):
+                if not commit:
+                    self.state[index] = 0
+                self.owner[index] = None
+            while (self.first_pending < len(self.state)
+                   and self.state[self.first_pending] == 1
+                   and self.owner[self.first_pending] is None):
+                self.first_pending += 1
+            self.condition.notify_all()
+
+
+def consume(engine, skip_locked, done):
+    claim = (select(jobs.c.id).where(jobs.c.state == 0).order_by(jobs.c.id)
+             .limit(BATCH).with_for_update(skip_locked=skip_locked))
+    finish = update(jobs).where(jobs.c.id == bindparam("job_id")).values(state=1)
+    with engine.connect() as conn:
+        while True:
+            ids = conn.execute(claim).scalars().all()
+            if not ids:
+                conn.rollback()
+                return
+            for job_id in ids:
+                time.sleep(WORK_SECONDS)
+                conn.execute(finish, {"job_id": job_id})
+            conn.commit()
+            done.append(len(ids))
+
+
+def run(label, skip_locked):
+    table = JobTable(JOBS)
+    engine = make_engine(make_dbapi(table.execute),
+                         pool_size=WORKERS, max_overflow=0)
+    done = []
+    threads = [threading.Thread(target=consume, args=(engine, skip_locked, done))
+               for _ in range(WORKERS)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    engine.dispose()
+    assert sum(done) == JOBS and all(table.state)
+    print("%-12s %d workers processed %d jobs in %.2f s, %7.0f jobs/s"
+          % (label, WORKERS, JOBS, elapsed, JOBS / elapsed))
+
+
+def main(jobs_count=JOBS, workers=WORKERS):
+    global JOBS, WORKERS
+    JOBS, WORKERS = jobs_count, workers
+    run("lock wait", skip_locked=False)
+    run("skip locked", skip_locked=True)
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:3]])
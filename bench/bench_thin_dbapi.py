@@ -0,0 +1,137 @@
+"""Thin DBAPI adapter benchmark.
+
+Fetches a result set of canned tuples from an in-script fake ``ibm_db``
+module, once through ibm_db_dbi and once through ``ibm_db_sa.thin``
+(``?ibmdbsa_dbapi=thin``), both from a raw DBAPI cursor and through a
+SQLAlchemy Core select, and reports rows/sec.  Since the fake does no
+I/O the numbers are the Python overhead of each adapter.  ibm_db_dbi is
+pure Python and ships with the ibm_db package; if it cannot be imported
+only the thin adapter is measured.
+
+    python bench/bench_thin_dbapi.py [rows]
+
+"""
+import sys
+import time
+import types
+
+from sqlalchemy import create_engine, select
+from sqlalchemy import Column, Integer, MetaData, Numeric, String, Table, Float
+
+ROWS = 1000000
+
+orders = Table("orders", MetaData(),
+               Column("id", Integer), Column("status", String(10)),
+               Column("amount", Numeric(12, 2)), Column("weight", Float))
+
+COLUMNS = [("ID", "int"), ("STATUS", "string"), ("AMOUNT", "decimal"),
+           ("WEIGHT", "double")]
+CANNED = [(i, "SHIPPED", "%d.25" % (i % 1000), i * 0.5) for i in range(1000)]
+
+
+class Statement(object):
+    def __init__(self, sql):
+        self.sql = sql
+        self.columns = COLUMNS if "ORDERS" in sql.upper() else []
+        self.rows = []
+        self.position = 0
+
+
+def _execute(stmt, params=None):
+    if stmt.columns:
+        stmt.rows = (CANNED * (ROWS // len(CANNED) + 1))[:ROWS]
+    stmt.position = 0
+    return True
+
+
+def _fetch_tuple(stmt):
+    position = stmt.position
+    if position < len(stmt.rows):
+        stmt.position = position + 1
+        return stmt.rows[position]
+    return False
+
+
+def _fetchmany(stmt, size):
+    rows = stmt.rows[stmt.position:stmt.position + size]
+    stmt.position += len(rows)
+    return rows
+
+
+def _fetchone(stmt):
+    row = _fetch_tuple(stmt)
+    return None if row is False else row
+
+
+def make_ibm_db():
+    module = types.ModuleType("ibm_db")
+    module.__version__ = "3.3.0"
+    constants = {"SQL_DBMS_NAME": 17, "SQL_DBMS_VER": 18,
+                 "SQL_ATTR_CURRENT_SCHEMA": 1254, "SQL_ATTR_TXN_ISOLATION": 108,
+                 "SQL_ATTR_AUTOCOMMIT": 102, "SQL_AUTOCOMMIT_OFF": 0,
+                 "SQL_AUTOCOMMIT_ON": 1}
+    vars(module).update(constants)
+    # every other constant ibm_db_dbi reads at import time
+    module.__getattr__ = lambda name: 0
+    db_info = {17: "DB2/LINUX", 18: "11.05.0900"}
+    module.connect = module.pconnect = lambda *args: object()
+    module.get_db_info = lambda conn, key: db_info[key]
+    module.get_option = lambda handle, attr, kind=1: (
+        "BENCH" if attr == 1254 else 2 if attr == 108 else 0)
+    module.set_option = lambda handle, attrs, kind=1: True
+    module.autocommit = lambda conn, value=None: 0
+    module.commit = module.rollback = module.close = lambda conn: True
+    module.prepare = lambda conn, sql, options=None: Statement(sql)
+    module.execute = _execute
+    module.execute_many = lambda stmt, params: len(params)
+    module.free_stmt = module.free_result = lambda stmt: True
+    module.num_fields = lambda stmt: len(stmt.columns) or False
+    module.num_rows = lambda stmt: 0 if stmt.columns else 1
+    module.field_name = lambda stmt, index: stmt.columns[index][0]
+    module.field_type = lambda stmt, index: stmt.columns[index][1]
+    for name in ("field_display_size", "field_precision", "field_scale",
+                 "field_nullable"):
+        setattr(module, name, lambda stmt, index: 0)
+    module.fetch_tuple = _fetch_tuple
+    module.fetchone = _fetchone
+    module.fetchmany = _fetchmany
+    module.fetchall = lambda stmt: _fetchmany(stmt, len(stmt.rows))
+    module.stmt_errormsg = module.conn_errormsg = lambda *args: ""
+    return module
+
+
+def run(label, url):
+    engine = create_engine(url)
+    with engine.connect() as conn:
+        cursor = conn.connection.cursor()
+        start = time.perf_counter()
+        cursor.execute("SELECT ID, STATUS, AMOUNT, WEIGHT FROM ORDERS")
+        fetched = len(cursor.fetchall())
+        raw = time.perf_counter() - start
+        cursor.close()
+        start = time.perf_counter()
+        count = len(conn.execute(select(orders)).all())
+        core = time.perf_counter() - start
+    engine.dispose()
+    assert fetched == count == ROWS
+    print("%-10s cursor.fetchall %9.0f rows/s, Core select %9.0f rows/s"
+          % (label, ROWS / raw, ROWS / core))
+
+
+def main(rows=ROWS):
+    global ROWS
+    ROWS = rows
+    sys.modules["ibm_db"] = make_ibm_db()
+    import ibm_db_sa  # noqa: F401 registers the dialects
+    url = "db2+ibm_db://user:pass@host:50000/bench"
+    try:
+        import ibm_db_dbi  # noqa: F401 runs on top of the fake ibm_db
+    except ImportError:
+        print("ibm_db_dbi is not installed; measuring the thin adapter only")
+    else:
+        run("ibm_db_dbi", url)
+    run("thin", url + "?ibmdbsa_dbapi=thin")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
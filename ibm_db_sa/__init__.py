@@ -27,10 +27,12 @@ base.dialect = ibm_db.dialect
 
 from .base import \
     BIGINT, BLOB, CHAR, CLOB, DATE, DATETIME, \
-    DECIMAL, DOUBLE, DECIMAL,\
+    DBCLOB, DECFLOAT, DECIMAL, DOUBLE, DECIMAL,\
     GRAPHIC, INTEGER, INTEGER, LONGVARCHAR, \
     NUMERIC, SMALLINT, REAL, TIME, TIMESTAMP, \
-    VARCHAR, VARGRAPHIC, dialect
+    VARCHAR, VARGRAPHIC, XML, dialect
+
+from .bulk import bulk_load, BulkLoadResult
 
 #__all__ = (
     # TODO: (put types here)
@@ -22,6 +22,8 @@
 import sys
 import sqlalchemy
 import datetime, re
+from time import perf_counter_ns
+from concurrent.futures import ThreadPoolExecutor
 from sqlalchemy import types as sa_types
 from sqlalchemy import schema as sa_schema
 from sqlalchemy import util
@@ -29,12 +31,18 @@ from sqlalchemy import exc
 from sqlalchemy.sql.elements import BindParameter
 from sqlalchemy.sql import compiler
 from sqlalchemy.sql import operators
+from sqlalchemy.sql import visitors
+from sqlalchemy.sql import elements
 from sqlalchemy.engine import default
 from sqlalchemy import event
 from sqlalchemy.engine import Engine
 from .logger import logger, log_entry_exit
+from .metrics import CompileCacheStats, StatementMetrics
 from sqlalchemy import __version__ as SA_VERSION_STR
 from . import reflection as ibm_reflection
+from .snapshot import SchemaSnapshot, load_snapshot
+from .dependencies import ForeignKeyGraph
+from .sequences import SequenceBlockAllocator
 
 m = re.match(r"^\s*(\d+)\.(\d+)", SA_VERSION_STR)
 SA_VERSION_MM = (int(m.group(1)), int(m.group(2))) if m else (0, 0)
@@ -99,7 +107,6 @@ FLOAT = Float
 DATE = Date
 TIME = Time
 DATETIME = DateTime
-TIMESTAMP = DateTime
 
 # as documented from:
 # http://publib.boulder.ibm.com/infocenter/db2luw/v9/index.jsp?topic=/com.ibm.db2.udb.doc/admin/r0001095.htm
@@ -186,15 +193,12 @@ class _IBM_Boolean(sa_types.Boolean):
         return process
 
     def bind_processor(self, dialect):
-        def process(value):
-            if value is None:
-                return None
-            elif bool(value):
-                return '1'
-            else:
-                return '0'
-
-        return process
+        if dialect.supports_native_boolean:
+            # native BOOLEAN binds Python bools as they are
+            return None
+        # SMALLINT columns get the integers 1/0; Boolean's processor also
+        # rejects values other than True, False, 1, 0 and None
+        return super(_IBM_Boolean, self).bind_processor(dialect)
 
 
 class _IBM_Date(sa_types.Date):
@@ -220,6 +224,28 @@ class _IBM_Date(sa_types.Date):
         return process
 
 
+class _IBM_NativeDate(_IBM_Date):
+    """Date for drivers that bind ``datetime.date`` as a DATE parameter and
+    return DATE columns as ``datetime.date``: no string conversion on the
+    way in and no result processor on the way out."""
+
+    def result_processor(self, dialect, coltype):
+        return None
+
+    def bind_processor(self, dialect):
+        date_cls = datetime.date
+
+        def process(value):
+            # a datetime would be bound as a TIMESTAMP
+            if value is None or value.__class__ is date_cls:
+                return value
+            if isinstance(value, datetime.datetime):
+                return date_cls(value.year, value.month, value.day)
+            return value
+
+        return process
+
+
 class BOOLEAN(sa_types.Boolean):
     __visit_name__ = 'BOOLEAN'
 
@@ -229,7 +255,7 @@ class DOUBLE(sa_types.Numeric):
 
 
 class LONGVARCHAR(sa_types.VARCHAR):
-    __visit_name_ = 'LONGVARCHAR'
+    __visit_name__ = 'LONGVARCHAR'
 
 
 class DBCLOB(sa_types.CLOB):
@@ -252,6 +278,18 @@ class XML(sa_types.Text):
     __visit_name__ = "XML"
 
 
+class TIMESTAMP(sa_types.TIMESTAMP):
+    __visit_name__ = "TIMESTAMP"
+
+    def __init__(self, timezone=False, precision=None):
+        super(TIMESTAMP, self).__init__(timezone=timezone)
+        self.precision = precision
+
+
+class DECFLOAT(sa_types.Numeric):
+    __visit_name__ = "DECFLOAT"
+
+
 colspecs = {
     sa_types.Boolean: _IBM_Boolean,
     sa_types.Date: _IBM_Date
@@ -261,6 +299,7 @@ colspecs = {
 
 ischema_names = {
     'BOOLEAN': BOOLEAN,
+    'BINARY': BINARY,
     'BLOB': BLOB,
     'CHAR': CHAR,
     'CHARACTER': CHAR,
@@ -271,6 +310,7 @@ ischema_names = {
     'SMALLINT': SMALLINT,
     'BIGINT': BIGINT,
     'DECIMAL': DECIMAL,
+    'DECFLOAT': DECFLOAT,
     'NUMERIC': NUMERIC,
     'REAL': REAL,
     'DOUBLE': DOUBLE,
@@ -279,6 +319,7 @@ ischema_names = {
     'TIMESTAMP': TIMESTAMP,
     'TIMESTMP': TIMESTAMP,
     'VARCHAR': VARCHAR,
+    'VARBINARY': VARBINARY,
     'LONGVARCHAR': LONGVARCHAR,
     'XML': XML,
     'GRAPHIC': GRAPHIC,
@@ -291,20 +332,21 @@ ischema_names = {
 class DB2TypeCompiler(compiler.GenericTypeCompiler):
    @log_entry_exit
    def visit_TIMESTAMP(self, type_, **kw):
-       sql = "TIMESTAMP"
-       logger.debug(f"Type rendering -> TIMESTAMP -> {sql}")
+       precision = getattr(type_, "precision", None)
+       sql = "TIMESTAMP" if precision is None else f"TIMESTAMP({precision})"
+       logger.debug("Type rendering -> TIMESTAMP -> precision=%s, sql=%s", precision, sql)
        return sql
 
    @log_entry_exit
    def visit_DATE(self, type_, **kw):
        sql = "DATE"
-       logger.debug(f"Type rendering -> DATE -> {sql}")
+       logger.debug("Type rendering -> DATE -> %s", sql)
        return sql
 
    @log_entry_exit
    def visit_TIME(self, type_, **kw):
        sql = "TIME"
-       logger.debug(f"Type rendering -> TIME -> {sql}")
+       logger.debug("Type rendering -> TIME -> %s", sql)
        return sql
 
    def visit_DATETIME(self, type_, **kw):
@@ -313,22 +355,22 @@ class DB2TypeCompiler(compiler.GenericTypeCompiler):
 
    def visit_SMALLINT(self, type_, **kw):
        sql = "SMALLINT"
-       logger.debug(f"Type rendering -> SMALLINT -> {sql}")
+       logger.debug("Type rendering -> SMALLINT -> %s", sql)
        return sql
 
    def visit_BOOLEAN(self, type_, **kw):
        sql = "BOOLEAN"
-       logger.debug(f"Type rendering -> BOOLEAN -> {sql}")
+       logger.debug("Type rendering -> BOOLEAN -> %s", sql)
        return sql
 
    def visit_INT(self, type_, **kw):
        sql = "INT"
-       logger.debug(f"Type rendering -> INT -> {sql}")
+       logger.debug("Type rendering -> INT -> %s", sql)
        return sql
 
    def visit_BIGINT(self, type_, **kw):
        sql = "BIGINT"
-       logger.debug(f"Type rendering -> BIGINT -> {sql}")
+       logger.debug("Type rendering -> BIGINT -> %s", sql)
        return sql
 
    def visit_FLOAT(self, type_, **kw):
@@ -337,68 +379,74 @@ class DB2TypeCompiler(compiler.GenericTypeCompiler):
            sql = "FLOAT"
        else:
            sql = f"FLOAT({precision})"
-       logger.debug(f"Type rendering -> FLOAT -> precision={precision}, sql={sql}")
+       logger.debug("Type rendering -> FLOAT -> precision=%s, sql=%s", precision, sql)
+       return sql
+
+   def visit_DECFLOAT(self, type_, **kw):
+       precision = type_.precision
+       sql = "DECFLOAT" if precision is None else f"DECFLOAT({precision})"
+       logger.debug("Type rendering -> DECFLOAT -> precision=%s, sql=%s", precision, sql)
        return sql
 
    def visit_DOUBLE(self, type_, **kw):
        sql = "DOUBLE"
-       logger.debug(f"Type rendering -> DOUBLE -> {sql}")
+       logger.debug("Type rendering -> DOUBLE -> %s", sql)
        return sql
 
    def visit_XML(self, type_, **kw):
        sql = "XML"
-       logger.debug(f"Type rendering -> XML -> {sql}")
+       logger.debug("Type rendering -> XML -> %s", sql)
        return sql
 
    def visit_CLOB(self, type_, **kw):
        sql = "CLOB"
-       logger.debug(f"Type rendering -> CLOB -> {sql}")
+       logger.debug("Type rendering -> CLOB -> %s", sql)
        return sql
 
    def visit_BLOB(self, type_, **kw):
        length = type_.length
        sql = "BLOB(1M)" if length in (None, 0) else f"BLOB({length})"
-       logger.debug(f"Type rendering -> BLOB -> length={length}, sql={sql}")
+       logger.debug("Type rendering -> BLOB -> length=%s, sql=%s", length, sql)
        return sql
 
    def visit_DBCLOB(self, type_, **kw):
        length = type_.length
        sql = "DBCLOB(1M)" if length in (None, 0) else f"DBCLOB({length})"
-       logger.debug(f"Type rendering -> DBCLOB -> length={length}, sql={sql}")
+       logger.debug("Type rendering -> DBCLOB -> length=%s, sql=%s", length, sql)
        return sql
 
    def visit_VARCHAR(self, type_, **kw):
        length = type_.length
        sql = f"VARCHAR({length})"
-       logger.debug(f"Type rendering -> VARCHAR -> length={length}, sql={sql}")
+       logger.debug("Type rendering -> VARCHAR -> length=%s, sql=%s", length, sql)
        return sql
 
    def visit_LONGVARCHAR(self, type_, **kw):
        sql = "LONG VARCHAR"
-       logger.debug(f"Type rendering -> LONG VARCHAR -> {sql}")
+       logger.debug("Type rendering -> LONG VARCHAR -> %s", sql)
        return sql
 
    def visit_VARGRAPHIC(self, type_, **kw):
        length = type_.length
        sql = f"VARGRAPHIC({length})"
-       logger.debug(f"Type rendering -> VARGRAPHIC -> length={length}, sql={sql}")
+       logger.debug("Type rendering -> VARGRAPHIC -> length=%s, sql=%s", length, sql)
        return sql
 
    def visit_LONGVARGRAPHIC(self, type_, **kw):
        sql = "LONG VARGRAPHIC"
-       logger.debug(f"Type rendering -> LONG VARGRAPHIC -> {sql}")
+       logger.debug("Type rendering -> LONG VARGRAPHIC -> %s", sql)
        return sql
 
    def visit_CHAR(self, type_, **kw):
        length = type_.length
        sql = "CHAR" if length in (None, 0) else f"CHAR({length})"
-       logger.debug(f"Type rendering -> CHAR -> length={length}, sql={sql}")
+       logger.debug("Type rendering -> CHAR -> length=%s, sql=%s", length, sql)
        return sql
 
    def visit_GRAPHIC(self, type_, **kw):
        length = type_.length
        sql = "GRAPHIC" if length in (None, 0) else f"GRAPHIC({length})"
-       logger.debug(f"Type rendering -> GRAPHIC -> length={length}, sql={sql}")
+       logger.debug("Type rendering -> GRAPHIC -> length=%s, sql=%s", length, sql)
        return sql
 
    @log_entry_exit
@@ -412,8 +460,9 @@ class DB2TypeCompiler(compiler.GenericTypeCompiler):
        else:
            sql = f"DECIMAL({precision}, {scale})"
        logger.debug(
-           f"Type rendering -> DECIMAL -> "
-           f"precision={precision}, scale={scale}, sql={sql}"
+           "Type rendering -> DECIMAL -> "
+           "precision=%s, scale=%s, sql=%s",
+           precision, scale, sql
        )
        return sql
 
@@ -453,8 +502,9 @@ class DB2TypeCompiler(compiler.GenericTypeCompiler):
        else:
            sql = base_sql
        logger.debug(
-           f"Type rendering -> UNICODE -> "
-           f"serverType={check_server}, sql={sql}"
+           "Type rendering -> UNICODE -> "
+           "serverType=%s, sql=%s",
+           check_server, sql
        )
        return sql
 
@@ -475,7 +525,124 @@ class DB2TypeCompiler(compiler.GenericTypeCompiler):
        return self.visit_BLOB(type_, **kw)
 
 
+# used by DB2Compiler.visit_select for the bare OFFSET rewrite
+_TRAILING_OFFSET_RE = re.compile(
+    r"\s+OFFSET\s+(?:\d+|__\[POSTCOMPILE_[^\]]+\]|:[A-Za-z0-9_]+|\?)\s*$",
+    re.IGNORECASE,
+)
+_SELECT_FROM_RE = re.compile(r"[\s+]FROM ")
+
+
 class DB2Compiler(compiler.SQLCompiler):
+
+    def __init__(self, dialect, statement, *args, **kw):
+        # reasons this compiled form can't be reused; filled in while
+        # the statement compiles, only when compile_stats is enabled
+        self._uncacheable_reasons = []
+        metrics = getattr(dialect, "statement_metrics", None)
+        if metrics is None:
+            super(DB2Compiler, self).__init__(dialect, statement, *args, **kw)
+        else:
+            start = perf_counter_ns()
+            super(DB2Compiler, self).__init__(dialect, statement, *args, **kw)
+            metrics.observe("compile", self.string or "", perf_counter_ns() - start)
+        stats = getattr(dialect, "compile_stats", None)
+        if stats is not None and self.string:
+            stats.record_compile(self.string, self._uncacheable_reasons)
+
+    def _note_uncacheable(self, reason):
+        if getattr(self.dialect, "compile_stats", None) is not None:
+            self._uncacheable_reasons.append(reason)
+
+    def _chunkable_in(self, binary, operator, text):
+        # remember the left side of "left IN (__[POSTCOMPILE_x])" so that a
+        # long list can be split into "left IN (...) OR left IN (...)"
+        right = binary.right
+        if not (getattr(right, "expanding", False) and self.dialect.in_list_chunk_size):
+            return
+        token = "%s(__[POSTCOMPILE_" % compiler.OPERATORS[operator]
+        if token not in text or "~~" in text or any(
+                isinstance(element, BindParameter)
+                for element in visitors.iterate(binary.left)):
+            return
+        chunk_left = getattr(self, "_in_chunk_left", None)
+        if chunk_left is None:
+            chunk_left = self._in_chunk_left = {}
+        left = text[1:text.rindex(token)]
+        # the same parameter in two IN predicates can't be split safely
+        chunk_left[right] = None if right in chunk_left else (left, operator)
+
+    def _boolean_constant(self, binary):
+        # IS TRUE / IS FALSE need native BOOLEAN; None otherwise
+        if self.dialect.supports_native_boolean:
+            return None
+        if isinstance(binary.right, elements.True_):
+            return 1
+        if isinstance(binary.right, elements.False_):
+            return 0
+        return None
+
+    def visit_is__binary(self, binary, operator, **kw):
+        constant = self._boolean_constant(binary)
+        if constant is None:
+            return self._generate_generic_binary(binary, compiler.OPERATORS[operator], **kw)
+        # "flag = 1" rather than "flag IS 1", which SMALLINT can't do
+        return "%s = %d" % (self.process(binary.left, **kw), constant)
+
+    def visit_is_not_binary(self, binary, operator, **kw):
+        constant = self._boolean_constant(binary)
+        if constant is None:
+            return self._generate_generic_binary(binary, compiler.OPERATORS[operator], **kw)
+        # IS NOT TRUE/FALSE also holds for NULL
+        return "COALESCE(%s, %d) <> %d" % (
+            self.process(binary.left, **kw), 1 - constant, constant)
+
+    def visit_in_op_binary(self, binary, operator, **kw):
+        text = self._generate_generic_binary(binary, compiler.OPERATORS[operator], **kw)
+        if getattr(binary.right, "expanding", False) and self.dialect.in_list_chunk_size:
+            # parenthesized like NOT IN, so the OR of the chunks stays together
+            text = "(%s)" % text
+            self._chunkable_in(binary, operator, text)
+        return text
+
+    def visit_not_in_op_binary(self, binary, operator, **kw):
+        text = super(DB2Compiler, self).visit_not_in_op_binary(binary, operator, **kw)
+        self._chunkable_in(binary, operator, text)
+        return text
+
+    def _literal_execute_expanding_parameter(self, name, parameter, values):
+        dialect = self.dialect
+        chunk_size = dialect.in_list_chunk_size
+        if parameter.literal_execute or not values or not (
+                dialect.in_list_padding or chunk_size):
+            return super(DB2Compiler, self)._literal_execute_expanding_parameter(
+                name, parameter, values)
+        chunk = (getattr(self, "_in_chunk_left", None) or {}).get(parameter)
+        count = len(values)
+        if chunk and count > chunk_size:
+            size = -(-count // chunk_size) * chunk_size
+        elif dialect.in_list_padding:
+            size = 8
+            while size < count:
+                size *= 2
+            if chunk_size and size > chunk_size >= count:
+                size = chunk_size
+        else:
+            size = count
+        if size > count:
+            # repeating the last value leaves IN and NOT IN results unchanged
+            values = list(values) + [values[-1]] * (size - count)
+        to_update, replacement = super(DB2Compiler, self)._literal_execute_expanding_parameter(
+            name, parameter, values)
+        if chunk and size > chunk_size and not replacement.startswith("VALUES "):
+            left, operator = chunk
+            joiner = ") OR %s IN (" if operator is operators.in_op else ") AND %s NOT IN ("
+            markers = replacement.split(", ")
+            width = len(markers) // len(values) * chunk_size
+            replacement = (joiner % left).join(
+                ", ".join(markers[i:i + width]) for i in range(0, len(markers), width))
+        return to_update, replacement
+
     if SA_VERSION_MM < (0, 9):
         @log_entry_exit
         def visit_false(self, expr, **kw):
@@ -489,7 +656,7 @@ class DB2Compiler(compiler.SQLCompiler):
 
     @log_entry_exit
     def get_cte_preamble(self, recursive):
-        logger.debug(f"Generating CTE preamble -> recursive={recursive}")
+        logger.debug("Generating CTE preamble -> recursive=%s", recursive)
         return "WITH"
 
     @log_entry_exit
@@ -497,17 +664,44 @@ class DB2Compiler(compiler.SQLCompiler):
         logger.debug("Rendering NOW function as CURRENT_TIMESTAMP")
         return "CURRENT_TIMESTAMP"
 
+    # set when a with_for_update(nowait=True) select compiles; the dialect
+    # then executes it with CURRENT LOCK TIMEOUT set to NOT WAIT.  That costs
+    # three extra statements per execution: reading the register, setting
+    # NOT WAIT before the select and putting the old value back after it
+    lock_nowait = False
+
     @log_entry_exit
     def for_update_clause(self, select, **kw):
-        for_update = select.for_update
-        logger.debug(f"Processing FOR UPDATE clause -> value={for_update}")
-        if for_update is True:
-            clause = " WITH RS USE AND KEEP UPDATE LOCKS"
-        elif for_update == "read":
-            clause = " WITH RS USE AND KEEP SHARE LOCKS"
+        for_update = getattr(select, "_for_update_arg", None)
+        logger.debug("Processing FOR UPDATE clause -> value=%s", for_update)
+        if for_update is None:
+            return ""
+        clause = ""
+        if for_update.of and not for_update.read:
+            # FOR UPDATE OF takes column names; a table stands for all of
+            # its columns.  A read lock has no columns to update, so ``of``
+            # is not rendered with read=True
+            names = []
+            for element in for_update.of:
+                for column in (element.c if hasattr(element, "c") else [element]):
+                    name = self.preparer.format_column(column)
+                    if name not in names:
+                        names.append(name)
+            clause += " FOR UPDATE OF " + ", ".join(names)
+        if for_update.read:
+            clause += " WITH RS USE AND KEEP SHARE LOCKS"
         else:
-            clause = ""
-        logger.debug(f"Generated FOR UPDATE clause -> {clause}")
+            clause += " WITH RS USE AND KEEP UPDATE LOCKS"
+        if for_update.skip_locked:
+            clause += " SKIP LOCKED DATA"
+        if for_update.nowait:
+            dbms_name = self.dialect.dbms_name
+            if dbms_name and not dbms_name.startswith("DB2/"):
+                raise exc.CompileError(
+                    "with_for_update(nowait=True) needs SET CURRENT LOCK "
+                    "TIMEOUT, which only Db2 for LUW has; server is %s" % dbms_name)
+            self.lock_nowait = True
+        logger.debug("Generated FOR UPDATE clause -> %s", clause)
         return clause
 
     @log_entry_exit
@@ -518,7 +712,8 @@ class DB2Compiler(compiler.SQLCompiler):
         right = self.process(right_expr)
         sql = f"mod({left}, {right})"
         logger.debug(
-            f"Rendering MOD binary -> left={left}, right={right}, sql={sql}"
+            "Rendering MOD binary -> left=%s, right=%s, sql=%s",
+            left, right, sql
         )
         return sql
 
@@ -546,10 +741,11 @@ class DB2Compiler(compiler.SQLCompiler):
         offset_clause = select._offset_clause
         literal_binds = self.literalBindsFlagFrom_kw(kw)
         logger.debug(
-            f"Processing LIMIT/OFFSET -> "
-            f"limit={limit_clause}, "
-            f"offset={offset_clause}, "
-            f"literal_binds={literal_binds}"
+            "Processing LIMIT/OFFSET -> "
+            "limit=%s, "
+            "offset=%s, "
+            "literal_binds=%s",
+            limit_clause, offset_clause, literal_binds
         )
 
         def _render_clause(clause):
@@ -563,6 +759,7 @@ class DB2Compiler(compiler.SQLCompiler):
                         return self.process(clause.render_literal_execute(), **kw)
                     except Exception:
                         pass
+                self._note_uncacheable("limit_clause literal rendering")
                 try:
                     return self.process(clause, literal_binds=True, **kw)
                 except Exception:
@@ -589,125 +786,91 @@ class DB2Compiler(compiler.SQLCompiler):
         limit_text = _render_clause(limit_clause)
         if limit_text is not None:
             text += f" LIMIT {limit_text}"
-            logger.debug(f"Applied LIMIT -> {limit_text}")
+            logger.debug("Applied LIMIT -> %s", limit_text)
         offset_text = _render_clause(offset_clause)
         if offset_text is not None:
             text += f" OFFSET {offset_text}"
-            logger.debug(f"Applied OFFSET -> {offset_text}")
-        logger.debug(f"Generated LIMIT/OFFSET clause -> {text}")
+            logger.debug("Applied OFFSET -> %s", offset_text)
+        logger.debug("Generated LIMIT/OFFSET clause -> %s", text)
         return text
 
     @log_entry_exit
     def visit_select(self, select, **kw):
         try:
             sql_ori = compiler.SQLCompiler.visit_select(self, select, **kw)
-            sql_upper = sql_ori.upper()
             logger.debug("Processing SELECT compilation.")
-            if ("LIMIT" in sql_upper) or ("FETCH FIRST" in sql_upper):
-                logger.debug("LIMIT/FETCH already present. Returning original SQL.")
-                logger.debug(f"Final SELECT SQL -> {sql_ori}")
-                return sql_ori
+            # The base compiler already appended limit_clause() or
+            # fetch_clause() output; only a bare OFFSET needs the
+            # ROW_NUMBER() rewrite.  Decide from the statement structure so
+            # nested subqueries and CTE members never rescan the SQL text.
             limit_clause_obj = select._limit_clause
             offset_clause_obj = select._offset_clause
-            logger.debug(
-                f"SELECT limit/offset detection -> "
-                f"limit={limit_clause_obj}, offset={offset_clause_obj}"
-            )
-            if limit_clause_obj is not None:
-                limit_offset_clause = self.limit_clause(select, **kw)
-                if limit_offset_clause:
-                    final_sql = sql_ori + limit_offset_clause
-                    logger.debug("Applying simple LIMIT/OFFSET clause.")
-                    logger.debug(f"Final SELECT SQL -> {final_sql}")
-                    return final_sql
-            if offset_clause_obj is not None:
-                logger.debug("Applying DB2 ROW_NUMBER based OFFSET rewrite.")
-                __rownum = "Z.__ROWNUM"
-                sql_work = re.sub(
-                    r"FETCH FIRST \d+ ROWS ONLY",
-                    "",
-                    sql_ori,
-                    flags=re.IGNORECASE,
-                ).strip()
-                sql_work = re.sub(
-                    r"\s+OFFSET\s+(?:\d+|__\[POSTCOMPILE_[^\]]+\]|:[A-Za-z0-9_]+|\?)\s*$",
-                    "",
-                    sql_work,
-                    flags=re.IGNORECASE,
-                )
-                sql_split = re.split(r"[\s+]FROM ", sql_work, 1)
-                if len(sql_split) < 2:
-                    logger.debug("Unable to split SELECT for OFFSET rewrite.")
-                    logger.debug(f"Final SELECT SQL -> {sql_ori}")
-                    return sql_ori
-                sql_sec = f" \nFROM {sql_split[1]} "
-                dummyVal = "Z.__db2_"
-                sql_pri = ""
-                sql_sel = "SELECT DISTINCT " if select._distinct else "SELECT "
-                sql_select_token = sql_split[0].split(",")
-                i = 0
-                while i < len(sql_select_token):
-                    token = sql_select_token[i]
-                    if token.count("TIMESTAMP(DATE(SUBSTR(CHAR(") == 1:
-                        sql_sel = f'{sql_sel} "{dummyVal}{i + 1}",'
-                        sql_pri = (
-                            f'{sql_pri} {sql_select_token[i]},'
-                            f'{sql_select_token[i + 1]},'
-                            f'{sql_select_token[i + 2]},'
-                            f'{sql_select_token[i + 3]} AS "{dummyVal}{i + 1}",'
-                        )
-                        i += 4
-                        continue
-                    if token.count(" AS ") == 1:
-                        temp_col_alias = token.split(" AS ")
-                        sql_pri = f"{sql_pri} {token},"
-                        sql_sel = f"{sql_sel} {temp_col_alias[1]},"
-                        i += 1
-                        continue
-                    sql_pri = f'{sql_pri} {token} AS "{dummyVal}{i + 1}",'
+            fetch_clause_obj = getattr(select, "_fetch_clause", None)
+            if (
+                offset_clause_obj is None
+                or limit_clause_obj is not None
+                or fetch_clause_obj is not None
+            ):
+                return sql_ori
+            logger.debug("Applying DB2 ROW_NUMBER based OFFSET rewrite.")
+            __rownum = "Z.__ROWNUM"
+            sql_work = _TRAILING_OFFSET_RE.sub("", sql_ori.strip())
+            sql_split = _SELECT_FROM_RE.split(sql_work, 1)
+            if len(sql_split) < 2:
+                logger.debug("Unable to split SELECT for OFFSET rewrite.")
+                return sql_ori
+            sql_sec = f" \nFROM {sql_split[1]} "
+            dummyVal = "Z.__db2_"
+            sql_pri = ""
+            sql_sel = "SELECT DISTINCT " if select._distinct else "SELECT "
+            sql_select_token = sql_split[0].split(",")
+            i = 0
+            while i < len(sql_select_token):
+                token = sql_select_token[i]
+                if token.count("TIMESTAMP(DATE(SUBSTR(CHAR(") == 1:
                     sql_sel = f'{sql_sel} "{dummyVal}{i + 1}",'
+                    sql_pri = (
+                        f'{sql_pri} {sql_select_token[i]},'
+                        f'{sql_select_token[i + 1]},'
+                        f'{sql_select_token[i + 2]},'
+                        f'{sql_select_token[i + 3]} AS "{dummyVal}{i + 1}",'
+                    )
+                    i += 4
+                    continue
+                if token.count(" AS ") == 1:
+                    temp_col_alias = token.split(" AS ")
+                    sql_pri = f"{sql_pri} {token},"
+                    sql_sel = f"{sql_sel} {temp_col_alias[1]},"
                     i += 1
-                sql_pri = sql_pri.rstrip(",")
-                sql_pri = f"{sql_pri}{sql_sec}"
-                sql_sel = sql_sel.rstrip(",")
-                sql = (
-                    f'{sql_sel}, ( ROW_NUMBER() OVER() ) AS "{__rownum}" '
-                    f"FROM ( {sql_pri} ) AS M"
-                )
-                sql = f'{sql_sel} FROM ( {sql} ) Z WHERE'
-
-                def _process_clause_text(clause):
-                    if clause is None:
-                        return None
-                    if select._simple_int_clause(clause):
-                        return self.process(
-                            clause.render_literal_execute(), **kw
-                        )
-                    return self.process(clause, **kw)
-
-                offset_text = _process_clause_text(offset_clause_obj)
-                limit_text = _process_clause_text(limit_clause_obj)
-                if offset_text is not None:
-                    sql = f'{sql} "{__rownum}" > {offset_text}'
-                if offset_text is not None and limit_text is not None:
-                    sql = f"{sql} AND "
-                if limit_text is not None:
-                    if offset_text is not None:
-                        sql = (
-                            f'{sql} "{__rownum}" <= '
-                            f"({offset_text} + {limit_text})"
-                        )
-                    else:
-                        sql = f'{sql} "{__rownum}" <= {limit_text}'
-                final_sql = f"( {sql} )"
-                logger.debug("Generated ROW_NUMBER based pagination SQL.")
-                logger.debug(f"Final SELECT SQL -> {final_sql}")
-                return final_sql
-            logger.debug("Returning original SELECT SQL.")
-            logger.debug(f"Final SELECT SQL -> {sql_ori}")
-            return sql_ori
+                    continue
+                sql_pri = f'{sql_pri} {token} AS "{dummyVal}{i + 1}",'
+                sql_sel = f'{sql_sel} "{dummyVal}{i + 1}",'
+                i += 1
+            sql_pri = sql_pri.rstrip(",")
+            sql_pri = f"{sql_pri}{sql_sec}"
+            sql_sel = sql_sel.rstrip(",")
+            sql = (
+                f'{sql_sel}, ( ROW_NUMBER() OVER() ) AS "{__rownum}" '
+                f"FROM ( {sql_pri} ) AS M"
+            )
+            sql = f'{sql_sel} FROM ( {sql} ) Z WHERE'
+
+            def _process_clause_text(clause):
+                if clause is None:
+                    return None
+                if select._simple_int_clause(clause):
+                    return self.process(
+                        clause.render_literal_execute(), **kw
+                    )
+                return self.process(clause, **kw)
+
+            offset_text = _process_clause_text(offset_clause_obj)
+            sql = f'{sql} "{__rownum}" > {offset_text}'
+            final_sql = f"( {sql} )"
+            logger.debug("Generated ROW_NUMBER based pagination SQL.")
+            return final_sql
         except Exception as e:
-            logger.error(f"Error compiling SELECT statement: {e}")
+            logger.error("Error compiling SELECT statement: %s", e)
             logger.exception("Stack trace in visit_select")
             raise
 
@@ -716,15 +879,15 @@ class DB2Compiler(compiler.SQLCompiler):
         try:
             schema = sequence.schema
             name = sequence.name
-            logger.debug(f"Rendering sequence -> schema={schema}, name={name}")
+            logger.debug("Rendering sequence -> schema=%s, name=%s", schema, name)
             if schema:
                 sql = f"NEXT VALUE FOR {schema}.{name}"
             else:
                 sql = f"NEXT VALUE FOR {name}"
-            logger.debug(f"Generated sequence SQL -> {sql}")
+            logger.debug("Generated sequence SQL -> %s", sql)
             return sql
         except Exception as e:
-            logger.error(f"Error rendering sequence: {e}")
+            logger.error("Error rendering sequence: %s", e)
             logger.exception("Stack trace in visit_sequence")
             raise
 
@@ -738,22 +901,22 @@ class DB2Compiler(compiler.SQLCompiler):
     def visit_function(self, func, result_map=None, **kwargs):
         try:
             func_name = func.name.upper()
-            logger.debug(f"Rendering function -> name={func_name}")
+            logger.debug("Rendering function -> name=%s", func_name)
             if func_name == "AVG":
                 args = self.function_argspec(func, **kwargs)
                 sql = f"AVG(DOUBLE({args}))"
-                logger.debug(f"Rewritten AVG function -> {sql}")
+                logger.debug("Rewritten AVG function -> %s", sql)
                 return sql
             elif func_name == "CHAR_LENGTH":
                 args = self.function_argspec(func, **kwargs)
                 sql = f"CHAR_LENGTH({args}, OCTETS)"
-                logger.debug(f"Rewritten CHAR_LENGTH function -> {sql}")
+                logger.debug("Rewritten CHAR_LENGTH function -> %s", sql)
                 return sql
             sql = compiler.SQLCompiler.visit_function(self, func, **kwargs)
-            logger.debug(f"Default function rendering -> {sql}")
+            logger.debug("Default function rendering -> %s", sql)
             return sql
         except Exception as e:
-            logger.error(f"Error rendering function {func}: {e}")
+            logger.error("Error rendering function %s: %s", func, e)
             logger.exception("Stack trace in visit_function")
             raise
 
@@ -767,7 +930,7 @@ class DB2Compiler(compiler.SQLCompiler):
     def visit_cast(self, cast, **kw):
         try:
             type_ = cast.typeclause.type
-            logger.debug(f"Rendering CAST -> type={type_}")
+            logger.debug("Rendering CAST -> type=%s", type_)
             if SA_VERSION_MM >= (2, 0):
                 valid_types = (
                     CHAR, VARCHAR, CLOB, String, Text, Unicode, UnicodeText,
@@ -794,12 +957,13 @@ class DB2Compiler(compiler.SQLCompiler):
                 )
             if isinstance(type_, valid_types):
                 sql = super(DB2Compiler, self).visit_cast(cast, **kw)
-                logger.debug(f"Standard CAST rendering -> {sql}")
+                logger.debug("Standard CAST rendering -> %s", sql)
                 return sql
             logger.debug("Unsupported CAST type, processing clause only.")
+            self._note_uncacheable("visit_cast unsupported type")
             return self.process(cast.clause)
         except Exception as e:
-            logger.error(f"Error rendering CAST: {e}")
+            logger.error("Error rendering CAST: %s", e)
             logger.exception("Stack trace in visit_cast")
             raise
 
@@ -811,7 +975,7 @@ class DB2Compiler(compiler.SQLCompiler):
             result = "DISTINCT "
         else:
             result = ""
-        logger.debug(f"SELECT precolumns -> {result.strip()}")
+        logger.debug("SELECT precolumns -> %s", result.strip())
         return result
 
     @log_entry_exit
@@ -823,8 +987,9 @@ class DB2Compiler(compiler.SQLCompiler):
             elif join.isouter:
                 join_type = " LEFT OUTER JOIN "
             logger.debug(
-                f"Rendering JOIN -> type={join_type.strip()}, "
-                f"left={join.left}, right={join.right}"
+                "Rendering JOIN -> type=%s, "
+                "left=%s, right=%s",
+                join_type.strip(), join.left, join.right
             )
             sql = "".join(
                 (
@@ -835,10 +1000,10 @@ class DB2Compiler(compiler.SQLCompiler):
                     self.process(join.onclause, **kwargs),
                 )
             )
-            logger.debug(f"Generated JOIN SQL -> {sql}")
+            logger.debug("Generated JOIN SQL -> %s", sql)
             return sql
         except Exception as e:
-            logger.error(f"Error rendering JOIN: {e}")
+            logger.error("Error rendering JOIN: %s", e)
             logger.exception("Stack trace in visit_join")
             raise
 
@@ -846,21 +1011,21 @@ class DB2Compiler(compiler.SQLCompiler):
     def visit_savepoint(self, savepoint_stmt):
         sid = self.preparer.format_savepoint(savepoint_stmt)
         sql = f"SAVEPOINT {sid} ON ROLLBACK RETAIN CURSORS"
-        logger.debug(f"Generated SAVEPOINT SQL -> {sql}")
+        logger.debug("Generated SAVEPOINT SQL -> %s", sql)
         return sql
 
     @log_entry_exit
     def visit_rollback_to_savepoint(self, savepoint_stmt):
         sid = self.preparer.format_savepoint(savepoint_stmt)
         sql = f"ROLLBACK TO SAVEPOINT {sid}"
-        logger.debug(f"Generated ROLLBACK TO SAVEPOINT SQL -> {sql}")
+        logger.debug("Generated ROLLBACK TO SAVEPOINT SQL -> %s", sql)
         return sql
 
     @log_entry_exit
     def visit_release_savepoint(self, savepoint_stmt):
         sid = self.preparer.format_savepoint(savepoint_stmt)
         sql = f"RELEASE TO SAVEPOINT {sid}"
-        logger.debug(f"Generated RELEASE SAVEPOINT SQL -> {sql}")
+        logger.debug("Generated RELEASE SAVEPOINT SQL -> %s", sql)
         return sql
 
     @log_entry_exit
@@ -869,19 +1034,20 @@ class DB2Compiler(compiler.SQLCompiler):
             operator_ = unary.operator
             within_columns = kw.get("within_columns_clause", False)
             logger.debug(
-                f"Rendering UNARY -> operator={operator_}, "
-                f"within_columns_clause={within_columns}"
+                "Rendering UNARY -> operator=%s, "
+                "within_columns_clause=%s",
+                operator_, within_columns
             )
             if operator_ == operators.exists and within_columns:
                 usql = super(DB2Compiler, self).visit_unary(unary, **kw)
                 sql = f"CASE WHEN {usql} THEN 1 ELSE 0 END"
-                logger.debug(f"Rewritten EXISTS unary -> {sql}")
+                logger.debug("Rewritten EXISTS unary -> %s", sql)
                 return sql
             sql = super(DB2Compiler, self).visit_unary(unary, **kw)
-            logger.debug(f"Standard unary rendering -> {sql}")
+            logger.debug("Standard unary rendering -> %s", sql)
             return sql
         except Exception as e:
-            logger.error(f"Error rendering unary expression: {e}")
+            logger.error("Error rendering unary expression: %s", e)
             logger.exception("Stack trace in visit_unary")
             raise
 
@@ -897,13 +1063,14 @@ class DB2DDLCompiler(compiler.DDLCompiler):
                 version_tokens = dialect.dbms_ver.split('.')[0:2]
                 version_info = [int(ver_token) for ver_token in version_tokens]
                 logger.debug(
-                    f"Parsed server version -> raw={dialect.dbms_ver}, parsed={version_info}"
+                    "Parsed server version -> raw=%s, parsed=%s",
+                    dialect.dbms_ver, version_info
                 )
                 return version_info
             logger.warning("Dialect has no dbms_ver attribute or version is empty.")
             return []
         except Exception as e:
-            logger.error(f"Failed to parse server version: {e}")
+            logger.error("Failed to parse server version: %s", e)
             logger.exception("Stack trace in get_server_version_info")
             raise
 
@@ -916,7 +1083,7 @@ class DB2DDLCompiler(compiler.DDLCompiler):
         """
         try:
             dbms_name = getattr(dialect, 'dbms_name', None)
-            logger.debug(f"Checking nullable unique constraint support -> dbms_name={dbms_name}")
+            logger.debug("Checking nullable unique constraint support -> dbms_name=%s", dbms_name)
             if not dbms_name:
                 logger.warning("DBMS name not available for constraint capability check.")
                 return False
@@ -924,14 +1091,15 @@ class DB2DDLCompiler(compiler.DDLCompiler):
                 version_info = cls.get_server_version_info(dialect)
                 supported = version_info >= [10, 5]
                 logger.info(
-                    f"Nullable unique constraint support -> "
-                    f"version={version_info}, supported={supported}"
+                    "Nullable unique constraint support -> "
+                    "version=%s, supported=%s",
+                    version_info, supported
                 )
                 return supported
             logger.debug("DBMS is not DB2 LUW. Nullable unique constraint not supported.")
             return False
         except Exception as e:
-            logger.error(f"Error checking nullable unique constraint support: {e}")
+            logger.error("Error checking nullable unique constraint support: %s", e)
             logger.exception("Stack trace in _is_nullable_unique_constraint_supported")
             raise
 
@@ -941,9 +1109,10 @@ class DB2DDLCompiler(compiler.DDLCompiler):
             column_name = column.name
             column_type = column.type
             logger.debug(
-                f"Generating column specification -> "
-                f"name={column_name}, type={column_type}, "
-                f"nullable={column.nullable}, primary_key={column.primary_key}"
+                "Generating column specification -> "
+                "name=%s, type=%s, "
+                "nullable=%s, primary_key=%s",
+                column_name, column_type, column.nullable, column.primary_key
             )
             col_spec = [
                 self.preparer.format_column(column),
@@ -956,7 +1125,7 @@ class DB2DDLCompiler(compiler.DDLCompiler):
             default = self.get_column_default_string(column)
             if default is not None:
                 col_spec.extend(['WITH DEFAULT', default])
-                logger.debug(f"Applied default clause -> {default}")
+                logger.debug("Applied default clause -> %s", default)
             # AUTOINCREMENT handling
             auto_column = column.table._autoincrement_column
             if column is auto_column:
@@ -967,10 +1136,10 @@ class DB2DDLCompiler(compiler.DDLCompiler):
                     '(START WITH 1)'
                 ])
             column_spec = ' '.join(col_spec)
-            logger.debug(f"Final column specification generated -> {column_spec}")
+            logger.debug("Final column specification generated -> %s", column_spec)
             return column_spec
         except Exception as e:
-            logger.error(f"Error generating column specification: {e}")
+            logger.error("Error generating column specification: %s", e)
             logger.exception("Stack trace in get_column_specification")
             raise
 
@@ -981,15 +1150,16 @@ class DB2DDLCompiler(compiler.DDLCompiler):
             ondelete = constraint.ondelete
             onupdate = constraint.onupdate
             logger.debug(
-                f"Defining constraint cascades -> "
-                f"name={constraint_name}, "
-                f"ondelete={ondelete}, "
-                f"onupdate={onupdate}"
+                "Defining constraint cascades -> "
+                "name=%s, "
+                "ondelete=%s, "
+                "onupdate=%s",
+                constraint_name, ondelete, onupdate
             )
             text = ""
             if ondelete is not None:
                 text += f" ON DELETE {ondelete}"
-                logger.debug(f"Applied ON DELETE clause -> {ondelete}")
+                logger.debug("Applied ON DELETE clause -> %s", ondelete)
             if onupdate is not None:
                 logger.warning(
                     "DB2 does not support UPDATE CASCADE for foreign keys."
@@ -997,10 +1167,10 @@ class DB2DDLCompiler(compiler.DDLCompiler):
                 util.warn(
                     "DB2 does not support UPDATE CASCADE for foreign keys."
                 )
-            logger.debug(f"Cascade definition result -> {text}")
+            logger.debug("Cascade definition result -> %s", text)
             return text
         except Exception as e:
-            logger.error(f"Error defining constraint cascades: {e}")
+            logger.error("Error defining constraint cascades: %s", e)
             logger.exception("Stack trace in define_constraint_cascades")
             raise
 
@@ -1012,9 +1182,10 @@ class DB2DDLCompiler(compiler.DDLCompiler):
             constraint_table = getattr(constraint, "table", None)
             constraint_type = type(constraint).__name__
             logger.debug(
-                f"Processing DROP constraint -> "
-                f"type={constraint_type}, "
-                f"name={constraint_name}"
+                "Processing DROP constraint -> "
+                "type=%s, "
+                "name=%s",
+                constraint_type, constraint_name
             )
             if isinstance(constraint, sa_schema.ForeignKeyConstraint):
                 qual = "FOREIGN KEY "
@@ -1048,10 +1219,10 @@ class DB2DDLCompiler(compiler.DDLCompiler):
             else:
                 table_name = self.preparer.format_table(constraint_table)
                 drop_sql = f"ALTER TABLE {table_name} DROP {qual}{const}"
-            logger.debug(f"Generated DROP SQL -> {drop_sql}")
+            logger.debug("Generated DROP SQL -> %s", drop_sql)
             return drop_sql
         except Exception as e:
-            logger.error(f"Error generating DROP constraint SQL: {e}")
+            logger.error("Error generating DROP constraint SQL: %s", e)
             logger.exception("Stack trace in visit_drop_constraint")
             raise
 
@@ -1059,7 +1230,7 @@ class DB2DDLCompiler(compiler.DDLCompiler):
     def create_table_constraints(self, table, **kw):
         try:
             table_name = table.name
-            logger.debug(f"Processing CREATE TABLE constraints -> table={table_name}")
+            logger.debug("Processing CREATE TABLE constraints -> table=%s", table_name)
             nullable_supported = self._is_nullable_unique_constraint_supported(
                 self.dialect
             )
@@ -1067,7 +1238,7 @@ class DB2DDLCompiler(compiler.DDLCompiler):
                 for constraint in table._sorted_constraints:
                     if isinstance(constraint, sa_schema.UniqueConstraint):
                         constraint_name = constraint.name
-                        logger.debug(f"Evaluating UniqueConstraint -> name={constraint_name}")
+                        logger.debug("Evaluating UniqueConstraint -> name=%s", constraint_name)
                         for column in constraint:
                             column_name = column.name
                             column_nullable = column.nullable
@@ -1075,8 +1246,9 @@ class DB2DDLCompiler(compiler.DDLCompiler):
                                 constraint.use_alter = True
                                 constraint.uConstraint_as_index = True
                                 logger.debug(
-                                    f"Nullable column detected -> {column_name}. "
-                                    "Converting UNIQUE constraint to INDEX."
+                                    "Nullable column detected -> %s. "
+                                    "Converting UNIQUE constraint to INDEX.",
+                                    column_name
                                 )
                                 break
                         use_index = getattr(constraint, "uConstraint_as_index", None)
@@ -1090,17 +1262,18 @@ class DB2DDLCompiler(compiler.DDLCompiler):
                             else:
                                 index_name = constraint_name
                             logger.debug(
-                                f"Creating index for nullable UNIQUE constraint -> "
-                                f"index_name={index_name}"
+                                "Creating index for nullable UNIQUE constraint -> "
+                                "index_name=%s",
+                                index_name
                             )
                             index = sa_schema.Index(index_name,*(col for col in constraint))
                             index.unique = True
                             index.uConstraint_as_index = True
             result = super(DB2DDLCompiler, self).create_table_constraints(table, **kw)
-            logger.debug(f"Final CREATE TABLE constraints SQL fragment -> {result}")
+            logger.debug("Final CREATE TABLE constraints SQL fragment -> %s", result)
             return result
         except Exception as e:
-            logger.error(f"Error processing create_table_constraints: {e}")
+            logger.error("Error processing create_table_constraints: %s", e)
             logger.exception("Stack trace in create_table_constraints")
             raise
 
@@ -1112,22 +1285,27 @@ class DB2DDLCompiler(compiler.DDLCompiler):
             is_unique = getattr(element, "unique", None)
             use_index = getattr(element, "uConstraint_as_index", None)
             logger.debug(
-                f"Processing CREATE INDEX -> "
-                f"name={index_name}, "
-                f"unique={is_unique}, "
-                f"uConstraint_as_index={use_index}"
+                "Processing CREATE INDEX -> "
+                "name=%s, "
+                "unique=%s, "
+                "uConstraint_as_index=%s",
+                index_name, is_unique, use_index
             )
             if SA_VERSION_MM < (0, 8):
                 sql = super(DB2DDLCompiler, self).visit_create_index(create, **kw)
             else:
                 sql = super(DB2DDLCompiler, self).visit_create_index(create,include_schema, include_table_schema, **kw)
+            include = element.dialect_kwargs.get("db2_include")
+            if include:
+                sql += " INCLUDE (%s)" % ", ".join(
+                    self.preparer.quote(getattr(col, "name", col)) for col in include)
             if use_index:
                 sql += " EXCLUDE NULL KEYS"
                 logger.debug("Applied EXCLUDE NULL KEYS for nullable unique constraint index.")
-            logger.debug(f"Generated CREATE INDEX SQL -> {sql}")
+            logger.debug("Generated CREATE INDEX SQL -> %s", sql)
             return sql
         except Exception as e:
-            logger.error(f"Error generating CREATE INDEX SQL: {e}")
+            logger.error("Error generating CREATE INDEX SQL: %s", e)
             logger.exception("Stack trace in visit_create_index")
             raise
 
@@ -1138,9 +1316,10 @@ class DB2DDLCompiler(compiler.DDLCompiler):
             constraint_type = type(element).__name__
             constraint_name = getattr(element, "name", None)
             logger.debug(
-                f"Processing ADD CONSTRAINT -> "
-                f"type={constraint_type}, "
-                f"name={constraint_name}"
+                "Processing ADD CONSTRAINT -> "
+                "type=%s, "
+                "name=%s",
+                constraint_type, constraint_name
             )
             nullable_supported = self._is_nullable_unique_constraint_supported(self.dialect)
             if nullable_supported and isinstance(element, sa_schema.UniqueConstraint):
@@ -1150,8 +1329,9 @@ class DB2DDLCompiler(compiler.DDLCompiler):
                     if column_nullable:
                         element.uConstraint_as_index = True
                         logger.debug(
-                            f"Nullable column detected -> {column_name}. "
-                            "Converting UNIQUE constraint to INDEX."
+                            "Nullable column detected -> %s. "
+                            "Converting UNIQUE constraint to INDEX.",
+                            column_name
                         )
                         break
                 use_index = getattr(element, "uConstraint_as_index", None)
@@ -1167,20 +1347,21 @@ class DB2DDLCompiler(compiler.DDLCompiler):
                     else:
                         index_name = constraint_name
                     logger.debug(
-                        f"Creating index for nullable UNIQUE constraint -> "
-                        f"index_name={index_name}"
+                        "Creating index for nullable UNIQUE constraint -> "
+                        "index_name=%s",
+                        index_name
                     )
                     index = sa_schema.Index(index_name,*(col for col in element))
                     index.unique = True
                     index.uConstraint_as_index = True
                     sql = self.visit_create_index(sa_schema.CreateIndex(index))
-                    logger.debug(f"Generated SQL via index conversion -> {sql}")
+                    logger.debug("Generated SQL via index conversion -> %s", sql)
                     return sql
             sql = super(DB2DDLCompiler, self).visit_add_constraint(create)
-            logger.debug(f"Generated ADD CONSTRAINT SQL -> {sql}")
+            logger.debug("Generated ADD CONSTRAINT SQL -> %s", sql)
             return sql
         except Exception as e:
-            logger.error(f"Error generating ADD CONSTRAINT SQL: {e}")
+            logger.error("Error generating ADD CONSTRAINT SQL: %s", e)
             logger.exception("Stack trace in visit_add_constraint")
             raise
 
@@ -1192,12 +1373,48 @@ class DB2IdentifierPreparer(compiler.IdentifierPreparer):
        logger.debug("Initializing DB2IdentifierPreparer")
        super(DB2IdentifierPreparer, self).__init__(dialect)
        logger.debug(
-           f"IdentifierPreparer configuration -> "
-           f"reserved_words_count={len(self.reserved_words)}, "
-           f"illegal_initial_characters={self.illegal_initial_characters}"
+           "IdentifierPreparer configuration -> "
+           "reserved_words_count=%s, "
+           "illegal_initial_characters=%s",
+           len(self.reserved_words), self.illegal_initial_characters
        )
 
 
+class _MetricsCursor(object):
+    """DBAPI cursor proxy reporting fetch timings to statement_metrics."""
+
+    def __init__(self, cursor, context, metrics):
+        self.__dict__.update(
+            dbapi_cursor=cursor, _context=context, _metrics=metrics)
+
+    def _timed(self, fn, *args):
+        start = perf_counter_ns()
+        try:
+            return fn(*args)
+        finally:
+            self._metrics.observe(
+                "fetch", self._context.statement or "",
+                perf_counter_ns() - start)
+
+    def fetchone(self):
+        return self._timed(self.dbapi_cursor.fetchone)
+
+    def fetchmany(self, *args):
+        return self._timed(self.dbapi_cursor.fetchmany, *args)
+
+    def fetchall(self):
+        return self._timed(self.dbapi_cursor.fetchall)
+
+    def __iter__(self):
+        return iter(self.fetchone, None)
+
+    def __getattr__(self, key):
+        return getattr(self.dbapi_cursor, key)
+
+    def __setattr__(self, key, value):
+        setattr(self.dbapi_cursor, key, value)
+
+
 class _SelectLastRowIDMixin(object):
    _select_lastrowid = False
    _lastrowid = None
@@ -1205,7 +1422,7 @@ class _SelectLastRowIDMixin(object):
    @log_entry_exit
    def get_lastrowid(self):
        lastrowid = self._lastrowid
-       logger.debug(f"Returning lastrowid -> {lastrowid}")
+       logger.debug("Returning lastrowid -> %s", lastrowid)
        return lastrowid
 
    @log_entry_exit
@@ -1213,7 +1430,7 @@ class _SelectLastRowIDMixin(object):
        try:
            is_insert = self.isinsert
            compiled = self.compiled
-           logger.debug(f"pre_exec invoked -> isinsert={is_insert}")
+           logger.debug("pre_exec invoked -> isinsert=%s", is_insert)
            if not is_insert:
                logger.debug("Statement is not INSERT. Skipping identity logic.")
                return
@@ -1224,11 +1441,12 @@ class _SelectLastRowIDMixin(object):
            returning_enabled = compiled.returning
            inline_insert = compiled.inline
            logger.debug(
-               f"Insert detected -> "
-               f"table={table.name}, "
-               f"autoincrement_column={getattr(seq_column, 'name', None)}, "
-               f"returning={returning_enabled}, "
-               f"inline={inline_insert}"
+               "Insert detected -> "
+               "table=%s, "
+               "autoincrement_column=%s, "
+               "returning=%s, "
+               "inline=%s",
+               table.name, getattr(seq_column, 'name', None), returning_enabled, inline_insert
            )
            select_lastrowid = (
                insert_has_sequence
@@ -1236,9 +1454,9 @@ class _SelectLastRowIDMixin(object):
                and not inline_insert
            )
            self._select_lastrowid = select_lastrowid
-           logger.debug(f"Will fetch identity after insert -> {select_lastrowid}")
+           logger.debug("Will fetch identity after insert -> %s", select_lastrowid)
        except Exception as e:
-           logger.error(f"Error during pre_exec: {e}")
+           logger.error("Error during pre_exec: %s", e)
            logger.exception("Stack trace in pre_exec")
            raise
 
@@ -1251,9 +1469,12 @@ class _SelectLastRowIDMixin(object):
                return
            logger.debug("Fetching IDENTITY_VAL_LOCAL() after insert")
            conn = self.root_connection
-           cursor = self.cursor
+           # bypass the fetch timing proxy; the round trip is timed as a whole
+           cursor = getattr(self.cursor, "dbapi_cursor", self.cursor)
            identity_sql = "SELECT IDENTITY_VAL_LOCAL() FROM SYSIBM.SYSDUMMY1"
-           logger.debug(f"Executing identity SQL -> {identity_sql}")
+           logger.debug("Executing identity SQL -> %s", identity_sql)
+           metrics = self.dialect.statement_metrics
+           start = perf_counter_ns() if metrics is not None else 0
            conn._cursor_execute(
                cursor,
                identity_sql,
@@ -1261,35 +1482,147 @@ class _SelectLastRowIDMixin(object):
                self
            )
            row = cursor.fetchall()[0]
+           if metrics is not None:
+               metrics.observe("identity", identity_sql, perf_counter_ns() - start)
            identity_value = row[0]
            if identity_value is not None:
                lastrowid = int(identity_value)
                self._lastrowid = lastrowid
-               logger.info(f"Identity value retrieved successfully -> {lastrowid}")
+               logger.info("Identity value retrieved successfully -> %s", lastrowid)
            else:
                logger.warning("IDENTITY_VAL_LOCAL() returned NULL")
        except Exception as e:
-           logger.error(f"Error during post_exec identity fetch: {e}")
+           logger.error("Error during post_exec identity fetch: %s", e)
            logger.exception("Stack trace in post_exec")
            raise
 
 
+# DDL that can add, remove or change catalog entries cached by the
+# existence index, or invalidate prepared statement handles
+_SCHEMA_CHANGE_RE = re.compile(r"\s*(ALTER|CREATE|DROP|RENAME)\s", re.IGNORECASE)
+# utility calls (RUNSTATS, LOAD, ...) that can change catalog statistics
+_ADMIN_CMD_RE = re.compile(r"\s*CALL\s+SYSPROC\.ADMIN_CMD\s*\(", re.IGNORECASE)
+# DDL after which prefetched sequence values may no longer be valid
+_SEQUENCE_DDL_RE = re.compile(r"\s*(ALTER|DROP)\s+SEQUENCE\s", re.IGNORECASE)
+
+# connection.info key: names of savepoints begun but not yet emitted
+_PENDING_SAVEPOINTS = "ibm_db_sa_pending_savepoints"
+# connection.info key: set while the transaction has uncommitted DDL
+_UNCOMMITTED_DDL = "ibm_db_sa_uncommitted_ddl"
+
+
 class DB2ExecutionContext(_SelectLastRowIDMixin, default.DefaultExecutionContext):
+    # SET statement putting back the session's lock timeout after a
+    # with_for_update(nowait=True) statement
+    _restore_lock_timeout = None
+
+    def create_cursor(self):
+        if self.dialect.lazy_savepoints:
+            self.dialect._emit_pending_savepoints(self._dbapi_connection)
+        cursor = super(DB2ExecutionContext, self).create_cursor()
+        metrics = self.dialect.statement_metrics
+        if metrics is not None:
+            cursor = _MetricsCursor(cursor, self, metrics)
+        return cursor
+
+    def pre_exec(self):
+        super(DB2ExecutionContext, self).pre_exec()
+        self._set_lock_timeout_nowait()
+
+    def _set_lock_timeout_nowait(self):
+        if getattr(self.compiled, "lock_nowait", False):
+            # Db2 has no NOWAIT; fail on the first lock conflict (SQL0911N
+            # reason 68) instead of waiting for the lock timeout
+            conn = self.root_connection
+            cursor = getattr(self.cursor, "dbapi_cursor", self.cursor)
+            conn._cursor_execute(cursor, "VALUES CURRENT LOCK TIMEOUT", (), self)
+            timeout = cursor.fetchall()[0][0]
+            conn._cursor_execute(cursor, "SET CURRENT LOCK TIMEOUT NOT WAIT", (), self)
+            self._restore_lock_timeout = "SET CURRENT LOCK TIMEOUT %s" % (
+                "NULL" if timeout is None else int(timeout))
+
+    def _reset_lock_timeout(self):
+        sql, self._restore_lock_timeout = self._restore_lock_timeout, None
+        # on a separate cursor so the select's result set stays open
+        cursor = self._dbapi_connection.cursor()
+        try:
+            self.root_connection._cursor_execute(cursor, sql, (), self)
+        finally:
+            cursor.close()
+
+    def handle_dbapi_exception(self, e):
+        if self._restore_lock_timeout is not None:
+            try:
+                self._reset_lock_timeout()
+            except Exception:
+                pass
+        super(DB2ExecutionContext, self).handle_dbapi_exception(e)
+
+    def post_exec(self):
+        if self._restore_lock_timeout is not None:
+            self._reset_lock_timeout()
+        stats = self.dialect.compile_stats
+        if stats is not None and self.compiled is not None:
+            # cache_hit is only populated on SQLAlchemy 1.4 and later
+            stats.record_execution(
+                self.compiled.string, getattr(self, "cache_hit", None))
+        dialect = self.dialect
+        schema_change = self.isddl or _SCHEMA_CHANGE_RE.match(self.statement or "")
+        if schema_change:
+            # Db2 DDL is transactional; what is cached from here on is
+            # dropped again if the transaction rolls back, see do_rollback()
+            self._dbapi_connection.info[_UNCOMMITTED_DDL] = True
+            if (dialect.existence_cache_ttl or dialect.schema_snapshot is not None
+                    or dialect._foreign_key_edges):
+                dialect.invalidate_existence_cache()
+        if dialect.stats_cache_ttl and (
+                schema_change or _ADMIN_CMD_RE.match(self.statement or "")):
+            dialect.invalidate_stats_cache()
+        if dialect.sequence_allocator is not None and (
+                self.isddl or _SEQUENCE_DDL_RE.match(self.statement or "")):
+            dialect.sequence_allocator.discard()
+        super(DB2ExecutionContext, self).post_exec()
+
     @log_entry_exit
     def fire_sequence(self, seq, type_):
         sequence_name = str(seq)
         try:
             formatted_seq = self.dialect.identifier_preparer.format_sequence(seq)
+            allocator = self.dialect.sequence_allocator
+            if allocator is not None:
+                return self._next_prefetched_value(allocator, formatted_seq, type_)
             sql = ("SELECT NEXTVAL FOR " + formatted_seq + " FROM SYSIBM.SYSDUMMY1")
-            logger.debug(f"Firing sequence -> name={sequence_name}, Generated SQL={sql}")
+            logger.debug("Firing sequence -> name=%s, Generated SQL=%s", sequence_name, sql)
             result = self._execute_scalar(sql, type_)
-            logger.info(f"Sequence value generated -> name={sequence_name}, value={result}")
+            logger.info("Sequence value generated -> name=%s, value=%s", sequence_name, result)
             return result
         except Exception as e:
-            logger.error(f"Sequence execution failed -> name={sequence_name}, error={e}")
+            logger.error("Sequence execution failed -> name=%s, error=%s", sequence_name, e)
             logger.exception("Stack trace for sequence execution failure")
             raise
 
+    def _next_prefetched_value(self, allocator, formatted_seq, type_):
+        if "schema_translate_map" in self.execution_options:
+            # key the buffer by the sequence actually used
+            formatted_seq = self.identifier_preparer._render_schema_translates(
+                formatted_seq, self.execution_options["schema_translate_map"])
+
+        def fetch_block():
+            sql = allocator.block_sql(formatted_seq)
+            self.root_connection._cursor_execute(
+                self.cursor, sql, self.dialect.execute_sequence_format(), context=self)
+            values = [row[0] for row in self.cursor.fetchall()]
+            if type_ is not None:
+                proc = type_._cached_result_processor(
+                    self.dialect, self.cursor.description[0][1])
+                if proc:
+                    values = [proc(value) for value in values]
+            return values
+
+        value = allocator.next_value(formatted_seq, fetch_block)
+        logger.debug("Prefetched sequence value -> name=%s, value=%s", formatted_seq, value)
+        return value
+
 
 class DB2Dialect(default.DefaultDialect):
     name = 'ibm_db_sa'
@@ -1335,12 +1668,361 @@ class DB2Dialect(default.DefaultDialect):
     _reflector_cls = ibm_reflection.DB2Reflector
     serverType = ''
 
-    def __init__(self, **kw):
+    engine_config_types = default.DefaultDialect.engine_config_types.union(
+        {
+            "compile_stats": util.asbool,
+            "statement_metrics": util.asbool,
+            "existence_cache_ttl": float,
+            "reflection_workers": util.asint,
+            "schema_snapshot_check": util.asbool,
+            "stats_cache_ttl": float,
+            "in_list_padding": util.asbool,
+            "in_list_chunk_size": util.asint,
+            "sequence_prefetch": util.asint,
+            "native_boolean": util.asbool,
+            "prepared_statement_cache_size": util.asint,
+            "lazy_savepoints": util.asbool,
+        }
+    )
+
+    compile_stats = None
+    statement_metrics = None
+    existence_cache_ttl = None
+    reflection_workers = None
+    schema_snapshot = None
+    schema_snapshot_check = True
+    stats_cache_ttl = None
+    in_list_padding = False
+    in_list_chunk_size = None
+    sequence_allocator = None
+    native_boolean = None
+    prepared_statement_cache_size = None
+    lazy_savepoints = False
+
+    def __init__(self, compile_stats=False, statement_metrics=None,
+                 existence_cache_ttl=None, reflection_workers=None,
+                 schema_snapshot=None, schema_snapshot_check=True,
+                 stats_cache_ttl=None, in_list_padding=False,
+                 in_list_chunk_size=None, sequence_prefetch=None,
+                 native_boolean=None, prepared_statement_cache_size=None,
+                 lazy_savepoints=False, **kw):
         logger.debug("Creating DB2Dialect instance")
         super(DB2Dialect, self).__init__(**kw)
         self._reflector = self._reflector_cls(self)
         self.dbms_ver = None
         self.dbms_name = None
+        # denormalized schema -> foreign key edges, see get_foreign_key_graph()
+        self._foreign_key_edges = {}
+        if compile_stats:
+            self.compile_stats = CompileCacheStats()
+        if statement_metrics is True:
+            self.statement_metrics = StatementMetrics()
+        elif statement_metrics:
+            # any object with an observe(phase, statement, elapsed_ns) method
+            self.statement_metrics = statement_metrics
+        if existence_cache_ttl:
+            # seconds for which has_table()/has_sequence() answer from a
+            # per-schema set of names instead of querying the catalog
+            self.existence_cache_ttl = float(existence_cache_ttl)
+        if reflection_workers and int(reflection_workers) > 1:
+            self.reflection_workers = int(reflection_workers)
+        if schema_snapshot is not None:
+            # a snapshot file path, or a SchemaSnapshot already loaded
+            if not isinstance(schema_snapshot, SchemaSnapshot):
+                schema_snapshot = load_snapshot(schema_snapshot)
+            self.schema_snapshot = schema_snapshot
+            self.schema_snapshot_check = util.asbool(schema_snapshot_check)
+        if stats_cache_ttl:
+            # seconds for which get_table_stats()/get_index_stats() answer
+            # from statistics read for the whole schema at once
+            self.stats_cache_ttl = float(stats_cache_ttl)
+        if in_list_padding:
+            # pad expanding IN lists to 8, 16, 32, ... values so that lists
+            # of similar length share one statement text
+            self.in_list_padding = True
+        if in_list_chunk_size:
+            # split longer IN lists into OR-ed IN predicates of this size
+            self.in_list_chunk_size = int(in_list_chunk_size)
+        if sequence_prefetch and int(sequence_prefetch) > 1:
+            # values fetched per round trip by fire_sequence()
+            self.sequence_allocator = SequenceBlockAllocator(int(sequence_prefetch))
+        if native_boolean is not None:
+            # overrides the server version check made in initialize()
+            self.native_boolean = util.asbool(native_boolean)
+        if prepared_statement_cache_size:
+            # prepared handles kept per DBAPI connection (ibm_db driver)
+            self.prepared_statement_cache_size = int(prepared_statement_cache_size)
+        if lazy_savepoints:
+            # SAVEPOINT is deferred until a statement runs inside it
+            self.lazy_savepoints = True
+
+    def invalidate_existence_cache(self, schema=None):
+        """Drop the names cached for has_table()/has_sequence() and the
+        foreign key graphs, and stop serving reflection from the schema
+        snapshot.
+
+        CREATE, DROP and RENAME statements executed through this dialect
+        do this automatically; call it after changing the schema by other
+        means.
+        """
+        self._reflector.invalidate_existence_cache(schema)
+        if schema is None:
+            self._foreign_key_edges.clear()
+        else:
+            self._foreign_key_edges.pop(self._reflector.denormalize_name(schema), None)
+        if self.schema_snapshot is not None:
+            self.schema_snapshot.discard(
+                schema and self._reflector.denormalize_name(schema))
+
+    def invalidate_stats_cache(self, schema=None):
+        """Drop the statistics cached for get_table_stats()/get_index_stats().
+
+        CREATE, DROP and RENAME statements and ``SYSPROC.ADMIN_CMD`` calls
+        (e.g. RUNSTATS) executed through this dialect do this automatically;
+        call it after RUNSTATS run by other means.
+        """
+        self._reflector.invalidate_stats_cache(schema)
+
+    def get_foreign_key_graph(self, connection, schemas=None, tables=()):
+        """Return the :class:`.ForeignKeyGraph` of the foreign keys
+        declared in ``schemas`` (default: the default schema).
+
+        Schemas not seen before are read together in one catalog query;
+        the result is kept per schema until DDL runs through this dialect
+        or :meth:`invalidate_existence_cache` is called.  ``tables`` adds
+        ``(schema, table)`` nodes that have no foreign keys.
+        """
+        keys = [self._reflector.denormalize_name(schema or self.default_schema_name)
+                for schema in (schemas or [None])]
+        missing = [key for key in keys if key not in self._foreign_key_edges]
+        if missing:
+            self._foreign_key_edges.update(
+                self._reflect("get_foreign_key_edges", connection, missing))
+        return ForeignKeyGraph(
+            [edge for key in keys for edge in self._foreign_key_edges[key]],
+            tables)
+
+    def do_execute(self, cursor, statement, parameters, context=None):
+        metrics = self.statement_metrics
+        if metrics is None:
+            return self._do_execute(cursor, statement, parameters, context)
+        start = perf_counter_ns()
+        try:
+            return self._do_execute(cursor, statement, parameters, context)
+        finally:
+            metrics.observe("execute", statement, perf_counter_ns() - start)
+
+    def _do_execute(self, cursor, statement, parameters, context=None):
+        super(DB2Dialect, self).do_execute(cursor, statement, parameters, context)
+
+    def do_executemany(self, cursor, statement, parameters, context=None):
+        metrics = self.statement_metrics
+        if metrics is None:
+            return super(DB2Dialect, self).do_executemany(
+                cursor, statement, parameters, context)
+        start = perf_counter_ns()
+        try:
+            return super(DB2Dialect, self).do_executemany(
+                cursor, statement, parameters, context)
+        finally:
+            metrics.observe("execute", statement, perf_counter_ns() - start)
+
+    def do_savepoint(self, connection, name):
+        if not self.lazy_savepoints:
+            return super(DB2Dialect, self).do_savepoint(connection, name)
+        logger.debug("Deferring savepoint -> %s", name)
+        connection.connection.info.setdefault(_PENDING_SAVEPOINTS, []).append(name)
+
+    def do_rollback_to_savepoint(self, connection, name):
+        if self._uncommitted_ddl(connection.connection):
+            self.invalidate_existence_cache()
+            self.invalidate_stats_cache()
+        if self.lazy_savepoints and self._discard_pending_savepoints(
+                connection.connection, name):
+            # nothing ran since the savepoint was begun
+            return
+        super(DB2Dialect, self).do_rollback_to_savepoint(connection, name)
+
+    def do_release_savepoint(self, connection, name):
+        if self.lazy_savepoints and self._discard_pending_savepoints(
+                connection.connection, name):
+            return
+        super(DB2Dialect, self).do_release_savepoint(connection, name)
+
+    def do_commit(self, dbapi_connection):
+        if self.lazy_savepoints:
+            self._discard_pending_savepoints(dbapi_connection)
+        super(DB2Dialect, self).do_commit(dbapi_connection)
+        self._uncommitted_ddl(dbapi_connection, clear=True)
+
+    def do_rollback(self, dbapi_connection):
+        if self.lazy_savepoints:
+            self._discard_pending_savepoints(dbapi_connection)
+        try:
+            super(DB2Dialect, self).do_rollback(dbapi_connection)
+        finally:
+            if self._uncommitted_ddl(dbapi_connection, clear=True):
+                # names looked up after the DDL may include objects the
+                # rollback removed, or miss ones it restored
+                self.invalidate_existence_cache()
+                self.invalidate_stats_cache()
+
+    def _uncommitted_ddl(self, dbapi_connection, clear=False):
+        """Return True if DDL ran in the current transaction of
+        ``dbapi_connection``; ``clear`` when the transaction ends."""
+        try:
+            info = dbapi_connection.info
+        except (AttributeError, NotImplementedError):
+            return False
+        if clear:
+            return info.pop(_UNCOMMITTED_DDL, False)
+        return info.get(_UNCOMMITTED_DDL, False)
+
+    def _discard_pending_savepoints(self, dbapi_connection, name=None):
+        """Forget deferred savepoints: ``name`` and those begun after it,
+        or all of them when ``name`` was already emitted (every deferred
+        savepoint is newer than an emitted one).  Return True if ``name``
+        was never emitted."""
+        try:
+            pending = dbapi_connection.info.get(_PENDING_SAVEPOINTS)
+        except (AttributeError, NotImplementedError):
+            # a plain DBAPI connection, or the ad-hoc proxy used on
+            # first connect, carries no deferred savepoints
+            return False
+        if not pending:
+            return False
+        if name in pending:
+            del pending[pending.index(name):]
+            return True
+        del pending[:]
+        return False
+
+    def _emit_pending_savepoints(self, dbapi_connection):
+        """Emit the deferred savepoints of ``dbapi_connection``, oldest
+        first, before a statement runs on it."""
+        pending = dbapi_connection.info.get(_PENDING_SAVEPOINTS)
+        if not pending:
+            return
+        cursor = dbapi_connection.cursor()
+        try:
+            while pending:
+                sql = self.statement_compiler(
+                    self, elements.SavepointClause(pending[0])).string
+                logger.debug("Emitting deferred savepoint -> %s", sql)
+                cursor.execute(sql)
+                pending.pop(0)
+        finally:
+            cursor.close()
+
+    def _reflect(self, method, connection, *args, **kw):
+        snapshot = self.schema_snapshot
+        if snapshot is not None:
+            found, result = snapshot.lookup(self, connection, method, *args, **kw)
+            if found:
+                return result
+        fn = getattr(self._reflector, method)
+        metrics = self.statement_metrics
+        if metrics is None:
+            return fn(connection, *args, **kw)
+        start = perf_counter_ns()
+        try:
+            return fn(connection, *args, **kw)
+        finally:
+            metrics.observe("reflect", method, perf_counter_ns() - start)
+
+    def _parallel_multi_reflect(self, method, connection, **kw):
+        """Run a per-table reflection method over ``reflection_workers``
+        pooled connections.
+
+        Used by the ``get_multi_*`` hooks that SQLAlchemy 2.0's
+        ``MetaData.reflect()`` calls.  Table names are resolved on
+        ``connection`` exactly as in the serial implementation; the
+        tables are then dealt round-robin to the workers, each of which
+        checks out its own connection from the engine's pool with the
+        execution options of ``connection``.  Results are yielded in the
+        same order as the serial implementation.
+
+        When DDL has run in the current transaction of ``connection`` the
+        tables are reflected serially on it instead: the workers, outside
+        that transaction, could neither see uncommitted tables nor read
+        the catalog rows it holds locked.
+        """
+        single_tbl_method = getattr(self, method)
+        workers = self.reflection_workers
+        engine = getattr(connection, "engine", None)
+        if workers is None or engine is None or self._uncommitted_ddl(
+                connection.connection):
+            return self._default_multi_reflect(
+                single_tbl_method, connection, **kw)
+        unreflectable = kw.pop("unreflectable", {})
+        keys = [
+            key for key, _ in self._default_multi_reflect(
+                lambda conn, table, schema=None, **tbl_kw: None,
+                connection, **kw)
+        ]
+        for name in ("kind", "schema", "filter_names", "scope"):
+            kw.pop(name, None)
+
+        def reflect_tables(conn, chunk):
+            results = []
+            for key in chunk:
+                schema, table = key
+                try:
+                    results.append((key, single_tbl_method(
+                        conn, table, schema=schema, **kw)))
+                except exc.UnreflectableTableError as err:
+                    results.append((key, err))
+                except exc.NoSuchTableError:
+                    pass
+            return results
+
+        # e.g. schema_translate_map, which the catalog queries honour
+        options = connection.get_execution_options()
+
+        def reflect_chunk(chunk):
+            with engine.connect() as worker_conn:
+                return reflect_tables(
+                    worker_conn.execution_options(**options), chunk)
+
+        merged = {}
+        if len(keys) < 2:
+            merged.update(reflect_tables(connection, keys))
+        else:
+            chunks = [keys[i::workers]
+                      for i in range(min(workers, len(keys)))]
+            logger.debug(
+                "Parallel %s -> tables=%s, workers=%s",
+                method, len(keys), len(chunks)
+            )
+            with ThreadPoolExecutor(max_workers=len(chunks)) as pool:
+                for results in pool.map(reflect_chunk, chunks):
+                    merged.update(results)
+        return self._merge_parallel_results(keys, merged, unreflectable)
+
+    @staticmethod
+    def _merge_parallel_results(keys, merged, unreflectable):
+        for key in keys:
+            if key not in merged:
+                continue
+            result = merged[key]
+            if isinstance(result, exc.UnreflectableTableError):
+                unreflectable.setdefault(key, result)
+            else:
+                yield key, result
+
+    def get_multi_columns(self, connection, **kw):
+        return self._parallel_multi_reflect("get_columns", connection, **kw)
+
+    def get_multi_pk_constraint(self, connection, **kw):
+        return self._parallel_multi_reflect(
+            "get_pk_constraint", connection, **kw)
+
+    def get_multi_foreign_keys(self, connection, **kw):
+        return self._parallel_multi_reflect(
+            "get_foreign_keys", connection, **kw)
+
+    def get_multi_indexes(self, connection, **kw):
+        return self._parallel_multi_reflect("get_indexes", connection, **kw)
 
     # reflection: these all defer to an BaseDB2Reflector
     # object which selects between DB2 and AS/400 schemas
@@ -1354,13 +2036,15 @@ class DB2Dialect(default.DefaultDialect):
                 logger.warning("DBMS name not detected from connection")
             else:
                 logger.info(
-                    f"Connected to DB Server -> name={self.dbms_name}, version={self.dbms_ver}"
+                    "Connected to DB Server -> name=%s, version=%s",
+                    self.dbms_name, self.dbms_ver
                 )
             DB2Dialect.serverType = self.dbms_name
             super(DB2Dialect, self).initialize(connection)
             logger.debug(
-                f"SQLAlchemy version branch -> SA_VERSION_MM={SA_VERSION_MM}, "
-                f"returns_unicode_strings={self.returns_unicode_strings}"
+                "SQLAlchemy version branch -> SA_VERSION_MM=%s, "
+                "returns_unicode_strings=%s",
+                SA_VERSION_MM, self.returns_unicode_strings
             )
             selected_reflector = self._reflector_cls
             if self.dbms_name == 'AS':
@@ -1374,140 +2058,169 @@ class DB2Dialect(default.DefaultDialect):
             elif self.dbms_name and self.dbms_name.startswith("DSN"):
                 selected_reflector = ibm_reflection.OS390Reflector
             self._reflector = selected_reflector(self)
-            logger.info(f"Reflector selected -> {selected_reflector.__name__}")
+            logger.info("Reflector selected -> %s", selected_reflector.__name__)
+            if self.native_boolean is None:
+                self.supports_native_boolean = self._server_has_boolean()
+            else:
+                self.supports_native_boolean = self.native_boolean
+            logger.info("Native BOOLEAN -> %s", self.supports_native_boolean)
         except Exception as e:
-            logger.critical(f"Dialect initialization failed: {e}")
+            logger.critical("Dialect initialization failed: %s", e)
             raise
 
+    def _server_has_boolean(self):
+        # BOOLEAN columns and literals: Db2 for LUW 11.1, Db2 for i 7.5
+        dbms_name = self.dbms_name or ""
+        try:
+            version = DB2DDLCompiler.get_server_version_info(self)
+        except ValueError:
+            return False
+        if dbms_name.startswith("DB2/"):
+            return version >= [11, 1]
+        if dbms_name == "AS":
+            return version >= [7, 5]
+        return False
+
     @log_entry_exit
     def get_columns(self, connection, table_name, schema=None, **kw):
-        logger.debug(f"Fetching columns -> table={table_name}, schema={schema}")
-        columns = self._reflector.get_columns(connection, table_name, schema=schema, **kw)
+        logger.debug("Fetching columns -> table=%s, schema=%s", table_name, schema)
+        columns = self._reflect("get_columns", connection, table_name, schema=schema, **kw)
         if not columns:
-            logger.warning(f"No columns found -> table={table_name}")
+            logger.warning("No columns found -> table=%s", table_name)
         else:
-            logger.debug(f"Columns fetched -> count={len(columns)}")
+            logger.debug("Columns fetched -> count=%s", len(columns))
         return columns
 
     @log_entry_exit
     def get_pk_constraint(self, connection, table_name, schema=None, **kw):
-        logger.debug(f"Fetching PK -> table={table_name}, schema={schema}")
-        pk = self._reflector.get_pk_constraint(connection, table_name, schema=schema, **kw)
+        logger.debug("Fetching PK -> table=%s, schema=%s", table_name, schema)
+        pk = self._reflect("get_pk_constraint", connection, table_name, schema=schema, **kw)
         if not pk or not pk.get("constrained_columns"):
-            logger.warning(f"No primary key found -> table={table_name}")
+            logger.warning("No primary key found -> table=%s", table_name)
         else:
-            logger.debug(f"PK columns -> {pk.get('constrained_columns')}")
+            logger.debug("PK columns -> %s", pk.get('constrained_columns'))
         return pk
 
     @log_entry_exit
     def get_foreign_keys(self, connection, table_name, schema=None, **kw):
-        logger.debug(f"Fetching foreign keys -> table={table_name}, schema={schema}")
-        fks = self._reflector.get_foreign_keys(connection, table_name, schema=schema, **kw)
-        logger.debug(f"Foreign keys fetched -> count={len(fks)}")
+        logger.debug("Fetching foreign keys -> table=%s, schema=%s", table_name, schema)
+        fks = self._reflect("get_foreign_keys", connection, table_name, schema=schema, **kw)
+        logger.debug("Foreign keys fetched -> count=%s", len(fks))
         return fks
 
     @log_entry_exit
     def get_table_names(self, connection, schema=None, **kw):
-        logger.debug(f"Fetching table names -> schema={schema}")
-        tables = self._reflector.get_table_names(connection, schema=schema, **kw)
-        logger.debug(f"Tables fetched -> count={len(tables)}")
+        logger.debug("Fetching table names -> schema=%s", schema)
+        tables = self._reflect("get_table_names", connection, schema=schema, **kw)
+        logger.debug("Tables fetched -> count=%s", len(tables))
         return tables
 
     @log_entry_exit
     def get_view_names(self, connection, schema=None, **kw):
-        logger.debug(f"Fetching view names -> schema={schema}")
-        views = self._reflector.get_view_names(connection, schema=schema, **kw)
-        logger.debug(f"Views fetched -> count={len(views)}")
+        logger.debug("Fetching view names -> schema=%s", schema)
+        views = self._reflect("get_view_names", connection, schema=schema, **kw)
+        logger.debug("Views fetched -> count=%s", len(views))
         return views
 
     @log_entry_exit
     def get_sequence_names(self, connection, schema=None, **kw):
-        logger.debug(f"Fetching sequence names -> schema={schema}")
-        sequences = self._reflector.get_sequence_names(connection, schema=schema, **kw)
-        logger.debug(f"Sequences fetched -> count={len(sequences)}")
+        logger.debug("Fetching sequence names -> schema=%s", schema)
+        sequences = self._reflect("get_sequence_names", connection, schema=schema, **kw)
+        logger.debug("Sequences fetched -> count=%s", len(sequences))
         return sequences
 
     @log_entry_exit
     def get_view_definition(self, connection, view_name, schema=None, **kw):
-        logger.debug(f"Fetching view definition -> view={view_name}, schema={schema}")
-        definition = self._reflector.get_view_definition(connection, view_name, schema=schema, **kw)
+        logger.debug("Fetching view definition -> view=%s, schema=%s", view_name, schema)
+        definition = self._reflect("get_view_definition", connection, view_name, schema=schema, **kw)
         if definition:
-            logger.debug(f"View definition length -> {len(definition)} characters")
+            logger.debug("View definition length -> %s characters", len(definition))
         else:
-            logger.warning(f"View definition not found -> view={view_name}")
+            logger.warning("View definition not found -> view=%s", view_name)
         return definition
 
     @log_entry_exit
     def get_indexes(self, connection, table_name, schema=None, **kw):
-        logger.debug(f"Fetching indexes -> table={table_name}, schema={schema}")
-        indexes = self._reflector.get_indexes(connection, table_name, schema=schema, **kw)
-        logger.debug(f"Indexes fetched -> count={len(indexes)}")
+        logger.debug("Fetching indexes -> table=%s, schema=%s", table_name, schema)
+        indexes = self._reflect("get_indexes", connection, table_name, schema=schema, **kw)
+        logger.debug("Indexes fetched -> count=%s", len(indexes))
         return indexes
 
     @log_entry_exit
     def get_unique_constraints(self, connection, table_name, schema=None, **kw):
-        logger.debug(f"Fetching unique constraints -> table={table_name}, schema={schema}")
-        constraints = self._reflector.get_unique_constraints(connection, table_name, schema=schema, **kw)
-        logger.debug(f"Unique constraints fetched -> count={len(constraints)}")
+        logger.debug("Fetching unique constraints -> table=%s, schema=%s", table_name, schema)
+        constraints = self._reflect("get_unique_constraints", connection, table_name, schema=schema, **kw)
+        logger.debug("Unique constraints fetched -> count=%s", len(constraints))
         return constraints
 
     @log_entry_exit
     def get_table_comment(self, connection, table_name, schema=None, **kw):
-        logger.debug(f"Fetching table comment -> table={table_name}, schema={schema}")
-        comment = self._reflector.get_table_comment(connection, table_name, schema=schema, **kw)
+        logger.debug("Fetching table comment -> table=%s, schema=%s", table_name, schema)
+        comment = self._reflect("get_table_comment", connection, table_name, schema=schema, **kw)
         if comment:
             logger.debug("Table comment present")
         else:
             logger.debug("No table comment found")
         return comment
 
+    @log_entry_exit
+    def get_table_stats(self, connection, table_name, schema=None, **kw):
+        logger.debug("Fetching table statistics -> table=%s, schema=%s", table_name, schema)
+        return self._reflect("get_table_stats", connection, table_name, schema=schema, **kw)
+
+    @log_entry_exit
+    def get_index_stats(self, connection, table_name, schema=None, **kw):
+        logger.debug("Fetching index statistics -> table=%s, schema=%s", table_name, schema)
+        return self._reflect("get_index_stats", connection, table_name, schema=schema, **kw)
+
     @log_entry_exit
     def normalize_name(self, name):
         normalized = self._reflector.normalize_name(name)
-        logger.debug(f"Normalize -> original={name}, normalized={normalized}")
+        logger.debug("Normalize -> original=%s, normalized=%s", name, normalized)
         return normalized
 
     @log_entry_exit
     def denormalize_name(self, name):
         denormalized = self._reflector.denormalize_name(name)
-        logger.debug(f"Denormalize -> original={name}, denormalized={denormalized}")
+        logger.debug("Denormalize -> original=%s, denormalized=%s", name, denormalized)
         return denormalized
 
     @log_entry_exit
     def has_table(self, connection, table_name, schema=None, **kw):
         if not isinstance(table_name, str) or len(table_name) > 128:
             logger.debug(
-                f"has_table -> returning False (invalid table_name: "
-                f"type={type(table_name).__name__}, "
-                f"len={len(table_name) if isinstance(table_name, str) else 'N/A'})"
+                "has_table -> returning False (invalid table_name: "
+                "type=%s, "
+                "len=%s)",
+                type(table_name).__name__, len(table_name) if isinstance(table_name, str) else 'N/A'
             )
             return False
-        exists = self._reflector.has_table(connection, table_name, schema=schema, **kw)
-        logger.debug(f"Table exists -> {exists}")
+        exists = self._reflect("has_table", connection, table_name, schema=schema, **kw)
+        logger.debug("Table exists -> %s", exists)
         return exists
 
     @log_entry_exit
     def has_sequence(self, connection, sequence_name, schema=None, **kw):
-        exists = self._reflector.has_sequence(connection, sequence_name, schema=schema, **kw)
-        logger.debug(f"Sequence exists -> {exists}")
+        exists = self._reflect("has_sequence", connection, sequence_name, schema=schema, **kw)
+        logger.debug("Sequence exists -> %s", exists)
         return exists
 
     @log_entry_exit
     def get_schema_names(self, connection, **kw):
-        schemas = self._reflector.get_schema_names(connection, **kw)
-        logger.debug(f"Schemas fetched -> count={len(schemas)}")
+        schemas = self._reflect("get_schema_names", connection, **kw)
+        logger.debug("Schemas fetched -> count=%s", len(schemas))
         return schemas
 
     @log_entry_exit
     def get_primary_keys(self, connection, table_name, schema=None, **kw):
-        keys = self._reflector.get_primary_keys(connection, table_name, schema=schema, **kw)
-        logger.debug(f"Primary keys fetched -> count={len(keys)}")
+        keys = self._reflect("get_primary_keys", connection, table_name, schema=schema, **kw)
+        logger.debug("Primary keys fetched -> count=%s", len(keys))
         return keys
 
     @log_entry_exit
     def get_incoming_foreign_keys(self, connection, table_name, schema=None, **kw):
-        fks = self._reflector.get_incoming_foreign_keys(connection, table_name, schema=schema, **kw)
-        logger.debug(f"Incoming foreign keys fetched -> count={len(fks)}")
+        fks = self._reflect("get_incoming_foreign_keys", connection, table_name, schema=schema, **kw)
+        logger.debug("Incoming foreign keys fetched -> count=%s", len(fks))
         return fks
 
 
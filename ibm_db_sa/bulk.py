@@ -0,0 +1,174 @@
+# +--------------------------------------------------------------------------+
+# |  Licensed Materials - Property of IBM                                    |
+# |                                                                          |
+# | (C) Copyright IBM Corporation 2026.                                      |
+# +--------------------------------------------------------------------------+
+# | Licensed under the Apache License, Version 2.0 (the "License");          |
+# | you may not use this file except in compliance with the License.         |
+# | You may obtain a copy of the License at                                  |
+# | http://www.apache.org/licenses/LICENSE-2.0 Unless required by applicable |
+# | law or agreed to in writing, software distributed under the License is   |
+# | distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY |
+# | KIND, either express or implied. See the License for the specific        |
+# | language governing permissions and limitations under the License.        |
+# +--------------------------------------------------------------------------+
+"""Bulk loading through the Db2 LOAD and IMPORT utilities.
+
+::
+
+    import ibm_db_sa
+
+    with engine.connect() as conn:
+        result = ibm_db_sa.bulk_load(conn, orders, rows, mode="REPLACE")
+    print(result.rows_loaded, result.rows_rejected)
+
+Rows from Python are staged into a NOT LOGGED declared global temporary
+table with array inserts, then moved into the target with
+``SYSPROC.ADMIN_CMD('LOAD FROM (SELECT ...) OF CURSOR ...')``.  A path
+string instead of rows names a delimited file on the database server.
+Servers without ADMIN_CMD (Db2 for i, Db2 for z/OS) get batched INSERTs.
+"""
+import itertools
+import collections
+import collections.abc
+
+from sqlalchemy import exc, Column
+
+from .logger import logger
+from .temptable import GlobalTemporaryTable
+
+BulkLoadResult = collections.namedtuple(
+    "BulkLoadResult", ["method", "rows_read", "rows_loaded", "rows_rejected",
+                       "rows_skipped", "rows_deleted"])
+
+METHODS = ("LOAD", "IMPORT", "INSERT")
+MODES = ("INSERT", "REPLACE")
+
+# staging tables get a name of their own per call, so that a bulk_load()
+# running while another one on the same connection is staging (e.g. from
+# the rows generator) does not replace that one's table
+_STAGE_TABLE = "IBM_DB_SA_BULK_STAGE_%d"
+_stage_ids = itertools.count(1)
+
+
+def _quote_string(value):
+    return "'%s'" % value.replace("'", "''")
+
+
+def _supports_admin_cmd(dialect):
+    dbms_name = getattr(dialect, "dbms_name", None) or ""
+    return dbms_name.startswith("DB2/")
+
+
+def _batches(rows, keys, batch_size):
+    rows = iter(rows)
+    while True:
+        batch = list(itertools.islice(rows, batch_size))
+        if not batch:
+            return
+        yield [row if isinstance(row, collections.abc.Mapping)
+               else dict(zip(keys, row)) for row in batch]
+
+
+def _call_admin_cmd(connection, command):
+    logger.info("Running ADMIN_CMD -> %s", command)
+    result = connection.exec_driver_sql("CALL SYSPROC.ADMIN_CMD(?)", (command,))
+    row = result.mappings().first() if result.returns_rows else None
+    return dict((key.upper(), value) for key, value in (row or {}).items())
+
+
+def _utility_result(method, counts):
+    def count(*names):
+        return sum(counts.get(name) or 0 for name in names)
+    return BulkLoadResult(
+        method, count("ROWS_READ"),
+        count("ROWS_LOADED", "ROWS_INSERTED", "ROWS_UPDATED"),
+        count("ROWS_REJECTED"), count("ROWS_SKIPPED"), count("ROWS_DELETED"))
+
+
+def _insert(connection, table, rows, keys, mode, batch_size):
+    deleted = 0
+    if mode == "REPLACE":
+        deleted = max(connection.execute(table.delete()).rowcount, 0)
+    loaded = 0
+    insert = table.insert()
+    for batch in _batches(rows, keys, batch_size):
+        connection.execute(insert, batch)
+        loaded += len(batch)
+    return BulkLoadResult("INSERT", loaded, loaded, 0, 0, deleted)
+
+
+def bulk_load(connection, table, rows, mode="INSERT", method="LOAD",
+              columns=None, batch_size=10000, nonrecoverable=True):
+    """Load ``rows`` into ``table`` and return a :class:`BulkLoadResult`.
+
+    ``rows`` is an iterable of mappings keyed by column key, or of
+    sequences in ``columns`` order (default: all columns of ``table``).
+    It may also be the path of a delimited (DEL) file on the database
+    server, which LOAD or IMPORT read directly.
+
+    ``mode`` is "INSERT" (append) or "REPLACE" (empty the table first).
+    ``method`` is "LOAD", "IMPORT" or "INSERT"; LOAD and IMPORT need
+    ``SYSPROC.ADMIN_CMD`` and fall back to INSERT on servers without it.
+    IMPORT only reads server files, so rows from Python are inserted.
+    LOAD commits on its own; ``nonrecoverable`` keeps it from leaving the
+    table space in backup pending state.
+    """
+    mode = mode.upper()
+    method = method.upper()
+    if mode not in MODES:
+        raise exc.ArgumentError("bulk_load() mode must be one of %s, got %r"
+                                % (", ".join(MODES), mode))
+    if method == "INGEST":
+        raise exc.ArgumentError(
+            "INGEST is a CLP command and cannot be run through ADMIN_CMD; "
+            "use method='LOAD'")
+    if method not in METHODS:
+        raise exc.ArgumentError("bulk_load() method must be one of %s, got %r"
+                                % (", ".join(METHODS), method))
+
+    dialect = connection.dialect
+    preparer = dialect.identifier_preparer
+    target_columns = [table.c[name] for name in columns] if columns else list(table.c)
+    keys = [column.key for column in target_columns]
+    column_list = ", ".join(preparer.format_column(column) for column in target_columns)
+    target = "%s INTO %s (%s)" % (mode, preparer.format_table(table), column_list)
+    load_options = " NONRECOVERABLE" if nonrecoverable else ""
+
+    if isinstance(rows, str):
+        if method == "INSERT" or not _supports_admin_cmd(dialect):
+            raise exc.ArgumentError(
+                "Loading the server file %s needs ADMIN_CMD LOAD or IMPORT" % rows)
+        if method == "LOAD":
+            command = "LOAD FROM %s OF DEL MESSAGES ON SERVER %s%s" % (
+                _quote_string(rows), target, load_options)
+        else:
+            command = "IMPORT FROM %s OF DEL MESSAGES ON SERVER %s" % (
+                _quote_string(rows), target)
+        return _utility_result(method, _call_admin_cmd(connection, command))
+
+    if method != "LOAD" or not _supports_admin_cmd(dialect):
+        logger.debug("bulk_load() inserting rows -> table=%s, method=%s, dbms_name=%s",
+                     table.name, method, getattr(dialect, "dbms_name", None))
+        return _insert(connection, table, rows, keys, mode, batch_size)
+
+    # only the loaded columns, all nullable; the target's constraints are
+    # checked by LOAD
+    stage = GlobalTemporaryTable(
+        _STAGE_TABLE % next(_stage_ids),
+        *[Column(column.name, column.type, key=column.key)
+          for column in target_columns])
+    stage_name = preparer.format_table(stage.table)
+    connection.exec_driver_sql(stage._declare_sql(dialect))
+    try:
+        staged = 0
+        insert = stage.table.insert()
+        for batch in _batches(rows, keys, batch_size):
+            connection.execute(insert, batch)
+            staged += len(batch)
+        logger.debug("bulk_load() staged rows -> table=%s, rows=%s", table.name, staged)
+        command = "LOAD FROM (SELECT %s FROM %s) OF CURSOR MESSAGES ON SERVER %s%s" % (
+            column_list, stage_name, target, load_options)
+        return _utility_result("LOAD", _call_admin_cmd(connection, command))
+    finally:
+        connection.exec_driver_sql("DROP TABLE %s" % stage_name)
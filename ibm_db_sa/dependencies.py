@@ -0,0 +1,135 @@
+# +--------------------------------------------------------------------------+
+# |  Licensed Materials - Property of IBM                                    |
+# |                                                                          |
+# | (C) Copyright IBM Corporation 2026.                                      |
+# +--------------------------------------------------------------------------+
+# | Licensed under the Apache License, Version 2.0 (the "License");          |
+# | you may not use this file except in compliance with the License.         |
+# | You may obtain a copy of the License at                                  |
+# | http://www.apache.org/licenses/LICENSE-2.0 Unless required by applicable |
+# | law or agreed to in writing, software distributed under the License is   |
+# | distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY |
+# | KIND, either express or implied. See the License for the specific        |
+# | language governing permissions and limitations under the License.        |
+# +--------------------------------------------------------------------------+
+"""Table-level foreign key dependency graphs.
+
+Returned by ``DB2Dialect.get_foreign_key_graph()``::
+
+    with engine.connect() as conn:
+        graph = engine.dialect.get_foreign_key_graph(conn, ["APP", "HIST"])
+    for schema, table in reversed(graph.sorted_tables()):
+        ...   # children before parents, e.g. to order deletes
+
+"""
+import heapq
+
+from sqlalchemy import exc
+
+
+class ForeignKeyGraph(object):
+    """Foreign key dependencies between tables.
+
+    Tables are ``(schema, table)`` tuples of normalized names; ``edges``
+    is a list of ``(constraint name, child table, parent table)``.
+    """
+
+    def __init__(self, edges, tables=()):
+        self.edges = list(edges)
+        self.tables = set(tables)
+        self._parents = {}
+        self._children = {}
+        for _, child, parent in self.edges:
+            self.tables.add(child)
+            self.tables.add(parent)
+            if child != parent:
+                self._parents.setdefault(child, set()).add(parent)
+                self._children.setdefault(parent, set()).add(child)
+
+    def parents(self, table):
+        """Tables referenced by ``table``'s foreign keys."""
+        return set(self._parents.get(table, ()))
+
+    def children(self, table):
+        """Tables whose foreign keys reference ``table``."""
+        return set(self._children.get(table, ()))
+
+    def sorted_tables(self):
+        """Return every table with parents before their children.
+
+        Self-referencing foreign keys are ignored.  Raises
+        :class:`sqlalchemy.exc.CircularDependencyError` when tables
+        depend on each other in a cycle; :meth:`find_cycles` lists them.
+        """
+        pending = dict(
+            (table, len(self._parents.get(table, ()))) for table in self.tables)
+        ready = [table for table, count in pending.items() if not count]
+        heapq.heapify(ready)
+        result = []
+        while ready:
+            table = heapq.heappop(ready)
+            result.append(table)
+            for child in self._children.get(table, ()):
+                pending[child] -= 1
+                if not pending[child]:
+                    heapq.heappush(ready, child)
+        if len(result) < len(self.tables):
+            cycles = self.find_cycles()
+            raise exc.CircularDependencyError(
+                "Foreign key cycles between tables: %s" % "; ".join(
+                    " -> ".join("%s.%s" % table for table in cycle)
+                    for cycle in cycles),
+                set(table for cycle in cycles for table in cycle),
+                [(parent, child) for _, child, parent in self.edges
+                 if child != parent])
+        return result
+
+    def find_cycles(self):
+        """Return the groups of tables that depend on each other, as
+        sorted lists, one per strongly connected component."""
+        index = {}
+        lowlink = {}
+        stack = []
+        on_stack = set()
+        cycles = []
+        counter = [0]
+
+        # iterative Tarjan, so that long FK chains cannot hit the
+        # recursion limit
+        for root in sorted(self.tables):
+            if root in index:
+                continue
+            work = [(root, iter(sorted(self._parents.get(root, ()))))]
+            index[root] = lowlink[root] = counter[0]
+            counter[0] += 1
+            stack.append(root)
+            on_stack.add(root)
+            while work:
+                table, parents = work[-1]
+                for parent in parents:
+                    if parent not in index:
+                        index[parent] = lowlink[parent] = counter[0]
+                        counter[0] += 1
+                        stack.append(parent)
+                        on_stack.add(parent)
+                        work.append(
+                            (parent, iter(sorted(self._parents.get(parent, ())))))
+                        break
+                    if parent in on_stack:
+                        lowlink[table] = min(lowlink[table], index[parent])
+                else:
+                    work.pop()
+                    if work:
+                        caller = work[-1][0]
+                        lowlink[caller] = min(lowlink[caller], lowlink[table])
+                    if lowlink[table] == index[table]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == table:
+                                break
+                        if len(component) > 1:
+                            cycles.append(sorted(component))
+        return sorted(cycles)
@@ -18,12 +18,16 @@
 # +--------------------------------------------------------------------------+
 
 import re
+import weakref
+import decimal
 from sqlalchemy import __version__ as SA_VERSION_STR
 from .logger import init_ibmdbsa_logging, logger, log_entry_exit
 m = re.match(r"^\s*(\d+)\.(\d+)", SA_VERSION_STR)
 SA_VERSION_MM = (int(m.group(1)), int(m.group(2))) if m else (0, 0)
 
-from .base import DB2ExecutionContext, DB2Dialect
+from .base import (DB2ExecutionContext, DB2Dialect, DECFLOAT, _IBM_NativeDate,
+                   _SCHEMA_CHANGE_RE)
+from .stmtcache import StatementCache
 
 if SA_VERSION_MM < (2, 0):
     from sqlalchemy import processors, types as sa_types, util
@@ -45,22 +49,118 @@ else:
     from sqlalchemy.engine import result as _result
 
 
+# DECFLOAT(34) holds 34 digits, more than any DECIMAL
+_DECFLOAT_CONTEXT = decimal.Context(prec=34)
+
+
 class _IBM_Numeric_ibm_db(sa_types.Numeric):
    @log_entry_exit
    def result_processor(self, dialect, coltype):
        logger.debug("Creating result processor for _IBM_Numeric_ibm_db")
-       def to_float(value):
-           logger.debug("Processing numeric result value: %s", value)
-           if value is None:
-               return None
-           else:
-               return float(value)
        if self.asdecimal:
+           # ibm_db_dbi returns DECIMAL and NUMERIC as Decimal already
            logger.debug("Returning None processor since asdecimal=True")
            return None
        else:
            logger.debug("Returning float conversion processor")
-           return to_float
+           return processors.to_float
+
+
+class _IBM_DecFloat_ibm_db(_IBM_Numeric_ibm_db):
+   @log_entry_exit
+   def result_processor(self, dialect, coltype):
+       if not self.asdecimal:
+           return processors.to_float
+       logger.debug("Creating DECFLOAT result processor for _IBM_DecFloat_ibm_db")
+       decimal_cls = decimal.Decimal
+       create_decimal = _DECFLOAT_CONTEXT.create_decimal
+
+       def process(value):
+           # DECFLOAT may come back as a string, including Infinity/NaN
+           if value is None or value.__class__ is decimal_cls:
+               return value
+           return create_decimal(value)
+
+       return process
+
+
+class _IBM_Numeric_thin(_IBM_Numeric_ibm_db):
+   def result_processor(self, dialect, coltype):
+       if not self.asdecimal:
+           return processors.to_float
+       # the thin adapter leaves DECIMAL and NUMERIC as ibm_db's strings
+       decimal_cls = decimal.Decimal
+
+       def process(value):
+           if value is None or value.__class__ is decimal_cls:
+               return value
+           try:
+               return decimal_cls(value)
+           except decimal.InvalidOperation:
+               # decimal comma locales
+               return decimal_cls(value.replace(",", "."))
+
+       return process
+
+
+_caching_cursor_classes = {}
+
+
+def _caching_cursor_class(dbapi):
+    """Return a subclass of ``dbapi.Cursor`` (ibm_db_dbi) whose execute()
+    and executemany() take prepared handles from a StatementCache instead
+    of preparing the statement every time."""
+    cursor_cls = _caching_cursor_classes.get(dbapi)
+    if cursor_cls is not None:
+        return cursor_cls
+    import ibm_db
+    base_cls = dbapi.Cursor
+
+    class CachingCursor(base_cls):
+        def __init__(self, conn_handler, conn_object, statement_cache):
+            base_cls.__init__(self, conn_handler, conn_object)
+            self._statement_cache = statement_cache
+            self._cached_statement = None
+
+        def _checkin(self):
+            statement, handle = self._cached_statement, self.stmt_handler
+            self._cached_statement = None
+            if statement is None or handle is None:
+                return
+            self.stmt_handler = None
+            try:
+                # close any result set still open on the handle
+                ibm_db.free_result(handle)
+            except Exception:
+                pass
+            self._statement_cache.checkin(statement, handle)
+
+        def _prepare_helper(self, operation, parameters=None):
+            self._checkin()
+            if getattr(self, "_is_scrollable_cursor", False):
+                return base_cls._prepare_helper(self, operation, parameters)
+            handle = self._statement_cache.checkout(operation)
+            if handle is None:
+                result = base_cls._prepare_helper(self, operation, parameters)
+            else:
+                # the cursor state that _prepare_helper resets
+                self._Cursor__description = None
+                self._Cursor__rowcount = -1
+                self.stmt_handler = handle
+                result = True
+            self._cached_statement = operation
+            return result
+
+        def close(self):
+            if self._cached_statement is None:
+                return base_cls.close(self)
+            # the handle goes back to the cache instead of free_stmt()
+            self._checkin()
+            self.conn_handler = None
+            return True
+
+    cursor_cls = _caching_cursor_classes[dbapi] = CachingCursor
+    return cursor_cls
 
 
 class DB2ExecutionContext_ibm_db(DB2ExecutionContext):
@@ -87,6 +187,15 @@ class DB2ExecutionContext_ibm_db(DB2ExecutionContext):
                         break
         else:
             logger.debug("No compiled_parameters attribute found")
+        self._set_lock_timeout_nowait()
+
+    def post_exec(self):
+        cache = getattr(self._dbapi_connection, "_ibm_db_sa_statement_cache", None)
+        if cache is not None and (
+                self.isddl or _SCHEMA_CHANGE_RE.match(self.statement or "")):
+            logger.debug("Clearing prepared statement cache after DDL")
+            cache.clear()
+        super(DB2ExecutionContext_ibm_db, self).post_exec()
 
     @log_entry_exit
     def get_result_proxy(self):
@@ -118,7 +227,7 @@ class DB2Dialect_ibm_db(DB2Dialect):
     supports_statement_cache = True
     supports_sane_rowcount = True
     supports_sane_multi_rowcount = False
-    supports_native_decimal = False
+    supports_native_decimal = True
     supports_char_length = True
     supports_default_values = False
     supports_multivalues_insert = True
@@ -127,7 +236,9 @@ class DB2Dialect_ibm_db(DB2Dialect):
     colspecs = util.update_copy(
         DB2Dialect.colspecs,
         {
-            sa_types.Numeric: _IBM_Numeric_ibm_db
+            sa_types.Numeric: _IBM_Numeric_ibm_db,
+            DECFLOAT: _IBM_DecFloat_ibm_db,
+            sa_types.Date: _IBM_NativeDate
         }
     )
 
@@ -150,8 +261,49 @@ class DB2Dialect_ibm_db(DB2Dialect):
             import ibm_db_dbi as module
             return module
 
+    @classmethod
+    def get_dialect_cls(cls, url):
+        """Return the thin DBAPI variant of this dialect when the URL has
+        ``ibmdbsa_dbapi=thin``."""
+        for key, value in (url.query or {}).items():
+            if key.lower() == "ibmdbsa_dbapi":
+                if str(value).lower() == "thin":
+                    return _thin_dialect_class(cls)
+                if str(value).lower() != "ibm_db_dbi":
+                    raise ArgumentError(
+                        "Invalid value '%s' for ibmdbsa_dbapi; expected "
+                        "'thin' or 'ibm_db_dbi'" % (value,))
+        return cls
+
+    def on_connect(self):
+        size = self.prepared_statement_cache_size
+        if not size:
+            return None
+        dbapi = self.dbapi
+
+        def install_statement_cache(dbapi_connection):
+            import ibm_db
+            cursor_cls = _caching_cursor_class(dbapi)
+            cache = StatementCache(size, ibm_db.free_stmt)
+            dbapi_connection._ibm_db_sa_statement_cache = cache
+
+            def cursor():
+                if dbapi_connection.conn_handler is None:
+                    raise dbapi.ProgrammingError(
+                        "Cursor cannot be returned; connection is no longer active.")
+                cur = cursor_cls(dbapi_connection.conn_handler, dbapi_connection, cache)
+                cursors = getattr(dbapi_connection, "_cursor_list", None)
+                if cursors is not None:
+                    cursors.append(weakref.ref(cur))
+                return cur
+
+            dbapi_connection.cursor = cursor
+            logger.debug("Prepared statement cache installed -> size=%s", size)
+
+        return install_statement_cache
+
     @log_entry_exit
-    def do_execute(self, cursor, statement, parameters, context=None):
+    def _do_execute(self, cursor, statement, parameters, context=None):
         logger.debug("Executing SQL statement")
         logger.debug("Statement: %s", statement)
         logger.debug("Parameters: %s", parameters)
@@ -163,6 +315,9 @@ class DB2Dialect_ibm_db(DB2Dialect):
             check_server = getattr(DB2Dialect, 'serverType')
             if ("round(" in statement.casefold()) and check_server == "DB2":
                 logger.debug("Applying round() workaround for DB2")
+                if self.compile_stats is not None:
+                    self.compile_stats.record_uncacheable(
+                        statement, "round() parameter inlining")
                 value_index = 0
                 while '?' in statement and value_index < len(parameters):
                     statement = statement.replace('?', str(parameters[value_index]), 1)
@@ -327,4 +482,57 @@ class DB2Dialect_ibm_db(DB2Dialect):
         return False
 
 
+
+class _ThinDBAPIDialect(object):
+    """Mixin selecting ibm_db_sa.thin, the adapter calling the ibm_db C
+    API directly, as the DBAPI instead of ibm_db_dbi."""
+
+    if SA_VERSION_MM < (2, 0):
+        @classmethod
+        def dbapi(cls):
+            logger.debug("Importing thin ibm_db DBAPI adapter")
+            from . import thin as module
+            return module
+    else:
+        @classmethod
+        def import_dbapi(cls):
+            logger.debug("Importing thin ibm_db DBAPI adapter")
+            from . import thin as module
+            return module
+
+    @classmethod
+    def get_dialect_cls(cls, url):
+        return cls
+
+    def on_connect(self):
+        size = self.prepared_statement_cache_size
+        if not size:
+            return None
+
+        def install_statement_cache(dbapi_connection):
+            import ibm_db
+            # thin cursors look the cache up on the connection themselves
+            dbapi_connection._ibm_db_sa_statement_cache = StatementCache(
+                size, ibm_db.free_stmt)
+            logger.debug("Prepared statement cache installed -> size=%s", size)
+
+        return install_statement_cache
+
+
+_thin_dialect_classes = {}
+
+
+def _thin_dialect_class(dialect_cls):
+    """Return the thin DBAPI subclass of ``dialect_cls`` (DB2 or AS400)."""
+    thin_cls = _thin_dialect_classes.get(dialect_cls)
+    if thin_cls is None:
+        thin_cls = _thin_dialect_classes[dialect_cls] = type(
+            dialect_cls.__name__ + "_thin", (_ThinDBAPIDialect, dialect_cls), {
+                "supports_statement_cache": True,
+                "colspecs": util.update_copy(
+                    dialect_cls.colspecs, {sa_types.Numeric: _IBM_Numeric_thin}),
+            })
+    return thin_cls
+
+
 dialect = DB2Dialect_ibm_db
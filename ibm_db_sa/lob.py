@@ -0,0 +1,268 @@
+# +--------------------------------------------------------------------------+
+# |  Licensed Materials - Property of IBM                                    |
+# |                                                                          |
+# | (C) Copyright IBM Corporation 2026.                                      |
+# +--------------------------------------------------------------------------+
+# | Licensed under the Apache License, Version 2.0 (the "License");          |
+# | you may not use this file except in compliance with the License.         |
+# | You may obtain a copy of the License at                                  |
+# | http://www.apache.org/licenses/LICENSE-2.0 Unless required by applicable |
+# | law or agreed to in writing, software distributed under the License is   |
+# | distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY |
+# | KIND, either express or implied. See the License for the specific        |
+# | language governing permissions and limitations under the License.        |
+# +--------------------------------------------------------------------------+
+"""Chunked reads and writes of BLOB, CLOB, DBCLOB and XML values.
+
+The DBAPI drivers fetch a LOB column as one Python value.  The helpers
+here move a single LOB through the connection in ``chunk_size`` pieces
+instead, so only one chunk is held in memory at a time::
+
+    from ibm_db_sa.lob import open_lob, write_lob
+
+    with engine.connect() as conn:
+        with open_lob(conn, docs.c.body, docs.c.id == 42) as reader:
+            shutil.copyfileobj(reader, out)
+
+    with engine.begin() as conn:
+        with open("report.pdf", "rb") as f:
+            write_lob(conn, docs.c.body, docs.c.id == 42, f)
+
+"""
+import io
+import itertools
+
+from sqlalchemy import exc, sql, types as sa_types, Column, Integer, MetaData, Table
+from sqlalchemy.ext.compiler import compiles
+
+from .logger import logger
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+# session table holding the chunks of a value written by write_lob()
+_STAGE_TABLE = "IBM_DB_SA_LOB_STAGE_%d"
+_stage_ids = itertools.count(1)
+
+
+class _xmlserialize(sql.expression.FunctionElement):
+    inherit_cache = True
+    type = sa_types.CLOB()
+
+
+@compiles(_xmlserialize)
+def _compile_xmlserialize(element, compiler, **kw):
+    return "XMLSERIALIZE(CONTENT %s AS CLOB(2G))" % compiler.process(
+        element.clauses, **kw)
+
+
+class LOBReader(object):
+    """Read-only file-like object over a LOB value fetched in chunks.
+
+    ``fetch(offset, size)`` returns ``size`` bytes or characters starting
+    at the zero-based ``offset``; ``length`` is the total size.  Iterating
+    yields chunks of ``chunk_size``.
+    """
+
+    def __init__(self, fetch, length, binary=True, chunk_size=DEFAULT_CHUNK_SIZE):
+        self._fetch = fetch
+        self.length = length
+        self.binary = binary
+        self.chunk_size = chunk_size
+        self._position = 0
+        self.closed = False
+
+    def readable(self):
+        return True
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += self.length
+        self._position = max(0, offset)
+        return self._position
+
+    def read(self, size=-1):
+        if self.closed:
+            raise ValueError("I/O operation on closed LOB reader")
+        remaining = self.length - self._position
+        if size is None or size < 0 or size > remaining:
+            size = remaining
+        empty = b"" if self.binary else ""
+        if size <= 0:
+            return empty
+        pieces = []
+        while size > 0:
+            piece = self._fetch(self._position, min(size, self.chunk_size))
+            if not piece:
+                break
+            pieces.append(piece)
+            self._position += len(piece)
+            size -= len(piece)
+        return empty.join(pieces)
+
+    def __iter__(self):
+        while True:
+            chunk = self.read(self.chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+    def close(self):
+        self.closed = True
+        self._fetch = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def iter_chunks(value, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Yield ``value`` -- bytes, str, a file-like object or an iterable of
+    chunks -- as pieces of at most ``chunk_size``."""
+    if isinstance(value, (bytes, bytearray, memoryview, str)):
+        for offset in range(0, len(value), chunk_size):
+            yield value[offset:offset + chunk_size]
+    elif hasattr(value, "read"):
+        while True:
+            chunk = value.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+    else:
+        for chunk in value:
+            for piece in iter_chunks(chunk, chunk_size):
+                yield piece
+
+
+def _is_xml(column):
+    return getattr(column.type, "__visit_name__", None) == "XML"
+
+
+def _source(column):
+    # XML has no SUBSTR(); serialize it to a CLOB first
+    if _is_xml(column):
+        return _xmlserialize(column), False
+    binary = isinstance(column.type, sa_types._Binary)
+    return column, binary
+
+
+def open_lob(connection, column, whereclause, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Return a :class:`LOBReader` over ``column`` of the single row
+    matching ``whereclause``, or None when the value is NULL.
+
+    Each ``read()`` selects only the requested part of the value with
+    ``SUBSTR``; character LOBs are addressed in characters (CODEUNITS32).
+    Raises ``NoResultFound``/``MultipleResultsFound`` unless exactly one
+    row matches.
+    """
+    source, binary = _source(column)
+    if binary:
+        length = sql.func.length(source)
+    else:
+        length = sql.func.character_length(source, sql.literal_column("CODEUNITS32"))
+    total = connection.execute(
+        sql.select(length).select_from(column.table).where(whereclause)
+    ).scalar_one()
+    if total is None:
+        return None
+    start = sql.bindparam("start", type_=sa_types.Integer)
+    size = sql.bindparam("size", type_=sa_types.Integer)
+    if binary:
+        piece = sql.func.substr(source, start, size)
+    else:
+        piece = sql.func.substring(source, start, size,
+                                   sql.literal_column("CODEUNITS32"))
+    query = sql.select(piece).select_from(column.table).where(whereclause)
+    logger.debug("Opening LOB reader -> column=%s, length=%s", column, total)
+
+    def fetch(offset, count):
+        return connection.execute(
+            query, {"start": offset + 1, "size": count}).scalar()
+
+    return LOBReader(fetch, total, binary=binary, chunk_size=chunk_size)
+
+
+def write_lob(connection, column, whereclause, value, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Store ``value`` -- bytes, str, a file-like object or an iterable of
+    chunks -- into ``column`` of the rows matching ``whereclause``.
+
+    No more than ``chunk_size`` is bound per statement.  A value of more
+    than one chunk is inserted chunk by chunk into a NOT LOGGED session
+    table, which needs a user temporary table space; the chunks are then
+    joined there pairwise and the result is stored with a single UPDATE.
+    XML columns are not supported.  Returns the number of bytes or
+    characters written.  Run it inside a transaction so readers never
+    see a partial value.
+    """
+    if _is_xml(column):
+        raise exc.ArgumentError(
+            "write_lob() cannot write the XML column %s; XML values cannot "
+            "be concatenated" % column)
+    table = column.table
+    binary = isinstance(column.type, sa_types._Binary)
+    chunks = (piece for piece in iter_chunks(value, chunk_size) if piece)
+    first = next(chunks, None)
+    second = next(chunks, None)
+    if second is None:
+        # one statement; an empty value is stored rather than left as is
+        if first is None:
+            first = b"" if binary else ""
+        connection.execute(table.update().where(whereclause).values(
+            {column: sql.bindparam("chunk", type_=column.type)}), {"chunk": first})
+        logger.debug("LOB written -> column=%s, length=%s", column, len(first))
+        return len(first)
+
+    preparer = connection.dialect.identifier_preparer
+    if binary:
+        piece_type = "BLOB(2G)"
+    elif getattr(column.type, "__visit_name__", None) == "DBCLOB":
+        piece_type = "DBCLOB(1G)"
+    else:
+        piece_type = "CLOB(2G)"
+    stage = Table(_STAGE_TABLE % next(_stage_ids), MetaData(),
+                  Column("seq", Integer), Column("piece", column.type),
+                  schema="SESSION")
+    stage_name = preparer.format_table(stage)
+    connection.exec_driver_sql(
+        "DECLARE GLOBAL TEMPORARY TABLE %s (%s INTEGER NOT NULL, %s %s) "
+        "ON COMMIT PRESERVE ROWS NOT LOGGED WITH REPLACE"
+        % (stage_name, preparer.format_column(stage.c.seq),
+           preparer.format_column(stage.c.piece), piece_type))
+    try:
+        insert = stage.insert()
+        count = written = 0
+        for piece in itertools.chain((first, second), chunks):
+            connection.execute(insert, {"seq": count, "piece": piece})
+            count += 1
+            written += len(piece)
+        # join neighbouring pieces until row 0 holds the whole value: each
+        # round copies the value once, so n chunks cost log2(n) copies
+        # rather than the n of appending every chunk to the column
+        other = stage.alias("other")
+        step = 1
+        while step < count:
+            span = sql.literal_column(str(2 * step), Integer)
+            following = stage.c.seq + sql.literal_column(str(step), Integer)
+            connection.execute(stage.update().where(
+                sql.func.mod(stage.c.seq, span) == 0,
+                following < sql.literal_column(str(count), Integer)
+            ).values(piece=stage.c.piece.concat(
+                sql.select(other.c.piece).where(other.c.seq == following)
+                .scalar_subquery())))
+            connection.execute(
+                stage.delete().where(sql.func.mod(stage.c.seq, span) != 0))
+            step *= 2
+        connection.execute(table.update().where(whereclause).values(
+            {column: sql.select(stage.c.piece).where(stage.c.seq == 0)
+             .scalar_subquery()}))
+    finally:
+        connection.exec_driver_sql("DROP TABLE %s" % stage_name)
+    logger.debug("LOB written -> column=%s, length=%s, chunks=%s",
+                 column, written, count)
+    return written
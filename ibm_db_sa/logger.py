@@ -2,7 +2,10 @@ import logging as ibmdbsa_logging
 import functools
 import inspect
 logger = ibmdbsa_logging.getLogger("ibm_db_sa")
-logger.setLevel(ibmdbsa_logging.DEBUG)
+# DEBUG/INFO records are only built once logging is configured, so the
+# many debug calls in the compiler and reflection paths cost a level check
+# and no string formatting while logging is off
+logger.setLevel(ibmdbsa_logging.WARNING)
 logger.propagate = False  # prevent propagation to root logger
 
 def configure_ibmdbsa_logging(target=False):
@@ -24,6 +27,7 @@ def configure_ibmdbsa_logging(target=False):
        except Exception:
            pass
    if not target:
+       logger.setLevel(ibmdbsa_logging.WARNING)
        logger.disabled = True
        logger._ibmdbsa_target = target
        return
@@ -43,9 +47,10 @@ def configure_ibmdbsa_logging(target=False):
    )
    handler.setFormatter(formatter)
    logger.addHandler(handler)
+   logger.setLevel(ibmdbsa_logging.DEBUG)
    logger.disabled = False
    logger._ibmdbsa_target = target
-   logger.debug(f"IBM_DB_SA logging initialized -> {target}")
+   logger.debug("IBM_DB_SA logging initialized -> %s", target)
 
 def init_ibmdbsa_logging(url):
    """
@@ -77,39 +82,55 @@ def init_ibmdbsa_logging(url):
    if ibmdbsa_log_value is not None:
        configure_ibmdbsa_logging(ibmdbsa_log_value)
        logger.debug(
-           f"ibm_db_sa logging enabled via URL parameter -> {ibmdbsa_log_value}"
+           "ibm_db_sa logging enabled via URL parameter -> %s",
+           ibmdbsa_log_value
        )
    return url, ibmdbsa_log_value
 
 def log_entry_exit(func):
-   """Logs entry, exit, execution time, and exceptions."""
-   import time
+   """Logs entry, exit, execution time, and exceptions.
+
+   Timings use time.perf_counter_ns() and are also attached to the exit
+   record as the ``ibm_db_sa_function`` and ``ibm_db_sa_duration_ns``
+   attributes so log handlers can aggregate them.  Nothing is measured
+   while INFO is disabled for the ibm_db_sa logger.
+   """
+   from time import perf_counter_ns
+   name = func.__name__
    @functools.wraps(func)
    async def async_wrapper(*args, **kwargs):
-       start = time.time()
        try:
-           logger.info(f"Entry: {func.__name__}")
+           if not logger.isEnabledFor(ibmdbsa_logging.INFO):
+               return await func(*args, **kwargs)
+           start = perf_counter_ns()
+           logger.info("Entry: %s", name)
            result = await func(*args, **kwargs)
-           duration = round((time.time() - start) * 1000, 2)
-           logger.info(f"Exit: {func.__name__} (took {duration} ms)")
+           _log_exit(name, perf_counter_ns() - start)
            return result
        except Exception as e:
-           logger.exception(f"Exception in {func.__name__}: {e}")
+           logger.exception("Exception in %s: %s", name, e)
            raise
    @functools.wraps(func)
    def sync_wrapper(*args, **kwargs):
-       start = time.time()
        try:
-           logger.info(f"Entry: {func.__name__}")
+           if not logger.isEnabledFor(ibmdbsa_logging.INFO):
+               return func(*args, **kwargs)
+           start = perf_counter_ns()
+           logger.info("Entry: %s", name)
            result = func(*args, **kwargs)
-           duration = round((time.time() - start) * 1000, 2)
-           logger.info(f"Exit: {func.__name__} (took {duration} ms)")
+           _log_exit(name, perf_counter_ns() - start)
            return result
        except Exception as e:
-           logger.exception(f"Exception in {func.__name__}: {e}")
+           logger.exception("Exception in %s: %s", name, e)
            raise
    return async_wrapper if inspect.iscoroutinefunction(func) else sync_wrapper
 
+def _log_exit(name, duration_ns):
+   logger.info(
+       "Exit: %s (took %.3f ms)", name, duration_ns / 1e6,
+       extra={"ibm_db_sa_function": name, "ibm_db_sa_duration_ns": duration_ns}
+   )
+
 def _format_args(args, kwargs):
    parts = []
    if args:
@@ -0,0 +1,335 @@
+# +--------------------------------------------------------------------------+
+# |  Licensed Materials - Property of IBM                                    |
+# |                                                                          |
+# | (C) Copyright IBM Corporation 2026.                                      |
+# +--------------------------------------------------------------------------+
+# | Licensed under the Apache License, Version 2.0 (the "License");          |
+# | you may not use this file except in compliance with the License.         |
+# | You may obtain a copy of the License at                                  |
+# | http://www.apache.org/licenses/LICENSE-2.0 Unless required by applicable |
+# | law or agreed to in writing, software distributed under the License is   |
+# | distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY |
+# | KIND, either express or implied. See the License for the specific        |
+# | language governing permissions and limitations under the License.        |
+# +--------------------------------------------------------------------------+
+"""In-process instrumentation for the ibm_db_sa dialects.
+
+Collectors are switched on per engine through dialect keyword arguments
+and are reachable afterwards from ``engine.dialect``::
+
+    engine = create_engine("db2+ibm_db://...", compile_stats=True,
+                           statement_metrics=True)
+    ...
+    print(engine.dialect.compile_stats.report())
+    print(engine.dialect.statement_metrics.to_prometheus())
+
+"""
+import re
+import bisect
+import threading
+import functools
+
+from .logger import logger
+
+_STRING_LITERAL_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL_RE = re.compile(r"(?<![\w.])\d+(?:\.\d+)?(?![\w.])")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+@functools.lru_cache(maxsize=2048)
+def statement_fingerprint(statement):
+    """Return the shape of a SQL string.
+
+    String and numeric literals are replaced with ``?`` and whitespace is
+    collapsed, so statements that differ only in inlined values share one
+    fingerprint.
+    """
+    text = _STRING_LITERAL_RE.sub("?", statement)
+    text = _NUMBER_LITERAL_RE.sub("?", text)
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+
+class _ShapeCounts(object):
+    __slots__ = ("compiles", "hits", "misses", "uncacheable", "reasons")
+
+    def __init__(self):
+        self.compiles = 0
+        self.hits = 0
+        self.misses = 0
+        self.uncacheable = 0
+        self.reasons = set()
+
+    @property
+    def recompiles(self):
+        return self.misses + self.uncacheable
+
+
+class CompileCacheStats(object):
+    """Counts compilations and compiled-cache outcomes per statement shape.
+
+    ``record_compile()`` is called by :class:`.DB2Compiler` every time a
+    statement is compiled; ``record_execution()`` is called by
+    :class:`.DB2ExecutionContext` with the cache outcome SQLAlchemy
+    reported for the execution (SQLAlchemy 1.4 and later).  Once
+    ``max_shapes`` distinct shapes are tracked, further shapes only count
+    towards the totals.
+    """
+
+    _uncacheable_outcomes = frozenset(
+        ["NO_CACHE_KEY", "CACHING_DISABLED", "NO_DIALECT_SUPPORT"])
+
+    def __init__(self, max_shapes=1000):
+        self.max_shapes = max_shapes
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.compiles = 0
+            self.hits = 0
+            self.misses = 0
+            self.uncacheable = 0
+            self._shapes = {}
+
+    def _shape(self, statement):
+        key = statement_fingerprint(statement)
+        counts = self._shapes.get(key)
+        if counts is None and len(self._shapes) < self.max_shapes:
+            counts = self._shapes[key] = _ShapeCounts()
+        return counts
+
+    def record_compile(self, statement, reasons=()):
+        with self._lock:
+            self.compiles += 1
+            counts = self._shape(statement)
+            if counts is not None:
+                counts.compiles += 1
+                counts.reasons.update(reasons)
+
+    def record_execution(self, statement, cache_hit):
+        outcome = getattr(cache_hit, "name", None)
+        if outcome is None:
+            return
+        with self._lock:
+            counts = self._shape(statement)
+            if outcome == "CACHE_HIT":
+                self.hits += 1
+                if counts is not None:
+                    counts.hits += 1
+            elif outcome == "CACHE_MISS":
+                self.misses += 1
+                if counts is not None:
+                    counts.misses += 1
+            elif outcome in self._uncacheable_outcomes:
+                self.uncacheable += 1
+                if counts is not None:
+                    counts.uncacheable += 1
+                    counts.reasons.add(outcome.lower())
+
+    def record_uncacheable(self, statement, reason):
+        """Flag a statement whose text is rebuilt on every execution."""
+        with self._lock:
+            self.uncacheable += 1
+            counts = self._shape(statement)
+            if counts is not None:
+                counts.uncacheable += 1
+                counts.reasons.add(reason)
+
+    def top_offenders(self, limit=10):
+        """Return the statement shapes that recompile most often.
+
+        Each entry is a dict with ``statement``, ``compiles``, ``hits``,
+        ``misses``, ``uncacheable`` and ``reasons`` keys, ordered by
+        misses plus uncacheable executions, then by compile count.
+        """
+        with self._lock:
+            items = [
+                (key, counts) for key, counts in self._shapes.items()
+                if counts.recompiles or counts.reasons
+            ]
+            items.sort(key=lambda item: (item[1].recompiles,
+                                         item[1].compiles), reverse=True)
+            return [
+                {
+                    "statement": key,
+                    "compiles": counts.compiles,
+                    "hits": counts.hits,
+                    "misses": counts.misses,
+                    "uncacheable": counts.uncacheable,
+                    "reasons": sorted(counts.reasons),
+                }
+                for key, counts in items[:limit]
+            ]
+
+    def as_dict(self):
+        with self._lock:
+            return {
+                "compiles": self.compiles,
+                "hits": self.hits,
+                "misses": self.misses,
+                "uncacheable": self.uncacheable,
+                "shapes": len(self._shapes),
+            }
+
+    def report(self, limit=10):
+        """Return a plain-text summary followed by the top offenders."""
+        totals = self.as_dict()
+        lines = [
+            "compiles=%(compiles)d hits=%(hits)d misses=%(misses)d "
+            "uncacheable=%(uncacheable)d shapes=%(shapes)d" % totals
+        ]
+        for entry in self.top_offenders(limit):
+            lines.append(
+                "%(compiles)6d compiles %(misses)6d misses "
+                "%(uncacheable)6d uncacheable  " % entry
+                + entry["statement"][:200]
+                + (" [%s]" % ", ".join(entry["reasons"])
+                   if entry["reasons"] else "")
+            )
+        return "\n".join(lines)
+
+    def log_report(self, limit=10):
+        logger.info("Compiled statement cache report:\n%s", self.report(limit))
+
+
+# upper bounds, in nanoseconds, of the timing histogram buckets:
+# 10us .. 10s in 1-2.5-5 steps
+DEFAULT_BUCKETS_NS = tuple(
+    int(mantissa * 10 ** exponent)
+    for exponent in range(4, 10)
+    for mantissa in (1, 2.5, 5)
+) + (10 ** 10,)
+
+
+class Histogram(object):
+    """Fixed-bucket latency histogram of nanosecond observations."""
+
+    __slots__ = ("bounds", "counts", "count", "sum_ns", "max_ns")
+
+    def __init__(self, bounds=DEFAULT_BUCKETS_NS):
+        self.bounds = bounds
+        # one extra slot for observations above the last bound (+Inf)
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum_ns = 0
+        self.max_ns = 0
+
+    def observe(self, elapsed_ns):
+        self.counts[bisect.bisect_left(self.bounds, elapsed_ns)] += 1
+        self.count += 1
+        self.sum_ns += elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+
+    def quantile(self, q):
+        """Estimate the q-quantile in nanoseconds from the bucket bounds."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, bucket_count in zip(self.bounds, self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                return min(bound, self.max_ns)
+        return self.max_ns
+
+    def as_dict(self):
+        return {
+            "count": self.count,
+            "sum_ns": self.sum_ns,
+            "max_ns": self.max_ns,
+            "p50_ns": self.quantile(0.5),
+            "p99_ns": self.quantile(0.99),
+        }
+
+
+class StatementMetrics(object):
+    """Timing histograms per (phase, statement fingerprint).
+
+    This is the default implementation of the ``statement_metrics`` hook.
+    The dialect reports ``perf_counter_ns()`` durations through
+    ``observe(phase, statement, elapsed_ns)`` for these phases:
+
+    ``compile``   DB2Compiler compiling a statement
+    ``execute``   the DBAPI ``execute()``/``executemany()`` call
+    ``fetch``     each DBAPI ``fetchone()``/``fetchmany()``/``fetchall()``
+    ``identity``  the IDENTITY_VAL_LOCAL() round trip in ``post_exec``
+    ``reflect``   one reflector call, keyed by method name
+
+    Any object providing the same ``observe()`` method can be passed as
+    the ``statement_metrics`` dialect argument instead.  Once
+    ``max_series`` series exist, new statements are folded into a single
+    ``<other>`` series per phase so memory stays bounded.
+    """
+
+    overflow_key = "<other>"
+
+    def __init__(self, max_series=1000, buckets=DEFAULT_BUCKETS_NS):
+        self.max_series = max_series
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._series = {}
+
+    def observe(self, phase, statement, elapsed_ns):
+        key = (phase, statement_fingerprint(statement))
+        with self._lock:
+            histogram = self._series.get(key)
+            if histogram is None:
+                if len(self._series) >= self.max_series:
+                    key = (phase, self.overflow_key)
+                    histogram = self._series.get(key)
+                if histogram is None:
+                    histogram = self._series[key] = Histogram(self.buckets)
+            histogram.observe(elapsed_ns)
+
+    def reset(self):
+        with self._lock:
+            self._series = {}
+
+    def snapshot(self):
+        """Return ``{(phase, fingerprint): summary dict}``."""
+        with self._lock:
+            return dict(
+                (key, histogram.as_dict())
+                for key, histogram in self._series.items()
+            )
+
+    def to_prometheus(self, metric="ibm_db_sa_statement_duration_seconds",
+                      max_label_length=200):
+        """Render all series in the Prometheus text exposition format."""
+        with self._lock:
+            series = [
+                (key, list(histogram.counts), histogram.count,
+                 histogram.sum_ns)
+                for key, histogram in sorted(self._series.items())
+            ]
+        lines = [
+            "# HELP %s Time spent per statement and phase." % metric,
+            "# TYPE %s histogram" % metric,
+        ]
+        bounds = ["%g" % (bound / 1e9) for bound in self.buckets] + ["+Inf"]
+        for (phase, statement), counts, count, sum_ns in series:
+            labels = 'phase="%s",statement="%s"' % (
+                phase, _escape_label(statement[:max_label_length]))
+            cumulative = 0
+            for bound, bucket_count in zip(bounds, counts):
+                cumulative += bucket_count
+                lines.append('%s_bucket{%s,le="%s"} %d'
+                             % (metric, labels, bound, cumulative))
+            lines.append("%s_sum{%s} %.9f" % (metric, labels, sum_ns / 1e9))
+            lines.append("%s_count{%s} %d" % (metric, labels, count))
+        return "\n".join(lines) + "\n"
+
+
+def _escape_label(value):
+    return (value.replace("\\", "\\\\")
+            .replace("\"", "\\\"")
+            .replace("\n", "\\n"))
+
+
+__all__ = [
+    "CompileCacheStats",
+    "Histogram",
+    "StatementMetrics",
+    "statement_fingerprint",
+]
@@ -18,10 +18,11 @@
 # +--------------------------------------------------------------------------+
 import re
 from sqlalchemy import util
+from sqlalchemy import types as sa_types
 from .logger import init_ibmdbsa_logging, logger, log_entry_exit
 import urllib
 from sqlalchemy.connectors.pyodbc import PyODBCConnector
-from .base import _SelectLastRowIDMixin, DB2ExecutionContext, DB2Dialect
+from .base import _SelectLastRowIDMixin, DB2ExecutionContext, DB2Dialect, _IBM_NativeDate
 from . import reflection as ibm_reflection
 
 class DB2ExecutionContext_pyodbc(DB2ExecutionContext):
@@ -36,6 +37,13 @@ class DB2Dialect_pyodbc(PyODBCConnector, DB2Dialect):
 
     execution_ctx_cls = DB2ExecutionContext_pyodbc
 
+    colspecs = util.update_copy(
+        DB2Dialect.colspecs,
+        {
+            sa_types.Date: _IBM_NativeDate
+        }
+    )
+
     pyodbc_driver_name = "IBM DB2 ODBC DRIVER"
 
     def create_connect_args(self, url):
@@ -105,6 +113,13 @@ class AS400Dialect_pyodbc(PyODBCConnector, DB2Dialect):
     supports_char_length = True
     supports_native_decimal = False
 
+    colspecs = util.update_copy(
+        DB2Dialect.colspecs,
+        {
+            sa_types.Date: _IBM_NativeDate
+        }
+    )
+
 #    pyodbc_driver_name = "iSeries Access ODBC Driver"
     pyodbc_driver_name ="IBM i Access ODBC Driver"
     _reflector_cls = ibm_reflection.AS400Reflector
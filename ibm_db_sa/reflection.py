@@ -24,8 +24,14 @@ from sqlalchemy.engine import reflection
 from sqlalchemy import *
 from .logger import logger, log_entry_exit
 import re
+import copy
 import codecs
+from itertools import groupby
 from sys import version_info
+from time import monotonic
+
+# column names in SYSCAT.INDEXES.COLNAMES style lists such as "+A+B-C"
+_COLUMN_NAMES_RE = re.compile(r"(\w+)")
 
 
 class CoerceUnicode(sa_types.TypeDecorator):
@@ -39,14 +45,52 @@ class CoerceUnicode(sa_types.TypeDecorator):
 
 
 class BaseReflector(object):
+    # catalog type names whose SQLAlchemy type takes (precision, scale)
+    # or (length)
+    _scaled_types = frozenset(['DECIMAL', 'NUMERIC'])
+    _sized_types = frozenset(['CHARACTER', 'CHAR', 'VARCHAR',
+                              'GRAPHIC', 'VARGRAPHIC',
+                              'BINARY', 'VARBINARY'])
+    # catalog spellings of type names that ischema_names knows by another key
+    _type_aliases = {
+        'LONG VARCHAR': 'LONGVARCHAR', 'LONGVAR': 'LONGVARCHAR',
+        'LONG VARGRAPHIC': 'LONGVARGRAPHIC', 'LONGVARG': 'LONGVARGRAPHIC',
+        'VARG': 'VARGRAPHIC', 'VARBIN': 'VARBINARY', 'TIMESTMP': 'TIMESTAMP',
+    }
+    # character types declared FOR BIT DATA reflect as their binary
+    # counterpart; the catalogs report such columns with code page 0
+    # (SYSCAT.COLUMNS.CODEPAGE) or CCSID 65535
+    _bit_data_types = {'CHAR': 'BINARY', 'CHARACTER': 'BINARY',
+                       'VARCHAR': 'VARBINARY', 'LONGVARCHAR': 'BLOB'}
+    _bit_data_codepages = frozenset([0, 65535])
+    # DECFLOAT storage length in bytes -> precision in digits
+    _decfloat_precisions = {8: 16, 16: 34}
+    # (id(ischema_names), typename, length, scale, codepage) -> type, shared
+    # by all reflectors; resolve_type() hands out copies of these
+    _resolved_types = {}
+    _resolved_types_limit = 4096
+    # statistics returned by get_table_stats()/get_index_stats(); the
+    # _*_stats_fields name the ones each catalog's stats queries select
+    _table_stats = ('row_count', 'pages', 'stats_time')
+    _index_stats = ('first_key_cardinality', 'full_key_cardinality',
+                    'key_count', 'leaf_pages', 'levels', 'stats_time')
+    _table_stats_fields = ('row_count', 'pages', 'stats_time')
+    _index_stats_fields = ('first_key_cardinality', 'full_key_cardinality',
+                           'leaf_pages', 'levels', 'stats_time')
+
     @log_entry_exit
     def __init__(self, dialect):
         self.dialect = dialect
         self.ischema_names = dialect.ischema_names
         self.identifier_preparer = dialect.identifier_preparer
+        # (kind, schema) -> (expires_at, frozenset of catalog names)
+        self._name_index = {}
+        # (kind, schema) -> (expires_at, {table: statistics})
+        self._stats_cache = {}
         logger.debug(
-            f"BaseReflector initialized -> "
-            f"dialect={dialect}, "
+            "BaseReflector initialized -> "
+            "dialect=%s, ",
+            dialect
         )
 
     @log_entry_exit
@@ -65,15 +109,16 @@ class BaseReflector(object):
                     else name
                 )
                 logger.debug(
-                    f"normalize_name -> original={original_name}, "
-                    f"requires_quotes={requires_quotes}, "
-                    f"result={result}"
+                    "normalize_name -> original=%s, "
+                    "requires_quotes=%s, "
+                    "result=%s",
+                    original_name, requires_quotes, result
                 )
                 return result
             logger.debug("normalize_name -> input is None")
             return name
         except Exception as e:
-            logger.error(f"Error in normalize_name: {e}")
+            logger.error("Error in normalize_name: %s", e)
             logger.exception("Stack trace in normalize_name")
             raise
 
@@ -102,14 +147,15 @@ class BaseReflector(object):
                 else:
                     name = str(name)
             logger.debug(
-                f"denormalize_name -> original={original_name}, "
-                f"requires_quotes={requires_quotes}, "
-                f"supports_unicode_binds={supports_unicode}, "
-                f"result={name}"
+                "denormalize_name -> original=%s, "
+                "requires_quotes=%s, "
+                "supports_unicode_binds=%s, "
+                "result=%s",
+                original_name, requires_quotes, supports_unicode, name
             )
             return name
         except Exception as e:
-            logger.error(f"Error in denormalize_name: {e}")
+            logger.error("Error in denormalize_name: %s", e)
             logger.exception("Stack trace in denormalize_name")
             raise
 
@@ -122,7 +168,8 @@ class BaseReflector(object):
                 u"SELECT CURRENT_SCHEMA FROM SYSIBM.SYSDUMMY1"
             ).scalar()
             logger.debug(
-                f"Raw default schema fetched -> {default_schema_name}"
+                "Raw default schema fetched -> %s",
+                default_schema_name
             )
             if isinstance(default_schema_name, str):
                 default_schema_name = default_schema_name.strip()
@@ -138,19 +185,256 @@ class BaseReflector(object):
                         )
             normalized = self.normalize_name(default_schema_name)
             logger.debug(
-                f"Normalized default schema -> {normalized}"
+                "Normalized default schema -> %s",
+                normalized
             )
             return normalized
         except Exception as e:
-            logger.error(f"Error fetching default schema name: {e}")
+            logger.error("Error fetching default schema name: %s", e)
             logger.exception("Stack trace in _get_default_schema_name")
             raise
 
+    @property
+    def existence_cache_ttl(self):
+        return getattr(self.dialect, "existence_cache_ttl", None)
+
+    def _cached_names(self, connection, kind, schema, query):
+        """Return the catalog names of ``kind`` in ``schema``.
+
+        ``query`` selects every name of that kind in the schema given as
+        the ``schema`` bind parameter; it is run once and its result is
+        reused for ``existence_cache_ttl`` seconds or until
+        :meth:`invalidate_existence_cache` is called.
+        """
+        key = (kind, schema)
+        entry = self._name_index.get(key)
+        now = monotonic()
+        if entry is not None and entry[0] > now:
+            return entry[1]
+        logger.debug("Loading %s existence index -> schema=%s", kind, schema)
+        names = frozenset(
+            r[0].rstrip() for r in connection.execute(query, {"schema": schema}))
+        self._name_index[key] = (now + self.existence_cache_ttl, names)
+        return names
+
+    def invalidate_existence_cache(self, schema=None):
+        """Forget cached table and sequence names, for one schema or all."""
+        if schema is None:
+            self._name_index.clear()
+            return
+        schema = self.denormalize_name(schema)
+        for key in list(self._name_index):
+            if key[1] == schema:
+                self._name_index.pop(key, None)
+
+    @log_entry_exit
+    def get_catalog_version(self, connection, schema=None, **kw):
+        """Return a token that changes when a table or view in ``schema``
+        is created, altered or dropped.
+
+        Built from the newest catalog alter timestamp and the number of
+        tables in the schema; used to detect stale schema snapshots.
+        """
+        try:
+            current_schema = self.denormalize_name(schema or self.default_schema_name)
+            row = connection.execute(
+                self._catalog_version_query, {"schema": current_schema}).first()
+            version = "%s/%s" % (row[0], row[1]) if row is not None else None
+            logger.debug("Catalog version -> schema=%s, version=%s", current_schema, version)
+            return version
+        except Exception as e:
+            logger.error("Error fetching catalog version: %s", e)
+            logger.exception("Stack trace in get_catalog_version")
+            raise
+
+    @log_entry_exit
+    def get_foreign_key_edges(self, connection, schemas, **kw):
+        """Return ``{schema: [(name, child, parent), ...]}`` for the foreign
+        keys declared in ``schemas``, read with a single catalog query.
+
+        Keys are the denormalized schema names; tables are
+        ``(schema, table)`` tuples of normalized names.
+        """
+        try:
+            schemas = [self.denormalize_name(schema) for schema in schemas]
+            logger.debug("Fetching foreign key edges -> schemas=%s", schemas)
+            edges = dict((schema, []) for schema in schemas)
+            rows = connection.execute(
+                self._foreign_key_edges_query, {"schemas": schemas})
+            normalize = self.normalize_name
+            for r in rows:
+                fk_schema = r[1].rstrip()
+                edges.setdefault(fk_schema, []).append((
+                    normalize(r[0].rstrip()),
+                    (normalize(fk_schema), normalize(r[2].rstrip())),
+                    (normalize(r[3].rstrip()), normalize(r[4].rstrip())),
+                ))
+            logger.debug(
+                "Foreign key edges reflected -> %s",
+                dict((schema, len(found)) for schema, found in edges.items())
+            )
+            return edges
+        except Exception as e:
+            logger.error("Error reflecting foreign key edges: %s", e)
+            logger.exception("Stack trace in get_foreign_key_edges")
+            raise
+
+    @property
+    def stats_cache_ttl(self):
+        return getattr(self.dialect, "stats_cache_ttl", None)
+
+    @staticmethod
+    def _stat_value(value):
+        # the catalogs use -1 for "no statistics collected"
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return int(value) if value >= 0 else None
+        return value
+
+    def _read_stats(self, connection, kind, schema, table_name=None):
+        if kind == "table":
+            fields = self._table_stats_fields
+            names = 1
+        else:
+            fields = self._index_stats_fields
+            names = 2
+        params = {"schema": schema}
+        if table_name is None:
+            query = getattr(self, "_schema_%s_stats_query" % kind)
+        else:
+            query = getattr(self, "_%s_stats_query" % kind)
+            params["table"] = table_name
+        logger.debug("Generated %s statistics SQL -> %s", kind, query)
+        by_table = {}
+        for r in connection.execute(query, params):
+            stats = dict.fromkeys(
+                self._table_stats if kind == "table" else self._index_stats)
+            stats.update(zip(fields, [self._stat_value(v) for v in r[names:]]))
+            if kind == "table":
+                by_table[r[0]] = stats
+            else:
+                stats["name"] = self.normalize_name(r[1])
+                by_table.setdefault(r[0], []).append(stats)
+        return by_table
+
+    def _stats_by_table(self, connection, kind, schema, table_name):
+        """Return ``{table: statistics}`` for ``kind`` "table" or "index".
+
+        With ``stats_cache_ttl`` set the whole schema is read in one query
+        and reused until the TTL expires; otherwise only ``table_name`` is
+        read.
+        """
+        ttl = self.stats_cache_ttl
+        if not ttl:
+            return self._read_stats(connection, kind, schema, table_name)
+        key = (kind, schema)
+        entry = self._stats_cache.get(key)
+        now = monotonic()
+        if entry is None or entry[0] <= now:
+            logger.debug("Loading %s statistics -> schema=%s", kind, schema)
+            entry = (now + ttl, self._read_stats(connection, kind, schema))
+            self._stats_cache[key] = entry
+        return entry[1]
+
+    def invalidate_stats_cache(self, schema=None):
+        """Forget cached table and index statistics, for one schema or all."""
+        if schema is None:
+            self._stats_cache.clear()
+            return
+        schema = self.denormalize_name(schema)
+        for key in list(self._stats_cache):
+            if key[1] == schema:
+                self._stats_cache.pop(key, None)
+
+    @log_entry_exit
+    def get_table_stats(self, connection, table_name, schema=None, **kw):
+        """Return the catalog statistics of a table as a dict with
+        ``row_count``, ``pages`` and ``stats_time``, or None if the table
+        has no statistics row.  Values the catalog does not keep are None.
+        """
+        try:
+            current_schema = self.denormalize_name(schema or self.default_schema_name)
+            table_name = self.denormalize_name(table_name)
+            logger.debug("Fetching table statistics -> schema=%s, table=%s", current_schema, table_name)
+            stats = self._stats_by_table(connection, "table", current_schema, table_name)
+            stats = stats.get(table_name)
+            return dict(stats) if stats is not None else None
+        except Exception as e:
+            logger.error("Error reflecting table statistics: %s", e)
+            logger.exception("Stack trace in get_table_stats")
+            raise
+
+    @log_entry_exit
+    def get_index_stats(self, connection, table_name, schema=None, **kw):
+        """Return one dict per index of a table with its ``name``,
+        ``first_key_cardinality``, ``full_key_cardinality``, ``key_count``,
+        ``leaf_pages``, ``levels`` and ``stats_time``.  Values the catalog
+        does not keep are None.
+        """
+        try:
+            current_schema = self.denormalize_name(schema or self.default_schema_name)
+            table_name = self.denormalize_name(table_name)
+            logger.debug("Fetching index statistics -> schema=%s, table=%s", current_schema, table_name)
+            stats = self._stats_by_table(connection, "index", current_schema, table_name)
+            return [dict(index) for index in stats.get(table_name, [])]
+        except Exception as e:
+            logger.error("Error reflecting index statistics: %s", e)
+            logger.exception("Stack trace in get_index_stats")
+            raise
+
+    def resolve_type(self, typename, length=None, scale=None, codepage=None):
+        """Return the SQLAlchemy type for a catalog column description.
+
+        Results are memoized on ``(typename, length, scale, codepage)``.
+        The memoized instance itself is not handed out: ``column_reflect``
+        listeners receive the type in the column dict and may change it in
+        place, and the dialect cannot tell whether one is registered, so
+        each call returns a shallow ``copy.copy()`` of it.  That is one
+        small allocation per column; the catalog lookups and argument
+        handling of ``_build_type()`` still run once per distinct
+        description.  Type classes (schema types such as BOOLEAN, which
+        the caller instantiates per column) are returned as they are.
+        Returns None for an unknown type name.
+        """
+        key = (id(self.ischema_names), typename, length, scale, codepage)
+        coltype = self._resolved_types.get(key)
+        if coltype is None:
+            coltype = self._build_type(typename, length, scale, codepage)
+            if coltype is None:
+                return None
+            if len(self._resolved_types) < self._resolved_types_limit:
+                self._resolved_types[key] = coltype
+        if isinstance(coltype, type):
+            return coltype
+        return copy.copy(coltype)
+
+    def _build_type(self, typename, length, scale, codepage):
+        name = typename.strip().upper()
+        name = self._type_aliases.get(name, name)
+        if codepage in self._bit_data_codepages and name in self._bit_data_types:
+            name = self._bit_data_types[name]
+        type_cls = self.ischema_names.get(name)
+        if type_cls is None:
+            return None
+        if name in self._scaled_types:
+            return type_cls(int(length), int(scale))
+        if name in self._sized_types:
+            return type_cls(int(length))
+        if name == 'DECFLOAT':
+            return type_cls(self._decfloat_precisions.get(length))
+        if name == 'TIMESTAMP' and scale is not None:
+            return type_cls(precision=int(scale))
+        if issubclass(type_cls, sa_types.SchemaType):
+            # schema types attach themselves to their column's table and
+            # cannot be shared; the class is instantiated per column
+            return type_cls
+        return type_cls()
+
     @property
     def default_schema_name(self):
         schema_name = self.dialect.default_schema_name
         logger.debug(
-            f"Accessing default_schema_name property -> {schema_name}"
+            "Accessing default_schema_name property -> %s",
+            schema_name
         )
         return schema_name
 
@@ -175,15 +459,35 @@ class DB2Reflector(BaseReflector):
       Column("TYPE", CoerceUnicode, key="type"),
       Column("STATUS", CoerceUnicode, key="status"),
       Column("REMARKS", CoerceUnicode, key="remarks"),
+      Column("ALTER_TIME", sa_types.DateTime, key="altertime"),
+      Column("CARD", sa_types.BigInteger, key="card"),
+      Column("NPAGES", sa_types.BigInteger, key="npages"),
+      Column("STATS_TIME", sa_types.DateTime, key="stats_time"),
       schema="SYSCAT")
 
     sys_indexes = Table("INDEXES", ischema,
       Column("TABSCHEMA", CoerceUnicode, key="tabschema"),
       Column("TABNAME", CoerceUnicode, key="tabname"),
+      Column("INDSCHEMA", CoerceUnicode, key="indschema"),
       Column("INDNAME", CoerceUnicode, key="indname"),
       Column("COLNAMES", CoerceUnicode, key="colnames"),
       Column("UNIQUERULE", CoerceUnicode, key="uniquerule"),
       Column("SYSTEM_REQUIRED", sa_types.SMALLINT, key="system_required"),
+      Column("FIRSTKEYCARD", sa_types.BigInteger, key="firstkeycard"),
+      Column("FULLKEYCARD", sa_types.BigInteger, key="fullkeycard"),
+      Column("NLEAF", sa_types.BigInteger, key="nleaf"),
+      Column("NLEVELS", sa_types.SMALLINT, key="nlevels"),
+      Column("STATS_TIME", sa_types.DateTime, key="stats_time"),
+      schema="SYSCAT")
+
+    sys_indexcoluse = Table("INDEXCOLUSE", ischema,
+      Column("INDSCHEMA", CoerceUnicode, key="indschema"),
+      Column("INDNAME", CoerceUnicode, key="indname"),
+      Column("COLNAME", CoerceUnicode, key="colname"),
+      Column("COLSEQ", sa_types.SMALLINT, key="colseq"),
+      Column("COLORDER", CoerceUnicode, key="colorder"),
+      Column("VIRTUAL", CoerceUnicode, key="virtual"),
+      Column("TEXT", CoerceUnicode, key="text"),
       schema="SYSCAT")
 
     sys_tabconst = Table("TABCONST", ischema,
@@ -227,6 +531,7 @@ class DB2Reflector(BaseReflector):
       Column("IDENTITY", CoerceUnicode, key="identity"),
       Column("GENERATED", CoerceUnicode, key="generated"),
       Column("REMARKS", CoerceUnicode, key="remarks"),
+      Column("CODEPAGE", sa_types.Integer, key="codepage"),
       schema="SYSCAT")
 
     sys_views = Table("VIEWS", ischema,
@@ -240,12 +545,231 @@ class DB2Reflector(BaseReflector):
       Column("SEQNAME", CoerceUnicode, key="seqname"),
       schema="SYSCAT")
 
+    # Per-object catalog queries are built once per class and executed
+    # with the schema/table names as bound parameters
+    _table_exists_query = sql.select(sys_tables.c.tabname).where(and_(
+        sys_tables.c.tabschema == sql.bindparam("schema"),
+        sys_tables.c.tabname == sql.bindparam("table")
+    ))
+
+    _table_names_query = sql.select(sys_tables.c.tabname).where(
+        sys_tables.c.tabschema == sql.bindparam("schema"))
+
+    _catalog_version_query = sql.select(
+        sql.func.max(sys_tables.c.altertime), sql.func.count()
+    ).where(sys_tables.c.tabschema == sql.bindparam("schema"))
+
+    _sequence_exists_query = sql.select(sys_sequences.c.seqname).where(and_(
+        sys_sequences.c.seqschema == sql.bindparam("schema"),
+        sys_sequences.c.seqname == sql.bindparam("sequence")
+    ))
+
+    _sequence_names_query = sql.select(sys_sequences.c.seqname).where(
+        sys_sequences.c.seqschema == sql.bindparam("schema"))
+
+    # has_table()/has_sequence() without a default schema
+    _any_table_exists_query = sql.select(sys_tables.c.tabname).where(
+        sys_tables.c.tabname == sql.bindparam("table"))
+
+    _any_sequence_exists_query = sql.select(sys_sequences.c.seqname).where(
+        sys_sequences.c.seqname == sql.bindparam("sequence"))
+
+    # listings returned by get_*_names()
+    _sorted_sequence_names_query = (
+        sql.select(sys_sequences.c.seqname)
+        .where(sys_sequences.c.seqschema == sql.bindparam("schema"))
+        .order_by(sys_sequences.c.seqschema, sys_sequences.c.seqname)
+    )
+
+    _view_names_query = (
+        sql.select(sys_views.c.viewname)
+        .where(sys_views.c.viewschema == sql.bindparam("schema"))
+        .order_by(sys_views.c.viewname)
+    )
+
+    _sorted_table_names_query = (
+        sql.select(sys_tables.c.tabname)
+        .where(sys_tables.c.type == 'T')
+        .where(sys_tables.c.tabschema == sql.bindparam("schema"))
+        .order_by(sys_tables.c.tabname)
+    )
+
+    _schema_names_query = (
+        sql.select(sys_schemas.c.schemaname)
+        .where(not_(sys_schemas.c.schemaname.like('SYS%')))
+        .order_by(sys_schemas.c.schemaname)
+    )
+
+    _table_comment_query = sql.select(sys_tables.c.remarks).where(and_(
+        sys_tables.c.tabschema == sql.bindparam("schema"),
+        sys_tables.c.tabname == sql.bindparam("table")
+    ))
+
+    # (table, <_table_stats_fields>) and (table, index, <_index_stats_fields>)
+    # for a whole schema, and narrowed to one table
+    _schema_table_stats_query = sql.select(
+        sys_tables.c.tabname, sys_tables.c.card, sys_tables.c.npages,
+        sys_tables.c.stats_time
+    ).where(sys_tables.c.tabschema == sql.bindparam("schema"))
+
+    _table_stats_query = _schema_table_stats_query.where(
+        sys_tables.c.tabname == sql.bindparam("table"))
+
+    _schema_index_stats_query = sql.select(
+        sys_indexes.c.tabname, sys_indexes.c.indname,
+        sys_indexes.c.firstkeycard, sys_indexes.c.fullkeycard,
+        sys_indexes.c.nleaf, sys_indexes.c.nlevels, sys_indexes.c.stats_time
+    ).where(sys_indexes.c.tabschema == sql.bindparam("schema"))
+
+    _index_stats_query = _schema_index_stats_query.where(
+        sys_indexes.c.tabname == sql.bindparam("table"))
+
+    _view_definition_query = sql.select(sys_views.c.text).where(and_(
+        sys_views.c.viewschema == sql.bindparam("schema"),
+        sys_views.c.viewname == sql.bindparam("view")
+    ))
+
+    _columns_query = (
+        sql.select(
+            sys_columns.c.colname, sys_columns.c.typename,
+            sys_columns.c.defaultval, sys_columns.c.nullable,
+            sys_columns.c.length, sys_columns.c.scale,
+            sys_columns.c.identity, sys_columns.c.generated,
+            sys_columns.c.remarks, sys_columns.c.codepage
+        )
+        .where(and_(
+            sys_columns.c.tabschema == sql.bindparam("schema"),
+            sys_columns.c.tabname == sql.bindparam("table")
+        ))
+        .order_by(sys_columns.c.colno)
+    )
+
+    _pk_constraint_query = (
+        sql.select(sys_indexes.c.colnames, sys_indexes.c.indname)
+        .where(and_(
+            sys_indexes.c.tabschema == sql.bindparam("schema"),
+            sys_indexes.c.tabname == sql.bindparam("table"),
+            sys_indexes.c.uniquerule == 'P'
+        ))
+        .order_by(sys_indexes.c.tabschema, sys_indexes.c.tabname)
+    )
+
+    _primary_keys_query = (
+        sql.select(sys_columns.c.colname)
+        .where(and_(
+            sys_columns.c.tabschema == sql.bindparam("schema"),
+            sys_columns.c.tabname == sql.bindparam("table"),
+            sys_columns.c.keyseq > 0
+        ))
+        .order_by(sys_columns.c.tabschema, sys_columns.c.tabname)
+    )
+
+    _foreign_keys_query = (
+        sql.select(
+            sys_foreignkeys.c.fkname, sys_foreignkeys.c.fktabschema,
+            sys_foreignkeys.c.fktabname, sys_foreignkeys.c.fkcolname,
+            sys_foreignkeys.c.pkname, sys_foreignkeys.c.pktabschema,
+            sys_foreignkeys.c.pktabname, sys_foreignkeys.c.pkcolname
+        )
+        .select_from(
+            join(
+                sys_tables,
+                sys_foreignkeys,
+                sql.and_(
+                    sys_tables.c.tabname == sys_foreignkeys.c.pktabname,
+                    sys_tables.c.tabschema == sys_foreignkeys.c.pktabschema
+                )
+            )
+        )
+        .where(sys_tables.c.type == 'T')
+        .where(sys_tables.c.tabschema == sql.bindparam("schema"))
+        .where(sys_foreignkeys.c.fktabname == sql.bindparam("table"))
+        .order_by(sys_tables.c.tabname)
+    )
+
+    _incoming_foreign_keys_query = (
+        sql.select(
+            sys_foreignkeys.c.fkname, sys_foreignkeys.c.fktabschema,
+            sys_foreignkeys.c.fktabname, sys_foreignkeys.c.fkcolname,
+            sys_foreignkeys.c.pkname, sys_foreignkeys.c.pktabschema,
+            sys_foreignkeys.c.pktabname, sys_foreignkeys.c.pkcolname
+        )
+        .where(and_(
+            sys_foreignkeys.c.pktabschema == sql.bindparam("schema"),
+            sys_foreignkeys.c.pktabname == sql.bindparam("table")
+        ))
+        .order_by(sys_foreignkeys.c.colno)
+    )
+
+    # (constraint, child schema, child, parent schema, parent) for every
+    # foreign key declared in the given schemas
+    _foreign_key_edges_query = (
+        sql.select(
+            sys_foreignkeys.c.fkname, sys_foreignkeys.c.fktabschema,
+            sys_foreignkeys.c.fktabname, sys_foreignkeys.c.pktabschema,
+            sys_foreignkeys.c.pktabname
+        )
+        .where(sys_foreignkeys.c.fktabschema.in_(
+            sql.bindparam("schemas", expanding=True)))
+        .distinct()
+    )
+
+    # one row per index key, in key order
+    _index_columns_query = (
+        sql.select(
+            sys_indexes.c.tabname, sys_indexes.c.indschema,
+            sys_indexes.c.indname, sys_indexes.c.uniquerule,
+            sys_indexes.c.system_required, sys_indexcoluse.c.colname,
+            sys_indexcoluse.c.colorder, sys_indexcoluse.c.virtual,
+            sys_indexcoluse.c.text
+        )
+        .select_from(
+            join(
+                sys_indexes,
+                sys_indexcoluse,
+                and_(
+                    sys_indexes.c.indschema == sys_indexcoluse.c.indschema,
+                    sys_indexes.c.indname == sys_indexcoluse.c.indname
+                )
+            )
+        )
+        .where(sys_indexes.c.tabschema == sql.bindparam("schema"))
+        .order_by(
+            sys_indexes.c.tabname, sys_indexes.c.indschema,
+            sys_indexes.c.indname, sys_indexcoluse.c.colseq
+        )
+    )
+
+    _table_index_columns_query = _index_columns_query.where(
+        sys_indexes.c.tabname == sql.bindparam("table"))
+
+    _unique_constraints_query = (
+        sql.select(sys_keycoluse.c.constname, sys_keycoluse.c.colname)
+        .select_from(
+            join(
+                sys_keycoluse,
+                sys_tabconst,
+                and_(
+                    sys_keycoluse.c.constname == sys_tabconst.c.constname,
+                    sys_keycoluse.c.tabschema == sys_tabconst.c.tabschema,
+                    sys_keycoluse.c.tabname == sys_tabconst.c.tabname,
+                ),
+            )
+        )
+        .where(and_(
+            sys_tabconst.c.tabname == sql.bindparam("table"),
+            sys_tabconst.c.tabschema == sql.bindparam("schema"),
+            sys_tabconst.c.type == "U",
+        ))
+        .order_by(sys_keycoluse.c.constname)
+    )
+
     @log_entry_exit
     def has_table(self, connection, table_name, schema=None, **kw):
         try:
             if not isinstance(table_name, str) or len(table_name) > 128:
                 return False
-            logger.debug(f"Checking table existence -> schema={schema}, table={table_name}")
+            logger.debug("Checking table existence -> schema=%s, table=%s", schema, table_name)
             current_schema = self.denormalize_name(schema or self.default_schema_name)
             original_table_name = table_name
             if table_name.startswith("'") and table_name.endswith("'"):
@@ -254,52 +778,62 @@ class DB2Reflector(BaseReflector):
             else:
                 table_name = self.denormalize_name(table_name)
             logger.debug(
-                f"Resolved identifiers -> "
-                f"schema={current_schema}, "
-                f"table={table_name}"
+                "Resolved identifiers -> "
+                "schema=%s, "
+                "table=%s",
+                current_schema, table_name
             )
-            if current_schema:
-                whereclause = sql.and_(
-                    self.sys_tables.c.tabschema == current_schema,
-                    self.sys_tables.c.tabname == table_name
+            if current_schema and self.existence_cache_ttl:
+                names = self._cached_names(
+                    connection, "table", current_schema,
+                    self._table_names_query
                 )
+                return table_name in names
+            if current_schema:
+                s = self._table_exists_query
             else:
-                whereclause = self.sys_tables.c.tabname == table_name
-            s = sql.select(self.sys_tables.c.tabname).where(whereclause)
-            logger.debug(f"Generated has_table SQL -> {s}")
-            result = connection.execute(s).first() is not None
-            logger.debug(f"has_table result -> table={original_table_name}, exists={result}")
+                s = self._any_table_exists_query
+            logger.debug("Generated has_table SQL -> %s", s)
+            result = connection.execute(
+                s, {"schema": current_schema, "table": table_name}
+            ).first() is not None
+            logger.debug("has_table result -> table=%s, exists=%s", original_table_name, result)
             return result
         except Exception as e:
-            logger.error(f"Error checking table existence: {e}")
+            logger.error("Error checking table existence: %s", e)
             logger.exception("Stack trace in has_table")
             raise
 
     @log_entry_exit
     def has_sequence(self, connection, sequence_name, schema=None):
         try:
-            logger.debug(f"Checking sequence existence -> schema={schema}, sequence={sequence_name}")
+            logger.debug("Checking sequence existence -> schema=%s, sequence=%s", schema, sequence_name)
             current_schema = self.denormalize_name(schema or self.default_schema_name)
             sequence_name = self.denormalize_name(sequence_name)
             logger.debug(
-                f"Resolved identifiers -> "
-                f"schema={current_schema}, "
-                f"sequence={sequence_name}"
+                "Resolved identifiers -> "
+                "schema=%s, "
+                "sequence=%s",
+                current_schema, sequence_name
             )
-            if current_schema:
-                whereclause = sql.and_(
-                    self.sys_sequences.c.seqschema == current_schema,
-                    self.sys_sequences.c.seqname == sequence_name
+            if current_schema and self.existence_cache_ttl:
+                names = self._cached_names(
+                    connection, "sequence", current_schema,
+                    self._sequence_names_query
                 )
+                return sequence_name in names
+            if current_schema:
+                s = self._sequence_exists_query
             else:
-                whereclause = self.sys_sequences.c.seqname == sequence_name
-            s = sql.select(self.sys_sequences.c.seqname).where(whereclause)
-            logger.debug(f"Generated has_sequence SQL -> {s}")
-            result = connection.execute(s).first() is not None
-            logger.debug(f"has_sequence result -> sequence={sequence_name}, exists={result}")
+                s = self._any_sequence_exists_query
+            logger.debug("Generated has_sequence SQL -> %s", s)
+            result = connection.execute(
+                s, {"schema": current_schema, "sequence": sequence_name}
+            ).first() is not None
+            logger.debug("has_sequence result -> sequence=%s, exists=%s", sequence_name, result)
             return result
         except Exception as e:
-            logger.error(f"Error checking sequence existence: {e}")
+            logger.error("Error checking sequence existence: %s", e)
             logger.exception("Stack trace in has_sequence")
             raise
 
@@ -308,22 +842,15 @@ class DB2Reflector(BaseReflector):
     def get_sequence_names(self, connection, schema=None, **kw):
         try:
             current_schema = self.denormalize_name(schema or self.default_schema_name)
-            logger.debug(f"Fetching sequence names -> schema={current_schema}")
-            sys_sequence = self.sys_sequences
-            query = (
-                sql.select(sys_sequence.c.seqname)
-                .where(sys_sequence.c.seqschema == current_schema)
-                .order_by(
-                    sys_sequence.c.seqschema,
-                    sys_sequence.c.seqname
-                )
-            )
-            logger.debug(f"Generated get_sequence_names SQL -> {query}")
-            result = [self.normalize_name(r[0]) for r in connection.execute(query)]
-            logger.debug(f"Reflected sequences -> count={len(result)}, sequences={result}")
+            logger.debug("Fetching sequence names -> schema=%s", current_schema)
+            query = self._sorted_sequence_names_query
+            logger.debug("Generated get_sequence_names SQL -> %s", query)
+            result = [self.normalize_name(r[0]) for r in connection.execute(
+                query, {"schema": current_schema})]
+            logger.debug("Reflected sequences -> count=%s, sequences=%s", len(result), result)
             return result
         except Exception as e:
-            logger.error(f"Error fetching sequence names: {e}")
+            logger.error("Error fetching sequence names: %s", e)
             logger.exception("Stack trace in get_sequence_names")
             raise
 
@@ -332,18 +859,13 @@ class DB2Reflector(BaseReflector):
     def get_schema_names(self, connection, **kw):
         try:
             logger.debug("Fetching schema names.")
-            sysschema = self.sys_schemas
-            query = (
-                sql.select(sysschema.c.schemaname)
-                .where(not_(sysschema.c.schemaname.like('SYS%')))
-                .order_by(sysschema.c.schemaname)
-            )
-            logger.debug(f"Generated get_schema_names SQL -> {query}")
+            query = self._schema_names_query
+            logger.debug("Generated get_schema_names SQL -> %s", query)
             result = [self.normalize_name(r[0].rstrip()) for r in connection.execute(query)]
-            logger.debug(f"Reflected schemas -> count={len(result)}, schemas={result}")
+            logger.debug("Reflected schemas -> count=%s, schemas=%s", len(result), result)
             return result
         except Exception as e:
-            logger.error(f"Error fetching schema names: {e}")
+            logger.error("Error fetching schema names: %s", e)
             logger.exception("Stack trace in get_schema_names")
             raise
 
@@ -352,20 +874,15 @@ class DB2Reflector(BaseReflector):
     def get_table_names(self, connection, schema=None, **kw):
         try:
             current_schema = self.denormalize_name(schema or self.default_schema_name)
-            logger.debug(f"Fetching table names -> schema={current_schema}")
-            systbl = self.sys_tables
-            query = (
-                sql.select(systbl.c.tabname)
-                .where(systbl.c.type == 'T')
-                .where(systbl.c.tabschema == current_schema)
-                .order_by(systbl.c.tabname)
-            )
-            logger.debug(f"Generated get_table_names SQL -> {query}")
-            result = [self.normalize_name(r[0]) for r in connection.execute(query)]
-            logger.debug(f"Reflected tables -> count={len(result)}, tables={result}")
+            logger.debug("Fetching table names -> schema=%s", current_schema)
+            query = self._sorted_table_names_query
+            logger.debug("Generated get_table_names SQL -> %s", query)
+            result = [self.normalize_name(r[0]) for r in connection.execute(
+                query, {"schema": current_schema})]
+            logger.debug("Reflected tables -> count=%s, tables=%s", len(result), result)
             return result
         except Exception as e:
-            logger.error(f"Error fetching table names: {e}")
+            logger.error("Error fetching table names: %s", e)
             logger.exception("Stack trace in get_table_names")
             raise
 
@@ -375,19 +892,14 @@ class DB2Reflector(BaseReflector):
         try:
             current_schema = self.denormalize_name(schema or self.default_schema_name)
             table_name = self.denormalize_name(table_name)
-            logger.debug(f"Fetching table comment -> schema={current_schema}, table={table_name}")
-            systbl = self.sys_tables
-            query = (
-                sql.select(systbl.c.remarks)
-                .where(systbl.c.tabschema == current_schema)
-                .where(systbl.c.tabname == table_name)
-            )
-            logger.debug(f"Generated get_table_comment SQL -> {query}")
-            comment = connection.execute(query).scalar()
-            logger.debug(f"Table comment result -> {comment}")
+            logger.debug("Fetching table comment -> schema=%s, table=%s", current_schema, table_name)
+            query = self._table_comment_query
+            logger.debug("Generated get_table_comment SQL -> %s", query)
+            comment = connection.execute(query, {"schema": current_schema, "table": table_name}).scalar()
+            logger.debug("Table comment result -> %s", comment)
             return {'text': comment}
         except Exception as e:
-            logger.error(f"Error fetching table comment: {e}")
+            logger.error("Error fetching table comment: %s", e)
             logger.exception("Stack trace in get_table_comment")
             raise
 
@@ -396,18 +908,15 @@ class DB2Reflector(BaseReflector):
     def get_view_names(self, connection, schema=None, **kw):
         try:
             current_schema = self.denormalize_name(schema or self.default_schema_name)
-            logger.debug(f"Fetching view names -> schema={current_schema}")
-            query = (
-                sql.select(self.sys_views.c.viewname)
-                .where(self.sys_views.c.viewschema == current_schema)
-                .order_by(self.sys_views.c.viewname)
-            )
-            logger.debug(f"Generated get_view_names SQL -> {query}")
-            result = [self.normalize_name(r[0]) for r in connection.execute(query)]
-            logger.debug(f"Reflected views -> count={len(result)}, views={result}")
+            logger.debug("Fetching view names -> schema=%s", current_schema)
+            query = self._view_names_query
+            logger.debug("Generated get_view_names SQL -> %s", query)
+            result = [self.normalize_name(r[0]) for r in connection.execute(
+                query, {"schema": current_schema})]
+            logger.debug("Reflected views -> count=%s, views=%s", len(result), result)
             return result
         except Exception as e:
-            logger.error(f"Error fetching view names: {e}")
+            logger.error("Error fetching view names: %s", e)
             logger.exception("Stack trace in get_view_names")
             raise
 
@@ -417,18 +926,15 @@ class DB2Reflector(BaseReflector):
         try:
             current_schema = self.denormalize_name(schema or self.default_schema_name)
             viewname = self.denormalize_name(viewname)
-            logger.debug(f"Fetching view definition -> schema={current_schema}, view={viewname}")
-            query = (
-                sql.select(self.sys_views.c.text)
-                .where(self.sys_views.c.viewschema == current_schema)
-                .where(self.sys_views.c.viewname == viewname)
-            )
-            logger.debug(f"Generated get_view_definition SQL -> {query}")
-            definition = connection.execute(query).scalar()
-            logger.debug(f"View definition length -> {len(definition) if definition else 0}")
+            logger.debug("Fetching view definition -> schema=%s, view=%s", current_schema, viewname)
+            query = self._view_definition_query
+            logger.debug("Generated get_view_definition SQL -> %s", query)
+            definition = connection.execute(
+                query, {"schema": current_schema, "view": viewname}).scalar()
+            logger.debug("View definition length -> %s", len(definition) if definition else 0)
             return definition
         except Exception as e:
-            logger.error(f"Error fetching view definition: {e}")
+            logger.error("Error fetching view definition: %s", e)
             logger.exception("Stack trace in get_view_definition")
             raise
 
@@ -438,45 +944,26 @@ class DB2Reflector(BaseReflector):
         try:
             current_schema = self.denormalize_name(schema or self.default_schema_name)
             table_name = self.denormalize_name(table_name)
-            logger.debug(f"Fetching columns -> schema={current_schema}, table={table_name}")
-            syscols = self.sys_columns
-            query = (
-                sql.select(
-                    syscols.c.colname, syscols.c.typename,
-                    syscols.c.defaultval, syscols.c.nullable,
-                    syscols.c.length, syscols.c.scale,
-                    syscols.c.identity, syscols.c.generated,
-                    syscols.c.remarks
-                )
-                .where(and_(
-                    syscols.c.tabschema == current_schema,
-                    syscols.c.tabname == table_name
-                ))
-                .order_by(syscols.c.colno)
-            )
-            logger.debug(f"Generated get_columns SQL -> {query}")
+            logger.debug("Fetching columns -> schema=%s, table=%s", current_schema, table_name)
+            query = self._columns_query
+            logger.debug("Generated get_columns SQL -> %s", query)
             sa_columns = []
-            for r in connection.execute(query):
+            for r in connection.execute(query, {"schema": current_schema, "table": table_name}):
                 raw_type = r[1].upper()
                 logger.debug(
-                    f"Processing column -> "
-                    f"name={r[0]}, type={raw_type}, "
-                    f"length={r[4]}, scale={r[5]}"
+                    "Processing column -> "
+                    "name=%s, type=%s, "
+                    "length=%s, scale=%s",
+                    r[0], raw_type, r[4], r[5]
                 )
-                if raw_type in ['DECIMAL', 'NUMERIC']:
-                    coltype = self.ischema_names.get(raw_type)(int(r[4]), int(r[5]))
-                elif raw_type in ['CHARACTER', 'CHAR', 'VARCHAR',
-                                  'GRAPHIC', 'VARGRAPHIC']:
-                    coltype = self.ischema_names.get(raw_type)(int(r[4]))
-                else:
-                    try:
-                        coltype = self.ischema_names[raw_type]
-                    except KeyError:
-                        logger.warning(
-                            f"Unrecognized column type '{raw_type}' "
-                            f"for column '{r[0]}'"
-                        )
-                        coltype = sa_types.NULLTYPE
+                coltype = self.resolve_type(raw_type, r[4], r[5], r[9])
+                if coltype is None:
+                    logger.warning(
+                        "Unrecognized column type '%s' "
+                        "for column '%s'",
+                        raw_type, r[0]
+                    )
+                    coltype = sa_types.NULLTYPE
                 column_info = {
                     'name': self.normalize_name(r[0]),
                     'type': coltype,
@@ -485,12 +972,12 @@ class DB2Reflector(BaseReflector):
                     'autoincrement': (r[6] == 'Y') and (r[7] != ' '),
                     'comment': r[8] or None,
                 }
-                logger.debug(f"Column reflected -> {column_info}")
+                logger.debug("Column reflected -> %s", column_info)
                 sa_columns.append(column_info)
-            logger.debug(f"Total columns reflected -> count={len(sa_columns)}")
+            logger.debug("Total columns reflected -> count=%s", len(sa_columns))
             return sa_columns
         except Exception as e:
-            logger.error(f"Error reflecting columns: {e}")
+            logger.error("Error reflecting columns: %s", e)
             logger.exception("Stack trace in get_columns")
             raise
 
@@ -500,39 +987,28 @@ class DB2Reflector(BaseReflector):
         try:
             current_schema = self.denormalize_name(schema or self.default_schema_name)
             table_name = self.denormalize_name(table_name)
-            logger.debug(f"Fetching primary key -> schema={current_schema}, table={table_name}")
-            sysindexes = self.sys_indexes
-            col_finder = re.compile(r"(\w+)")
-            query = (
-                sql.select(sysindexes.c.colnames, sysindexes.c.indname)
-                .where(and_(
-                    sysindexes.c.tabschema == current_schema,
-                    sysindexes.c.tabname == table_name,
-                    sysindexes.c.uniquerule == 'P'
-                ))
-                .order_by(
-                    sysindexes.c.tabschema,
-                    sysindexes.c.tabname
-                ))
-            logger.debug(f"Generated get_pk_constraint SQL -> {query}")
+            logger.debug("Fetching primary key -> schema=%s, table=%s", current_schema, table_name)
+            query = self._pk_constraint_query
+            logger.debug("Generated get_pk_constraint SQL -> %s", query)
             pk_columns = []
             pk_name = None
-            for r in connection.execute(query):
-                cols = col_finder.findall(r[0])
+            for r in connection.execute(query, {"schema": current_schema, "table": table_name}):
+                cols = _COLUMN_NAMES_RE.findall(r[0])
                 pk_columns.extend(cols)
                 if not pk_name:
                     pk_name = self.normalize_name(r[1])
             normalized_columns = [self.normalize_name(col) for col in pk_columns]
             logger.debug(
-                f"Primary key reflected -> "
-                f"name={pk_name}, columns={normalized_columns}"
+                "Primary key reflected -> "
+                "name=%s, columns=%s",
+                pk_name, normalized_columns
             )
             return {
                 "constrained_columns": normalized_columns,
                 "name": pk_name
             }
         except Exception as e:
-            logger.error(f"Error reflecting primary key: {e}")
+            logger.error("Error reflecting primary key: %s", e)
             logger.exception("Stack trace in get_pk_constraint")
             raise
 
@@ -542,28 +1018,18 @@ class DB2Reflector(BaseReflector):
         try:
             current_schema = self.denormalize_name(schema or self.default_schema_name)
             table_name = self.denormalize_name(table_name)
-            logger.debug(f"Fetching primary keys -> schema={current_schema}, table={table_name}")
-            syscols = self.sys_columns
-            col_finder = re.compile(r"(\w+)")
-            query = (
-                sql.select(syscols.c.colname)
-                .where(and_(
-                    syscols.c.tabschema == current_schema,
-                    syscols.c.tabname == table_name,
-                    syscols.c.keyseq > 0
-                ))
-                .order_by(syscols.c.tabschema, syscols.c.tabname)
-            )
-            logger.debug(f"Generated get_primary_keys SQL -> {query}")
+            logger.debug("Fetching primary keys -> schema=%s, table=%s", current_schema, table_name)
+            query = self._primary_keys_query
+            logger.debug("Generated get_primary_keys SQL -> %s", query)
             pk_columns = []
-            for r in connection.execute(query):
-                cols = col_finder.findall(r[0])
+            for r in connection.execute(query, {"schema": current_schema, "table": table_name}):
+                cols = _COLUMN_NAMES_RE.findall(r[0])
                 pk_columns.extend(cols)
             normalized_columns = [self.normalize_name(col) for col in pk_columns]
-            logger.debug(f"Primary keys reflected -> columns={normalized_columns}")
+            logger.debug("Primary keys reflected -> columns=%s", normalized_columns)
             return normalized_columns
         except Exception as e:
-            logger.error(f"Error reflecting primary keys: {e}")
+            logger.error("Error reflecting primary keys: %s", e)
             logger.exception("Stack trace in get_primary_keys")
             raise
 
@@ -576,36 +1042,14 @@ class DB2Reflector(BaseReflector):
             normalized_default_schema = self.normalize_name(default_schema)
             table_name = self.denormalize_name(table_name)
             logger.debug(
-                f"Fetching foreign keys -> "
-                f"schema={current_schema}, table={table_name}"
-            )
-            sysfkeys = self.sys_foreignkeys
-            systbl = self.sys_tables
-            query = (
-                sql.select(
-                    sysfkeys.c.fkname, sysfkeys.c.fktabschema,
-                    sysfkeys.c.fktabname, sysfkeys.c.fkcolname,
-                    sysfkeys.c.pkname, sysfkeys.c.pktabschema,
-                    sysfkeys.c.pktabname, sysfkeys.c.pkcolname
-                )
-                .select_from(
-                    join(
-                        systbl,
-                        sysfkeys,
-                        sql.and_(
-                            systbl.c.tabname == sysfkeys.c.pktabname,
-                            systbl.c.tabschema == sysfkeys.c.pktabschema
-                        )
-                    )
-                )
-                .where(systbl.c.type == 'T')
-                .where(systbl.c.tabschema == current_schema)
-                .where(sysfkeys.c.fktabname == table_name)
-                .order_by(systbl.c.tabname)
+                "Fetching foreign keys -> "
+                "schema=%s, table=%s",
+                current_schema, table_name
             )
-            logger.debug(f"Generated get_foreign_keys SQL -> {query}")
+            query = self._foreign_keys_query
+            logger.debug("Generated get_foreign_keys SQL -> %s", query)
             fschema = {}
-            for r in connection.execute(query):
+            for r in connection.execute(query, {"schema": current_schema, "table": table_name}):
                 fk_name = r[0]
                 if fk_name not in fschema:
                     referred_schema = self.normalize_name(r[5])
@@ -621,15 +1065,15 @@ class DB2Reflector(BaseReflector):
                         'referred_table': self.normalize_name(r[6]),
                         'referred_columns': [self.normalize_name(r[7])]
                     }
-                    logger.debug(f"Foreign key discovered -> {fschema[fk_name]}")
+                    logger.debug("Foreign key discovered -> %s", fschema[fk_name])
                 else:
                     fschema[fk_name]['constrained_columns'].append(self.normalize_name(r[3]))
                     fschema[fk_name]['referred_columns'].append(self.normalize_name(r[7]))
             result = [value for value in fschema.values()]
-            logger.debug(f"Total foreign keys reflected -> count={len(result)}")
+            logger.debug("Total foreign keys reflected -> count=%s", len(result))
             return result
         except Exception as e:
-            logger.error(f"Error reflecting foreign keys: {e}")
+            logger.error("Error reflecting foreign keys: %s", e)
             logger.exception("Stack trace in get_foreign_keys")
             raise
 
@@ -642,26 +1086,14 @@ class DB2Reflector(BaseReflector):
             normalized_default_schema = self.normalize_name(default_schema)
             table_name = self.denormalize_name(table_name)
             logger.debug(
-                f"Fetching incoming foreign keys -> "
-                f"schema={current_schema}, table={table_name}"
+                "Fetching incoming foreign keys -> "
+                "schema=%s, table=%s",
+                current_schema, table_name
             )
-            sysfkeys = self.sys_foreignkeys
-            query = (
-                sql.select(
-                    sysfkeys.c.fkname, sysfkeys.c.fktabschema,
-                    sysfkeys.c.fktabname, sysfkeys.c.fkcolname,
-                    sysfkeys.c.pkname, sysfkeys.c.pktabschema,
-                    sysfkeys.c.pktabname, sysfkeys.c.pkcolname
-                )
-                .where(and_(
-                    sysfkeys.c.pktabschema == current_schema,
-                    sysfkeys.c.pktabname == table_name
-                ))
-                .order_by(sysfkeys.c.colno)
-            )
-            logger.debug(f"Generated get_incoming_foreign_keys SQL -> {query}")
+            query = self._incoming_foreign_keys_query
+            logger.debug("Generated get_incoming_foreign_keys SQL -> %s", query)
             fschema = {}
-            for r in connection.execute(query):
+            for r in connection.execute(query, {"schema": current_schema, "table": table_name}):
                 fk_name = r[0]
                 if fk_name not in fschema:
                     constrained_schema = self.normalize_name(r[1])
@@ -679,73 +1111,128 @@ class DB2Reflector(BaseReflector):
                         'referred_table': self.normalize_name(r[6]),
                         'referred_columns': [self.normalize_name(r[7])]
                     }
-                    logger.debug(f"Incoming foreign key discovered -> {fschema[fk_name]}")
+                    logger.debug("Incoming foreign key discovered -> %s", fschema[fk_name])
                 else:
                     fschema[fk_name]['constrained_columns'].append(self.normalize_name(r[3]))
                     fschema[fk_name]['referred_columns'].append(self.normalize_name(r[7]))
             result = [value for value in fschema.values()]
-            logger.debug(f"Total incoming foreign keys reflected -> count={len(result)}")
+            logger.debug("Total incoming foreign keys reflected -> count=%s", len(result))
             return result
         except Exception as e:
-            logger.error(f"Error reflecting incoming foreign keys: {e}")
+            logger.error("Error reflecting incoming foreign keys: %s", e)
             logger.exception("Stack trace in get_incoming_foreign_keys")
             raise
 
     @reflection.cache
     @log_entry_exit
-    def get_indexes(self, connection, table_name, schema=None, **kw):
+    def _get_indexes_by_table(self, connection, current_schema,
+                              table_name=None, **kw):
+        """Return ``{table name: [index tuple, ...]}`` for a schema.
+
+        Index keys come from SYSCAT.INDEXCOLUSE in key order.  With
+        ``table_name`` left as None every index in the schema is read in
+        one query, so that repeated ``get_indexes()`` calls sharing an
+        ``info_cache`` are answered from that single result.  Each index
+        is a ``(name, unique, column names, expressions, descending
+        columns, include columns)`` tuple that ``_index_info()`` turns
+        into the dict handed to the caller.
+        """
         try:
-            current_schema = self.denormalize_name(schema or self.default_schema_name)
-            table_name = self.denormalize_name(table_name)
-            logger.debug(f"Fetching indexes -> schema={current_schema}, table={table_name}")
-            sysidx = self.sys_indexes
-            query = (
-                sql.select(sysidx.c.indname, sysidx.c.colnames,
-                    sysidx.c.uniquerule, sysidx.c.system_required
-                )
-                .where(and_(
-                    sysidx.c.tabschema == current_schema,
-                    sysidx.c.tabname == table_name
-                ))
-                .order_by(sysidx.c.tabname)
-            )
-            logger.debug(f"Generated get_indexes SQL -> {query}")
-            indexes = []
-            col_finder = re.compile(r"(\w+)")
-            for r in connection.execute(query):
-                index_name = r[0]
-                column_text = r[1]
-                unique_rule = r[2]
-                system_required = r[3]
-                logger.debug(
-                    f"Processing index row -> "
-                    f"name={index_name}, unique_rule={unique_rule}, "
-                    f"system_required={system_required}"
-                )
+            params = {"schema": current_schema}
+            if table_name is None:
+                query = self._index_columns_query
+            else:
+                query = self._table_index_columns_query
+                params["table"] = table_name
+            logger.debug("Generated get_indexes SQL -> %s", query)
+            by_table = {}
+            rows = connection.execute(query, params)
+            for (tabname, _, index_name), keys in groupby(
+                    rows, lambda r: (r[0], r[1], r[2])):
+                keys = list(keys)
+                unique_rule, system_required = keys[0][3], keys[0][4]
                 if unique_rule == 'P':
-                    logger.debug(f"Skipping primary key index -> {index_name}")
+                    logger.debug("Skipping primary key index -> %s", index_name)
                     continue
                 if unique_rule == 'U' and system_required != 0:
-                    logger.debug(f"Skipping system-required unique index -> {index_name}")
+                    logger.debug("Skipping system-required unique index -> %s", index_name)
                     continue
-                if 'sqlnotapplicable' in column_text.lower():
-                    logger.debug(f"Skipping internal index -> {index_name}")
+                if any((r[5] or '').upper() == 'SQLNOTAPPLICABLE' for r in keys):
+                    logger.debug("Skipping internal index -> %s", index_name)
                     continue
-                normalized_columns = [self.normalize_name(col) for col in col_finder.findall(column_text)]
-                index_info = {
-                    'name': self.normalize_name(index_name),
-                    'column_names': normalized_columns,
-                    'unique': unique_rule == 'U'
-                }
-                logger.debug(f"Index reflected -> {index_info}")
-                indexes.append(index_info)
-            logger.debug(f"Total indexes reflected -> count={len(indexes)}")
-            return indexes
+                column_names = []
+                expressions = []
+                descending = []
+                include_columns = []
+                for r in keys:
+                    colname, colorder, virtual, text = r[5], r[6], r[7], r[8]
+                    if colorder == 'I':
+                        include_columns.append(self.normalize_name(colname))
+                    elif virtual == 'Y':
+                        # expression-based key; COLNAME is system generated
+                        column_names.append(None)
+                        expressions.append(
+                            text + " DESC" if colorder == 'D' else text)
+                    else:
+                        name = self.normalize_name(colname)
+                        column_names.append(name)
+                        expressions.append(name)
+                        if colorder == 'D':
+                            descending.append(name)
+                index = (
+                    self.normalize_name(index_name), unique_rule == 'U',
+                    tuple(column_names),
+                    tuple(expressions) if None in column_names else None,
+                    tuple(descending), tuple(include_columns),
+                )
+                logger.debug("Index reflected -> %s", index)
+                by_table.setdefault(tabname, []).append(index)
+            logger.debug(
+                "Indexes reflected -> schema=%s, tables=%s",
+                current_schema, len(by_table)
+            )
+            return by_table
         except Exception as e:
-            logger.error(f"Error reflecting indexes: {e}")
-            logger.exception("Stack trace in get_indexes")
+            logger.error("Error reflecting indexes: %s", e)
+            logger.exception("Stack trace in _get_indexes_by_table")
             raise
 
+    @reflection.cache
+    @log_entry_exit
+    def get_indexes(self, connection, table_name, schema=None, **kw):
+        current_schema = self.denormalize_name(schema or self.default_schema_name)
+        table_name = self.denormalize_name(table_name)
+        logger.debug("Fetching indexes -> schema=%s, table=%s", current_schema, table_name)
+        if kw.get("info_cache") is None:
+            # nothing to share the schema-wide result with
+            by_table = self._get_indexes_by_table(
+                connection, current_schema, table_name)
+        else:
+            by_table = self._get_indexes_by_table(
+                connection, current_schema, info_cache=kw["info_cache"])
+        indexes = [self._index_info(index) for index in by_table.get(table_name, ())]
+        logger.debug("Total indexes reflected -> count=%s", len(indexes))
+        return indexes
+
+    @staticmethod
+    def _index_info(index):
+        """Build the get_indexes() dict of an ``_get_indexes_by_table()``
+        tuple; the cached tuples stay untouched by callers."""
+        name, unique, column_names, expressions, descending, include_columns = index
+        index_info = {
+            'name': name,
+            'column_names': list(column_names),
+            'unique': unique,
+        }
+        if expressions is not None:
+            index_info['expressions'] = list(expressions)
+        if descending:
+            index_info['column_sorting'] = dict(
+                (column, ('desc',)) for column in descending)
+        if include_columns:
+            index_info['dialect_options'] = {'db2_include': list(include_columns)}
+        return index_info
+
     @reflection.cache
     @log_entry_exit
     def get_unique_constraints(self, connection, table_name, schema=None, **kw):
@@ -753,47 +1240,23 @@ class DB2Reflector(BaseReflector):
             current_schema = self.denormalize_name(schema or self.default_schema_name)
             table_name = self.denormalize_name(table_name)
             logger.debug(
-                f"Fetching unique constraints -> "
-                f"schema={current_schema}, table={table_name}"
+                "Fetching unique constraints -> "
+                "schema=%s, table=%s",
+                current_schema, table_name
             )
-            syskeycol = self.sys_keycoluse
-            sysconst = self.sys_tabconst
-            query = (
-                sql.select(
-                    syskeycol.c.constname,
-                    syskeycol.c.colname
-                )
-                .select_from(
-                    join(
-                        syskeycol,
-                        sysconst,
-                        and_(
-                            syskeycol.c.constname == sysconst.c.constname,
-                            syskeycol.c.tabschema == sysconst.c.tabschema,
-                            syskeycol.c.tabname == sysconst.c.tabname,
-                        ),
-                    )
-                )
-                .where(
-                    and_(
-                        sysconst.c.tabname == table_name,
-                        sysconst.c.tabschema == current_schema,
-                        sysconst.c.type == "U",
-                    )
-                )
-                .order_by(syskeycol.c.constname)
-            )
-            logger.debug(f"Generated get_unique_constraints SQL -> {query}")
+            query = self._unique_constraints_query
+            logger.debug("Generated get_unique_constraints SQL -> %s", query)
             uniqueConsts = []
             currConst = None
-            for r in connection.execute(query):
+            for r in connection.execute(query, {"schema": current_schema, "table": table_name}):
                 constraint_name = r[0]
                 column_name = self.normalize_name(r[1])
                 if currConst == constraint_name:
                     uniqueConsts[-1]["column_names"].append(column_name)
                     logger.debug(
-                        f"Appending column to constraint -> "
-                        f"name={constraint_name}, column={column_name}"
+                        "Appending column to constraint -> "
+                        "name=%s, column=%s",
+                        constraint_name, column_name
                     )
                 else:
                     currConst = constraint_name
@@ -801,21 +1264,25 @@ class DB2Reflector(BaseReflector):
                         "name": self.normalize_name(currConst),
                         "column_names": [column_name],
                     }
-                    logger.debug(f"New unique constraint discovered -> {constraint_info}")
+                    logger.debug("New unique constraint discovered -> %s", constraint_info)
                     uniqueConsts.append(constraint_info)
             logger.debug(
-                f"Total unique constraints reflected -> "
-                f"count={len(uniqueConsts)}"
+                "Total unique constraints reflected -> "
+                "count=%s",
+                len(uniqueConsts)
             )
             return uniqueConsts
         except Exception as e:
-            logger.error(f"Error reflecting unique constraints: {e}")
+            logger.error("Error reflecting unique constraints: %s", e)
             logger.exception("Stack trace in get_unique_constraints")
             raise
 
 
 class AS400Reflector(BaseReflector):
 
+    # QSYS2.SYSCOLUMNS reports a DECFLOAT column's precision as its length
+    _decfloat_precisions = {16: 16, 34: 34}
+
     ischema = MetaData()
 
     sys_schemas = Table("SQLSCHEMAS", ischema,
@@ -827,6 +1294,20 @@ class AS400Reflector(BaseReflector):
       Column("TABLE_NAME", CoerceUnicode, key="tabname"),
       Column("TABLE_TYPE", CoerceUnicode, key="tabtype"),
       Column("LONG_COMMENT", CoerceUnicode, key="remarks"),
+      Column("LAST_ALTERED_TIMESTAMP", sa_types.DateTime, key="altertime"),
+      schema="QSYS2")
+
+    sys_table_stats = Table("SYSTABLESTAT", ischema,
+      Column("TABLE_SCHEMA", CoerceUnicode, key="tabschema"),
+      Column("TABLE_NAME", CoerceUnicode, key="tabname"),
+      Column("NUMBER_ROWS", sa_types.BigInteger, key="card"),
+      schema="QSYS2")
+
+    sys_index_stats = Table("SYSINDEXSTAT", ischema,
+      Column("TABLE_SCHEMA", CoerceUnicode, key="tabschema"),
+      Column("TABLE_NAME", CoerceUnicode, key="tabname"),
+      Column("INDEX_NAME", CoerceUnicode, key="indname"),
+      Column("NUMBER_KEYS", sa_types.BigInteger, key="nkeys"),
       schema="QSYS2")
 
     sys_table_constraints = Table("SYSCST", ischema,
@@ -861,6 +1342,7 @@ class AS400Reflector(BaseReflector):
       Column("IS_IDENTITY", CoerceUnicode, key="isid"),
       Column("IDENTITY_GENERATION", CoerceUnicode, key="idgenerate"),
       Column("LONG_COMMENT", CoerceUnicode, key="remark"),
+      Column("CCSID", sa_types.Integer, key="ccsid"),
       schema="QSYS2")
 
     sys_indexes = Table("SYSINDEXES", ischema,
@@ -902,6 +1384,197 @@ class AS400Reflector(BaseReflector):
       Column("SEQUENCE_NAME", CoerceUnicode, key="seqname"),
       schema="QSYS2")
 
+    # Per-object catalog queries are built once per class and executed
+    # with the schema/table names as bound parameters
+    _table_exists_query = sql.select(sys_tables.c.tabname).where(and_(
+        sys_tables.c.tabschema == sql.bindparam("schema"),
+        sys_tables.c.tabname == sql.bindparam("table")
+    ))
+
+    _table_names_query = sql.select(sys_tables.c.tabname).where(
+        sys_tables.c.tabschema == sql.bindparam("schema"))
+
+    _catalog_version_query = sql.select(
+        sql.func.max(sys_tables.c.altertime), sql.func.count()
+    ).where(sys_tables.c.tabschema == sql.bindparam("schema"))
+
+    _sequence_exists_query = sql.select(sys_sequences.c.seqname).where(and_(
+        sys_sequences.c.seqschema == sql.bindparam("schema"),
+        sys_sequences.c.seqname == sql.bindparam("sequence")
+    ))
+
+    _sequence_names_query = sql.select(sys_sequences.c.seqname).where(
+        sys_sequences.c.seqschema == sql.bindparam("schema"))
+
+    # has_table()/has_sequence() without a default schema
+    _any_table_exists_query = sql.select(sys_tables.c.tabname).where(
+        sys_tables.c.tabname == sql.bindparam("table"))
+
+    _any_sequence_exists_query = sql.select(sys_sequences.c.seqname).where(
+        sys_sequences.c.seqname == sql.bindparam("sequence"))
+
+    # listings returned by get_*_names()
+    _sorted_sequence_names_query = (
+        sql.select(sys_sequences.c.seqname)
+        .where(sys_sequences.c.seqschema == sql.bindparam("schema"))
+        .order_by(sys_sequences.c.seqschema, sys_sequences.c.seqname)
+    )
+
+    _view_names_query = (
+        sql.select(sys_views.c.viewname)
+        .where(sys_views.c.viewschema == sql.bindparam("schema"))
+        .order_by(sys_views.c.viewname)
+    )
+
+    _sorted_table_names_query = (
+        sql.select(sys_tables.c.tabname)
+        .where(sys_tables.c.tabtype == 'T')
+        .where(sys_tables.c.tabschema == sql.bindparam("schema"))
+        .order_by(sys_tables.c.tabname)
+    )
+
+    _schema_names_query = (
+        sql.select(sys_schemas.c.schemaname)
+        .where(~sys_schemas.c.schemaname.like('Q%'))
+        .where(~sys_schemas.c.schemaname.like('SYS%'))
+        .order_by(sys_schemas.c.schemaname)
+    )
+
+    _table_comment_query = sql.select(sys_tables.c.remarks).where(and_(
+        sys_tables.c.tabschema == sql.bindparam("schema"),
+        sys_tables.c.tabname == sql.bindparam("table")
+    ))
+
+    # (table, <_table_stats_fields>) and (table, index, <_index_stats_fields>)
+    # for a whole library, and narrowed to one table; partitions are summed
+    _table_stats_fields = ('row_count',)
+    _index_stats_fields = ('key_count',)
+
+    _schema_table_stats_query = (
+        sql.select(sys_table_stats.c.tabname, sql.func.sum(sys_table_stats.c.card))
+        .where(sys_table_stats.c.tabschema == sql.bindparam("schema"))
+        .group_by(sys_table_stats.c.tabname)
+    )
+
+    _table_stats_query = _schema_table_stats_query.where(
+        sys_table_stats.c.tabname == sql.bindparam("table"))
+
+    _schema_index_stats_query = (
+        sql.select(
+            sys_index_stats.c.tabname, sys_index_stats.c.indname,
+            sql.func.sum(sys_index_stats.c.nkeys)
+        )
+        .where(sys_index_stats.c.tabschema == sql.bindparam("schema"))
+        .group_by(sys_index_stats.c.tabname, sys_index_stats.c.indname)
+    )
+
+    _index_stats_query = _schema_index_stats_query.where(
+        sys_index_stats.c.tabname == sql.bindparam("table"))
+
+    _view_definition_query = sql.select(sys_views.c.text).where(and_(
+        sys_views.c.viewschema == sql.bindparam("schema"),
+        sys_views.c.viewname == sql.bindparam("view")
+    ))
+
+    _columns_query = (
+        sql.select(
+            sys_columns.c.colname, sys_columns.c.typename,
+            sys_columns.c.defaultval, sys_columns.c.nullable,
+            sys_columns.c.length, sys_columns.c.scale,
+            sys_columns.c.isid, sys_columns.c.idgenerate,
+            sys_columns.c.remark, sys_columns.c.ccsid
+        )
+        .where(and_(
+            sys_columns.c.tabschema == sql.bindparam("schema"),
+            sys_columns.c.tabname == sql.bindparam("table")
+        ))
+        .order_by(sys_columns.c.colno)
+    )
+
+    _pk_constraint_query = (
+        sql.select(sys_key_constraints.c.colname,
+                   sys_table_constraints.c.tabname,
+                   sys_table_constraints.c.conname)
+        .where(and_(
+            sys_key_constraints.c.conschema == sys_table_constraints.c.conschema,
+            sys_key_constraints.c.conname == sys_table_constraints.c.conname,
+            sys_table_constraints.c.tabschema == sql.bindparam("schema"),
+            sys_table_constraints.c.tabname == sql.bindparam("table"),
+            sys_table_constraints.c.contype == 'PRIMARY KEY'
+        ))
+        .order_by(sys_key_constraints.c.colno)
+    )
+
+    _primary_keys_query = (
+        sql.select(sys_key_constraints.c.colname,
+                   sys_table_constraints.c.tabname)
+        .where(and_(
+            sys_key_constraints.c.conschema == sys_table_constraints.c.conschema,
+            sys_key_constraints.c.conname == sys_table_constraints.c.conname,
+            sys_table_constraints.c.tabschema == sql.bindparam("schema"),
+            sys_table_constraints.c.tabname == sql.bindparam("table"),
+            sys_table_constraints.c.contype == 'PRIMARY KEY'
+        ))
+        .order_by(sys_key_constraints.c.colno)
+    )
+
+    _foreign_keys_query = (
+        sql.select(
+            sys_foreignkeys.c.fkname, sys_foreignkeys.c.fktabschema,
+            sys_foreignkeys.c.fktabname, sys_foreignkeys.c.fkcolname,
+            sys_foreignkeys.c.pkname, sys_foreignkeys.c.pktabschema,
+            sys_foreignkeys.c.pktabname, sys_foreignkeys.c.pkcolname
+        )
+        .where(and_(
+            sys_foreignkeys.c.fktabschema == sql.bindparam("schema"),
+            sys_foreignkeys.c.fktabname == sql.bindparam("table")
+        ))
+        .order_by(sys_foreignkeys.c.colno)
+    )
+
+    # (constraint, child schema, child, parent schema, parent) for every
+    # foreign key declared in the given schemas
+    _foreign_key_edges_query = (
+        sql.select(
+            sys_foreignkeys.c.fkname, sys_foreignkeys.c.fktabschema,
+            sys_foreignkeys.c.fktabname, sys_foreignkeys.c.pktabschema,
+            sys_foreignkeys.c.pktabname
+        )
+        .where(sys_foreignkeys.c.fktabschema.in_(
+            sql.bindparam("schemas", expanding=True)))
+        .distinct()
+    )
+
+    _indexes_query = (
+        sql.select(sys_indexes.c.indname, sys_indexes.c.uniquerule,
+                   sys_keys.c.colname)
+        .where(and_(
+            sys_keys.c.indschema == sys_indexes.c.indschema,
+            sys_keys.c.indname == sys_indexes.c.indname,
+            sys_indexes.c.tabschema == sql.bindparam("schema"),
+            sys_indexes.c.tabname == sql.bindparam("table")
+        ))
+        .order_by(sys_keys.c.indname, sys_keys.c.colno)
+    )
+
+    _unique_constraints_query = (
+        sql.select(sys_table_constraints.c.tabname,
+                   sys_table_constraints.c.conname,
+                   sys_key_constraints.c.colname)
+        .where(and_(
+            sys_key_constraints.c.conschema == sys_table_constraints.c.conschema,
+            sys_key_constraints.c.conname == sys_table_constraints.c.conname,
+            sys_table_constraints.c.tabschema == sql.bindparam("schema"),
+            sys_table_constraints.c.contype == 'UNIQUE'
+        ))
+        .order_by(sys_table_constraints.c.tabname,
+                  sys_table_constraints.c.conname,
+                  sys_key_constraints.c.colno)
+    )
+
+    _table_unique_constraints_query = _unique_constraints_query.where(
+        sys_table_constraints.c.tabname == sql.bindparam("table"))
+
     @log_entry_exit
     def has_table(self, connection, table_name, schema=None, **kw):
         try:
@@ -910,23 +1583,28 @@ class AS400Reflector(BaseReflector):
             current_schema = self.denormalize_name(schema or self.default_schema_name)
             table_name = self.denormalize_name(table_name)
             logger.debug(
-                f"[AS400] Checking table existence -> "
-                f"schema={current_schema}, table={table_name}"
+                "[AS400] Checking table existence -> "
+                "schema=%s, table=%s",
+                current_schema, table_name
             )
-            if current_schema:
-                whereclause = sql.and_(
-                    self.sys_tables.c.tabschema == current_schema,
-                    self.sys_tables.c.tabname == table_name
+            if current_schema and self.existence_cache_ttl:
+                names = self._cached_names(
+                    connection, "table", current_schema,
+                    self._table_names_query
                 )
+                return table_name in names
+            if current_schema:
+                s = self._table_exists_query
             else:
-                whereclause = self.sys_tables.c.tabname == table_name
-            s = sql.select(self.sys_tables).where(whereclause)
-            logger.debug(f"[AS400] Generated has_table SQL -> {s}")
-            result = connection.execute(s).first() is not None
-            logger.debug(f"[AS400] has_table result -> exists={result}")
+                s = self._any_table_exists_query
+            logger.debug("[AS400] Generated has_table SQL -> %s", s)
+            result = connection.execute(
+                s, {"schema": current_schema, "table": table_name}
+            ).first() is not None
+            logger.debug("[AS400] has_table result -> exists=%s", result)
             return result
         except Exception as e:
-            logger.error(f"[AS400] Error in has_table: {e}")
+            logger.error("[AS400] Error in has_table: %s", e)
             logger.exception("Stack trace in AS400 has_table")
             raise
 
@@ -936,23 +1614,28 @@ class AS400Reflector(BaseReflector):
             current_schema = self.denormalize_name(schema or self.default_schema_name)
             sequence_name = self.denormalize_name(sequence_name)
             logger.debug(
-                f"[AS400] Checking sequence existence -> "
-                f"schema={current_schema}, sequence={sequence_name}"
+                "[AS400] Checking sequence existence -> "
+                "schema=%s, sequence=%s",
+                current_schema, sequence_name
             )
-            if current_schema:
-                whereclause = sql.and_(
-                    self.sys_sequences.c.seqschema == current_schema,
-                    self.sys_sequences.c.seqname == sequence_name
+            if current_schema and self.existence_cache_ttl:
+                names = self._cached_names(
+                    connection, "sequence", current_schema,
+                    self._sequence_names_query
                 )
+                return sequence_name in names
+            if current_schema:
+                s = self._sequence_exists_query
             else:
-                whereclause = self.sys_sequences.c.seqname == sequence_name
-            s = sql.select(self.sys_sequences.c.seqname).where(whereclause)
-            logger.debug(f"[AS400] Generated has_sequence SQL -> {s}")
-            result = connection.execute(s).first() is not None
-            logger.debug(f"[AS400] has_sequence result -> exists={result}")
+                s = self._any_sequence_exists_query
+            logger.debug("[AS400] Generated has_sequence SQL -> %s", s)
+            result = connection.execute(
+                s, {"schema": current_schema, "sequence": sequence_name}
+            ).first() is not None
+            logger.debug("[AS400] has_sequence result -> exists=%s", result)
             return result
         except Exception as e:
-            logger.error(f"[AS400] Error in has_sequence: {e}")
+            logger.error("[AS400] Error in has_sequence: %s", e)
             logger.exception("Stack trace in AS400 has_sequence")
             raise
 
@@ -962,21 +1645,17 @@ class AS400Reflector(BaseReflector):
             current_schema = self.denormalize_name(schema or self.default_schema_name)
             table_name = self.denormalize_name(table_name)
             logger.debug(
-                f"[AS400] Fetching table comment -> "
-                f"schema={current_schema}, table={table_name}"
-            )
-            systbl = self.sys_tables
-            query = (
-                sql.select(systbl.c.remarks)
-                .where(systbl.c.tabschema == current_schema)
-                .where(systbl.c.tabname == table_name)
+                "[AS400] Fetching table comment -> "
+                "schema=%s, table=%s",
+                current_schema, table_name
             )
-            logger.debug(f"[AS400] Generated get_table_comment SQL -> {query}")
-            comment = connection.execute(query).scalar()
-            logger.debug(f"[AS400] Table comment result -> {comment}")
+            query = self._table_comment_query
+            logger.debug("[AS400] Generated get_table_comment SQL -> %s", query)
+            comment = connection.execute(query, {"schema": current_schema, "table": table_name}).scalar()
+            logger.debug("[AS400] Table comment result -> %s", comment)
             return {'text': comment}
         except Exception as e:
-            logger.error(f"[AS400] Error in get_table_comment: {e}")
+            logger.error("[AS400] Error in get_table_comment: %s", e)
             logger.exception("Stack trace in AS400 get_table_comment")
             raise
 
@@ -986,24 +1665,22 @@ class AS400Reflector(BaseReflector):
         try:
             current_schema = self.denormalize_name(schema or self.default_schema_name)
             logger.debug(
-                f"[AS400] Fetching sequence names -> "
-                f"schema={current_schema}"
-            )
-            sys_sequence = self.sys_sequences
-            query = (
-                sql.select(sys_sequence.c.seqname)
-                .where(sys_sequence.c.seqschema == current_schema)
-                .order_by(sys_sequence.c.seqschema, sys_sequence.c.seqname)
+                "[AS400] Fetching sequence names -> "
+                "schema=%s",
+                current_schema
             )
-            logger.debug(f"[AS400] Generated get_sequence_names SQL -> {query}")
-            result = [self.normalize_name(r[0]) for r in connection.execute(query)]
+            query = self._sorted_sequence_names_query
+            logger.debug("[AS400] Generated get_sequence_names SQL -> %s", query)
+            result = [self.normalize_name(r[0]) for r in connection.execute(
+                query, {"schema": current_schema})]
             logger.debug(
-                f"[AS400] Reflected sequences -> count={len(result)}, "
-                f"sequences={result}"
+                "[AS400] Reflected sequences -> count=%s, "
+                "sequences=%s",
+                len(result), result
             )
             return result
         except Exception as e:
-            logger.error(f"[AS400] Error in get_sequence_names: {e}")
+            logger.error("[AS400] Error in get_sequence_names: %s", e)
             logger.exception("Stack trace in AS400 get_sequence_names")
             raise
 
@@ -1012,32 +1689,16 @@ class AS400Reflector(BaseReflector):
     def get_schema_names(self, connection, **kw):
         try:
             logger.debug("[AS400] Fetching schema names")
-            sysschema = self.sys_schemas
-            if version_info[0] < 3:
-                logger.debug("[AS400] Using unicode branch for schema filtering")
-                query = (
-                    sql.select(sysschema.c.schemaname)
-                    .where(~sysschema.c.schemaname.like(unicode('Q%')))
-                    .where(~sysschema.c.schemaname.like(unicode('SYS%')))
-                    .order_by(sysschema.c.schemaname)
-                )
-            else:
-                logger.debug("[AS400] Using str branch for schema filtering")
-                query = (
-                    sql.select(sysschema.c.schemaname)
-                    .where(~sysschema.c.schemaname.like(str('Q%')))
-                    .where(~sysschema.c.schemaname.like(str('SYS%')))
-                    .order_by(sysschema.c.schemaname)
-                )
-            logger.debug(f"[AS400] Generated get_schema_names SQL -> {query}")
+            query = self._schema_names_query
+            logger.debug("[AS400] Generated get_schema_names SQL -> %s", query)
             result = [
                 self.normalize_name(r[0].rstrip())
                 for r in connection.execute(query)
             ]
-            logger.debug(f"[AS400] Reflected schemas -> count={len(result)}, schemas={result}")
+            logger.debug("[AS400] Reflected schemas -> count=%s, schemas=%s", len(result), result)
             return result
         except Exception as e:
-            logger.error(f"[AS400] Error in get_schema_names: {e}")
+            logger.error("[AS400] Error in get_schema_names: %s", e)
             logger.exception("Stack trace in AS400 get_schema_names")
             raise
 
@@ -1047,33 +1708,17 @@ class AS400Reflector(BaseReflector):
     def get_table_names(self, connection, schema=None, **kw):
         try:
             current_schema = self.denormalize_name(schema or self.default_schema_name)
-            logger.debug(f"[AS400] Fetching table names -> schema={current_schema}")
-            systbl = self.sys_tables
-            if version_info[0] < 3:
-                logger.debug("[AS400] Using unicode branch for table type filter")
-                query = (
-                    sql.select(systbl.c.tabname)
-                    .where(systbl.c.tabtype == unicode('T'))
-                    .where(systbl.c.tabschema == current_schema)
-                    .order_by(systbl.c.tabname)
-                )
-            else:
-                logger.debug("[AS400] Using str branch for table type filter")
-                query = (
-                    sql.select(systbl.c.tabname)
-                    .where(systbl.c.tabtype == str('T'))
-                    .where(systbl.c.tabschema == current_schema)
-                    .order_by(systbl.c.tabname)
-                )
-            logger.debug(f"[AS400] Generated get_table_names SQL -> {query}")
+            logger.debug("[AS400] Fetching table names -> schema=%s", current_schema)
+            query = self._sorted_table_names_query
+            logger.debug("[AS400] Generated get_table_names SQL -> %s", query)
             result = [
                 self.normalize_name(r[0])
-                for r in connection.execute(query)
+                for r in connection.execute(query, {"schema": current_schema})
             ]
-            logger.debug(f"[AS400] Reflected tables -> count={len(result)}, tables={result}")
+            logger.debug("[AS400] Reflected tables -> count=%s, tables=%s", len(result), result)
             return result
         except Exception as e:
-            logger.error(f"[AS400] Error in get_table_names: {e}")
+            logger.error("[AS400] Error in get_table_names: %s", e)
             logger.exception("Stack trace in AS400 get_table_names")
             raise
 
@@ -1082,21 +1727,17 @@ class AS400Reflector(BaseReflector):
     def get_view_names(self, connection, schema=None, **kw):
         try:
             current_schema = self.denormalize_name(schema or self.default_schema_name)
-            logger.debug(f"[AS400] Fetching view names -> schema={current_schema}")
-            query = (
-                sql.select(self.sys_views.c.viewname)
-                .where(self.sys_views.c.viewschema == current_schema)
-                .order_by(self.sys_views.c.viewname)
-            )
-            logger.debug(f"[AS400] Generated get_view_names SQL -> {query}")
+            logger.debug("[AS400] Fetching view names -> schema=%s", current_schema)
+            query = self._view_names_query
+            logger.debug("[AS400] Generated get_view_names SQL -> %s", query)
             result = [
                 self.normalize_name(r[0])
-                for r in connection.execute(query)
+                for r in connection.execute(query, {"schema": current_schema})
             ]
-            logger.debug(f"[AS400] Reflected views -> count={len(result)}, views={result}")
+            logger.debug("[AS400] Reflected views -> count=%s, views=%s", len(result), result)
             return result
         except Exception as e:
-            logger.error(f"[AS400] Error in get_view_names: {e}")
+            logger.error("[AS400] Error in get_view_names: %s", e)
             logger.exception("Stack trace in AS400 get_view_names")
             raise
 
@@ -1107,23 +1748,22 @@ class AS400Reflector(BaseReflector):
             current_schema = self.denormalize_name(schema or self.default_schema_name)
             viewname = self.denormalize_name(viewname)
             logger.debug(
-                f"[AS400] Fetching view definition -> "
-                f"schema={current_schema}, view={viewname}"
+                "[AS400] Fetching view definition -> "
+                "schema=%s, view=%s",
+                current_schema, viewname
             )
-            query = (
-                sql.select(self.sys_views.c.text)
-                .where(self.sys_views.c.viewschema == current_schema)
-                .where(self.sys_views.c.viewname == viewname)
-            )
-            logger.debug(f"[AS400] Generated get_view_definition SQL -> {query}")
-            definition = connection.execute(query).scalar()
+            query = self._view_definition_query
+            logger.debug("[AS400] Generated get_view_definition SQL -> %s", query)
+            definition = connection.execute(
+                query, {"schema": current_schema, "view": viewname}).scalar()
             logger.debug(
-                f"[AS400] View definition length -> "
-                f"{len(definition) if definition else 0}"
+                "[AS400] View definition length -> "
+                "%s",
+                len(definition) if definition else 0
             )
             return definition
         except Exception as e:
-            logger.error(f"[AS400] Error in get_view_definition: {e}")
+            logger.error("[AS400] Error in get_view_definition: %s", e)
             logger.exception("Stack trace in AS400 get_view_definition")
             raise
 
@@ -1134,47 +1774,29 @@ class AS400Reflector(BaseReflector):
             current_schema = self.denormalize_name(schema or self.default_schema_name)
             table_name = self.denormalize_name(table_name)
             logger.debug(
-                f"[AS400] Fetching columns -> "
-                f"schema={current_schema}, table={table_name}"
+                "[AS400] Fetching columns -> "
+                "schema=%s, table=%s",
+                current_schema, table_name
             )
-            syscols = self.sys_columns
-            query = (
-                sql.select(
-                    syscols.c.colname, syscols.c.typename,
-                    syscols.c.defaultval, syscols.c.nullable,
-                    syscols.c.length, syscols.c.scale,
-                    syscols.c.isid, syscols.c.idgenerate,
-                    syscols.c.remark
-                )
-                .where(and_(
-                    syscols.c.tabschema == current_schema,
-                    syscols.c.tabname == table_name
-                ))
-                .order_by(syscols.c.colno)
-            )
-            logger.debug(f"[AS400] Generated get_columns SQL -> {query}")
+            query = self._columns_query
+            logger.debug("[AS400] Generated get_columns SQL -> %s", query)
             sa_columns = []
-            for r in connection.execute(query):
+            for r in connection.execute(query, {"schema": current_schema, "table": table_name}):
                 raw_type = r[1].upper()
                 logger.debug(
-                    f"[AS400] Processing column -> "
-                    f"name={r[0]}, type={raw_type}, "
-                    f"length={r[4]}, scale={r[5]}"
+                    "[AS400] Processing column -> "
+                    "name=%s, type=%s, "
+                    "length=%s, scale=%s",
+                    r[0], raw_type, r[4], r[5]
                 )
-                if raw_type in ['DECIMAL', 'NUMERIC']:
-                    coltype = self.ischema_names.get(raw_type)(int(r[4]), int(r[5]))
-                elif raw_type in ['CHARACTER', 'CHAR', 'VARCHAR',
-                                  'GRAPHIC', 'VARGRAPHIC']:
-                    coltype = self.ischema_names.get(raw_type)(int(r[4]))
-                else:
-                    try:
-                        coltype = self.ischema_names[raw_type]
-                    except KeyError:
-                        logger.warning(
-                            f"[AS400] Unrecognized type '{raw_type}' "
-                            f"for column '{r[0]}'"
-                        )
-                        coltype = sa_types.NULLTYPE
+                coltype = self.resolve_type(raw_type, r[4], r[5], r[9])
+                if coltype is None:
+                    logger.warning(
+                        "[AS400] Unrecognized type '%s' "
+                        "for column '%s'",
+                        raw_type, r[0]
+                    )
+                    coltype = sa_types.NULLTYPE
                 if version_info[0] < 3:
                     nullable_flag = r[3] == unicode('Y')
                     autoinc_flag = (r[6] == unicode('YES')) and (r[7] is not None)
@@ -1189,12 +1811,12 @@ class AS400Reflector(BaseReflector):
                     'autoincrement': autoinc_flag,
                     'comment': r[8] or None,
                 }
-                logger.debug(f"[AS400] Column reflected -> {column_info}")
+                logger.debug("[AS400] Column reflected -> %s", column_info)
                 sa_columns.append(column_info)
-            logger.debug(f"[AS400] Total columns reflected -> count={len(sa_columns)}")
+            logger.debug("[AS400] Total columns reflected -> count=%s", len(sa_columns))
             return sa_columns
         except Exception as e:
-            logger.error(f"[AS400] Error reflecting columns: {e}")
+            logger.error("[AS400] Error reflecting columns: %s", e)
             logger.exception("Stack trace in AS400 get_columns")
             raise
 
@@ -1205,32 +1827,22 @@ class AS400Reflector(BaseReflector):
             current_schema = self.denormalize_name(schema or self.default_schema_name)
             table_name = self.denormalize_name(table_name)
             logger.debug(
-                f"[AS400] Fetching PK constraint -> "
-                f"schema={current_schema}, table={table_name}"
+                "[AS400] Fetching PK constraint -> "
+                "schema=%s, table=%s",
+                current_schema, table_name
             )
-            sysconst = self.sys_table_constraints
-            syskeyconst = self.sys_key_constraints
-            query = (
-                sql.select(syskeyconst.c.colname, sysconst.c.tabname, sysconst.c.conname)
-                .where(and_(
-                    syskeyconst.c.conschema == sysconst.c.conschema,
-                    syskeyconst.c.conname == sysconst.c.conname,
-                    sysconst.c.tabschema == current_schema,
-                    sysconst.c.tabname == table_name,
-                    sysconst.c.contype == 'PRIMARY KEY'
-                )).order_by(syskeyconst.c.colno)
-            )
-            logger.debug(f"[AS400] Generated get_pk_constraint SQL -> {query}")
+            query = self._pk_constraint_query
+            logger.debug("[AS400] Generated get_pk_constraint SQL -> %s", query)
             pk_columns = []
             pk_name = None
-            for key in connection.execute(query):
+            for key in connection.execute(query, {"schema": current_schema, "table": table_name}):
                 pk_columns.append(self.normalize_name(key[0]))
                 if not pk_name:
                     pk_name = self.normalize_name(key[2])
-            logger.debug(f"[AS400] PK reflected -> name={pk_name}, columns={pk_columns}")
+            logger.debug("[AS400] PK reflected -> name=%s, columns=%s", pk_name, pk_columns)
             return {"constrained_columns": pk_columns, "name": pk_name}
         except Exception as e:
-            logger.error(f"[AS400] Error reflecting PK constraint: {e}")
+            logger.error("[AS400] Error reflecting PK constraint: %s", e)
             logger.exception("Stack trace in AS400 get_pk_constraint")
             raise
 
@@ -1241,46 +1853,20 @@ class AS400Reflector(BaseReflector):
             current_schema = self.denormalize_name(schema or self.default_schema_name)
             table_name = self.denormalize_name(table_name)
             logger.debug(
-                f"[AS400] Fetching primary keys -> "
-                f"schema={current_schema}, table={table_name}"
+                "[AS400] Fetching primary keys -> "
+                "schema=%s, table=%s",
+                current_schema, table_name
             )
-            sysconst = self.sys_table_constraints
-            syskeyconst = self.sys_key_constraints
-            if version_info[0] < 3:
-                logger.debug("[AS400] Using unicode branch for PK lookup")
-                query = (
-                    sql.select(syskeyconst.c.colname, sysconst.c.tabname)
-                    .where(and_(
-                        syskeyconst.c.conschema == sysconst.c.conschema,
-                        syskeyconst.c.conname == sysconst.c.conname,
-                        sysconst.c.tabschema == current_schema,
-                        sysconst.c.tabname == table_name,
-                        sysconst.c.contype == unicode('PRIMARY KEY')
-                    ))
-                    .order_by(syskeyconst.c.colno)
-                )
-            else:
-                logger.debug("[AS400] Using str branch for PK lookup")
-                query = (
-                    sql.select(syskeyconst.c.colname, sysconst.c.tabname)
-                    .where(and_(
-                        syskeyconst.c.conschema == sysconst.c.conschema,
-                        syskeyconst.c.conname == sysconst.c.conname,
-                        sysconst.c.tabschema == current_schema,
-                        sysconst.c.tabname == table_name,
-                        sysconst.c.contype == str('PRIMARY KEY')
-                    ))
-                    .order_by(syskeyconst.c.colno)
-                )
-            logger.debug(f"[AS400] Generated get_primary_keys SQL -> {query}")
+            query = self._primary_keys_query
+            logger.debug("[AS400] Generated get_primary_keys SQL -> %s", query)
             result = [
                 self.normalize_name(key[0])
-                for key in connection.execute(query)
+                for key in connection.execute(query, {"schema": current_schema, "table": table_name})
             ]
-            logger.debug(f"[AS400] Primary keys reflected -> {result}")
+            logger.debug("[AS400] Primary keys reflected -> %s", result)
             return result
         except Exception as e:
-            logger.error(f"[AS400] Error reflecting primary keys: {e}")
+            logger.error("[AS400] Error reflecting primary keys: %s", e)
             logger.exception("Stack trace in AS400 get_primary_keys")
             raise
 
@@ -1293,26 +1879,14 @@ class AS400Reflector(BaseReflector):
             normalized_default_schema = self.normalize_name(default_schema)
             table_name = self.denormalize_name(table_name)
             logger.debug(
-                f"[AS400] Fetching foreign keys -> "
-                f"schema={current_schema}, table={table_name}"
-            )
-            sysfkeys = self.sys_foreignkeys
-            query = (
-                sql.select(
-                    sysfkeys.c.fkname, sysfkeys.c.fktabschema,
-                    sysfkeys.c.fktabname, sysfkeys.c.fkcolname,
-                    sysfkeys.c.pkname, sysfkeys.c.pktabschema,
-                    sysfkeys.c.pktabname, sysfkeys.c.pkcolname
-                )
-                .where(and_(
-                    sysfkeys.c.fktabschema == current_schema,
-                    sysfkeys.c.fktabname == table_name
-                ))
-                .order_by(sysfkeys.c.colno)
+                "[AS400] Fetching foreign keys -> "
+                "schema=%s, table=%s",
+                current_schema, table_name
             )
-            logger.debug(f"[AS400] Generated get_foreign_keys SQL -> {query}")
+            query = self._foreign_keys_query
+            logger.debug("[AS400] Generated get_foreign_keys SQL -> %s", query)
             fschema = {}
-            for r in connection.execute(query):
+            for r in connection.execute(query, {"schema": current_schema, "table": table_name}):
                 fk_name = r[0]
                 if fk_name not in fschema:
                     referred_schema = self.normalize_name(r[5])
@@ -1328,15 +1902,15 @@ class AS400Reflector(BaseReflector):
                         'referred_table': self.normalize_name(r[6]),
                         'referred_columns': [self.normalize_name(r[7])]
                     }
-                    logger.debug(f"[AS400] Foreign key discovered -> {fschema[fk_name]}")
+                    logger.debug("[AS400] Foreign key discovered -> %s", fschema[fk_name])
                 else:
                     fschema[fk_name]['constrained_columns'].append(self.normalize_name(r[3]))
                     fschema[fk_name]['referred_columns'].append(self.normalize_name(r[7]))
             result = list(fschema.values())
-            logger.debug(f"[AS400] Total foreign keys reflected -> count={len(result)}")
+            logger.debug("[AS400] Total foreign keys reflected -> count=%s", len(result))
             return result
         except Exception as e:
-            logger.error(f"[AS400] Error reflecting foreign keys: {e}")
+            logger.error("[AS400] Error reflecting foreign keys: %s", e)
             logger.exception("Stack trace in AS400 get_foreign_keys")
             raise
 
@@ -1348,37 +1922,24 @@ class AS400Reflector(BaseReflector):
             current_schema = self.denormalize_name(schema or self.default_schema_name)
             table_name = self.denormalize_name(table_name)
             logger.debug(
-                f"[AS400] Fetching indexes -> "
-                f"schema={current_schema}, table={table_name}"
+                "[AS400] Fetching indexes -> "
+                "schema=%s, table=%s",
+                current_schema, table_name
             )
-            sysidx = self.sys_indexes
-            syskey = self.sys_keys
-            query = (
-                sql.select(
-                    sysidx.c.indname,
-                    sysidx.c.uniquerule,
-                    syskey.c.colname
-                )
-                .where(and_(
-                    syskey.c.indschema == sysidx.c.indschema,
-                    syskey.c.indname == sysidx.c.indname,
-                    sysidx.c.tabschema == current_schema,
-                    sysidx.c.tabname == table_name
-                ))
-                .order_by(syskey.c.indname, syskey.c.colno)
-            )
-            logger.debug(f"[AS400] Generated get_indexes SQL -> {query}")
+            query = self._indexes_query
+            logger.debug("[AS400] Generated get_indexes SQL -> %s", query)
             indexes = {}
-            for r in connection.execute(query):
+            for r in connection.execute(query, {"schema": current_schema, "table": table_name}):
                 index_name_raw = r[0]
                 unique_flag_raw = r[1]
                 column_raw = r[2]
                 key = index_name_raw.upper()
                 logger.debug(
-                    f"[AS400] Processing index row -> "
-                    f"name={index_name_raw}, "
-                    f"unique_flag={unique_flag_raw}, "
-                    f"column={column_raw}"
+                    "[AS400] Processing index row -> "
+                    "name=%s, "
+                    "unique_flag=%s, "
+                    "column=%s",
+                    index_name_raw, unique_flag_raw, column_raw
                 )
                 if key in indexes:
                     indexes[key]['column_names'].append(self.normalize_name(column_raw))
@@ -1393,30 +1954,82 @@ class AS400Reflector(BaseReflector):
                         'unique': is_unique
                     }
                     logger.debug(
-                        f"[AS400] New index discovered -> "
-                        f"{indexes[key]}"
+                        "[AS400] New index discovered -> "
+                        "%s",
+                        indexes[key]
                     )
             result = list(indexes.values())
-            logger.debug(f"[AS400] Total indexes reflected -> count={len(result)}")
+            logger.debug("[AS400] Total indexes reflected -> count=%s", len(result))
             return result
         except Exception as e:
-            logger.error(f"[AS400] Error reflecting indexes: {e}")
+            logger.error("[AS400] Error reflecting indexes: %s", e)
             logger.exception("Stack trace in AS400 get_indexes")
             raise
 
+    @reflection.cache
+    @log_entry_exit
+    def _get_unique_constraints_by_table(self, connection, current_schema,
+                                         table_name=None, **kw):
+        """Return ``{table name: [constraint dict, ...]}`` for a library.
+
+        With ``table_name`` left as None every UNIQUE constraint in the
+        library is read in one query, so that repeated
+        ``get_unique_constraints()`` calls sharing an ``info_cache`` (as
+        ``MetaData.reflect()`` and Alembic's autogenerate do) are answered
+        from that single result.
+        """
+        try:
+            params = {"schema": current_schema}
+            if table_name is None:
+                query = self._unique_constraints_query
+            else:
+                query = self._table_unique_constraints_query
+                params["table"] = table_name
+            logger.debug("[AS400] Generated unique constraints SQL -> %s", query)
+            by_table = {}
+            current = None
+            for r in connection.execute(query, params):
+                column_name = self.normalize_name(r[2])
+                if current is not None and (r[0], r[1]) == current:
+                    by_table[r[0]][-1]["column_names"].append(column_name)
+                else:
+                    current = (r[0], r[1])
+                    by_table.setdefault(r[0], []).append({
+                        "name": self.normalize_name(r[1]),
+                        "column_names": [column_name],
+                    })
+            logger.debug(
+                "[AS400] Unique constraints reflected -> "
+                "schema=%s, tables=%s",
+                current_schema, len(by_table)
+            )
+            return by_table
+        except Exception as e:
+            logger.error("[AS400] Error reflecting unique constraints: %s", e)
+            logger.exception("Stack trace in AS400 _get_unique_constraints_by_table")
+            raise
+
     @reflection.cache
     @log_entry_exit
     def get_unique_constraints(self, connection, table_name, schema=None, **kw):
+        current_schema = self.denormalize_name(schema or self.default_schema_name)
+        table_name = self.denormalize_name(table_name)
         logger.debug(
-            f"[AS400] get_unique_constraints invoked -> "
-            f"schema={schema}, table={table_name}"
-        )
-        uniqueConsts = []
-        logger.debug(
-            "[AS400] Unique constraints not implemented for AS400 "
-            "(returning empty list)"
+            "[AS400] Fetching unique constraints -> "
+            "schema=%s, table=%s",
+            current_schema, table_name
         )
-        return uniqueConsts
+        if kw.get("info_cache") is None:
+            # nothing to share the library-wide result with
+            by_table = self._get_unique_constraints_by_table(
+                connection, current_schema, table_name)
+        else:
+            by_table = self._get_unique_constraints_by_table(
+                connection, current_schema, info_cache=kw["info_cache"])
+        return [
+            dict(const, column_names=list(const["column_names"]))
+            for const in by_table.get(table_name, [])
+        ]
 
 
 class OS390Reflector(BaseReflector):
@@ -1438,6 +2051,10 @@ class OS390Reflector(BaseReflector):
         Column("TYPE", CoerceUnicode, key="type"),
         Column("STATUS", CoerceUnicode, key="status"),
         Column("REMARKS", CoerceUnicode, key="remarks"),
+        Column("ALTEREDTS", sa_types.DateTime, key="altertime"),
+        Column("CARDF", sa_types.Float, key="card"),
+        Column("NPAGESF", sa_types.Float, key="npages"),
+        Column("STATSTIME", sa_types.DateTime, key="stats_time"),
         schema="SYSIBM")
 
     sys_indexes = Table("SYSINDEXES", ischema,
@@ -1446,6 +2063,11 @@ class OS390Reflector(BaseReflector):
         Column("NAME", CoerceUnicode, key="indname"),
         Column("UNIQUERULE", CoerceUnicode, key="uniquerule"),
         Column("IBMREQD", sa_types.SMALLINT, key="system_required"),
+        Column("FIRSTKEYCARDF", sa_types.Float, key="firstkeycard"),
+        Column("FULLKEYCARDF", sa_types.Float, key="fullkeycard"),
+        Column("NLEAF", sa_types.Integer, key="nleaf"),
+        Column("NLEVELS", sa_types.SMALLINT, key="nlevels"),
+        Column("STATSTIME", sa_types.DateTime, key="stats_time"),
         schema="SYSIBM")
 
     sys_tabconst = Table("SYSTABCONST", ischema,
@@ -1491,6 +2113,7 @@ class OS390Reflector(BaseReflector):
         Column("GENERATED_ATTR", CoerceUnicode, key="generated"),
         Column("KEYSEQ", sa_types.Integer, key="keyseq"),
         Column("REMARKS", sa_types.Integer, key="remark"),
+        Column("FOREIGNKEY", CoerceUnicode, key="subtype"),
         schema="SYSIBM")
 
     sys_views = Table("SYSVIEWS", ischema,
@@ -1504,6 +2127,198 @@ class OS390Reflector(BaseReflector):
         Column("NAME", CoerceUnicode, key="seqname"),
         schema="SYSIBM")
 
+    # Per-object catalog queries are built once per class and executed
+    # with the schema/table names as bound parameters
+    _table_exists_query = sql.select(sys_tables.c.tabname).where(and_(
+        sys_tables.c.tabschema == sql.bindparam("schema"),
+        sys_tables.c.tabname == sql.bindparam("table")
+    ))
+
+    _table_names_query = sql.select(sys_tables.c.tabname).where(
+        sys_tables.c.tabschema == sql.bindparam("schema"))
+
+    _catalog_version_query = sql.select(
+        sql.func.max(sys_tables.c.altertime), sql.func.count()
+    ).where(sys_tables.c.tabschema == sql.bindparam("schema"))
+
+    _sequence_exists_query = sql.select(sys_sequences.c.seqname).where(and_(
+        sys_sequences.c.seqschema == sql.bindparam("schema"),
+        sys_sequences.c.seqname == sql.bindparam("sequence")
+    ))
+
+    _sequence_names_query = sql.select(sys_sequences.c.seqname).where(
+        sys_sequences.c.seqschema == sql.bindparam("schema"))
+
+    # has_table()/has_sequence() without a default schema
+    _any_table_exists_query = sql.select(sys_tables.c.tabname).where(
+        sys_tables.c.tabname == sql.bindparam("table"))
+
+    _any_sequence_exists_query = sql.select(sys_sequences.c.seqname).where(
+        sys_sequences.c.seqname == sql.bindparam("sequence"))
+
+    # listings returned by get_*_names()
+    _sorted_sequence_names_query = (
+        sql.select(sys_sequences.c.seqname)
+        .where(sys_sequences.c.seqschema == sql.bindparam("schema"))
+        .order_by(sys_sequences.c.seqschema, sys_sequences.c.seqname)
+    )
+
+    _view_names_query = (
+        sql.select(sys_views.c.viewname)
+        .where(sys_views.c.viewschema == sql.bindparam("schema"))
+        .order_by(sys_views.c.viewname)
+    )
+
+    _sorted_table_names_query = (
+        sql.select(sys_tables.c.tabname)
+        .where(sys_tables.c.type == 'T')
+        .where(sys_tables.c.tabschema == sql.bindparam("schema"))
+        .order_by(sys_tables.c.tabname)
+    )
+
+    _schema_names_query = (
+        sql.select(sys_tables.c.tabschema)
+        .where(not_(sys_tables.c.tabschema.like('SYS%')))
+        .distinct(sys_tables.c.tabschema)
+    )
+
+    _table_comment_query = sql.select(sys_tables.c.remarks).where(and_(
+        sys_tables.c.tabschema == sql.bindparam("schema"),
+        sys_tables.c.tabname == sql.bindparam("table")
+    ))
+
+    # (table, <_table_stats_fields>) and (table, index, <_index_stats_fields>)
+    # for a whole schema, and narrowed to one table
+    _schema_table_stats_query = sql.select(
+        sys_tables.c.tabname, sys_tables.c.card, sys_tables.c.npages,
+        sys_tables.c.stats_time
+    ).where(sys_tables.c.tabschema == sql.bindparam("schema"))
+
+    _table_stats_query = _schema_table_stats_query.where(
+        sys_tables.c.tabname == sql.bindparam("table"))
+
+    _schema_index_stats_query = sql.select(
+        sys_indexes.c.tabname, sys_indexes.c.indname,
+        sys_indexes.c.firstkeycard, sys_indexes.c.fullkeycard,
+        sys_indexes.c.nleaf, sys_indexes.c.nlevels, sys_indexes.c.stats_time
+    ).where(sys_indexes.c.tabschema == sql.bindparam("schema"))
+
+    _index_stats_query = _schema_index_stats_query.where(
+        sys_indexes.c.tabname == sql.bindparam("table"))
+
+    _view_definition_query = sql.select(sys_views.c.text).where(and_(
+        sys_views.c.viewschema == sql.bindparam("schema"),
+        sys_views.c.viewname == sql.bindparam("view")
+    ))
+
+    _columns_query = (
+        sql.select(
+            sys_columns.c.colname, sys_columns.c.typename,
+            sys_columns.c.defaultval, sys_columns.c.nullable,
+            sys_columns.c.length, sys_columns.c.scale,
+            sys_columns.c.generated, sys_columns.c.remark,
+            sys_columns.c.subtype
+        )
+        .where(and_(
+            sys_columns.c.tabschema == sql.bindparam("schema"),
+            sys_columns.c.tabname == sql.bindparam("table")
+        ))
+        .order_by(sys_columns.c.colno)
+    )
+
+    # get_pk_constraint() and get_primary_keys() share this query
+    _primary_keys_query = (
+        sql.select(sys_columns.c.colname)
+        .where(and_(
+            sys_columns.c.tabschema == sql.bindparam("schema"),
+            sys_columns.c.tabname == sql.bindparam("table"),
+            sys_columns.c.keyseq > 0
+        ))
+        .order_by(sys_columns.c.tabschema, sys_columns.c.tabname)
+    )
+
+    _foreign_keys_query = (
+        sql.select(
+            sys_rels.c.fkname, sys_rels.c.fktabschema,
+            sys_rels.c.fktabname, sys_foreignkeys.c.fkcolname,
+            sys_indexes.c.indname, sys_rels.c.pktabschema,
+            sys_rels.c.pktabname, sys_columns.c.colname
+        )
+        .where(and_(
+            sys_rels.c.fktabschema == sql.bindparam("schema"),
+            sys_rels.c.fktabname == sql.bindparam("table"),
+            sys_rels.c.fktabname == sys_foreignkeys.c.fktabname,
+            sys_rels.c.pktabname == sys_columns.c.tabname,
+            sys_columns.c.tabname == sys_indexes.c.tabname,
+            sys_columns.c.keyseq > 0
+        ))
+        .order_by(sys_foreignkeys.c.colno)
+    )
+
+    _incoming_foreign_keys_query = (
+        sql.select(
+            sys_rels.c.fkname, sys_rels.c.fktabschema,
+            sys_rels.c.fktabname, sys_foreignkeys.c.fkcolname,
+            sys_indexes.c.indname, sys_rels.c.pktabschema,
+            sys_rels.c.pktabname, sys_columns.c.colname
+        )
+        .where(and_(
+            sys_columns.c.tabschema == sql.bindparam("schema"),
+            sys_columns.c.tabname == sql.bindparam("table"),
+            sys_rels.c.fktabname == sys_foreignkeys.c.fktabname,
+            sys_rels.c.pktabname == sys_columns.c.tabname,
+            sys_columns.c.tabname == sys_indexes.c.tabname,
+            sys_columns.c.keyseq > 0
+        ))
+        .order_by(sys_foreignkeys.c.colno)
+    )
+
+    # (constraint, child schema, child, parent schema, parent) for every
+    # foreign key declared in the given schemas
+    _foreign_key_edges_query = (
+        sql.select(
+            sys_rels.c.fkname, sys_rels.c.fktabschema, sys_rels.c.fktabname,
+            sys_rels.c.pktabschema, sys_rels.c.pktabname
+        )
+        .where(sys_rels.c.fktabschema.in_(
+            sql.bindparam("schemas", expanding=True)))
+    )
+
+    _indexes_query = (
+        sql.select(
+            sys_indexes.c.indname, sys_columns.c.colname,
+            sys_indexes.c.uniquerule, sys_indexes.c.system_required
+        )
+        .where(and_(
+            sys_indexes.c.tabschema == sql.bindparam("schema"),
+            sys_indexes.c.tabname == sql.bindparam("table"),
+            sys_columns.c.colname == sys_indexes.c.tabname,
+            sys_columns.c.keyseq > 0
+        ))
+        .order_by(sys_indexes.c.tabname)
+    )
+
+    _unique_constraints_query = (
+        sql.select(sys_keycoluse.c.constname, sys_keycoluse.c.colname)
+        .select_from(
+            join(
+                sys_keycoluse,
+                sys_tabconst,
+                and_(
+                    sys_keycoluse.c.constname == sys_tabconst.c.constname,
+                    sys_keycoluse.c.tabschema == sys_tabconst.c.tabschema,
+                    sys_keycoluse.c.tabname == sys_tabconst.c.tabname,
+                ),
+            )
+        )
+        .where(and_(
+            sys_tabconst.c.tabname == sql.bindparam("table"),
+            sys_tabconst.c.tabschema == sql.bindparam("schema"),
+            sys_tabconst.c.type == "U",
+        ))
+        .order_by(sys_keycoluse.c.constname)
+    )
+
     @log_entry_exit
     def has_table(self, connection, table_name, schema=None, **kw):
         try:
@@ -1512,20 +2327,25 @@ class OS390Reflector(BaseReflector):
             current_schema = self.denormalize_name(schema or self.default_schema_name)
             table_name = self.denormalize_name(table_name)
             logger.debug(
-                f"Checking table existence (OS390) -> "
-                f"schema={current_schema}, table={table_name}"
+                "Checking table existence (OS390) -> "
+                "schema=%s, table=%s",
+                current_schema, table_name
             )
-            if current_schema:
-                whereclause = sql.and_(
-                    self.sys_tables.c.tabschema == current_schema,
-                    self.sys_tables.c.tabname == table_name
+            if current_schema and self.existence_cache_ttl:
+                names = self._cached_names(
+                    connection, "table", current_schema,
+                    self._table_names_query
                 )
+                return table_name in names
+            if current_schema:
+                s = self._table_exists_query
             else:
-                whereclause = self.sys_tables.c.tabname == table_name
-            s = sql.select(self.sys_tables.c.tabname).where(whereclause)
-            logger.debug(f"has_table SQL -> {s}")
-            result = connection.execute(s).first() is not None
-            logger.debug(f"has_table result -> {result}")
+                s = self._any_table_exists_query
+            logger.debug("has_table SQL -> %s", s)
+            result = connection.execute(
+                s, {"schema": current_schema, "table": table_name}
+            ).first() is not None
+            logger.debug("has_table result -> %s", result)
             return result
         except Exception:
             logger.exception("Error in has_table (OS390)")
@@ -1537,20 +2357,25 @@ class OS390Reflector(BaseReflector):
             current_schema = self.denormalize_name(schema or self.default_schema_name)
             sequence_name = self.denormalize_name(sequence_name)
             logger.debug(
-                f"Checking sequence existence (OS390) -> "
-                f"schema={current_schema}, sequence={sequence_name}"
+                "Checking sequence existence (OS390) -> "
+                "schema=%s, sequence=%s",
+                current_schema, sequence_name
             )
-            if current_schema:
-                whereclause = sql.and_(
-                    self.sys_sequences.c.seqschema == current_schema,
-                    self.sys_sequences.c.seqname == sequence_name
+            if current_schema and self.existence_cache_ttl:
+                names = self._cached_names(
+                    connection, "sequence", current_schema,
+                    self._sequence_names_query
                 )
+                return sequence_name in names
+            if current_schema:
+                s = self._sequence_exists_query
             else:
-                whereclause = self.sys_sequences.c.seqname == sequence_name
-            s = sql.select(self.sys_sequences.c.seqname).where(whereclause)
-            logger.debug(f"has_sequence SQL -> {s}")
-            result = connection.execute(s).first() is not None
-            logger.debug(f"has_sequence result -> {result}")
+                s = self._any_sequence_exists_query
+            logger.debug("has_sequence SQL -> %s", s)
+            result = connection.execute(
+                s, {"schema": current_schema, "sequence": sequence_name}
+            ).first() is not None
+            logger.debug("has_sequence result -> %s", result)
             return result
         except Exception:
             logger.exception("Error in has_sequence (OS390)")
@@ -1561,16 +2386,12 @@ class OS390Reflector(BaseReflector):
     def get_sequence_names(self, connection, schema=None, **kw):
         try:
             current_schema = self.denormalize_name(schema or self.default_schema_name)
-            logger.debug(f"Fetching sequence names (OS390) -> schema={current_schema}")
-            sys_sequence = self.sys_sequences
-            query = (
-                sql.select(sys_sequence.c.seqname)
-                .where(sys_sequence.c.seqschema == current_schema)
-                .order_by(sys_sequence.c.seqschema, sys_sequence.c.seqname)
-            )
-            logger.debug(f"get_sequence_names SQL -> {query}")
-            result = [self.normalize_name(r[0]) for r in connection.execute(query)]
-            logger.debug(f"Sequences found -> count={len(result)}")
+            logger.debug("Fetching sequence names (OS390) -> schema=%s", current_schema)
+            query = self._sorted_sequence_names_query
+            logger.debug("get_sequence_names SQL -> %s", query)
+            result = [self.normalize_name(r[0]) for r in connection.execute(
+                query, {"schema": current_schema})]
+            logger.debug("Sequences found -> count=%s", len(result))
             return result
         except Exception:
             logger.exception("Error in get_sequence_names (OS390)")
@@ -1581,16 +2402,13 @@ class OS390Reflector(BaseReflector):
     def get_schema_names(self, connection, **kw):
         try:
             logger.debug("[OS390] get_schema_names invoked")
-            sysschema = self.sys_tables
-            query = sql.select(sysschema.c.tabschema). \
-                where(not_(sysschema.c.tabschema.like('SYS%'))). \
-                distinct(sysschema.c.tabschema)
-            logger.debug(f"[OS390] get_schema_names SQL -> {query}")
+            query = self._schema_names_query
+            logger.debug("[OS390] get_schema_names SQL -> %s", query)
             result = [
                 self.normalize_name(r[0].rstrip())
                 for r in connection.execute(query)
             ]
-            logger.debug(f"[OS390] schemas found -> count={len(result)}")
+            logger.debug("[OS390] schemas found -> count=%s", len(result))
             return result
         except Exception:
             logger.exception("[OS390] Error in get_schema_names")
@@ -1601,14 +2419,11 @@ class OS390Reflector(BaseReflector):
         try:
             current_schema = self.denormalize_name(schema or self.default_schema_name)
             table_name = self.denormalize_name(table_name)
-            logger.debug(f"[OS390] get_table_comment -> schema={current_schema}, table={table_name}")
-            systbl = self.sys_tables
-            query = sql.select(systbl.c.remarks). \
-                where(systbl.c.tabschema == current_schema). \
-                where(systbl.c.tabname == table_name)
-            logger.debug(f"[OS390] get_table_comment SQL -> {query}")
-            comment = connection.execute(query).scalar()
-            logger.debug(f"[OS390] table comment -> {comment}")
+            logger.debug("[OS390] get_table_comment -> schema=%s, table=%s", current_schema, table_name)
+            query = self._table_comment_query
+            logger.debug("[OS390] get_table_comment SQL -> %s", query)
+            comment = connection.execute(query, {"schema": current_schema, "table": table_name}).scalar()
+            logger.debug("[OS390] table comment -> %s", comment)
             return {'text': comment}
         except Exception:
             logger.exception("[OS390] Error in get_table_comment")
@@ -1619,15 +2434,12 @@ class OS390Reflector(BaseReflector):
     def get_table_names(self, connection, schema=None, **kw):
         try:
             current_schema = self.denormalize_name(schema or self.default_schema_name)
-            logger.debug(f"[OS390] get_table_names -> schema={current_schema}")
-            systbl = self.sys_tables
-            query = sql.select(systbl.c.tabname). \
-                where(systbl.c.type == 'T'). \
-                where(systbl.c.tabschema == current_schema). \
-                order_by(systbl.c.tabname)
-            logger.debug(f"[OS390] get_table_names SQL -> {query}")
-            result = [self.normalize_name(r[0]) for r in connection.execute(query)]
-            logger.debug(f"[OS390] tables found -> count={len(result)}")
+            logger.debug("[OS390] get_table_names -> schema=%s", current_schema)
+            query = self._sorted_table_names_query
+            logger.debug("[OS390] get_table_names SQL -> %s", query)
+            result = [self.normalize_name(r[0]) for r in connection.execute(
+                query, {"schema": current_schema})]
+            logger.debug("[OS390] tables found -> count=%s", len(result))
             return result
         except Exception:
             logger.exception("[OS390] Error in get_table_names")
@@ -1638,13 +2450,12 @@ class OS390Reflector(BaseReflector):
     def get_view_names(self, connection, schema=None, **kw):
         try:
             current_schema = self.denormalize_name(schema or self.default_schema_name)
-            logger.debug(f"[OS390] get_view_names -> schema={current_schema}")
-            query = sql.select(self.sys_views.c.viewname). \
-                where(self.sys_views.c.viewschema == current_schema). \
-                order_by(self.sys_views.c.viewname)
-            logger.debug(f"[OS390] get_view_names SQL -> {query}")
-            result = [self.normalize_name(r[0]) for r in connection.execute(query)]
-            logger.debug(f"[OS390] views found -> count={len(result)}")
+            logger.debug("[OS390] get_view_names -> schema=%s", current_schema)
+            query = self._view_names_query
+            logger.debug("[OS390] get_view_names SQL -> %s", query)
+            result = [self.normalize_name(r[0]) for r in connection.execute(
+                query, {"schema": current_schema})]
+            logger.debug("[OS390] views found -> count=%s", len(result))
             return result
         except Exception:
             logger.exception("[OS390] Error in get_view_names")
@@ -1657,17 +2468,18 @@ class OS390Reflector(BaseReflector):
             current_schema = self.denormalize_name(schema or self.default_schema_name)
             viewname = self.denormalize_name(viewname)
             logger.debug(
-                f"[OS390] get_view_definition -> "
-                f"schema={current_schema}, view={viewname}"
+                "[OS390] get_view_definition -> "
+                "schema=%s, view=%s",
+                current_schema, viewname
             )
-            query = sql.select(self.sys_views.c.text). \
-                where(self.sys_views.c.viewschema == current_schema). \
-                where(self.sys_views.c.viewname == viewname)
-            logger.debug(f"[OS390] get_view_definition SQL -> {query}")
-            result = connection.execute(query).scalar()
+            query = self._view_definition_query
+            logger.debug("[OS390] get_view_definition SQL -> %s", query)
+            result = connection.execute(
+                query, {"schema": current_schema, "view": viewname}).scalar()
             logger.debug(
-                f"[OS390] view definition length -> "
-                f"{len(result) if result else 0}"
+                "[OS390] view definition length -> "
+                "%s",
+                len(result) if result else 0
             )
             return result
         except Exception:
@@ -1680,36 +2492,23 @@ class OS390Reflector(BaseReflector):
         try:
             current_schema = self.denormalize_name(schema or self.default_schema_name)
             table_name = self.denormalize_name(table_name)
-            logger.debug(f"[OS390] get_columns -> schema={current_schema}, table={table_name}")
-            syscols = self.sys_columns
-            query = sql.select(syscols.c.colname, syscols.c.typename,
-                               syscols.c.defaultval, syscols.c.nullable,
-                               syscols.c.length, syscols.c.scale,
-                               syscols.c.generated, syscols.c.remark). \
-                where(and_(
-                syscols.c.tabschema == current_schema,
-                syscols.c.tabname == table_name)). \
-                order_by(syscols.c.colno)
-            logger.debug(f"[OS390] get_columns SQL -> {query}")
+            logger.debug("[OS390] get_columns -> schema=%s, table=%s", current_schema, table_name)
+            query = self._columns_query
+            logger.debug("[OS390] get_columns SQL -> %s", query)
             sa_columns = []
-            for r in connection.execute(query):
+            for r in connection.execute(query, {"schema": current_schema, "table": table_name}):
                 rowtype = r[1].upper()
-                logger.debug(f"[OS390] Processing column -> name={r[0]}, raw_type={rowtype}")
-                if rowtype in ['DECIMAL', 'NUMERIC']:
-                    coltype = self.ischema_names.get(rowtype)(int(r[4]), int(r[5]))
-                elif rowtype in ['CHARACTER', 'CHAR', 'VARCHAR',
-                                 'GRAPHIC', 'VARGRAPHIC']:
-                    coltype = self.ischema_names.get(rowtype)(int(r[4]))
-                else:
-                    try:
-                        coltype = self.ischema_names[rowtype]
-                    except KeyError:
-                        logger.warning(f"[OS390] Unknown type '{rowtype}' for column '{r[0]}'")
-                        util.warn(
-                            "Did not recognize type '%s' of column '%s'" %
-                            (rowtype, r[0])
-                        )
-                        coltype = sa_types.NULLTYPE
+                logger.debug("[OS390] Processing column -> name=%s, raw_type=%s", r[0], rowtype)
+                # SYSCOLUMNS.FOREIGNKEY is 'B' for FOR BIT DATA columns
+                codepage = 0 if r[8] == 'B' else None
+                coltype = self.resolve_type(rowtype, r[4], r[5], codepage)
+                if coltype is None:
+                    logger.warning("[OS390] Unknown type '%s' for column '%s'", rowtype, r[0])
+                    util.warn(
+                        "Did not recognize type '%s' of column '%s'" %
+                        (rowtype, r[0])
+                    )
+                    coltype = sa_types.NULLTYPE
                 sa_columns.append({
                     'name': self.normalize_name(r[0]),
                     'type': coltype,
@@ -1718,7 +2517,7 @@ class OS390Reflector(BaseReflector):
                     'autoincrement': (r[2] == 'J') and (r[2] != ' '),
                     'comment': r[7] or None,
                 })
-            logger.debug(f"[OS390] get_columns completed -> count={len(sa_columns)}")
+            logger.debug("[OS390] get_columns completed -> count=%s", len(sa_columns))
             return sa_columns
         except Exception:
             logger.exception("[OS390] Error in get_columns")
@@ -1730,25 +2529,18 @@ class OS390Reflector(BaseReflector):
         try:
             current_schema = self.denormalize_name(schema or self.default_schema_name)
             table_name = self.denormalize_name(table_name)
-            logger.debug(f"[OS390] get_pk_constraint -> schema={current_schema}, table={table_name}")
-            sysindexes = self.sys_columns
-            col_finder = re.compile(r"(\w+)")
-            query = sql.select(sysindexes.c.colname). \
-                where(and_(
-                sysindexes.c.tabschema == current_schema,
-                sysindexes.c.tabname == table_name,
-                sysindexes.c.keyseq > 0)). \
-                order_by(sysindexes.c.tabschema, sysindexes.c.tabname)
-            logger.debug(f"[OS390] get_pk_constraint SQL -> {query}")
+            logger.debug("[OS390] get_pk_constraint -> schema=%s, table=%s", current_schema, table_name)
+            query = self._primary_keys_query
+            logger.debug("[OS390] get_pk_constraint SQL -> %s", query)
             pk_columns = []
-            for r in connection.execute(query):
-                cols = col_finder.findall(r[0])
+            for r in connection.execute(query, {"schema": current_schema, "table": table_name}):
+                cols = _COLUMN_NAMES_RE.findall(r[0])
                 pk_columns.extend(cols)
             result = {
                 "constrained_columns": [self.normalize_name(col) for col in pk_columns],
                 "name": None
             }
-            logger.debug(f"[OS390] get_pk_constraint result -> {result}")
+            logger.debug("[OS390] get_pk_constraint result -> %s", result)
             return result
         except Exception:
             logger.exception("[OS390] Error in get_pk_constraint")
@@ -1760,22 +2552,15 @@ class OS390Reflector(BaseReflector):
         try:
             current_schema = self.denormalize_name(schema or self.default_schema_name)
             table_name = self.denormalize_name(table_name)
-            logger.debug(f"[OS390] get_primary_keys -> schema={current_schema}, table={table_name}")
-            sysindexes = self.sys_columns
-            col_finder = re.compile(r"(\w+)")
-            query = sql.select(sysindexes.c.colname). \
-                where(and_(
-                sysindexes.c.tabschema == current_schema,
-                sysindexes.c.tabname == table_name,
-                sysindexes.c.keyseq > 0)). \
-                order_by(sysindexes.c.tabschema, sysindexes.c.tabname)
-            logger.debug(f"[OS390] get_primary_keys SQL -> {query}")
+            logger.debug("[OS390] get_primary_keys -> schema=%s, table=%s", current_schema, table_name)
+            query = self._primary_keys_query
+            logger.debug("[OS390] get_primary_keys SQL -> %s", query)
             pk_columns = []
-            for r in connection.execute(query):
-                cols = col_finder.findall(r[0])
+            for r in connection.execute(query, {"schema": current_schema, "table": table_name}):
+                cols = _COLUMN_NAMES_RE.findall(r[0])
                 pk_columns.extend(cols)
             result = [self.normalize_name(col) for col in pk_columns]
-            logger.debug(f"[OS390] get_primary_keys result -> {result}")
+            logger.debug("[OS390] get_primary_keys result -> %s", result)
             return result
         except Exception:
             logger.exception("[OS390] Error in get_primary_keys")
@@ -1789,27 +2574,11 @@ class OS390Reflector(BaseReflector):
             current_schema = self.denormalize_name(schema or default_schema)
             default_schema = self.normalize_name(default_schema)
             table_name = self.denormalize_name(table_name)
-            logger.debug(f"[OS390] get_foreign_keys -> schema={current_schema}, table={table_name}")
-            sysfkeys = self.sys_foreignkeys
-            sysrels = self.sys_rels
-            syscolspk = self.sys_columns
-            sysindex = self.sys_indexes
-            query = sql.select(
-                sysrels.c.fkname, sysrels.c.fktabschema,
-                sysrels.c.fktabname, sysfkeys.c.fkcolname,
-                sysindex.c.indname, sysrels.c.pktabschema,
-                sysrels.c.pktabname, syscolspk.c.colname). \
-                where(and_(
-                sysrels.c.fktabschema == current_schema,
-                sysrels.c.fktabname == table_name,
-                sysrels.c.fktabname == sysfkeys.c.fktabname,
-                sysrels.c.pktabname == syscolspk.c.tabname,
-                syscolspk.c.tabname == sysindex.c.tabname,
-                syscolspk.c.keyseq > 0)). \
-                order_by(sysfkeys.c.colno)
-            logger.debug(f"[OS390] get_foreign_keys SQL -> {query}")
+            logger.debug("[OS390] get_foreign_keys -> schema=%s, table=%s", current_schema, table_name)
+            query = self._foreign_keys_query
+            logger.debug("[OS390] get_foreign_keys SQL -> %s", query)
             fschema = {}
-            for r in connection.execute(query):
+            for r in connection.execute(query, {"schema": current_schema, "table": table_name}):
                 if r[0] not in fschema:
                     referred_schema = self.normalize_name(r[5])
                     # if no schema specified and referred schema here is the
@@ -1827,7 +2596,7 @@ class OS390Reflector(BaseReflector):
                     fschema[r[0]]['constrained_columns'].append(self.normalize_name(r[3]))
                     fschema[r[0]]['referred_columns'].append(self.normalize_name(r[7]))
             result = [value for key, value in fschema.items()]
-            logger.debug(f"[OS390] get_foreign_keys result count -> {len(result)}")
+            logger.debug("[OS390] get_foreign_keys result count -> %s", len(result))
             return result
         except Exception:
             logger.exception("[OS390] Error in get_foreign_keys")
@@ -1841,27 +2610,11 @@ class OS390Reflector(BaseReflector):
             current_schema = self.denormalize_name(schema or default_schema)
             default_schema = self.normalize_name(default_schema)
             table_name = self.denormalize_name(table_name)
-            logger.debug(f"[OS390] get_incoming_foreign_keys -> schema={current_schema}, table={table_name}")
-            sysfkeys = self.sys_foreignkeys
-            sysrels = self.sys_rels
-            syscolspk = self.sys_columns
-            sysindex = self.sys_indexes
-            query = sql.select(
-                sysrels.c.fkname, sysrels.c.fktabschema,
-                sysrels.c.fktabname, sysfkeys.c.fkcolname,
-                sysindex.c.indname, sysrels.c.pktabschema,
-                sysrels.c.pktabname, syscolspk.c.colname). \
-                where(and_(
-                syscolspk.c.tabschema == current_schema,
-                syscolspk.c.tabname == table_name,
-                sysrels.c.fktabname == sysfkeys.c.fktabname,
-                sysrels.c.pktabname == syscolspk.c.tabname,
-                syscolspk.c.tabname == sysindex.c.tabname,
-                syscolspk.c.keyseq > 0)). \
-                order_by(sysfkeys.c.colno)
-            logger.debug(f"[OS390] get_incoming_foreign_keys SQL -> {query}")
+            logger.debug("[OS390] get_incoming_foreign_keys -> schema=%s, table=%s", current_schema, table_name)
+            query = self._incoming_foreign_keys_query
+            logger.debug("[OS390] get_incoming_foreign_keys SQL -> %s", query)
             fschema = {}
-            for r in connection.execute(query):
+            for r in connection.execute(query, {"schema": current_schema, "table": table_name}):
                 if r[0] not in fschema:
                     constrained_schema = self.normalize_name(r[1])
                     # if no schema specified and referred schema here is the
@@ -1881,7 +2634,7 @@ class OS390Reflector(BaseReflector):
                     fschema[r[0]]['constrained_columns'].append(self.normalize_name(r[3]))
                     fschema[r[0]]['referred_columns'].append(self.normalize_name(r[7]))
             result = [value for key, value in fschema.items()]
-            logger.debug(f"[OS390] get_incoming_foreign_keys result count -> {len(result)}")
+            logger.debug("[OS390] get_incoming_foreign_keys result count -> %s", len(result))
             return result
         except Exception:
             logger.exception("[OS390] Error in get_incoming_foreign_keys")
@@ -1893,32 +2646,21 @@ class OS390Reflector(BaseReflector):
         try:
             current_schema = self.denormalize_name(schema or self.default_schema_name)
             table_name = self.denormalize_name(table_name)
-            logger.debug(f"[OS390] get_indexes -> schema={current_schema}, table={table_name}")
-            sysidx = self.sys_indexes
-            syscolpk = self.sys_columns
-            query = sql.select(
-                sysidx.c.indname, syscolpk.c.colname,
-                sysidx.c.uniquerule, sysidx.c.system_required). \
-                where(and_(
-                sysidx.c.tabschema == current_schema,
-                sysidx.c.tabname == table_name,
-                syscolpk.c.colname == sysidx.c.tabname,
-                syscolpk.c.keyseq > 0)). \
-                order_by(sysidx.c.tabname)
-            logger.debug(f"[OS390] get_indexes SQL -> {query}")
+            logger.debug("[OS390] get_indexes -> schema=%s, table=%s", current_schema, table_name)
+            query = self._indexes_query
+            logger.debug("[OS390] get_indexes SQL -> %s", query)
             indexes = []
-            col_finder = re.compile(r"(\w+)")
-            for r in connection.execute(query):
+            for r in connection.execute(query, {"schema": current_schema, "table": table_name}):
                 if r[2] != 'P':
                     if r[2] == 'U' and r[3] != 0:
                         continue
                     indexes.append({
                         'name': self.normalize_name(r[0]),
                         'column_names': [self.normalize_name(col)
-                                         for col in col_finder.findall(r[1])],
+                                         for col in _COLUMN_NAMES_RE.findall(r[1])],
                         'unique': r[2] == 'U'
                     })
-            logger.debug(f"[OS390] get_indexes result count -> {len(indexes)}")
+            logger.debug("[OS390] get_indexes result count -> %s", len(indexes))
             return indexes
         except Exception:
             logger.exception("[OS390] Error in get_indexes")
@@ -1930,35 +2672,12 @@ class OS390Reflector(BaseReflector):
         try:
             current_schema = self.denormalize_name(schema or self.default_schema_name)
             table_name = self.denormalize_name(table_name)
-            logger.debug(f"[OS390] get_unique_constraints -> schema={current_schema}, table={table_name}")
-            syskeycol = self.sys_keycoluse
-            sysconst = self.sys_tabconst
-            query = (
-                sql.select(syskeycol.c.constname, syskeycol.c.colname)
-                .select_from(
-                    join(
-                        syskeycol,
-                        sysconst,
-                        and_(
-                            syskeycol.c.constname == sysconst.c.constname,
-                            syskeycol.c.tabschema == sysconst.c.tabschema,
-                            syskeycol.c.tabname == sysconst.c.tabname,
-                        ),
-                    )
-                )
-                .where(
-                    and_(
-                        sysconst.c.tabname == table_name,
-                        sysconst.c.tabschema == current_schema,
-                        sysconst.c.type == "U",
-                    )
-                )
-                .order_by(syskeycol.c.constname)
-            )
-            logger.debug(f"[OS390] get_unique_constraints SQL -> {query}")
+            logger.debug("[OS390] get_unique_constraints -> schema=%s, table=%s", current_schema, table_name)
+            query = self._unique_constraints_query
+            logger.debug("[OS390] get_unique_constraints SQL -> %s", query)
             uniqueConsts = []
             currConst = None
-            for r in connection.execute(query):
+            for r in connection.execute(query, {"schema": current_schema, "table": table_name}):
                 if currConst == r[0]:
                     uniqueConsts[-1]["column_names"].append(self.normalize_name(r[1]))
                 else:
@@ -1967,7 +2686,7 @@ class OS390Reflector(BaseReflector):
                         "name": self.normalize_name(currConst),
                         "column_names": [self.normalize_name(r[1])],
                     })
-            logger.debug(f"[OS390] get_unique_constraints result count -> {len(uniqueConsts)}")
+            logger.debug("[OS390] get_unique_constraints result count -> %s", len(uniqueConsts))
             return uniqueConsts
         except Exception:
             logger.exception("[OS390] Error in get_unique_constraints")
@@ -0,0 +1,102 @@
+# +--------------------------------------------------------------------------+
+# |  Licensed Materials - Property of IBM                                    |
+# |                                                                          |
+# | (C) Copyright IBM Corporation 2026.                                      |
+# +--------------------------------------------------------------------------+
+# | Licensed under the Apache License, Version 2.0 (the "License");          |
+# | you may not use this file except in compliance with the License.         |
+# | You may obtain a copy of the License at                                  |
+# | http://www.apache.org/licenses/LICENSE-2.0 Unless required by applicable |
+# | law or agreed to in writing, software distributed under the License is   |
+# | distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY |
+# | KIND, either express or implied. See the License for the specific        |
+# | language governing permissions and limitations under the License.        |
+# +--------------------------------------------------------------------------+
+"""Client-side prefetching of sequence values.
+
+Enabled per engine with ``sequence_prefetch``::
+
+    engine = create_engine("db2+ibm_db://...", sequence_prefetch=100)
+
+Each time a sequence's buffer runs dry, the next 100 values are fetched
+with a single ``SELECT NEXT VALUE FOR ...`` over a 100-row VALUES table
+and then handed out one by one, from any thread or connection of the
+engine.
+
+Values are unique but may be used out of order across threads, and
+values still buffered when the engine is disposed or the process exits
+are never used, leaving gaps -- exactly as with the server's own
+``CACHE`` clause.
+"""
+import threading
+import collections
+
+from .logger import logger
+
+
+class SequenceBlockAllocator(object):
+    """Per-engine buffers of prefetched values, keyed by sequence name."""
+
+    def __init__(self, block_size):
+        self.block_size = block_size
+        self._buffers = collections.defaultdict(collections.deque)
+        # guards _buffers, _fetch_locks and _generation; never held
+        # across a database round trip
+        self._lock = threading.Lock()
+        # sequence -> lock held while its buffer is refilled
+        self._fetch_locks = {}
+        # bumped by discard() so that blocks fetched meanwhile aren't kept
+        self._generation = 0
+        self.fetches = 0
+
+    def block_sql(self, formatted_sequence):
+        """SELECT returning ``block_size`` new values of the sequence."""
+        return ("SELECT NEXT VALUE FOR %s FROM (VALUES %s) AS IBM_DB_SA_BLOCK(N)"
+                % (formatted_sequence, ", ".join(["(0)"] * self.block_size)))
+
+    def _take(self, key):
+        with self._lock:
+            buffer = self._buffers.get(key)
+            return buffer.popleft() if buffer else None
+
+    def next_value(self, key, fetch_block):
+        """Return the next buffered value for sequence ``key``, refilling
+        the buffer with ``fetch_block()`` -- a list of new values -- when
+        it is empty.
+
+        Only callers of the same sequence wait for a refill, so that
+        concurrent callers don't each pull a block; other sequences are
+        served meanwhile.
+        """
+        value = self._take(key)
+        if value is not None:
+            return value
+        with self._lock:
+            fetch_lock = self._fetch_locks.setdefault(key, threading.Lock())
+        with fetch_lock:
+            # another caller may have refilled the buffer while we waited
+            value = self._take(key)
+            if value is not None:
+                return value
+            generation = self._generation
+            values = fetch_block()
+            logger.debug("Sequence block fetched -> name=%s, values=%s",
+                         key, len(values))
+            with self._lock:
+                self.fetches += 1
+                if generation != self._generation:
+                    # discarded while fetching; keep none of the block
+                    return values[0]
+                buffer = self._buffers[key]
+                buffer.extend(values)
+                return buffer.popleft()
+
+    def discard(self, key=None):
+        """Drop the buffered values of one sequence, or all; they become
+        gaps."""
+        with self._lock:
+            self._generation += 1
+            if key is None:
+                self._buffers.clear()
+            else:
+                self._buffers.pop(key, None)
@@ -0,0 +1,282 @@
+# +--------------------------------------------------------------------------+
+# |  Licensed Materials - Property of IBM                                    |
+# |                                                                          |
+# | (C) Copyright IBM Corporation 2026.                                      |
+# +--------------------------------------------------------------------------+
+# | Licensed under the Apache License, Version 2.0 (the "License");          |
+# | you may not use this file except in compliance with the License.         |
+# | You may obtain a copy of the License at                                  |
+# | http://www.apache.org/licenses/LICENSE-2.0 Unless required by applicable |
+# | law or agreed to in writing, software distributed under the License is   |
+# | distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY |
+# | KIND, either express or implied. See the License for the specific        |
+# | language governing permissions and limitations under the License.        |
+# +--------------------------------------------------------------------------+
+"""Schema snapshots: reflected metadata saved to a file and served back
+to the dialect without querying the catalog.
+
+A snapshot is written once, from a live database::
+
+    from ibm_db_sa import snapshot
+    snapshot.save_snapshot(engine, "orders.snapshot", schemas=["ORDERS"])
+
+or from the command line::
+
+    python -m ibm_db_sa.snapshot db2+ibm_db://... orders.snapshot ORDERS
+
+and then handed to the dialect, which answers table names, columns,
+keys, indexes, comments and view definitions for the snapshotted schemas
+from the file::
+
+    engine = create_engine("db2+ibm_db://...",
+                           schema_snapshot="orders.snapshot")
+
+"""
+import os
+import sys
+import copy
+import gzip
+import json
+import datetime
+import importlib
+
+from sqlalchemy import types as sa_types
+from sqlalchemy.engine import Engine
+
+from .logger import logger
+
+SNAPSHOT_FORMAT = "ibm_db_sa.schema-snapshot"
+SNAPSHOT_VERSION = 1
+
+# reflector methods answered per schema and per table or view
+SCHEMA_METHODS = ("get_table_names", "get_view_names", "get_sequence_names")
+OBJECT_METHODS = ("get_columns", "get_pk_constraint", "get_foreign_keys",
+                  "get_indexes", "get_unique_constraints", "get_table_comment")
+
+_MISSING = object()
+
+# type attributes that are passed back to the type's constructor on load
+_TYPE_ARGS = ("length", "precision", "scale", "timezone")
+
+
+def _encode_type(type_):
+    if isinstance(type_, type):
+        return {"__class__": "%s:%s" % (type_.__module__, type_.__qualname__)}
+    cls = type(type_)
+    args = {}
+    for attr in _TYPE_ARGS:
+        value = getattr(type_, attr, None)
+        if value is not None and value is not False:
+            args[attr] = value
+    return {"__type__": ["%s:%s" % (cls.__module__, cls.__qualname__), args]}
+
+
+def _encode(value):
+    if isinstance(value, sa_types.TypeEngine) or (
+            isinstance(value, type) and issubclass(value, sa_types.TypeEngine)):
+        return _encode_type(value)
+    if isinstance(value, dict):
+        return dict((k, _encode(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return [_encode(v) for v in value]
+    return value
+
+
+def _import_type(path):
+    module_name, _, qualname = path.partition(":")
+    if module_name.split(".")[0] not in ("sqlalchemy", "ibm_db_sa"):
+        raise ValueError("Refusing to load type %r from a schema snapshot" % path)
+    obj = importlib.import_module(module_name)
+    for part in qualname.split("."):
+        obj = getattr(obj, part)
+    return obj
+
+
+def _decode(value, types):
+    # ``types`` interns decoded types so equal columns share one object
+    if isinstance(value, dict):
+        if "__class__" in value:
+            return _import_type(value["__class__"])
+        if "__type__" in value:
+            key = json.dumps(value["__type__"], sort_keys=True)
+            type_ = types.get(key)
+            if type_ is None:
+                path, args = value["__type__"]
+                type_ = types[key] = _import_type(path)(**args)
+            return type_
+        return dict((k, _decode(v, types)) for k, v in value.items())
+    if isinstance(value, list):
+        return [_decode(v, types) for v in value]
+    return value
+
+
+def _copy(value):
+    # fresh containers and type instances for each caller, so that a
+    # column_reflect listener changing a type affects only its column
+    if isinstance(value, dict):
+        return dict((k, _copy(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return [_copy(v) for v in value]
+    if isinstance(value, sa_types.TypeEngine):
+        return copy.copy(value)
+    return value
+
+
+class SchemaSnapshot(object):
+    """Reflected metadata for one or more schemas, as loaded from a
+    snapshot file.
+
+    ``schemas`` maps each denormalized schema name to its catalog
+    version token, its name lists and the per-object reflection results.
+    """
+
+    def __init__(self, reflector, schemas, created=None):
+        self.reflector = reflector
+        self.schemas = schemas
+        self.created = created
+        # schema -> whether the snapshot may answer for it
+        self._current = {}
+
+    def _is_current(self, dialect, connection, schema):
+        current = self._current.get(schema)
+        if current is None:
+            reflector = dialect._reflector
+            if type(reflector).__name__ != self.reflector:
+                logger.warning(
+                    "Schema snapshot was taken with %s, dialect uses %s; "
+                    "ignoring it", self.reflector, type(reflector).__name__)
+                current = False
+            elif not dialect.schema_snapshot_check:
+                current = True
+            else:
+                version = reflector.get_catalog_version(connection, schema)
+                current = version == self.schemas[schema]["catalog_version"]
+                if not current:
+                    logger.warning(
+                        "Schema snapshot for %s is stale (catalog version %s, "
+                        "snapshot %s); reflecting from the catalog", schema,
+                        version, self.schemas[schema]["catalog_version"])
+            self._current[schema] = current
+        return current
+
+    def lookup(self, dialect, connection, method, name=None, schema=None, **kw):
+        """Return ``(True, result)`` when the snapshot can answer the
+        reflection call, else ``(False, None)``."""
+        if method not in SCHEMA_METHODS and method not in OBJECT_METHODS \
+                and method != "get_view_definition":
+            return False, None
+        explicit_schema = schema is not None
+        schema = dialect._reflector.denormalize_name(
+            schema or dialect.default_schema_name)
+        entry = self.schemas.get(schema)
+        if entry is None or not self._is_current(dialect, connection, schema):
+            return False, None
+        if method in SCHEMA_METHODS:
+            result = entry.get(method, _MISSING)
+        else:
+            result = entry["objects"].get(name, {}).get(method, _MISSING)
+        if result is _MISSING:
+            return False, None
+        logger.debug("Schema snapshot hit -> %s, schema=%s, name=%s", method, schema, name)
+        result = _copy(result)
+        if method == "get_foreign_keys" and not explicit_schema:
+            # the snapshot was reflected with an explicit schema; live
+            # reflection of the default schema reports referred_schema=None
+            # for keys into that schema, so that MetaData.reflect() does not
+            # create a second, schema-qualified copy of the referred table
+            default = dialect._reflector.normalize_name(dialect.default_schema_name)
+            for fkey in result:
+                if fkey.get("referred_schema") == default:
+                    fkey["referred_schema"] = None
+        return True, result
+
+    def discard(self, schema=None):
+        """Stop answering for ``schema``, or for every schema."""
+        if schema is None:
+            for key in self.schemas:
+                self._current[key] = False
+        else:
+            self._current[schema] = False
+
+
+def save_snapshot(bind, path, schemas=None):
+    """Reflect ``schemas`` (default: the connection's default schema)
+    through ``bind``, an Engine or Connection, and write them to ``path``.
+    """
+    if isinstance(bind, Engine):
+        with bind.connect() as connection:
+            return save_snapshot(connection, path, schemas)
+    dialect = bind.dialect
+    reflector = dialect._reflector
+    data = {
+        "format": SNAPSHOT_FORMAT,
+        "version": SNAPSHOT_VERSION,
+        "reflector": type(reflector).__name__,
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "schemas": {},
+    }
+    for schema in schemas or [None]:
+        schema = reflector.denormalize_name(schema or dialect.default_schema_name)
+        logger.info("Taking schema snapshot -> schema=%s", schema)
+        # read the version first so that changes made while reflecting
+        # leave the snapshot stale rather than silently incomplete
+        entry = {"catalog_version": reflector.get_catalog_version(bind, schema)}
+        for method in SCHEMA_METHODS:
+            entry[method] = getattr(reflector, method)(bind, schema=schema)
+        objects = entry["objects"] = {}
+        views = set(entry["get_view_names"])
+        for name in entry["get_table_names"] + entry["get_view_names"]:
+            methods = OBJECT_METHODS + (
+                ("get_view_definition",) if name in views else ())
+            results = objects[name] = {}
+            for method in methods:
+                fn = getattr(reflector, method, None)
+                if fn is None:
+                    continue
+                try:
+                    results[method] = fn(bind, name, schema=schema)
+                except NotImplementedError:
+                    pass
+        data["schemas"][schema] = entry
+    payload = json.dumps(_encode(data), separators=(",", ":")).encode("utf-8")
+    tmp_path = "%s.tmp%d" % (path, os.getpid())
+    with gzip.open(tmp_path, "wb") as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+    logger.info("Schema snapshot written -> path=%s, bytes=%s",
+                path, os.path.getsize(path))
+
+
+def load_snapshot(path):
+    """Read a snapshot file written by :func:`save_snapshot`."""
+    with gzip.open(path, "rb") as f:
+        data = json.loads(f.read().decode("utf-8"))
+    if data.get("format") != SNAPSHOT_FORMAT:
+        raise ValueError("%s is not an ibm_db_sa schema snapshot" % path)
+    if data.get("version") != SNAPSHOT_VERSION:
+        raise ValueError(
+            "Unsupported schema snapshot version %r in %s (expected %d)"
+            % (data.get("version"), path, SNAPSHOT_VERSION))
+    schemas = _decode(data["schemas"], {})
+    logger.debug("Schema snapshot loaded -> path=%s, schemas=%s", path, list(schemas))
+    return SchemaSnapshot(data["reflector"], schemas, data.get("created"))
+
+
+def main(argv=None):
+    from sqlalchemy import create_engine
+
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) < 2:
+        sys.stderr.write(
+            "usage: python -m ibm_db_sa.snapshot URL PATH [SCHEMA ...]\n")
+        return 2
+    engine = create_engine(argv[0])
+    try:
+        save_snapshot(engine, argv[1], argv[2:] or None)
+    finally:
+        engine.dispose()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+# +--------------------------------------------------------------------------+
+# |  Licensed Materials - Property of IBM                                    |
+# |                                                                          |
+# | (C) Copyright IBM Corporation 2026.                                      |
+# +--------------------------------------------------------------------------+
+# | Licensed under the Apache License, Version 2.0 (the "License");          |
+# | you may not use this file except in compliance with the License.         |
+# | You may obtain a copy of the License at                                  |
+# | http://www.apache.org/licenses/LICENSE-2.0 Unless required by applicable |
+# | law or agreed to in writing, software distributed under the License is   |
+# | distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY |
+# | KIND, either express or implied. See the License for the specific        |
+# | language governing permissions and limitations under the License.        |
+# +--------------------------------------------------------------------------+
+"""Per-connection cache of prepared statement handles.
+
+Enabled with ``prepared_statement_cache_size``::
+
+    engine = create_engine("db2+ibm_db://...", prepared_statement_cache_size=256)
+
+Each DBAPI connection keeps up to that many prepared handles, keyed by
+SQL text and evicted least recently used first.  A handle is checked out
+while a cursor executes and reads it and checked back in when the cursor
+is closed or re-executed, so two open cursors never share one.  The
+cache lives on the DBAPI connection and goes away with it, e.g. when the
+pool invalidates the connection.
+"""
+import collections
+
+from .logger import logger
+
+
+class StatementCache(object):
+    """LRU of idle prepared statement handles for one connection.
+
+    ``free(handle)`` releases a handle that is evicted or not needed.
+    """
+
+    def __init__(self, size, free):
+        self.size = size
+        self._free = free
+        self._handles = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._handles)
+
+    def checkout(self, statement):
+        """Take the idle handle for ``statement``, or None to prepare one."""
+        handle = self._handles.pop(statement, None)
+        if handle is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return handle
+
+    def checkin(self, statement, handle):
+        """Keep ``handle`` for reuse, evicting the least recently used
+        handles beyond ``size``."""
+        if statement in self._handles:
+            # another cursor ran the same statement meanwhile
+            self._release(handle)
+            self._handles.move_to_end(statement)
+            return
+        self._handles[statement] = handle
+        while len(self._handles) > self.size:
+            _, evicted = self._handles.popitem(last=False)
+            self._release(evicted)
+
+    def clear(self):
+        """Free every idle handle, e.g. after DDL."""
+        while self._handles:
+            _, handle = self._handles.popitem()
+            self._release(handle)
+
+    def _release(self, handle):
+        try:
+            self._free(handle)
+        except Exception as e:
+            logger.debug("Failed to free cached statement handle: %s", e)
@@ -0,0 +1,130 @@
+# +--------------------------------------------------------------------------+
+# |  Licensed Materials - Property of IBM                                    |
+# |                                                                          |
+# | (C) Copyright IBM Corporation 2026.                                      |
+# +--------------------------------------------------------------------------+
+# | Licensed under the Apache License, Version 2.0 (the "License");          |
+# | you may not use this file except in compliance with the License.         |
+# | You may obtain a copy of the License at                                  |
+# | http://www.apache.org/licenses/LICENSE-2.0 Unless required by applicable |
+# | law or agreed to in writing, software distributed under the License is   |
+# | distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY |
+# | KIND, either express or implied. See the License for the specific        |
+# | language governing permissions and limitations under the License.        |
+# +--------------------------------------------------------------------------+
+"""Declared global temporary tables for joining against large key sets.
+
+Instead of rendering 100k ids into an IN list, load them into a session
+table and join to it::
+
+    from ibm_db_sa.temptable import key_table
+
+    with engine.connect() as conn:
+        keys = key_table(conn, order_ids)
+        rows = conn.execute(
+            select(orders).join(keys, orders.c.id == keys.c.key)).all()
+
+The table is declared ``ON COMMIT PRESERVE ROWS NOT LOGGED`` once per
+pooled DBAPI connection; later loads on the same connection only delete
+the old rows.  Declaring needs a user temporary table space.
+"""
+import itertools
+
+from sqlalchemy import exc, Column, Integer, MetaData, Table
+
+from .logger import logger
+
+# connection.info key: table name -> column signature it was declared with
+_DECLARED_KEY = "ibm_db_sa_temp_tables"
+
+
+class GlobalTemporaryTable(object):
+    """A ``SESSION`` table declared on demand on each connection.
+
+    ``columns`` are :class:`~sqlalchemy.Column` objects; ``index`` lists
+    column names to index after declaring.  :attr:`table` (also the
+    return value of :meth:`load`) is an ordinary Table to select from
+    and join to.
+    """
+
+    def __init__(self, name, *columns, **kw):
+        self.index = kw.pop("index", None)
+        if kw:
+            raise exc.ArgumentError(
+                "Unknown GlobalTemporaryTable argument(s): %s" % ", ".join(kw))
+        self.table = Table(name, MetaData(), *columns, schema="SESSION")
+        self.name = name
+
+    @property
+    def c(self):
+        return self.table.c
+
+    def _signature(self, dialect):
+        return tuple(
+            (column.name, dialect.type_compiler_instance.process(column.type),
+             column.nullable) for column in self.table.c) + (tuple(self.index or ()),)
+
+    def _declare_sql(self, dialect):
+        preparer = dialect.identifier_preparer
+        columns = ", ".join(
+            "%s %s%s" % (preparer.format_column(column),
+                         dialect.type_compiler_instance.process(column.type),
+                         "" if column.nullable else " NOT NULL")
+            for column in self.table.c)
+        return ("DECLARE GLOBAL TEMPORARY TABLE %s (%s) "
+                "ON COMMIT PRESERVE ROWS NOT LOGGED WITH REPLACE"
+                % (preparer.format_table(self.table), columns))
+
+    def declare(self, connection):
+        """Declare the table on ``connection`` unless it already is, in
+        which case its rows are deleted."""
+        dialect = connection.dialect
+        declared = connection.connection.info.setdefault(_DECLARED_KEY, {})
+        signature = self._signature(dialect)
+        if declared.get(self.name) == signature:
+            try:
+                connection.execute(self.table.delete())
+                return self.table
+            except exc.DBAPIError as e:
+                # a declaration made in a transaction that was rolled back
+                # is gone; declare again
+                logger.debug("Redeclaring temporary table %s: %s", self.name, e)
+                declared.pop(self.name, None)
+        logger.debug("Declaring temporary table -> %s", self.name)
+        connection.exec_driver_sql(self._declare_sql(dialect))
+        if self.index:
+            preparer = dialect.identifier_preparer
+            connection.exec_driver_sql("CREATE INDEX %s.%s ON %s (%s)" % (
+                preparer.quote_schema("SESSION"), preparer.quote("%s_IX" % self.name),
+                preparer.format_table(self.table),
+                ", ".join(preparer.format_column(self.table.c[name])
+                          for name in self.index)))
+        declared[self.name] = signature
+        return self.table
+
+    def load(self, connection, rows, batch_size=10000):
+        """Declare or empty the table, insert ``rows`` (mappings keyed by
+        column key) with array binds of ``batch_size`` and return
+        :attr:`table`."""
+        self.declare(connection)
+        insert = self.table.insert()
+        rows = iter(rows)
+        total = 0
+        while True:
+            batch = list(itertools.islice(rows, batch_size))
+            if not batch:
+                break
+            connection.execute(insert, batch)
+            total += len(batch)
+        logger.debug("Temporary table loaded -> %s, rows=%s", self.name, total)
+        return self.table
+
+
+def key_table(connection, keys, type_=Integer, name="IBM_DB_SA_KEYS",
+              batch_size=10000):
+    """Load the distinct ``keys`` into an indexed one-column temporary
+    table and return it; the column is ``key``."""
+    temp = GlobalTemporaryTable(
+        name, Column("key", type_, nullable=False), index=["key"])
+    return temp.load(connection, ({"key": key} for key in dict.fromkeys(keys)),
+                     batch_size=batch_size)
@@ -0,0 +1,386 @@
+# +--------------------------------------------------------------------------+
+# |  Licensed Materials - Property of IBM                                    |
+# |                                                                          |
+# | (C) Copyright IBM Corporation 2026.                                      |
+# +--------------------------------------------------------------------------+
+# | Licensed under the Apache License, Version 2.0 (the "License");          |
+# | you may not use this file except in compliance with the License.         |
+# | You may obtain a copy of the License at                                  |
+# | http://www.apache.org/licenses/LICENSE-2.0 Unless required by applicable |
+# | law or agreed to in writing, software distributed under the License is   |
+# | distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY |
+# | KIND, either express or implied. See the License for the specific        |
+# | language governing permissions and limitations under the License.        |
+# +--------------------------------------------------------------------------+
+"""Thin DBAPI adapter over the ibm_db C extension.
+
+Selected with the ``ibmdbsa_dbapi`` URL flag::
+
+    engine = create_engine("db2+ibm_db://user:pass@host:50000/db?ibmdbsa_dbapi=thin")
+
+Statements go straight to ``ibm_db.prepare``, ``ibm_db.execute`` and
+``ibm_db.execute_many``, and rows are fetched with ``ibm_db.fetch_tuple``
+driven from C by ``iter()``, so there is no Python code per row or per
+value.  Unlike ibm_db_dbi, values are returned exactly as ibm_db produces
+them: DECIMAL and NUMERIC as strings (the dialect's Numeric type converts
+them), BLOB as bytes.  ``description`` carries only the column name and
+ibm_db type name.
+"""
+import re
+import datetime
+import functools
+import itertools
+
+import ibm_db
+
+apilevel = "2.0"
+threadsafety = 1
+paramstyle = "qmark"
+
+Binary = bytes
+Date = datetime.date
+Time = datetime.time
+Timestamp = datetime.datetime
+
+
+class Warning(Exception):
+    pass
+
+
+class Error(Exception):
+    pass
+
+
+class InterfaceError(Error):
+    pass
+
+
+class DatabaseError(Error):
+    pass
+
+
+class InternalError(DatabaseError):
+    pass
+
+
+class OperationalError(DatabaseError):
+    pass
+
+
+class ProgrammingError(DatabaseError):
+    pass
+
+
+class IntegrityError(DatabaseError):
+    pass
+
+
+class DataError(DatabaseError):
+    pass
+
+
+class NotSupportedError(DatabaseError):
+    pass
+
+
+# SQLSTATE class -> exception, as classified by ibm_db_dbi
+_SQLSTATE_CLASSES = {
+    "02": DataError, "22": DataError, "54": DataError,
+    "08": OperationalError, "09": OperationalError,
+    "23": IntegrityError,
+    "24": InternalError, "25": InternalError, "26": InternalError,
+    "2D": InternalError, "51": InternalError, "57": InternalError,
+    "0A": NotSupportedError,
+}
+for _code in ("07", "21", "27", "28", "2E", "34", "36", "38", "39", "3B",
+              "40", "42", "44", "53", "55", "56", "58", "5U"):
+    _SQLSTATE_CLASSES[_code] = ProgrammingError
+del _code
+
+# driver messages without a SQLSTATE that mean the connection is gone
+_CONNECTION_MESSAGES = ("Connection is not active",
+                        "Connection Resource cannot be found")
+
+_SQLSTATE_RE = re.compile(r"SQLSTATE=(\w{5})")
+_CURRENT_SCHEMA_RE = re.compile(r"CURRENTSCHEMA=([^;]*)", re.IGNORECASE)
+
+
+def _error(e):
+    """Translate an ibm_db exception, or message, into a DBAPI error."""
+    message = str(e)
+    match = _SQLSTATE_RE.search(message)
+    if match is not None:
+        return _SQLSTATE_CLASSES.get(match.group(1)[:2], DatabaseError)(message)
+    for known in _CONNECTION_MESSAGES:
+        if known in message:
+            return OperationalError(message)
+    return InterfaceError(message)
+
+
+def _failure(handle=None):
+    """The error of a call that returned False instead of raising."""
+    message = (ibm_db.stmt_errormsg(handle) if handle is not None
+               else ibm_db.stmt_errormsg()) or ibm_db.conn_errormsg()
+    return _error(message or "Unknown ibm_db error")
+
+
+class Cursor(object):
+    """PEP 249 cursor over one ibm_db statement handle at a time.
+
+    With a StatementCache on the connection, handles are taken from and
+    returned to it instead of being prepared and freed every time.
+    """
+
+    arraysize = 1
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.conn_handler = connection.conn_handler
+        self.stmt_handler = None
+        self.description = None
+        self.rowcount = -1
+        self._statement_cache = connection._ibm_db_sa_statement_cache
+        self._cached_statement = None
+
+    def _release(self):
+        handle, self.stmt_handler = self.stmt_handler, None
+        statement, self._cached_statement = self._cached_statement, None
+        if handle is None:
+            return
+        try:
+            if statement is None:
+                ibm_db.free_stmt(handle)
+            else:
+                # close any result set still open on the handle
+                ibm_db.free_result(handle)
+        except Exception:
+            pass
+        if statement is not None:
+            self._statement_cache.checkin(statement, handle)
+
+    def _prepare(self, operation):
+        if self.conn_handler is None:
+            raise ProgrammingError("Cursor is closed; connection is no longer active.")
+        self._release()
+        cache = self._statement_cache
+        handle = cache.checkout(operation) if cache is not None else None
+        if handle is None:
+            try:
+                handle = ibm_db.prepare(self.conn_handler, operation)
+            except Exception as e:
+                raise _error(e)
+            if not handle:
+                raise _failure()
+        if cache is not None:
+            self._cached_statement = operation
+        self.stmt_handler = handle
+        return handle
+
+    def _describe(self, handle):
+        try:
+            count = ibm_db.num_fields(handle)
+            if count:
+                field_name, field_type = ibm_db.field_name, ibm_db.field_type
+                self.description = [
+                    (field_name(handle, index), field_type(handle, index).upper(),
+                     None, None, None, None, None) for index in range(count)]
+                self.rowcount = -1
+            else:
+                self.description = None
+                self.rowcount = ibm_db.num_rows(handle)
+        except Exception as e:
+            raise _error(e)
+
+    def execute(self, operation, parameters=None):
+        handle = self._prepare(operation)
+        try:
+            if parameters:
+                if parameters.__class__ is not tuple:
+                    parameters = tuple(parameters)
+                succeeded = ibm_db.execute(handle, parameters)
+            else:
+                succeeded = ibm_db.execute(handle)
+        except Exception as e:
+            raise _error(e)
+        if succeeded is False:
+            raise _failure(handle)
+        self._describe(handle)
+        return True
+
+    def executemany(self, operation, seq_of_parameters):
+        handle = self._prepare(operation)
+        try:
+            count = ibm_db.execute_many(handle, tuple(map(tuple, seq_of_parameters)))
+        except Exception as e:
+            raise _error(e)
+        if count is None or count is False:
+            raise _failure(handle)
+        self.description = None
+        self.rowcount = count
+        return True
+
+    def callproc(self, procname, parameters=None):
+        if self.conn_handler is None:
+            raise ProgrammingError("Cursor is closed; connection is no longer active.")
+        self._release()
+        try:
+            if parameters:
+                result = ibm_db.callproc(self.conn_handler, procname, tuple(parameters))
+            else:
+                result = ibm_db.callproc(self.conn_handler, procname)
+        except Exception as e:
+            raise _error(e)
+        values = None
+        if isinstance(result, tuple):
+            result, values = result[0], result[1:]
+        self.stmt_handler = result
+        self._describe(result)
+        return values
+
+    def _rows(self):
+        if self.stmt_handler is None or self.description is None:
+            raise ProgrammingError("The last call to execute did not produce any result set.")
+        # fetch_tuple() returns False once the result set is exhausted
+        return iter(functools.partial(ibm_db.fetch_tuple, self.stmt_handler), False)
+
+    def fetchone(self):
+        rows = self._rows()
+        try:
+            return next(rows, None)
+        except Exception as e:
+            raise _error(e)
+
+    def fetchmany(self, size=None):
+        rows = self._rows()
+        try:
+            return list(itertools.islice(rows, size or self.arraysize))
+        except Exception as e:
+            raise _error(e)
+
+    def fetchall(self):
+        rows = self._rows()
+        try:
+            return list(rows)
+        except Exception as e:
+            raise _error(e)
+
+    @property
+    def last_identity_val(self):
+        try:
+            handle = ibm_db.prepare(
+                self.conn_handler, "SELECT IDENTITY_VAL_LOCAL() FROM SYSIBM.SYSDUMMY1")
+            try:
+                ibm_db.execute(handle)
+                row = ibm_db.fetch_tuple(handle)
+            finally:
+                ibm_db.free_stmt(handle)
+        except Exception as e:
+            raise _error(e)
+        return int(row[0]) if row and row[0] is not None else None
+
+    def setinputsizes(self, sizes):
+        pass
+
+    def setoutputsize(self, size, column=None):
+        pass
+
+    def close(self):
+        self._release()
+        self.conn_handler = None
+
+    def __iter__(self):
+        return self._rows()
+
+
+class Connection(object):
+    """PEP 249 connection wrapping an ibm_db connection handle.
+
+    Provides the extra methods the ibm_db dialect uses on ibm_db_dbi
+    connections: ``dbms_name``, ``dbms_ver``, ``server_info()``,
+    ``get_current_schema()``, ``get_option()`` and ``set_option()``.
+    """
+
+    def __init__(self, conn_handler, current_schema=None):
+        self.conn_handler = conn_handler
+        self.current_schema = current_schema
+        # set by the dialect when prepared_statement_cache_size is used
+        self._ibm_db_sa_statement_cache = None
+        try:
+            self.dbms_name = ibm_db.get_db_info(conn_handler, ibm_db.SQL_DBMS_NAME)
+            self.dbms_ver = ibm_db.get_db_info(conn_handler, ibm_db.SQL_DBMS_VER)
+        except Exception as e:
+            raise _error(e)
+
+    def _call(self, function, *args):
+        if self.conn_handler is None:
+            raise ProgrammingError("Connection is not active")
+        try:
+            return function(self.conn_handler, *args)
+        except Exception as e:
+            raise _error(e)
+
+    def cursor(self):
+        if self.conn_handler is None:
+            raise ProgrammingError("Cursor cannot be returned; "
+                                   "connection is no longer active.")
+        return Cursor(self)
+
+    def commit(self):
+        return self._call(ibm_db.commit)
+
+    def rollback(self):
+        return self._call(ibm_db.rollback)
+
+    def close(self):
+        if self.conn_handler is None:
+            return True
+        cache = self._ibm_db_sa_statement_cache
+        if cache is not None:
+            cache.clear()
+        self.rollback()
+        result = self._call(ibm_db.close)
+        self.conn_handler = None
+        return result
+
+    def set_option(self, attr_dict):
+        return self._call(ibm_db.set_option, attr_dict, 1)
+
+    def get_option(self, attr_key):
+        return self._call(ibm_db.get_option, attr_key, 1)
+
+    def get_current_schema(self):
+        schema = self._call(ibm_db.get_option, ibm_db.SQL_ATTR_CURRENT_SCHEMA, 1)
+        if schema:
+            self.current_schema = schema
+        return self.current_schema
+
+    def server_info(self):
+        return (self.dbms_name, self.dbms_ver)
+
+
+def connect(dsn, user="", password="", host="", database="", conn_options=None):
+    """Connect like ``ibm_db_dbi.connect()``: ``dsn`` is a connection
+    string or a cataloged DSN name, and autocommit is off."""
+    options = dict(conn_options or {})
+    options.setdefault(ibm_db.SQL_ATTR_AUTOCOMMIT, ibm_db.SQL_AUTOCOMMIT_OFF)
+    if "=" in dsn:
+        if not dsn.endswith(";"):
+            dsn += ";"
+        if database and "DATABASE=" not in dsn:
+            dsn += "DATABASE=%s;" % database
+        if host and "HOSTNAME=" not in dsn:
+            dsn += "HOSTNAME=%s;" % host
+    else:
+        dsn = "DSN=%s;" % dsn
+    if user and "UID=" not in dsn:
+        dsn += "UID=%s;" % user
+    if password and "PWD=" not in dsn:
+        dsn += "PWD=%s;" % password
+    try:
+        conn_handler = ibm_db.connect(dsn, "", "", options)
+    except Exception as e:
+        raise _error(e)
+    if not conn_handler:
+        raise _error(ibm_db.conn_errormsg() or "Connection failed")
+    match = _CURRENT_SCHEMA_RE.search(dsn)
+    return Connection(conn_handler, match.group(1) if match else user)
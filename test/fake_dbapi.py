@@ -0,0 +1,133 @@
+"""A DBAPI module stand-in for tests and benchmarks that run without a
+database.
+
+Every statement, and every commit and rollback (as ``"COMMIT"`` and
+``"ROLLBACK"``), is appended to the module's ``log`` and passed to
+``handler(connection, statement, parameters)``, which returns the rows
+of a result set, a ``(column_names, rows)`` tuple, or None for
+statements without a result set.
+"""
+import types
+
+from sqlalchemy import create_engine
+
+
+class Cursor(object):
+    arraysize = 1
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.description = None
+        self.rowcount = -1
+        self.rows = []
+        self.position = 0
+
+    def execute(self, statement, parameters=None):
+        rows = self.connection.dbapi._run(self.connection, statement, parameters)
+        self.position = 0
+        if rows is None:
+            self.description, self.rows = None, []
+            self.rowcount = 1
+        else:
+            if isinstance(rows, tuple):
+                names, rows = rows
+            else:
+                names = ["C%d" % i for i in range(len(rows[0]) if rows else 1)]
+            self.description = [(name, None, None, None, None, None, None)
+                                for name in names]
+            # not copied; fetches only read it, so benchmarks can hand out
+            # large result sets cheaply
+            self.rows = rows if isinstance(rows, list) else list(rows)
+            self.rowcount = -1
+
+    def executemany(self, statement, seq_of_parameters):
+        for parameters in seq_of_parameters:
+            self.execute(statement, parameters)
+
+    def fetchone(self):
+        rows = self.fetchmany(1)
+        return rows[0] if rows else None
+
+    def fetchmany(self, size=None):
+        start = self.position
+        rows = self.rows[start:start + (size or self.arraysize)]
+        self.position = start + len(rows)
+        return rows
+
+    def fetchall(self):
+        rows = self.rows[self.position:]
+        self.position = len(self.rows)
+        return rows
+
+    def setinputsizes(self, *sizes):
+        pass
+
+    def close(self):
+        pass
+
+
+class Connection(object):
+    dbms_ver = "11.05.0900"
+
+    def __init__(self, dbapi):
+        self.dbapi = dbapi
+        self.dbms_name = dbapi.dbms_name
+
+    def cursor(self):
+        return Cursor(self)
+
+    def commit(self):
+        self.dbapi._run(self, "COMMIT", None)
+
+    def rollback(self):
+        self.dbapi._run(self, "ROLLBACK", None)
+
+    def close(self):
+        pass
+
+    def server_info(self):
+        return (self.dbms_name, self.dbms_ver)
+
+    def get_current_schema(self):
+        return "APP"
+
+    def get_option(self, attr):
+        return 2
+
+    def set_option(self, attrs):
+        return True
+
+
+def make_dbapi(handler=None, dbms_name="DB2/LINUX"):
+    dbapi = types.ModuleType("fake_dbapi")
+    dbapi.paramstyle = "qmark"
+    dbapi.apilevel = "2.0"
+    dbapi.threadsafety = 1
+    dbapi.Binary = bytes
+    dbapi.SQL_ATTR_TXN_ISOLATION = 108
+    dbapi.Error = type("Error", (Exception,), {})
+    dbapi.Warning = type("Warning", (Exception,), {})
+    dbapi.InterfaceError = type("InterfaceError", (dbapi.Error,), {})
+    dbapi.DatabaseError = type("DatabaseError", (dbapi.Error,), {})
+    for name in ("DataError", "OperationalError", "IntegrityError",
+                 "InternalError", "ProgrammingError", "NotSupportedError"):
+        setattr(dbapi, name, type(name, (dbapi.DatabaseError,), {}))
+    dbapi.dbms_name = dbms_name
+    dbapi.log = []
+    dbapi.handler = handler
+
+    def _run(connection, statement, parameters):
+        dbapi.log.append(statement)
+        if dbapi.handler is not None:
+            return dbapi.handler(connection, statement, parameters)
+        return None
+
+    dbapi._run = _run
+    dbapi.connect = lambda *args, **kw: Connection(dbapi)
+    return dbapi
+
+
+def make_engine(dbapi, **kw):
+    kw.setdefault("pool_size", 1)
+    return create_engine("db2+ibm_db://user:pass@host:50000/test",
+                         module=dbapi, **kw)
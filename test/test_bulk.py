@@ -0,0 +1,97 @@
+from sqlalchemy import MetaData, Table, Column, Integer, String
+from sqlalchemy.testing import fixtures
+
+from ibm_db_sa import bulk_load
+from test.fake_dbapi import make_dbapi, make_engine
+
+_ADMIN_CMD_RESULT = (["ROWS_READ", "ROWS_SKIPPED", "ROWS_LOADED",
+                      "ROWS_REJECTED", "ROWS_DELETED", "ROWS_COMMITTED"],
+                     [(3, 0, 2, 1, 0, 3)])
+
+
+class BulkLoadTest(fixtures.TestBase):
+
+    def setup_test(self):
+        self.orders = Table("orders", MetaData(),
+                            Column("id", Integer, nullable=False),
+                            Column("status", String(10), nullable=False),
+                            Column("note", String(100)))
+        self.calls = []
+        self.engine = None
+
+    def teardown_test(self):
+        self.engine.dispose()
+
+    def _handle(self, connection, statement, parameters):
+        statement = statement.strip()
+        if statement.startswith("CALL SYSPROC.ADMIN_CMD"):
+            return _ADMIN_CMD_RESULT
+        if statement.startswith("SELECT"):
+            return []
+        return None
+
+    def _connect(self, dbms_name="DB2/LINUX"):
+        dbapi = make_dbapi(self._handle, dbms_name=dbms_name)
+        self.engine = make_engine(dbapi)
+        self.dbapi = dbapi
+        return self.engine.connect()
+
+    def _statements(self):
+        return [s.strip() for s in self.dbapi.log if s not in ("ROLLBACK", "COMMIT")]
+
+    def test_load_rows_through_stage(self):
+        captured = []
+        with self._connect() as conn:
+            self.dbapi.handler = lambda c, s, p: (
+                captured.append(p) if "ADMIN_CMD" in s else None) or self._handle(c, s, p)
+            result = bulk_load(conn, self.orders, [(1, "NEW"), (2, "SHIPPED")],
+                               columns=["id", "status"])
+        assert tuple(result) == ("LOAD", 3, 2, 1, 0, 0)
+        declare, insert_1, insert_2, call, drop = self._statements()
+        stage = declare.split()[4]
+        assert stage.startswith('"SESSION"."IBM_DB_SA_BULK_STAGE_')
+        # the stage has the loaded columns only, none of them NOT NULL
+        assert declare == (
+            "DECLARE GLOBAL TEMPORARY TABLE %s (id INT, status VARCHAR(10)) "
+            "ON COMMIT PRESERVE ROWS NOT LOGGED WITH REPLACE" % stage)
+        assert insert_1 == "INSERT INTO %s (id, status) VALUES (?, ?)" % stage
+        assert captured == [(
+            "LOAD FROM (SELECT id, status FROM %s) OF CURSOR MESSAGES ON SERVER "
+            "INSERT INTO orders (id, status) NONRECOVERABLE" % stage,)]
+        assert drop == "DROP TABLE %s" % stage
+
+    def test_each_load_has_its_own_stage(self):
+        with self._connect() as conn:
+            bulk_load(conn, self.orders, [(1, "NEW", None)])
+            bulk_load(conn, self.orders, [(2, "NEW", None)])
+        declared = [s.split()[4] for s in self._statements()
+                    if s.startswith("DECLARE")]
+        assert len(set(declared)) == 2
+
+    def test_server_file_commands(self):
+        captured = []
+        with self._connect() as conn:
+            self.dbapi.handler = lambda c, s, p: (
+                captured.append(p[0]) if "ADMIN_CMD" in s else None) or self._handle(c, s, p)
+            bulk_load(conn, self.orders, "/data/o'rders.del", mode="REPLACE",
+                      nonrecoverable=False)
+            bulk_load(conn, self.orders, "/data/orders.del", method="IMPORT",
+                      columns=["id"])
+        assert captured == [
+            "LOAD FROM '/data/o''rders.del' OF DEL MESSAGES ON SERVER "
+            "REPLACE INTO orders (id, status, note)",
+            "IMPORT FROM '/data/orders.del' OF DEL MESSAGES ON SERVER "
+            "INSERT INTO orders (id)",
+        ]
+
+    def test_insert_fallback_without_admin_cmd(self):
+        with self._connect(dbms_name="DB2") as conn:
+            result = bulk_load(conn, self.orders,
+                               [{"id": 1, "status": "NEW", "note": None}] * 3,
+                               mode="REPLACE", batch_size=2)
+        assert tuple(result) == ("INSERT", 3, 3, 0, 0, 1)
+        statements = self._statements()
+        assert statements[0] == "DELETE FROM orders"
+        assert statements[1:] == [
+            "INSERT INTO orders (id, status, note) VALUES (?, ?, ?)"] * 3
+        assert not [s for s in statements if "ADMIN_CMD" in s]
@@ -0,0 +1,92 @@
+from sqlalchemy.testing import fixtures
+from sqlalchemy.testing import AssertsCompiledSQL
+from sqlalchemy.testing import assert_raises
+from sqlalchemy import MetaData, Table, Column, Integer, String
+from sqlalchemy import select
+
+from ibm_db_sa import base
+
+
+class CompileTest(fixtures.TestBase, AssertsCompiledSQL):
+
+    __dialect__ = base.dialect()
+
+    @classmethod
+    def setup_class(cls):
+        m = MetaData()
+        cls.t = Table('t', m, Column('a', Integer), Column('b', String(20)))
+
+    def test_limit_offset(self):
+        t = self.t
+        self.assert_compile(
+            select(t).limit(5).offset(3),
+            "SELECT t.a, t.b FROM t LIMIT __[POSTCOMPILE_param_1] "
+            "OFFSET __[POSTCOMPILE_param_2]"
+        )
+
+    def test_offset_only_rewritten_despite_nested_limit(self):
+        # a LIMIT inside a subquery must not suppress the ROW_NUMBER()
+        # rewrite needed for the outer bare OFFSET
+        t = self.t
+        stmt = select(t).where(t.c.a.in_(select(t.c.a).limit(2))).offset(5)
+        sql = str(stmt.compile(dialect=self.__dialect__))
+        assert 'ROW_NUMBER() OVER()' in sql
+        assert sql.rstrip().endswith(
+            '"Z.__ROWNUM" > __[POSTCOMPILE_param_2] )')
+
+    def test_reflected_type_rendering(self):
+        d = self.__dialect__
+        tc = getattr(d, 'type_compiler_instance', None) or d.type_compiler
+        assert tc.process(base.DECFLOAT(34)) == "DECFLOAT(34)"
+        assert tc.process(base.TIMESTAMP(precision=3)) == "TIMESTAMP(3)"
+        assert tc.process(base.TIMESTAMP()) == "TIMESTAMP"
+        assert tc.process(base.LONGVARCHAR()) == "LONG VARCHAR"
+
+    def test_in_list_padding_and_chunking(self):
+        t = self.t
+        d = base.dialect(in_list_padding=True, in_list_chunk_size=8)
+        compiled = select(t.c.a).where(t.c.a.in_(list(range(3)))).compile(
+            dialect=d, compile_kwargs={"render_postcompile": True})
+        assert str(compiled).endswith("WHERE (t.a IN (?, ?, ?, ?, ?, ?, ?, ?))")
+        assert compiled.construct_params()["a_1_8"] == 2
+        compiled = select(t.c.a).where(t.c.a.in_(list(range(10)))).compile(
+            dialect=d, compile_kwargs={"render_postcompile": True})
+        assert str(compiled).endswith(
+            "WHERE (t.a IN (%s) OR t.a IN (%s))" % ((", ".join("?" * 8),) * 2))
+
+    def test_boolean_predicates_without_native_boolean(self):
+        from sqlalchemy import Boolean
+        t = Table('tb', MetaData(), Column('f', Boolean))
+        self.assert_compile(
+            select(t).where(t.c.f.is_(True), t.c.f.is_not(False)),
+            "SELECT tb.f FROM tb WHERE tb.f = 1 AND COALESCE(tb.f, 1) <> 0"
+        )
+
+    def test_for_update_skip_locked_and_nowait(self):
+        t = Table('jobs', MetaData(), Column('id', Integer), Column('state', Integer))
+        self.assert_compile(
+            select(t.c.id).with_for_update(skip_locked=True),
+            "SELECT jobs.id FROM jobs "
+            "WITH RS USE AND KEEP UPDATE LOCKS SKIP LOCKED DATA"
+        )
+        self.assert_compile(
+            select(t.c.id).with_for_update(read=True, of=t.c.state),
+            "SELECT jobs.id FROM jobs WITH RS USE AND KEEP SHARE LOCKS"
+        )
+        self.assert_compile(
+            select(t.c.id).with_for_update(of=t),
+            "SELECT jobs.id FROM jobs FOR UPDATE OF id, state "
+            "WITH RS USE AND KEEP UPDATE LOCKS"
+        )
+        compiled = select(t.c.id).with_for_update(nowait=True).compile(
+            dialect=self.__dialect__)
+        assert compiled.lock_nowait
+
+    def test_boolean_bind_processor(self):
+        from sqlalchemy import Boolean
+        d = base.dialect()
+        process = Boolean().dialect_impl(d).bind_processor(d)
+        assert [process(v) for v in (True, False, None)] == [1, 0, None]
+        assert_raises(TypeError, process, "yes")
+        d.supports_native_boolean = True
+        assert Boolean().dialect_impl(d).bind_processor(d) is None
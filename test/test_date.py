@@ -0,0 +1,39 @@
+import datetime
+
+from sqlalchemy import Date
+from sqlalchemy.testing import fixtures
+
+from ibm_db_sa import base
+from ibm_db_sa.base import _IBM_Date, _IBM_NativeDate
+from ibm_db_sa.ibm_db import DB2Dialect_ibm_db
+from ibm_db_sa.pyodbc import AS400Dialect_pyodbc, DB2Dialect_pyodbc
+
+
+class NativeDateTest(fixtures.TestBase):
+
+    def test_colspecs(self):
+        for dialect_cls in (DB2Dialect_ibm_db, DB2Dialect_pyodbc,
+                            AS400Dialect_pyodbc):
+            assert type(Date().dialect_impl(dialect_cls())) is _IBM_NativeDate
+        # other drivers keep binding dates as strings
+        assert type(Date().dialect_impl(base.DB2Dialect())) is _IBM_Date
+
+    def test_bind(self):
+        dialect = DB2Dialect_ibm_db()
+        process = Date().dialect_impl(dialect).bind_processor(dialect)
+        value = datetime.date(2024, 2, 29)
+        assert process(value) is value
+        bound = process(datetime.datetime(2024, 2, 29, 23, 59, 59))
+        assert type(bound) is datetime.date
+        assert bound == value
+        assert process(None) is None
+
+    def test_result(self):
+        dialect = DB2Dialect_pyodbc()
+        assert Date().dialect_impl(dialect).result_processor(dialect, None) is None
+
+    def test_string_bind(self):
+        dialect = base.DB2Dialect()
+        process = Date().dialect_impl(dialect).bind_processor(dialect)
+        assert process(datetime.datetime(2024, 2, 29, 23, 59)) == "2024-02-29"
+        assert process(datetime.date(2024, 2, 29)) == "2024-02-29"
@@ -0,0 +1,57 @@
+from sqlalchemy import exc
+from sqlalchemy.testing import fixtures
+
+from ibm_db_sa.dependencies import ForeignKeyGraph
+
+ORDERS = ("APP", "ORDERS")
+LINES = ("APP", "ORDER_LINES")
+CUSTOMERS = ("APP", "CUSTOMERS")
+PRODUCTS = ("APP", "PRODUCTS")
+AUDIT = ("HIST", "AUDIT")
+
+
+class ForeignKeyGraphTest(fixtures.TestBase):
+
+    def test_sorted_tables(self):
+        graph = ForeignKeyGraph([
+            ("FK_LINE_ORDER", LINES, ORDERS),
+            ("FK_LINE_PRODUCT", LINES, PRODUCTS),
+            ("FK_ORDER_CUSTOMER", ORDERS, CUSTOMERS),
+            # self-referencing keys do not order anything
+            ("FK_CUSTOMER_REFERRER", CUSTOMERS, CUSTOMERS),
+        ], tables=[AUDIT])
+        assert graph.sorted_tables() == [
+            CUSTOMERS, ORDERS, PRODUCTS, LINES, AUDIT]
+        assert graph.parents(LINES) == set([ORDERS, PRODUCTS])
+        assert graph.children(CUSTOMERS) == set([ORDERS])
+        assert graph.find_cycles() == []
+
+    def test_long_chain(self):
+        tables = [("APP", "T%05d" % i) for i in range(5000)]
+        graph = ForeignKeyGraph(
+            ("FK%d" % i, tables[i + 1], tables[i]) for i in range(len(tables) - 1))
+        assert graph.sorted_tables() == tables
+        assert graph.find_cycles() == []
+
+    def test_find_cycles(self):
+        a, b, c, d, e = [("APP", name) for name in "ABCDE"]
+        graph = ForeignKeyGraph([
+            ("FK1", a, b), ("FK2", b, c), ("FK3", c, a),
+            ("FK4", d, e), ("FK5", e, d),
+            ("FK6", e, a),
+        ])
+        assert graph.find_cycles() == [[a, b, c], [d, e]]
+
+    def test_sorted_tables_with_cycle(self):
+        graph = ForeignKeyGraph([
+            ("FK_ORDER_CUSTOMER", ORDERS, CUSTOMERS),
+            ("FK_CUSTOMER_LAST_ORDER", CUSTOMERS, ORDERS),
+            ("FK_LINE_ORDER", LINES, ORDERS),
+        ])
+        try:
+            graph.sorted_tables()
+        except exc.CircularDependencyError as err:
+            assert "APP.CUSTOMERS -> APP.ORDERS" in str(err)
+            assert err.cycles == set([CUSTOMERS, ORDERS])
+        else:
+            assert False, "CircularDependencyError not raised"
@@ -0,0 +1,87 @@
+from sqlalchemy import MetaData, Table, Column, Integer
+from sqlalchemy.testing import fixtures
+
+from test.fake_dbapi import make_dbapi, make_engine
+
+
+class _Catalog(object):
+    """Tables of schema APP, with transactional CREATE TABLE."""
+
+    def __init__(self):
+        self.committed = set()
+        self.working = {}
+        self.savepoints = {}
+
+    def __call__(self, connection, statement, parameters):
+        tables = self.working.setdefault(connection, set(self.committed))
+        statement = statement.strip()
+        words = statement.split()
+        if statement.startswith("CREATE TABLE"):
+            tables.add(words[2].upper())
+        elif statement == "COMMIT":
+            self.committed = set(tables)
+        elif statement == "ROLLBACK":
+            self.working[connection] = set(self.committed)
+        elif statement.startswith("SAVEPOINT"):
+            self.savepoints[words[1]] = set(tables)
+        elif statement.startswith("ROLLBACK TO SAVEPOINT"):
+            self.working[connection] = set(self.savepoints[words[3]])
+        elif '"SYSCAT"."TABLES"' in statement:
+            return [(name,) for name in sorted(tables)]
+        elif statement.startswith("SELECT"):
+            return []
+        return None
+
+
+class ExistenceCacheTest(fixtures.TestBase):
+
+    def setup_test(self):
+        self.catalog = _Catalog()
+        self.dbapi = make_dbapi(self.catalog)
+        self.engine = make_engine(self.dbapi, existence_cache_ttl=300)
+        self.metadata = MetaData()
+        Table("orders", self.metadata, Column("id", Integer))
+
+    def teardown_test(self):
+        self.engine.dispose()
+
+    def _creates(self):
+        return [s for s in self.dbapi.log if s.strip().startswith("CREATE TABLE")]
+
+    def _has_table(self, conn):
+        return self.engine.dialect.has_table(conn, "orders")
+
+    def test_rollback_drops_names_cached_after_create(self):
+        with self.engine.connect() as conn:
+            self.metadata.create_all(conn)
+            assert self._has_table(conn)
+            conn.rollback()
+            assert not self._has_table(conn)
+            self.metadata.create_all(conn)
+            conn.commit()
+        assert len(self._creates()) == 2
+        with self.engine.connect() as conn:
+            assert self._has_table(conn)
+
+    def test_rollback_to_savepoint_drops_names_cached_after_create(self):
+        with self.engine.connect() as conn:
+            nested = conn.begin_nested()
+            self.metadata.create_all(conn)
+            assert self._has_table(conn)
+            nested.rollback()
+            assert not self._has_table(conn)
+            self.metadata.create_all(conn)
+            conn.commit()
+        assert len(self._creates()) == 2
+
+    def test_cache_kept_after_commit(self):
+        with self.engine.connect() as conn:
+            self.metadata.create_all(conn)
+            conn.commit()
+            assert self._has_table(conn)
+        loads = len([s for s in self.dbapi.log if '"TABLES"' in s])
+        with self.engine.connect() as conn:
+            assert self._has_table(conn)
+            conn.rollback()
+            assert self._has_table(conn)
+        assert len([s for s in self.dbapi.log if '"TABLES"' in s]) == loads
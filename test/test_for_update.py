@@ -0,0 +1,81 @@
+from sqlalchemy import MetaData, Table, Column, Integer
+from sqlalchemy import event, exc, select
+from sqlalchemy.engine import default
+from sqlalchemy.testing import fixtures
+
+from test.fake_dbapi import make_dbapi, make_engine
+
+
+class NowaitTest(fixtures.TestBase):
+
+    def setup_test(self):
+        self.lock_timeout = 30
+        self.dbapi = make_dbapi(self._handle)
+        self.engine = make_engine(self.dbapi)
+        self.executed = []
+        event.listen(self.engine, "before_cursor_execute",
+                     lambda conn, cursor, statement, *arg: self.executed.append(statement))
+        self.jobs = Table("jobs", MetaData(), Column("id", Integer))
+
+    def teardown_test(self):
+        self.engine.dispose()
+
+    def _handle(self, connection, statement, parameters):
+        if statement == "VALUES CURRENT LOCK TIMEOUT":
+            return [(self.lock_timeout,)]
+        if statement.startswith("SELECT jobs.id"):
+            if self.conflict:
+                raise self.dbapi.OperationalError(
+                    "SQL0911N reason code 68. SQLSTATE=40001")
+            return [(1,), (2,)]
+        if statement.startswith("SELECT"):
+            return []
+        return None
+
+    conflict = False
+
+    def _claim(self, conn):
+        return conn.execute(select(self.jobs.c.id).with_for_update(nowait=True)).all()
+
+    def test_session_lock_timeout_restored(self):
+        with self.engine.connect() as conn:
+            assert self._claim(conn) == [(1,), (2,)]
+            self.lock_timeout = None
+            self._claim(conn)
+        assert self.executed == [
+            "VALUES CURRENT LOCK TIMEOUT",
+            "SET CURRENT LOCK TIMEOUT NOT WAIT",
+            "SELECT jobs.id \nFROM jobs WITH RS USE AND KEEP UPDATE LOCKS",
+            "SET CURRENT LOCK TIMEOUT 30",
+            "VALUES CURRENT LOCK TIMEOUT",
+            "SET CURRENT LOCK TIMEOUT NOT WAIT",
+            "SELECT jobs.id \nFROM jobs WITH RS USE AND KEEP UPDATE LOCKS",
+            "SET CURRENT LOCK TIMEOUT NULL",
+        ]
+
+    def test_session_lock_timeout_restored_after_lock_conflict(self):
+        self.conflict = True
+        handled = []
+        base_handler = default.DefaultExecutionContext.handle_dbapi_exception
+        default.DefaultExecutionContext.handle_dbapi_exception = (
+            lambda context, e: handled.append(e))
+        try:
+            with self.engine.connect() as conn:
+                try:
+                    self._claim(conn)
+                except exc.OperationalError:
+                    pass
+                else:
+                    assert False, "lock conflict did not raise"
+        finally:
+            default.DefaultExecutionContext.handle_dbapi_exception = base_handler
+        assert self.executed[-1] == "SET CURRENT LOCK TIMEOUT 30"
+        # the base class still sees the error
+        assert len(handled) == 1
+        assert isinstance(handled[0], self.dbapi.OperationalError)
+
+    def test_lock_timeout_untouched_without_nowait(self):
+        with self.engine.connect() as conn:
+            conn.execute(select(self.jobs.c.id).with_for_update()).all()
+        assert self.executed == [
+            "SELECT jobs.id \nFROM jobs WITH RS USE AND KEEP UPDATE LOCKS"]
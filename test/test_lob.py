@@ -0,0 +1,109 @@
+import io
+
+from sqlalchemy import MetaData, Table, Column, Integer, LargeBinary, Text, exc
+from sqlalchemy.testing import fixtures
+
+from ibm_db_sa import base
+from ibm_db_sa.lob import LOBReader, iter_chunks, write_lob
+from test.fake_dbapi import make_dbapi, make_engine
+
+
+class LOBReaderTest(fixtures.TestBase):
+
+    def _reader(self, value, chunk_size=4):
+        self.fetches = []
+
+        def fetch(offset, size):
+            self.fetches.append((offset, size))
+            return value[offset:offset + size]
+
+        return LOBReader(fetch, len(value), binary=isinstance(value, bytes),
+                         chunk_size=chunk_size)
+
+    def test_read_in_chunks(self):
+        reader = self._reader(b"0123456789")
+        assert reader.read(6) == b"012345"
+        assert self.fetches == [(0, 4), (4, 2)]
+        assert reader.tell() == 6
+        assert reader.read() == b"6789"
+        assert reader.read() == b""
+
+    def test_seek_and_iterate(self):
+        reader = self._reader("abcdefghij")
+        assert reader.seek(-3, io.SEEK_END) == 7
+        assert reader.read(10) == "hij"
+        reader.seek(2)
+        reader.seek(1, io.SEEK_CUR)
+        assert list(reader) == ["defg", "hij"]
+
+    def test_closed(self):
+        with self._reader(b"abc") as reader:
+            pass
+        assert reader.closed
+        try:
+            reader.read()
+        except ValueError:
+            pass
+        else:
+            assert False, "read() on a closed reader did not raise"
+
+
+class IterChunksTest(fixtures.TestBase):
+
+    def test_values(self):
+        assert list(iter_chunks(b"abcdefg", 3)) == [b"abc", b"def", b"g"]
+        assert list(iter_chunks("abcdef", 3)) == ["abc", "def"]
+        assert list(iter_chunks(io.BytesIO(b"abcde"), 2)) == [b"ab", b"cd", b"e"]
+        assert list(iter_chunks(b"", 3)) == []
+
+    def test_iterable_of_chunks_is_resplit(self):
+        assert list(iter_chunks([b"abcde", b"", b"f"], 2)) == [
+            b"ab", b"cd", b"e", b"f"]
+
+
+class WriteLOBTest(fixtures.TestBase):
+
+    def setup_test(self):
+        self.dbapi = make_dbapi()
+        self.engine = make_engine(self.dbapi)
+        self.docs = Table("docs", MetaData(), Column("id", Integer),
+                          Column("body", LargeBinary), Column("text", Text),
+                          Column("xml", base.XML))
+
+    def teardown_test(self):
+        self.engine.dispose()
+
+    def _statements(self):
+        return [s.strip() for s in self.dbapi.log if s != "ROLLBACK"]
+
+    def test_single_chunk_is_one_update(self):
+        with self.engine.connect() as conn:
+            assert write_lob(conn, self.docs.c.body, self.docs.c.id == 1, b"abc") == 3
+            assert write_lob(conn, self.docs.c.text, self.docs.c.id == 1, []) == 0
+        assert self._statements() == [
+            "UPDATE docs SET body=? WHERE docs.id = ?",
+            "UPDATE docs SET text=? WHERE docs.id = ?"]
+
+    def test_chunks_joined_in_log2_rounds(self):
+        with self.engine.connect() as conn:
+            written = write_lob(conn, self.docs.c.text, self.docs.c.id == 1,
+                                "x" * 20, chunk_size=2)
+        assert written == 20
+        statements = self._statements()
+        assert statements[0].startswith("DECLARE GLOBAL TEMPORARY TABLE")
+        assert "piece CLOB(2G)" in statements[0]
+        assert len([s for s in statements if s.startswith("INSERT")]) == 10
+        # 10 chunks: pieces of 2, 4, 8 and 16 chunks
+        assert len([s for s in statements if s.startswith("UPDATE \"SESSION\"")]) == 4
+        assert statements[-2].startswith("UPDATE docs SET text=(SELECT")
+        assert statements[-1].startswith("DROP TABLE")
+
+    def test_xml_rejected(self):
+        with self.engine.connect() as conn:
+            try:
+                write_lob(conn, self.docs.c.xml, self.docs.c.id == 1, "<a/>")
+            except exc.ArgumentError:
+                pass
+            else:
+                assert False, "write_lob() accepted an XML column"
+        assert self._statements() == []
@@ -0,0 +1,157 @@
+from sqlalchemy import column, select, table
+from sqlalchemy.engine.default import CACHE_HIT, CACHE_MISS, NO_CACHE_KEY
+from sqlalchemy.testing import fixtures
+
+from ibm_db_sa.metrics import (CompileCacheStats, Histogram, StatementMetrics,
+                               statement_fingerprint)
+
+from test.fake_dbapi import make_dbapi, make_engine
+
+
+def _select_handler(connection, statement, parameters):
+    return [(1,)] if statement.strip().startswith("SELECT") else None
+
+
+class FingerprintTest(fixtures.TestBase):
+
+    def test_literals_and_whitespace(self):
+        assert statement_fingerprint(
+            "SELECT a FROM t\n WHERE b = 'it''s'  AND c IN (1, 2.5) AND t2.x = d") == (
+            "SELECT a FROM t WHERE b = ? AND c IN (?, ?) AND t2.x = d")
+
+
+class CompileCacheStatsTest(fixtures.TestBase):
+
+    def setup_test(self):
+        self.stats = CompileCacheStats()
+
+    def test_totals(self):
+        stats = self.stats
+        stats.record_compile("SELECT a FROM t WHERE b = 1")
+        stats.record_compile("SELECT a FROM t WHERE b = 2", ["literal_execute"])
+        stats.record_execution("SELECT a FROM t WHERE b = ?", CACHE_MISS)
+        stats.record_execution("SELECT a FROM t WHERE b = ?", CACHE_HIT)
+        stats.record_execution("SELECT a FROM t WHERE b = ?", NO_CACHE_KEY)
+        # SQLAlchemy before 1.4 reports no cache outcome
+        stats.record_execution("SELECT a FROM t WHERE b = ?", None)
+        assert stats.as_dict() == {
+            "compiles": 2, "hits": 1, "misses": 1, "uncacheable": 1, "shapes": 1}
+
+    def test_top_offenders(self):
+        stats = self.stats
+        for value in range(3):
+            stats.record_compile("SELECT a FROM t WHERE b = %d" % value)
+            stats.record_uncacheable(
+                "SELECT a FROM t WHERE b = %d" % value, "textual")
+        stats.record_compile("SELECT b FROM t")
+        stats.record_execution("SELECT b FROM t", CACHE_MISS)
+        stats.record_execution("SELECT c FROM t", CACHE_HIT)
+        assert stats.top_offenders() == [
+            {"statement": "SELECT a FROM t WHERE b = ?", "compiles": 3,
+             "hits": 0, "misses": 0, "uncacheable": 3, "reasons": ["textual"]},
+            {"statement": "SELECT b FROM t", "compiles": 1,
+             "hits": 0, "misses": 1, "uncacheable": 0, "reasons": []},
+        ]
+        assert len(stats.top_offenders(1)) == 1
+        report = stats.report().splitlines()
+        assert report[0] == (
+            "compiles=4 hits=1 misses=1 uncacheable=3 shapes=3")
+        assert report[1].endswith("SELECT a FROM t WHERE b = ? [textual]")
+
+    def test_max_shapes(self):
+        stats = CompileCacheStats(max_shapes=1)
+        stats.record_compile("SELECT a FROM t")
+        stats.record_compile("SELECT b FROM t")
+        stats.record_execution("SELECT b FROM t", CACHE_MISS)
+        assert stats.as_dict() == {
+            "compiles": 2, "hits": 0, "misses": 1, "uncacheable": 0, "shapes": 1}
+        assert stats.top_offenders() == []
+
+    def test_reset(self):
+        self.stats.record_compile("SELECT a FROM t")
+        self.stats.reset()
+        assert self.stats.as_dict() == {
+            "compiles": 0, "hits": 0, "misses": 0, "uncacheable": 0, "shapes": 0}
+
+    def test_engine_records_compiles_and_cache_outcomes(self):
+        engine = make_engine(make_dbapi(_select_handler), compile_stats=True)
+        t = table("t", column("a"))
+        with engine.connect() as conn:
+            for value in range(2):
+                conn.execute(select(t.c.a).where(t.c.a == value)).all()
+        engine.dispose()
+        assert engine.dialect.compile_stats.as_dict() == {
+            "compiles": 1, "hits": 1, "misses": 1, "uncacheable": 0, "shapes": 1}
+
+
+class HistogramTest(fixtures.TestBase):
+
+    def test_observe_and_quantiles(self):
+        histogram = Histogram((10, 100))
+        assert histogram.quantile(0.5) is None
+        for elapsed_ns in (5, 10, 50, 500):
+            histogram.observe(elapsed_ns)
+        # bucket upper bounds are inclusive; 500 goes to +Inf
+        assert histogram.counts == [2, 1, 1]
+        assert histogram.as_dict() == {
+            "count": 4, "sum_ns": 565, "max_ns": 500,
+            "p50_ns": 10, "p99_ns": 500}
+
+
+class StatementMetricsTest(fixtures.TestBase):
+
+    def test_series_per_phase_and_fingerprint(self):
+        metrics = StatementMetrics(buckets=(10, 100))
+        metrics.observe("execute", "SELECT a FROM t WHERE b = 1", 5)
+        metrics.observe("execute", "SELECT a FROM t WHERE b = 2", 50)
+        metrics.observe("fetch", "SELECT a FROM t WHERE b = 1", 20)
+        snapshot = metrics.snapshot()
+        assert sorted(snapshot) == [
+            ("execute", "SELECT a FROM t WHERE b = ?"),
+            ("fetch", "SELECT a FROM t WHERE b = ?")]
+        assert snapshot[("execute", "SELECT a FROM t WHERE b = ?")]["count"] == 2
+        metrics.reset()
+        assert metrics.snapshot() == {}
+
+    def test_max_series(self):
+        metrics = StatementMetrics(max_series=1)
+        metrics.observe("execute", "SELECT a FROM t", 5)
+        metrics.observe("execute", "SELECT b FROM t", 5)
+        metrics.observe("fetch", "SELECT c FROM t", 5)
+        metrics.observe("execute", "SELECT d FROM t", 5)
+        snapshot = metrics.snapshot()
+        assert sorted(snapshot) == [
+            ("execute", "<other>"), ("execute", "SELECT a FROM t"),
+            ("fetch", "<other>")]
+        assert snapshot[("execute", "<other>")]["count"] == 2
+
+    def test_to_prometheus(self):
+        metrics = StatementMetrics(buckets=(1000, 2500000))
+        metrics.observe("execute", 'SELECT "A" FROM t\nWHERE b = 1', 500)
+        metrics.observe("execute", 'SELECT "A" FROM t WHERE b = 2', 3000000)
+        labels = 'phase="execute",statement="SELECT \\"A\\" FROM t WHERE b = ?"'
+        assert metrics.to_prometheus("m") == "\n".join([
+            "# HELP m Time spent per statement and phase.",
+            "# TYPE m histogram",
+            'm_bucket{%s,le="1e-06"} 1' % labels,
+            'm_bucket{%s,le="0.0025"} 1' % labels,
+            'm_bucket{%s,le="+Inf"} 2' % labels,
+            "m_sum{%s} 0.003000500" % labels,
+            "m_count{%s} 2" % labels,
+        ]) + "\n"
+
+    def test_label_escaping(self):
+        metrics = StatementMetrics()
+        metrics.observe("reflect", 'get_columns "T" \\ x', 1)
+        output = metrics.to_prometheus(max_label_length=17)
+        assert 'statement="get_columns \\"T\\" \\\\"' in output
+
+    def test_engine_observes_phases(self):
+        engine = make_engine(make_dbapi(_select_handler), statement_metrics=True)
+        t = table("t", column("a"))
+        with engine.connect() as conn:
+            conn.execute(select(t.c.a).where(t.c.a == 1)).all()
+        engine.dispose()
+        snapshot = engine.dialect.statement_metrics.snapshot()
+        assert sorted(phase for phase, _ in snapshot) == [
+            "compile", "execute", "fetch"]
@@ -0,0 +1,85 @@
+import decimal
+from decimal import Decimal
+
+from sqlalchemy import Column, Float, MetaData, Numeric, Table
+from sqlalchemy.testing import fixtures
+
+from ibm_db_sa import DECFLOAT
+from ibm_db_sa.ibm_db import DB2Dialect_ibm_db, _DECFLOAT_CONTEXT
+from ibm_db_sa.ibm_db import _IBM_DecFloat_ibm_db, _IBM_Numeric_ibm_db
+
+from test.fake_dbapi import make_dbapi, make_engine
+
+
+class NumericProcessorTest(fixtures.TestBase):
+
+    def setup_test(self):
+        self.dialect = DB2Dialect_ibm_db()
+
+    def _processor(self, type_):
+        return type_.dialect_impl(self.dialect).result_processor(self.dialect, None)
+
+    def test_colspecs(self):
+        assert type(DECFLOAT(34).dialect_impl(self.dialect)) is _IBM_DecFloat_ibm_db
+        assert type(Numeric(10, 2).dialect_impl(self.dialect)) is _IBM_Numeric_ibm_db
+
+    def test_numeric_result(self):
+        assert self._processor(Numeric(10, 2)) is None
+        process = self._processor(Numeric(10, 2, asdecimal=False))
+        assert process(Decimal("1.25")) == 1.25
+        assert process(None) is None
+
+    def test_decfloat_decimal_passthrough(self):
+        process = self._processor(DECFLOAT(34))
+        value = Decimal("1.5")
+        assert process(value) is value
+        assert process(None) is None
+
+    def test_decfloat_strings(self):
+        process = self._processor(DECFLOAT(34))
+        digits = "1.000000000000000000000000000000001"
+        assert process(digits) == Decimal(digits)
+        assert process("-Infinity") == Decimal("-Infinity")
+        assert process("NaN").is_nan()
+        assert process("sNaN").is_snan()
+
+    def test_decfloat_context(self):
+        assert _DECFLOAT_CONTEXT.prec == 34
+        process = self._processor(DECFLOAT(34))
+        # rounded to 34 digits whatever the thread's decimal context is
+        with decimal.localcontext() as context:
+            context.prec = 5
+            assert process("1.0000000000000000000000000000000005") == Decimal(
+                "1.000000000000000000000000000000000")
+            assert process("1.23456789") == Decimal("1.23456789")
+
+    def test_decfloat_float(self):
+        process = self._processor(DECFLOAT(34, asdecimal=False))
+        assert process("2.5") == 2.5
+
+
+class NativeDecimalBindTest(fixtures.TestBase):
+
+    def test_decimals_bound_as_they_are(self):
+        dialect = DB2Dialect_ibm_db()
+        assert dialect.supports_native_decimal
+        for type_ in (Numeric(10, 2), DECFLOAT(34)):
+            impl = type_.dialect_impl(dialect)
+            assert impl.bind_processor(dialect) is None
+
+        params = []
+
+        def handler(connection, statement, parameters):
+            if statement.startswith("INSERT"):
+                params.append(parameters)
+        ledger = Table("ledger", MetaData(), Column("amount", Numeric(10, 2)),
+                       Column("rate", DECFLOAT(34)), Column("ratio", Float))
+        engine = make_engine(make_dbapi(handler))
+        with engine.connect() as conn:
+            conn.execute(ledger.insert(), {
+                "amount": Decimal("10.25"),
+                "rate": Decimal("1.000000000000000000000000000000001"),
+                "ratio": 0.5})
+        engine.dispose()
+        assert params == [(Decimal("10.25"),
+                           Decimal("1.000000000000000000000000000000001"), 0.5)]
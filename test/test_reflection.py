@@ -0,0 +1,364 @@
+import threading
+
+from sqlalchemy import event
+from sqlalchemy.engine import ObjectKind, ObjectScope
+from sqlalchemy.testing import fixtures
+
+from ibm_db_sa import base, reflection
+from test.fake_dbapi import make_dbapi, make_engine
+
+
+class ResolveTypeTest(fixtures.TestBase):
+
+    def setup_test(self):
+        self.reflector = base.dialect()._reflector
+
+    def test_catalog_descriptions(self):
+        resolve = self.reflector.resolve_type
+        assert repr(resolve("VARCHAR", 20)) == "VARCHAR(length=20)"
+        # FOR BIT DATA
+        assert repr(resolve("VARCHAR", 20, None, 0)) == "VARBINARY(length=20)"
+        assert repr(resolve("DECIMAL", 10, 2)) == "DECIMAL(precision=10, scale=2)"
+        # DECFLOAT(34) is stored in 16 bytes
+        assert resolve("DECFLOAT", 16).precision == 34
+        assert resolve("TIMESTAMP", 10, 3).precision == 3
+        assert resolve("NO SUCH TYPE") is None
+        # schema types are instantiated per column by the caller
+        assert resolve("BOOLEAN") is base.BOOLEAN
+
+    def test_each_column_gets_its_own_type(self):
+        built = []
+        build_type = self.reflector._build_type
+
+        def counting_build_type(*args):
+            built.append(args)
+            return build_type(*args)
+
+        self.reflector._build_type = counting_build_type
+        # the memo is shared by all reflectors; start from an empty one
+        self.reflector._resolved_types = {}
+        first = self.reflector.resolve_type("CHARACTER", 37, 0, 1208)
+        second = self.reflector.resolve_type("CHARACTER", 37, 0, 1208)
+        assert first is not second
+        first.length = 10
+        assert second.length == 37
+        assert self.reflector.resolve_type("CHARACTER", 37, 0, 1208).length == 37
+        # built once, then copied from the memo
+        assert len(built) == 1
+
+
+class QueryTemplateTest(fixtures.TestBase):
+
+    def setup_test(self):
+        self.engine = make_engine(make_dbapi(
+            lambda connection, statement, parameters:
+                [] if "SELECT" in statement else None))
+        self.executed = []
+
+        @event.listens_for(self.engine, "before_execute")
+        def before_execute(conn, clauseelement, multiparams, params, options):
+            self.executed.append(clauseelement)
+
+    def teardown_test(self):
+        self.engine.dispose()
+
+    def _assert_reused(self, reflector, attribute, call):
+        del self.executed[:]
+        call()
+        call()
+        first, second = self.executed
+        assert first is second is getattr(reflector, attribute)
+        assert first._generate_cache_key() == second._generate_cache_key()
+
+    def test_repeated_calls_reuse_templates(self):
+        for reflector_cls in (reflection.DB2Reflector, reflection.AS400Reflector,
+                              reflection.OS390Reflector):
+            reflector = reflector_cls(self.engine.dialect)
+            with self.engine.connect() as conn:
+                for attribute, method, args in [
+                    ("_sorted_table_names_query", "get_table_names", ("S1",)),
+                    ("_view_names_query", "get_view_names", ("S1",)),
+                    ("_sorted_sequence_names_query", "get_sequence_names", ("S1",)),
+                    ("_schema_names_query", "get_schema_names", ()),
+                    ("_pk_constraint_query" if reflector_cls is not
+                     reflection.OS390Reflector else "_primary_keys_query",
+                     "get_pk_constraint", ("T1", "S1")),
+                ]:
+                    self._assert_reused(
+                        reflector, attribute,
+                        lambda: getattr(reflector, method)(conn, *args))
+                self.engine.dialect.default_schema_name = None
+                try:
+                    self._assert_reused(
+                        reflector, "_any_table_exists_query",
+                        lambda: reflector.has_table(conn, "T1"))
+                    self._assert_reused(
+                        reflector, "_any_sequence_exists_query",
+                        lambda: reflector.has_sequence(conn, "S1"))
+                finally:
+                    self.engine.dialect.default_schema_name = "APP"
+
+
+class IndexReflectionTest(fixtures.TestBase):
+
+    # SYSCAT.INDEXES joined with SYSCAT.INDEXCOLUSE: TABNAME, INDSCHEMA,
+    # INDNAME, UNIQUERULE, SYSTEM_REQUIRED, COLNAME, COLORDER, VIRTUAL,
+    # TEXT, ordered by table, index and COLSEQ
+    rows = [
+        ("CUSTOMERS", "APP", "CUST_PK", "P", 1, "ID", "A", "N", None),
+        ("ORDERS", "APP", "IX-Order Date", "D", 0, "Order Date", "D", "N", None),
+        ("ORDERS", "APP", "IX-Order Date", "D", 0, "ID", "A", "N", None),
+        ("ORDERS", "APP", "ORD_CUST", "U", 0, "CUSTOMER_ID", "A", "N", None),
+        ("ORDERS", "APP", "ORD_CUST", "U", 0, "STATUS", "D", "N", None),
+        ("ORDERS", "APP", "ORD_CUST", "U", 0, "TOTAL", "I", "N", None),
+        ("ORDERS", "APP", "ORD_UPPER", "D", 0, "K00001", "A", "Y", "UPPER(STATUS)"),
+        ("ORDERS", "APP", "ORD_UPPER", "D", 0, "K00002", "D", "Y", "YEAR(CREATED)"),
+        ("ORDERS", "APP", "ORD_UPPER", "D", 0, "CUSTOMER_ID", "A", "N", None),
+        ("ORDERS", "APP", "SQL0001", "U", 1, "REF", "A", "N", None),
+        ("ORDERS", "APP", "SYSIDX", "D", 0, "SQLNOTAPPLICABLE", "A", "N", None),
+    ]
+
+    def setup_test(self):
+        self.queries = []
+
+        def handler(connection, statement, parameters):
+            if "INDEXCOLUSE" in statement:
+                self.queries.append(parameters)
+                return list(self.rows)
+        self.engine = make_engine(make_dbapi(handler))
+        self.reflector = self.engine.dialect._reflector
+
+    def teardown_test(self):
+        self.engine.dispose()
+
+    expected = [
+        {"name": "IX-Order Date", "column_names": ["Order Date", "id"],
+         "unique": False, "column_sorting": {"Order Date": ("desc",)}},
+        {"name": "ord_cust", "column_names": ["customer_id", "status"],
+         "unique": True, "column_sorting": {"status": ("desc",)},
+         "dialect_options": {"db2_include": ["total"]}},
+        {"name": "ord_upper", "column_names": [None, None, "customer_id"],
+         "unique": False,
+         "expressions": ["UPPER(STATUS)", "YEAR(CREATED) DESC", "customer_id"]},
+    ]
+
+    def test_get_indexes(self):
+        with self.engine.connect() as conn:
+            indexes = self.reflector.get_indexes(conn, "orders")
+        assert indexes == self.expected
+        # without an info_cache only the one table is read
+        assert self.queries == [("APP", "ORDERS")]
+
+    def test_schema_read_once_per_info_cache(self):
+        info_cache = {}
+        with self.engine.connect() as conn:
+            orders = self.reflector.get_indexes(conn, "orders", info_cache=info_cache)
+            assert self.reflector.get_indexes(
+                conn, "customers", info_cache=info_cache) == []
+            assert self.reflector.get_indexes(
+                conn, "other", schema="app2", info_cache=info_cache) == []
+        assert orders == self.expected
+        assert self.queries == [("APP",), ("APP2",)]
+
+    def test_results_do_not_share_state(self):
+        info_cache = {}
+        with self.engine.connect() as conn:
+            first = self.reflector.get_indexes(conn, "orders", info_cache=info_cache)
+            first[1]["column_names"].append("changed")
+            first[1]["column_sorting"]["changed"] = ("desc",)
+            first[1]["dialect_options"]["db2_include"].append("changed")
+            first[2]["expressions"].append("changed")
+            # another get_indexes() cache key, same schema-wide result
+            second = self.reflector.get_indexes(conn, "ORDERS", info_cache=info_cache)
+        assert second == self.expected
+        assert len(self.queries) == 1
+
+
+class AS400UniqueConstraintTest(fixtures.TestBase):
+
+    # QSYS2.SYSCST joined with QSYS2.SYSKEYCST: TABNAME, CONNAME, COLNAME,
+    # ordered by table, constraint and COLNO
+    rows = [
+        ("CUSTOMERS", "CUST_EMAIL", "EMAIL"),
+        ("ORDERS", "ORD_NUMBER", "REGION"),
+        ("ORDERS", "ORD_NUMBER", "ORDER_YEAR"),
+        ("ORDERS", "ORD_NUMBER", "SEQ"),
+        ("ORDERS", "ORD_Ref", "REFERENCE"),
+    ]
+
+    def setup_test(self):
+        self.queries = []
+
+        def handler(connection, statement, parameters):
+            if "SYSKEYCST" in statement:
+                self.queries.append(parameters)
+                return [row for row in self.rows
+                        if len(parameters) == 2 or row[0] == parameters[2]]
+            return [] if "SELECT" in statement else None
+        self.engine = make_engine(make_dbapi(handler))
+        self.reflector = reflection.AS400Reflector(self.engine.dialect)
+
+    def teardown_test(self):
+        self.engine.dispose()
+
+    orders = [
+        {"name": "ord_number", "column_names": ["region", "order_year", "seq"]},
+        {"name": "ORD_Ref", "column_names": ["reference"]},
+    ]
+
+    def test_get_unique_constraints(self):
+        with self.engine.connect() as conn:
+            constraints = self.reflector.get_unique_constraints(conn, "orders")
+        assert constraints == self.orders
+        # without an info_cache only the one table is read
+        assert self.queries == [("APP", "UNIQUE", "ORDERS")]
+
+    def test_library_read_once_per_info_cache(self):
+        info_cache = {}
+        with self.engine.connect() as conn:
+            orders = self.reflector.get_unique_constraints(
+                conn, "orders", info_cache=info_cache)
+            customers = self.reflector.get_unique_constraints(
+                conn, "customers", info_cache=info_cache)
+            assert self.reflector.get_unique_constraints(
+                conn, "products", info_cache=info_cache) == []
+            # the cached lists are not handed out
+            orders[0]["column_names"].append("changed")
+            assert self.reflector.get_unique_constraints(
+                conn, "ORDERS", info_cache=info_cache) == self.orders
+        assert orders[1] == self.orders[1]
+        assert customers == [{"name": "cust_email", "column_names": ["email"]}]
+        assert self.queries == [("APP", "UNIQUE")]
+
+
+class ParallelReflectionTest(fixtures.TestBase):
+
+    def setup_test(self):
+        self.engine = make_engine(make_dbapi(), pool_size=4, reflection_workers=3)
+        self.calls = []
+        lock = threading.Lock()
+
+        def get_columns(connection, table_name, schema=None, **kw):
+            with lock:
+                self.calls.append((table_name, connection, connection.get_execution_options()))
+            return [{"name": "id"}]
+
+        self.engine.dialect.get_columns = get_columns
+
+    def teardown_test(self):
+        self.engine.dispose()
+
+    def _reflect(self, conn, names):
+        return list(self.engine.dialect.get_multi_columns(
+            conn, schema=None, filter_names=names,
+            kind=ObjectKind.ANY, scope=ObjectScope.ANY))
+
+    def test_workers_use_own_connections_and_options(self):
+        names = ["a", "b", "c", "d"]
+        with self.engine.connect() as conn:
+            conn = conn.execution_options(schema_translate_map={None: "TENANT1"})
+            result = self._reflect(conn, names)
+        assert [key for key, _ in result] == [(None, name) for name in names]
+        assert all(c is not conn for _, c, _ in self.calls)
+        assert all(options["schema_translate_map"] == {None: "TENANT1"}
+                   for _, _, options in self.calls)
+
+    def test_serial_after_uncommitted_ddl(self):
+        names = ["a", "b", "c", "d"]
+        with self.engine.connect() as conn:
+            conn.exec_driver_sql("CREATE TABLE d (id INT)")
+            result = self._reflect(conn, names)
+            assert [key for key, _ in result] == [(None, name) for name in names]
+            assert all(c is conn for _, c, _ in self.calls)
+            conn.commit()
+            del self.calls[:]
+            self._reflect(conn, names)
+            assert all(c is not conn for _, c, _ in self.calls)
+
+
+class StatsTest(fixtures.TestBase):
+
+    def setup_test(self):
+        self.rows = {"table": [("ORDERS", 120, 4, None)],
+                     "index": [("ORDERS", "ORDERS_PK", 120, -1, 2, 1, None)]}
+        self.queries = []
+        self.now = 1000.0
+        self.engine = None
+        self._monotonic = reflection.monotonic
+        reflection.monotonic = lambda: self.now
+
+    def teardown_test(self):
+        reflection.monotonic = self._monotonic
+        if self.engine is not None:
+            self.engine.dispose()
+
+    def _handle(self, connection, statement, parameters):
+        if "STAT" in statement:
+            self.queries.append(statement)
+            return self.rows["index" if "INDEX" in statement else "table"]
+        if statement.strip().startswith(("SELECT", "CALL")):
+            return []
+        return None
+
+    def _engine(self, dbms_name="DB2/LINUX", **kw):
+        self.engine = make_engine(make_dbapi(self._handle, dbms_name=dbms_name), **kw)
+        return self.engine
+
+    def test_stat_value(self):
+        stat_value = reflection.BaseReflector._stat_value
+        assert stat_value(-1) is None
+        assert stat_value(-1.0) is None
+        assert stat_value(7.0) == 7 and isinstance(stat_value(7.0), int)
+        assert stat_value(0) == 0
+        assert stat_value(None) is None
+        assert stat_value(True) is True
+        assert stat_value("2026-01-01") == "2026-01-01"
+
+    def test_table_and_index_stats(self):
+        with self._engine().connect() as conn:
+            assert self.engine.dialect.get_table_stats(conn, "orders") == {
+                "row_count": 120, "pages": 4, "stats_time": None}
+            index, = self.engine.dialect.get_index_stats(conn, "orders")
+        assert index["name"] == "orders_pk"
+        assert index["first_key_cardinality"] == 120
+        # -1: not collected
+        assert index["full_key_cardinality"] is None
+        assert index["key_count"] is None
+
+    def test_db2_for_i_partitions_summed(self):
+        self.rows = {"table": [("ORDERS", 300)], "index": [("ORDERS", "ORDERS_PK", 300)]}
+        with self._engine(dbms_name="AS").connect() as conn:
+            assert isinstance(self.engine.dialect._reflector, reflection.AS400Reflector)
+            assert self.engine.dialect.get_table_stats(conn, "orders") == {
+                "row_count": 300, "pages": None, "stats_time": None}
+            index, = self.engine.dialect.get_index_stats(conn, "orders")
+        assert index["key_count"] == 300
+        assert index["first_key_cardinality"] is None
+        assert all("sum(" in query and "GROUP BY" in query for query in self.queries)
+
+    def test_schema_cache_expiry(self):
+        with self._engine(stats_cache_ttl=300).connect() as conn:
+            get_table_stats = self.engine.dialect.get_table_stats
+            assert get_table_stats(conn, "orders")["row_count"] == 120
+            assert get_table_stats(conn, "missing") is None
+            assert len(self.queries) == 1
+            # the whole schema, no table name
+            assert "TABNAME\" = ?" not in self.queries[0]
+            self.rows["table"] = [("ORDERS", 130, 5, None)]
+            self.now += 299
+            assert get_table_stats(conn, "orders")["row_count"] == 120
+            self.now += 2
+            assert get_table_stats(conn, "orders")["row_count"] == 130
+        assert len(self.queries) == 2
+
+    def test_schema_cache_invalidated_by_ddl_and_runstats(self):
+        with self._engine(stats_cache_ttl=300).connect() as conn:
+            get_table_stats = self.engine.dialect.get_table_stats
+            get_table_stats(conn, "orders")
+            conn.exec_driver_sql(
+                "CALL SYSPROC.ADMIN_CMD(?)", ("RUNSTATS ON TABLE APP.ORDERS",))
+            get_table_stats(conn, "orders")
+            conn.exec_driver_sql("DROP TABLE APP.ORDERS_OLD")
+            get_table_stats(conn, "orders")
+            get_table_stats(conn, "orders")
+        assert len(self.queries) == 3
@@ -0,0 +1,128 @@
+from sqlalchemy.testing import fixtures
+from sqlalchemy.testing.assertions import expect_warnings
+
+from ibm_db_sa.base import _PENDING_SAVEPOINTS
+
+from test.fake_dbapi import make_dbapi, make_engine
+
+
+class LazySavepointTest(fixtures.TestBase):
+
+    lazy = True
+
+    def setup_test(self):
+        self.dbapi = make_dbapi()
+        self.engine = make_engine(self.dbapi, lazy_savepoints=self.lazy)
+        self.conn = self.engine.connect()
+        self.conn.exec_driver_sql("UPDATE T SET A = 0")
+        del self.dbapi.log[:]
+
+    def teardown_test(self):
+        self.conn.close()
+        self.engine.dispose()
+
+    def _statements(self):
+        return [statement.strip() for statement in self.dbapi.log
+                if statement not in ("COMMIT", "ROLLBACK")]
+
+    def _pending(self):
+        return self.conn.connection.info.get(_PENDING_SAVEPOINTS, [])
+
+
+class LazyTest(LazySavepointTest):
+
+    def test_empty_nested_block_emits_nothing(self):
+        with self.conn.begin_nested():
+            pass
+        sp = self.conn.begin_nested()
+        sp.rollback()
+        assert self._statements() == []
+        assert self._pending() == []
+
+    def test_savepoint_emitted_before_statement(self):
+        sp = self.conn.begin_nested()
+        self.conn.exec_driver_sql("UPDATE T SET A = 1")
+        sp.commit()
+        assert self._statements() == [
+            "SAVEPOINT sa_savepoint_1 ON ROLLBACK RETAIN CURSORS",
+            "UPDATE T SET A = 1",
+            "RELEASE TO SAVEPOINT sa_savepoint_1",
+        ]
+
+    def test_release_of_pending_savepoint(self):
+        outer = self.conn.begin_nested()
+        self.conn.exec_driver_sql("UPDATE T SET A = 1")
+        inner = self.conn.begin_nested()
+        assert self._pending() == ["sa_savepoint_2"]
+        inner.commit()
+        assert self._pending() == []
+        outer.commit()
+        assert self._statements() == [
+            "SAVEPOINT sa_savepoint_1 ON ROLLBACK RETAIN CURSORS",
+            "UPDATE T SET A = 1",
+            "RELEASE TO SAVEPOINT sa_savepoint_1",
+        ]
+
+    def test_rollback_of_emitted_savepoint_with_pending_inner(self):
+        outer = self.conn.begin_nested()
+        self.conn.exec_driver_sql("UPDATE T SET A = 1")
+        self.conn.begin_nested()
+        self.conn.begin_nested()
+        assert self._pending() == ["sa_savepoint_2", "sa_savepoint_3"]
+        with expect_warnings("nested transaction already deassociated"):
+            outer.rollback()
+        assert self._pending() == []
+        self.conn.exec_driver_sql("UPDATE T SET A = 2")
+        assert self._statements() == [
+            "SAVEPOINT sa_savepoint_1 ON ROLLBACK RETAIN CURSORS",
+            "UPDATE T SET A = 1",
+            "ROLLBACK TO SAVEPOINT sa_savepoint_1",
+            "UPDATE T SET A = 2",
+        ]
+
+    def test_nested_rollback_inside_emitted_savepoint(self):
+        sp1 = self.conn.begin_nested()
+        sp2 = self.conn.begin_nested()
+        self.conn.exec_driver_sql("UPDATE T SET A = 1")
+        sp3 = self.conn.begin_nested()
+        sp3.rollback()
+        sp2.rollback()
+        self.conn.exec_driver_sql("UPDATE T SET A = 2")
+        sp1.commit()
+        assert self._statements() == [
+            "SAVEPOINT sa_savepoint_1 ON ROLLBACK RETAIN CURSORS",
+            "SAVEPOINT sa_savepoint_2 ON ROLLBACK RETAIN CURSORS",
+            "UPDATE T SET A = 1",
+            "ROLLBACK TO SAVEPOINT sa_savepoint_2",
+            "UPDATE T SET A = 2",
+            "RELEASE TO SAVEPOINT sa_savepoint_1",
+        ]
+
+    def test_outer_rollback_clears_pending(self):
+        self.conn.begin_nested()
+        self.conn.begin_nested()
+        assert self._pending() == ["sa_savepoint_1", "sa_savepoint_2"]
+        self.conn.rollback()
+        assert self._pending() == []
+        assert self.dbapi.log == ["ROLLBACK"]
+        self.conn.exec_driver_sql("UPDATE T SET A = 1")
+        assert self._statements() == ["UPDATE T SET A = 1"]
+
+    def test_commit_clears_pending(self):
+        self.conn.begin_nested()
+        self.conn.commit()
+        assert self._pending() == []
+        assert self.dbapi.log == ["COMMIT"]
+
+
+class EagerTest(LazySavepointTest):
+
+    lazy = False
+
+    def test_empty_nested_block_emits_savepoint(self):
+        with self.conn.begin_nested():
+            pass
+        assert self._statements() == [
+            "SAVEPOINT sa_savepoint_1 ON ROLLBACK RETAIN CURSORS",
+            "RELEASE TO SAVEPOINT sa_savepoint_1",
+        ]
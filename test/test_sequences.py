@@ -0,0 +1,83 @@
+import itertools
+import threading
+
+from sqlalchemy.testing import fixtures
+
+from ibm_db_sa.sequences import SequenceBlockAllocator
+
+
+class SequenceBlockAllocatorTest(fixtures.TestBase):
+
+    def setup_test(self):
+        self.allocator = SequenceBlockAllocator(3)
+        self.counters = {}
+
+    def _fetch(self, key):
+        counter = self.counters.setdefault(key, itertools.count(1))
+        return lambda: [next(counter) for _ in range(3)]
+
+    def test_block_sql(self):
+        assert self.allocator.block_sql("S.ORDER_SEQ") == (
+            "SELECT NEXT VALUE FOR S.ORDER_SEQ FROM "
+            "(VALUES (0), (0), (0)) AS IBM_DB_SA_BLOCK(N)")
+
+    def test_values_served_from_blocks(self):
+        values = [self.allocator.next_value("A", self._fetch("A")) for _ in range(7)]
+        assert values == [1, 2, 3, 4, 5, 6, 7]
+        assert self.allocator.fetches == 3
+        assert self.allocator.next_value("B", self._fetch("B")) == 1
+
+    def test_discard(self):
+        self.allocator.next_value("A", self._fetch("A"))
+        self.allocator.next_value("B", self._fetch("B"))
+        self.allocator.discard("A")
+        # 2 and 3 are gaps
+        assert self.allocator.next_value("A", self._fetch("A")) == 4
+        assert self.allocator.next_value("B", self._fetch("B")) == 2
+        self.allocator.discard()
+        assert self.allocator.next_value("B", self._fetch("B")) == 4
+
+    def test_block_fetched_during_discard_not_kept(self):
+        def fetch():
+            self.allocator.discard()
+            return [1, 2, 3]
+        assert self.allocator.next_value("A", fetch) == 1
+        assert self.allocator.next_value("A", self._fetch("A")) == 1
+
+    def test_refill_does_not_block_other_sequences(self):
+        started, release = threading.Event(), threading.Event()
+
+        def slow_fetch():
+            started.set()
+            assert release.wait(5)
+            return [10, 11, 12]
+
+        results = []
+        thread = threading.Thread(
+            target=lambda: results.append(self.allocator.next_value("A", slow_fetch)))
+        thread.start()
+        try:
+            assert started.wait(5)
+            # served while A's refill is still waiting on the database
+            assert self.allocator.next_value("B", self._fetch("B")) == 1
+        finally:
+            release.set()
+            thread.join(5)
+        assert results == [10]
+
+    def test_concurrent_callers_share_one_block(self):
+        barrier = threading.Barrier(3)
+        results = []
+        fetch = self._fetch("A")
+
+        def take():
+            barrier.wait(5)
+            results.append(self.allocator.next_value("A", fetch))
+
+        threads = [threading.Thread(target=take) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+        assert sorted(results) == [1, 2, 3]
+        assert self.allocator.fetches == 1
@@ -0,0 +1,102 @@
+import os
+import shutil
+import tempfile
+
+from sqlalchemy.testing import fixtures
+
+from ibm_db_sa import base, reflection, snapshot
+
+
+class _CannedReflector(reflection.DB2Reflector):
+    """Answers the snapshot's reflection calls without a database, the
+    way DB2Reflector reports a table ``child`` referring to ``parent``
+    in the same schema."""
+
+    def get_catalog_version(self, connection, schema=None, **kw):
+        return "1"
+
+    def get_table_names(self, connection, schema=None, **kw):
+        return ["child", "parent"]
+
+    def get_view_names(self, connection, schema=None, **kw):
+        return []
+
+    def get_sequence_names(self, connection, schema=None, **kw):
+        return []
+
+    def get_columns(self, connection, table_name, schema=None, **kw):
+        return [{"name": "id", "type": base.INTEGER(), "nullable": False,
+                 "default": None, "autoincrement": False}]
+
+    def get_pk_constraint(self, connection, table_name, schema=None, **kw):
+        return {"constrained_columns": ["id"], "name": None}
+
+    def get_foreign_keys(self, connection, table_name, schema=None, **kw):
+        if table_name != "child":
+            return []
+        referred_schema = None if schema is None else self.normalize_name(schema)
+        return [{"name": "fk_parent", "constrained_columns": ["id"],
+                 "referred_schema": referred_schema,
+                 "referred_table": "parent", "referred_columns": ["id"]}]
+
+    def get_indexes(self, connection, table_name, schema=None, **kw):
+        return []
+
+    def get_unique_constraints(self, connection, table_name, schema=None, **kw):
+        return []
+
+    def get_table_comment(self, connection, table_name, schema=None, **kw):
+        return {"text": None}
+
+
+class _Bind(object):
+    def __init__(self, dialect):
+        self.dialect = dialect
+
+
+class SnapshotTest(fixtures.TestBase):
+
+    def setup_test(self):
+        self.dialect = base.dialect(schema_snapshot_check=False)
+        self.dialect.default_schema_name = "app"
+        self.dialect._reflector = _CannedReflector(self.dialect)
+        self.tmpdir = tempfile.mkdtemp()
+
+    def teardown_test(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _round_trip(self, schemas=None):
+        path = os.path.join(self.tmpdir, "app.snapshot")
+        snapshot.save_snapshot(_Bind(self.dialect), path, schemas)
+        return snapshot.load_snapshot(path)
+
+    def _foreign_keys(self, snap, schema=None):
+        found, result = snap.lookup(
+            self.dialect, None, "get_foreign_keys", "child", schema=schema)
+        assert found
+        return result
+
+    def test_default_schema_foreign_keys_match_live_reflection(self):
+        snap = self._round_trip()
+        assert list(snap.schemas) == ["APP"]
+        reflector = self.dialect._reflector
+        assert self._foreign_keys(snap) == reflector.get_foreign_keys(
+            None, "child")
+        assert self._foreign_keys(snap)[0]["referred_schema"] is None
+
+    def test_explicit_schema_keeps_referred_schema(self):
+        snap = self._round_trip(["app"])
+        assert self._foreign_keys(snap, "app")[0]["referred_schema"] == "app"
+        # each lookup gets its own copy
+        assert self._foreign_keys(snap)[0]["referred_schema"] is None
+        assert self._foreign_keys(snap, "app")[0]["referred_schema"] == "app"
+
+    def test_types_survive_round_trip(self):
+        snap = self._round_trip()
+        found, columns = snap.lookup(self.dialect, None, "get_columns", "parent")
+        assert found
+        assert isinstance(columns[0]["type"], base.INTEGER)
+        columns[0]["type"].display_width = 3
+        found, columns = snap.lookup(self.dialect, None, "get_columns", "parent")
+        assert not hasattr(columns[0]["type"], "display_width")
+        assert snap.lookup(self.dialect, None, "get_columns", "missing") == (False, None)
@@ -0,0 +1,58 @@
+from sqlalchemy.testing import fixtures
+
+from ibm_db_sa.stmtcache import StatementCache
+
+
+class StatementCacheTest(fixtures.TestBase):
+
+    def setup_test(self):
+        self.freed = []
+        self.cache = StatementCache(2, self.freed.append)
+
+    def test_checkout_miss_and_hit(self):
+        assert self.cache.checkout("SELECT 1") is None
+        self.cache.checkin("SELECT 1", "h1")
+        assert self.cache.checkout("SELECT 1") == "h1"
+        # checked out handles are not shared
+        assert self.cache.checkout("SELECT 1") is None
+        assert (self.cache.hits, self.cache.misses) == (1, 2)
+        assert len(self.cache) == 0
+
+    def test_lru_eviction(self):
+        self.cache.checkin("A", "ha")
+        self.cache.checkin("B", "hb")
+        # A becomes the most recently used
+        self.cache.checkin("A", self.cache.checkout("A"))
+        self.cache.checkin("C", "hc")
+        assert self.freed == ["hb"]
+        assert len(self.cache) == 2
+        assert self.cache.checkout("B") is None
+        assert self.cache.checkout("A") == "ha"
+        assert self.cache.checkout("C") == "hc"
+
+    def test_duplicate_checkin(self):
+        self.cache.checkin("A", "ha1")
+        self.cache.checkin("B", "hb")
+        self.cache.checkin("A", "ha2")
+        # the idle handle is kept, the second one freed, A moves to the end
+        assert self.freed == ["ha2"]
+        self.cache.checkin("C", "hc")
+        assert self.freed == ["ha2", "hb"]
+        assert self.cache.checkout("A") == "ha1"
+
+    def test_clear(self):
+        self.cache.checkin("A", "ha")
+        self.cache.checkin("B", "hb")
+        self.cache.clear()
+        assert sorted(self.freed) == ["ha", "hb"]
+        assert len(self.cache) == 0
+        assert self.cache.checkout("A") is None
+
+    def test_free_errors_ignored(self):
+        def free(handle):
+            raise RuntimeError("handle already freed")
+        cache = StatementCache(1, free)
+        cache.checkin("A", "ha")
+        cache.checkin("B", "hb")
+        cache.clear()
+        assert len(cache) == 0
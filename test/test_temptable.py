@@ -0,0 +1,89 @@
+from sqlalchemy import exc, Column, Integer, String
+from sqlalchemy.testing import assert_raises_message, fixtures
+
+from ibm_db_sa import base
+from ibm_db_sa.temptable import GlobalTemporaryTable, key_table
+
+from test.fake_dbapi import make_dbapi, make_engine
+
+
+class GlobalTemporaryTableTest(fixtures.TestBase):
+
+    def setup_test(self):
+        self.dbapi = make_dbapi()
+        self.engine = make_engine(self.dbapi)
+
+    def teardown_test(self):
+        self.engine.dispose()
+
+    def _statements(self):
+        return [" ".join(statement.split()) for statement in self.dbapi.log
+                if statement not in ("COMMIT", "ROLLBACK")]
+
+    def test_declare_sql(self):
+        temp = GlobalTemporaryTable(
+            "ORDER_KEYS", Column("id", Integer, nullable=False),
+            Column("Region", String(10)))
+        assert temp._declare_sql(base.dialect()) == (
+            'DECLARE GLOBAL TEMPORARY TABLE "SESSION"."ORDER_KEYS" '
+            '(id INT NOT NULL, "Region" VARCHAR(10)) '
+            "ON COMMIT PRESERVE ROWS NOT LOGGED WITH REPLACE")
+
+    def test_unknown_argument(self):
+        assert_raises_message(
+            exc.ArgumentError, "Unknown GlobalTemporaryTable argument",
+            GlobalTemporaryTable, "T", Column("id", Integer), indexes=["id"])
+
+    def test_declared_once_per_connection(self):
+        temp = GlobalTemporaryTable("ORDER_KEYS", Column("id", Integer))
+        with self.engine.connect() as conn:
+            temp.declare(conn)
+            temp.declare(conn)
+            # same name, another column signature
+            GlobalTemporaryTable("ORDER_KEYS", Column("id", String(10))).declare(conn)
+        statements = self._statements()
+        assert [s.split(" (")[0] for s in statements] == [
+            'DECLARE GLOBAL TEMPORARY TABLE "SESSION"."ORDER_KEYS"',
+            'DELETE FROM "SESSION"."ORDER_KEYS"',
+            'DECLARE GLOBAL TEMPORARY TABLE "SESSION"."ORDER_KEYS"',
+        ]
+        assert "(id VARCHAR(10))" in statements[2]
+
+    def test_redeclared_when_delete_fails(self):
+        def handler(connection, statement, parameters):
+            if statement.startswith("DELETE"):
+                # the declaration was rolled back with its transaction
+                raise self.dbapi.ProgrammingError(
+                    "SQL0204N  \"SESSION.ORDER_KEYS\" is an undefined name.  "
+                    "SQLSTATE=42704")
+        temp = GlobalTemporaryTable("ORDER_KEYS", Column("id", Integer))
+        with self.engine.connect() as conn:
+            temp.declare(conn)
+            self.dbapi.handler = handler
+            temp.declare(conn)
+        assert [s.split(" (")[0] for s in self._statements()] == [
+            'DECLARE GLOBAL TEMPORARY TABLE "SESSION"."ORDER_KEYS"',
+            'DELETE FROM "SESSION"."ORDER_KEYS"',
+            'DECLARE GLOBAL TEMPORARY TABLE "SESSION"."ORDER_KEYS"',
+        ]
+
+    def test_key_table(self):
+        params = []
+
+        def handler(connection, statement, parameters):
+            if statement.startswith("INSERT"):
+                params.append(parameters)
+        self.dbapi.handler = handler
+        with self.engine.connect() as conn:
+            table = key_table(conn, [3, 1, 3, 2, 1], batch_size=2)
+        assert table.schema == "SESSION"
+        statements = self._statements()
+        assert statements[:2] == [
+            'DECLARE GLOBAL TEMPORARY TABLE "SESSION"."IBM_DB_SA_KEYS" '
+            '("key" INT NOT NULL) ON COMMIT PRESERVE ROWS NOT LOGGED '
+            "WITH REPLACE",
+            'CREATE INDEX "SESSION"."IBM_DB_SA_KEYS_IX" ON '
+            '"SESSION"."IBM_DB_SA_KEYS" ("key")',
+        ]
+        # distinct keys, in order
+        assert params == [(3,), (1,), (2,)]
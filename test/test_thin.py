@@ -0,0 +1,120 @@
+import os
+import sys
+import decimal
+import importlib
+import importlib.util
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.testing import assert_raises, assert_raises_context_ok, fixtures
+
+_BENCH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                      "bench", "bench_thin_dbapi.py")
+
+
+def _load_bench():
+    spec = importlib.util.spec_from_file_location("bench_thin_dbapi", _BENCH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class ThinDBAPITest(fixtures.TestBase):
+    """ibm_db_sa.thin running on the fake ``ibm_db`` module of
+    bench/bench_thin_dbapi.py."""
+
+    @classmethod
+    def setup_class(cls):
+        cls.bench = _load_bench()
+        cls.bench.ROWS = 5
+        cls.saved_ibm_db = sys.modules.get("ibm_db")
+        sys.modules["ibm_db"] = cls.ibm_db = cls.bench.make_ibm_db()
+        sys.modules.pop("ibm_db_sa.thin", None)
+        cls.thin = importlib.import_module("ibm_db_sa.thin")
+
+    @classmethod
+    def teardown_class(cls):
+        # later imports get the real ibm_db again
+        sys.modules.pop("ibm_db_sa.thin", None)
+        if cls.saved_ibm_db is None:
+            sys.modules.pop("ibm_db", None)
+        else:
+            sys.modules["ibm_db"] = cls.saved_ibm_db
+
+    def _connect(self):
+        return self.thin.connect("DATABASE=bench;HOSTNAME=host;", "user", "pass")
+
+    def test_error_sqlstate_classes(self):
+        thin = self.thin
+        for message, error_cls in [
+            ("SQL0803N  One or more values ... SQLSTATE=23505", thin.IntegrityError),
+            ("SQL0204N  \"T\" is an undefined name.  SQLSTATE=42704",
+             thin.ProgrammingError),
+            ("SQL0302N  The value ... is too large.  SQLSTATE=22001",
+             thin.DataError),
+            ("SQL30081N  A communication error ... SQLSTATE=08001",
+             thin.OperationalError),
+            ("SQL0270N  Function not supported.  SQLSTATE=0A000",
+             thin.NotSupportedError),
+            ("SQL0901N  ... SQLSTATE=99999", thin.DatabaseError),
+            ("[IBM][CLI Driver] Connection is not active", thin.OperationalError),
+            ("Supplied parameter is invalid", thin.InterfaceError),
+        ]:
+            error = thin._error(Exception(message))
+            assert type(error) is error_cls, (message, error)
+            assert str(error) == message
+
+    def test_failure_reads_driver_message(self):
+        ibm_db = self.ibm_db
+        ibm_db.stmt_errormsg = lambda *args: "SQL0911N  ... SQLSTATE=40001"
+        try:
+            error = self.thin._failure(object())
+        finally:
+            ibm_db.stmt_errormsg = lambda *args: ""
+        assert isinstance(error, self.thin.ProgrammingError)
+        assert isinstance(self.thin._failure(), self.thin.InterfaceError)
+
+    def test_cursor_fetch(self):
+        conn = self._connect()
+        cursor = conn.cursor()
+        cursor.execute("SELECT ID, STATUS, AMOUNT, WEIGHT FROM ORDERS")
+        assert [column[:2] for column in cursor.description] == [
+            ("ID", "INT"), ("STATUS", "STRING"), ("AMOUNT", "DECIMAL"),
+            ("WEIGHT", "DOUBLE")]
+        assert cursor.rowcount == -1
+        assert cursor.fetchone() == (0, "SHIPPED", "0.25", 0.0)
+        cursor.arraysize = 2
+        assert [row[0] for row in cursor.fetchmany()] == [1, 2]
+        assert [row[0] for row in cursor.fetchall()] == [3, 4]
+        assert cursor.fetchone() is None
+        assert cursor.fetchall() == []
+        cursor.execute("UPDATE INVOICES SET ID = ?", [1])
+        assert cursor.description is None
+        assert cursor.rowcount == 1
+        assert_raises(self.thin.ProgrammingError, cursor.fetchone)
+        cursor.close()
+        assert_raises(self.thin.ProgrammingError, cursor.execute, "VALUES 1")
+        conn.close()
+        assert_raises(self.thin.ProgrammingError, conn.cursor)
+
+    def test_execute_error(self):
+        ibm_db = self.ibm_db
+
+        def execute(stmt, params=None):
+            raise Exception("SQL0803N  One or more values ... SQLSTATE=23505")
+        ibm_db.execute = execute
+        try:
+            cursor = self._connect().cursor()
+            assert_raises_context_ok(self.thin.IntegrityError, cursor.execute,
+                                     "INSERT INTO INVOICES VALUES (?)", [1])
+        finally:
+            ibm_db.execute = self.bench._execute
+
+    def test_core_select(self):
+        engine = create_engine(
+            "db2+ibm_db://user:pass@host:50000/bench?ibmdbsa_dbapi=thin")
+        with engine.connect() as conn:
+            assert engine.dialect.dbapi is self.thin
+            rows = conn.execute(select(self.bench.orders)).all()
+        engine.dispose()
+        assert len(rows) == 5
+        assert rows[1] == (1, "SHIPPED", decimal.Decimal("1.25"), 0.5)